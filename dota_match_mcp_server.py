@@ -47,7 +47,9 @@ TOOL_INSTRUCTIONS = """
 2. **One tool per question** - Avoid chaining tools. Each tool returns complete data for its purpose.
 
 3. **Parallel calls for efficiency** - Tools like get_cs_at_minute, get_stats_at_minute,
-   get_hero_positions can be called in parallel for different time points.
+   get_hero_positions can be called in parallel for different time points. For game-state
+   snapshots at several times of one match, make one get_snapshots_at_times call instead of
+   many get_snapshot_at_time calls: it decodes the replay once for all of them.
 """
 
 # Assemble full instructions from shared constants + server-specific rules
@@ -86,12 +88,14 @@ from src.utils.pro_scene_fetcher import pro_scene_fetcher
 _replay_cache = ReplayCacheV2()
 _replay_service = ReplayService(cache=_replay_cache)
 _combat_service = CombatService()
-_fight_service = FightService(combat_service=_combat_service)
+_fight_service = FightService(combat_service=_combat_service, derived_cache=_replay_cache.derived)
 _jungle_service = JungleService()
-_lane_service = LaneService()
+_lane_service = LaneService(derived_cache=_replay_cache.derived)
 _seek_service = SeekService()
-_farming_service = FarmingService()
-_rotation_service = RotationService(combat_service=_combat_service, fight_service=_fight_service)
+_farming_service = FarmingService(derived_cache=_replay_cache.derived)
+_rotation_service = RotationService(
+    combat_service=_combat_service, fight_service=_fight_service, derived_cache=_replay_cache.derived
+)
 
 # Create services dictionary for tool registration
 services = {
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# ruff: noqa: E402
+"""
+Dota 2 Replay Prefetch - warm the replay cache for many matches at once
+
+Downloads, extracts, parses and caches a list of matches (or a whole league)
+so later MCP tool calls hit the cache. Progress is written to a manifest, so
+rerunning the same command resumes where it stopped.
+"""
+
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import List
+
+# Add project paths for imports
+project_root = Path(__file__).parent.parent
+mcp_dir = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(mcp_dir))
+
+from opendota import OpenDota
+
+from src.services.models.replay_data import PARSE_PROFILES
+from src.services.replay.prefetch import PrefetchManifest
+from src.services.replay.replay_service import (
+    DEFAULT_REPLAY_DIR,
+    PREFETCH_DOWNLOAD_CONCURRENCY,
+    PREFETCH_MAX_ATTEMPTS,
+    PREFETCH_PARSE_CONCURRENCY,
+    PREFETCH_PARSE_WAIT,
+    PREFETCH_RETRY_DELAY,
+    ReplayService,
+)
+
+
+def read_match_ids(path: Path) -> List[int]:
+    """Read match IDs from a file, one per line. Blank lines and # comments are ignored."""
+    ids = []
+    for line in path.read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            ids.append(int(line))
+    return ids
+
+
+async def fetch_league_match_ids(league_id: int) -> List[int]:
+    """Get all match IDs of a league from OpenDota."""
+    opendota = OpenDota(format="json")
+    try:
+        matches = await opendota.get(f"leagues/{league_id}/matches")
+    finally:
+        await opendota.close()
+    return [m["match_id"] for m in matches if m.get("match_id")]
+
+
+async def run(args) -> int:
+    match_ids = list(args.match_ids)
+    if args.file:
+        match_ids.extend(read_match_ids(args.file))
+    if args.league:
+        league_ids = await fetch_league_match_ids(args.league)
+        print(f"League {args.league}: {len(league_ids)} matches", file=sys.stderr)
+        match_ids.extend(league_ids)
+
+    if not match_ids:
+        print("No match IDs given", file=sys.stderr)
+        return 2
+
+    manifest = PrefetchManifest(args.manifest)
+
+    async def progress(current: int, total: int, message: str) -> None:
+        print(f"[{current}/{total}] {message}", file=sys.stderr)
+
+    service = ReplayService()
+    try:
+        summary = await service.prefetch(
+            match_ids,
+            download_concurrency=args.downloads,
+            parse_concurrency=args.parses,
+            max_attempts=args.attempts,
+            retry_delay=args.retry_delay,
+            wait_timeout=args.wait_timeout,
+            manifest=manifest,
+            progress=progress,
+            profile=args.profile,
+        )
+    finally:
+        service.close()
+
+    print(
+        f"Done: {len(summary.completed)} cached, {len(summary.skipped)} skipped, "
+        f"{len(summary.failed)} failed (manifest: {args.manifest})",
+        file=sys.stderr,
+    )
+    for match_id, error in summary.failed.items():
+        print(f"  {match_id}: {error}", file=sys.stderr)
+    return 1 if summary.failed else 0
+
+
+def main():
+    """Main entry point for the prefetch CLI."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Prefetch and cache Dota 2 replays")
+    parser.add_argument("match_ids", nargs="*", type=int, help="Match IDs to prefetch")
+    parser.add_argument("--file", type=Path, help="File with one match ID per line")
+    parser.add_argument("--league", type=int, help="Prefetch every match of an OpenDota league ID")
+    parser.add_argument(
+        "--manifest", type=Path, default=DEFAULT_REPLAY_DIR / "prefetch_manifest.json",
+        help="Progress manifest, reused to resume interrupted runs",
+    )
+    parser.add_argument("--downloads", type=int, default=PREFETCH_DOWNLOAD_CONCURRENCY, help="Parallel downloads")
+    parser.add_argument("--parses", type=int, default=PREFETCH_PARSE_CONCURRENCY, help="Parallel parses")
+    parser.add_argument("--attempts", type=int, default=PREFETCH_MAX_ATTEMPTS, help="Attempts per match")
+    parser.add_argument(
+        "--retry-delay", type=float, default=PREFETCH_RETRY_DELAY, help="Seconds before first retry (doubles)"
+    )
+    parser.add_argument(
+        "--wait-timeout", type=float, default=PREFETCH_PARSE_WAIT,
+        help="Seconds to wait for OpenDota to parse a match per attempt",
+    )
+    parser.add_argument(
+        "--profile", choices=list(PARSE_PROFILES), default="full", help="Collectors to parse and cache"
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
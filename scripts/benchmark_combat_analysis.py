@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark get_hero_combat_analysis: numpy vs row-by-row aggregation.
+
+Runs the analysis for every hero of a match with both backends, checks the
+responses are identical, and prints the per-match time of each.
+
+Usage:
+    # Synthetic match (no replay needed)
+    uv run python scripts/benchmark_combat_analysis.py
+
+    # Bigger synthetic log, more repeats
+    uv run python scripts/benchmark_combat_analysis.py --entries 300000 --repeat 5
+
+    # A match already in the replay cache
+    uv run python scripts/benchmark_combat_analysis.py --match-id 8461956309
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from python_manta import CombatLogEntry, CombatLogResult, CombatLogType
+
+from src.services.cache.replay_cache import ReplayCache
+from src.services.combat.combat_service import CombatService
+from src.services.combat.fight_service import FightService
+from src.services.models.combat_data import Fight
+from src.services.models.replay_data import ParsedReplayData
+
+HEROES = [
+    "axe", "lina", "earthshaker", "shadow_shaman", "juggernaut",
+    "pudge", "crystal_maiden", "sniper", "tidehunter", "lion",
+]
+ABILITIES = {hero: [f"{hero}_q_spell", f"{hero}_w_spell", f"{hero}_ultimate"] for hero in HEROES}
+TYPE_WEIGHTS = [
+    (CombatLogType.DAMAGE.value, 50),
+    (CombatLogType.HEAL.value, 10),
+    (CombatLogType.MODIFIER_ADD.value, 20),
+    (CombatLogType.MODIFIER_REMOVE.value, 10),
+    (CombatLogType.ABILITY.value, 8),
+    (CombatLogType.DEATH.value, 0.05),  # ~75 deaths in 150k entries
+]
+
+
+def synthetic_match(entries: int, seed: int = 1) -> ParsedReplayData:
+    """A match-sized random combat log over ten heroes, creeps and neutrals."""
+    rng = random.Random(seed)
+    units = [f"npc_dota_hero_{h}" for h in HEROES] + ["npc_dota_creep_goodguys_melee", "npc_dota_neutral_kobold"]
+    types, weights = zip(*TYPE_WEIGHTS)
+    duration = 2400.0
+
+    log = []
+    for i in range(entries):
+        attacker = rng.choice(units)
+        target = rng.choice(units)
+        hero = attacker[len("npc_dota_hero_"):] if attacker.startswith("npc_dota_hero_") else rng.choice(HEROES)
+        ability = rng.choice(ABILITIES[hero])
+        entry_type = rng.choices(types, weights)[0]
+        inflictor = f"modifier_{ability}" if entry_type == CombatLogType.MODIFIER_ADD.value else ability
+        log.append(CombatLogEntry(
+            tick=i,
+            net_tick=i,
+            type=entry_type,
+            type_name="",
+            game_time=duration * i / entries - 90.0,
+            attacker_name=attacker,
+            target_name=target,
+            is_attacker_hero=attacker.startswith("npc_dota_hero_"),
+            is_target_hero=target.startswith("npc_dota_hero_"),
+            inflictor_name=inflictor,
+            value=rng.randint(0, 400),
+            attacker_hero_level=rng.randint(1, 25),
+            target_hero_level=rng.randint(1, 25),
+        ))
+    return ParsedReplayData(match_id=0, replay_path="", combat_log=CombatLogResult(entries=log, success=True))
+
+
+def synthetic_fights(data: ParsedReplayData):
+    """One 20s fight ending at each hero death, all heroes participating.
+
+    The random log has damage everywhere, so real fight detection would
+    merge the whole match into one fight.
+    """
+    deaths = CombatService().get_hero_deaths(data)
+    return [
+        Fight(
+            fight_id=f"fight_{i}",
+            start_time=death.game_time - 20.0,
+            start_time_str="",
+            end_time=death.game_time,
+            end_time_str="",
+            duration=20.0,
+            participants=HEROES,
+        )
+        for i, death in enumerate(deaths)
+    ]
+
+
+def run(service: CombatService, data: ParsedReplayData, heroes, fights):
+    return [service.get_hero_combat_analysis(data, data.match_id, hero, fights) for hero in heroes]
+
+
+def timed(service: CombatService, data: ParsedReplayData, heroes, fights, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = run(service, data, heroes, fights)
+        best = min(best, time.perf_counter() - started)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--match-id", type=int, help="Benchmark a match from the replay cache")
+    parser.add_argument("--entries", type=int, default=150_000, help="Synthetic combat log size")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per backend (best time is reported)")
+    args = parser.parse_args()
+
+    if args.match_id:
+        data = ReplayCache().get(args.match_id)
+        if data is None:
+            sys.exit(f"Match {args.match_id} is not in the replay cache")
+    else:
+        data = synthetic_match(args.entries)
+
+    fights = FightService().get_all_fights_from_combat(data).fights if args.match_id else synthetic_fights(data)
+    heroes = sorted({p for fight in fights for p in fight.participants}) or HEROES
+    print(f"{len(data.combat_log_entries):,} combat log entries, {len(fights)} fights, {len(heroes)} heroes")
+
+    started = time.perf_counter()
+    data.combat_index.arrays()
+    print(f"numpy columns built in {(time.perf_counter() - started) * 1000:.1f} ms (once per match)")
+
+    python_time, expected = timed(CombatService(aggregation_backend="python"), data, heroes, fights, args.repeat)
+    numpy_time, actual = timed(CombatService(aggregation_backend="numpy"), data, heroes, fights, args.repeat)
+    if actual != expected:
+        sys.exit("Backends disagree!")
+
+    print(f"python: {python_time * 1000:8.1f} ms per match")
+    print(f"numpy:  {numpy_time * 1000:8.1f} ms per match")
+    print(f"speedup: {python_time / numpy_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark combat-window fight detection against the previous implementation.
+
+Runs FightDetector.detect_fights_from_combat on a full match's
+DetailLevel.FULL event list with the sliding-window implementation and with
+the previous one (rebuilding the intensity list per event and scanning every
+window per death), checks both detect the same fights, and prints the best
+time of each.
+
+Usage:
+    # Synthetic match (no replay needed)
+    uv run python scripts/benchmark_fight_detection.py
+
+    # Denser synthetic log, more repeats
+    uv run python scripts/benchmark_fight_detection.py --events 400000 --repeat 5
+
+    # A match already in the replay cache
+    uv run python scripts/benchmark_fight_detection.py --match-id 8461956309
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.combat_log import DetailLevel
+from src.services.analyzers.fight_detector import (
+    INTENSITY_WINDOW,
+    MIN_INTENSITY_EVENTS,
+    SERIOUS_COMBAT_ABILITIES,
+    CombatWindow,
+    FightDetector,
+)
+from src.services.cache.replay_cache import ReplayCache
+from src.services.combat.combat_service import CombatService
+from src.services.models.combat_data import CombatLogEvent, HeroDeath
+
+HEROES = [
+    "axe", "lina", "earthshaker", "shadow_shaman", "juggernaut",
+    "pudge", "crystal_maiden", "sniper", "tidehunter", "lion",
+]
+ABILITIES = ["attack", "lina_dragon_slave", "earthshaker_fissure", "item_blink", "pudge_meat_hook", "lion_impale"]
+
+
+class PreviousFightDetector(FightDetector):
+    """FightDetector with the window building and death association it replaced."""
+
+    def _build_combat_windows(self, events: List[CombatLogEvent]) -> List[CombatWindow]:
+        combat_events = [e for e in events if self._is_hero_combat_event(e)]
+        if not combat_events:
+            return []
+        combat_events.sort(key=lambda e: e.game_time)
+
+        windows = []
+        current = CombatWindow()
+        current.start_time = combat_events[0].game_time
+        current.end_time = combat_events[0].game_time
+        recent_events: List[float] = []
+
+        for event in combat_events:
+            event_time = event.game_time
+            recent_events = [t for t in recent_events if event_time - t <= INTENSITY_WINDOW]
+            gap = event_time - current.end_time if current.event_count > 0 else 0
+            should_split = gap > self.combat_gap or (
+                gap > INTENSITY_WINDOW and len(recent_events) < MIN_INTENSITY_EVENTS
+            )
+            if should_split and current.event_count > 0:
+                windows.append(current)
+                current = CombatWindow()
+                current.start_time = event_time
+                recent_events = []
+
+            current.end_time = event_time
+            current.event_count += 1
+            recent_events.append(event_time)
+            if event.attacker_is_hero:
+                current.heroes_involved.add(self._clean_hero_name(event.attacker))
+            if event.target_is_hero:
+                current.heroes_involved.add(self._clean_hero_name(event.target))
+            ability = event.ability
+            if ability and ability not in ("dota_unknown", "attack"):
+                current.abilities_used.add(ability)
+                if ability in SERIOUS_COMBAT_ABILITIES:
+                    current.serious_abilities.add(ability)
+            if event.type == "DAMAGE":
+                current.damage_events += 1
+
+        if current.event_count > 0:
+            windows.append(current)
+        return windows
+
+    def _associate_deaths(self, windows: List[CombatWindow], deaths: List[HeroDeath]):
+        for death in deaths:
+            for window in windows:
+                if window.start_time - 2.0 <= death.game_time <= window.end_time + 2.0:
+                    window.deaths.append(death)
+                    window.heroes_involved.add(self._clean_hero_name(death.victim))
+                    if death.killer_is_hero:
+                        window.heroes_involved.add(self._clean_hero_name(death.killer))
+                    break
+
+
+def synthetic_match(events: int, seed: int = 1):
+    """Hero combat in bursts (fights) separated by quiet laning, plus deaths inside the bursts."""
+    rng = random.Random(seed)
+    log: List[CombatLogEvent] = []
+    deaths: List[HeroDeath] = []
+    game_time = 0.0
+    while len(log) < events:
+        in_fight = rng.random() < 0.3
+        burst = rng.randint(200, 2000) if in_fight else rng.randint(5, 40)
+        step = 0.01 if in_fight else 1.5
+        for _ in range(burst):
+            game_time += rng.uniform(0, 2 * step)
+            attacker, target = rng.sample(HEROES, 2)
+            log.append(CombatLogEvent(
+                type=rng.choice(["DAMAGE", "DAMAGE", "ABILITY", "MODIFIER_ADD"]),
+                game_time=game_time,
+                game_time_str="",
+                attacker=attacker,
+                attacker_is_hero=True,
+                target=target,
+                target_is_hero=rng.random() < 0.8,
+                ability=rng.choice(ABILITIES),
+                value=rng.randint(0, 300),
+            ))
+            if in_fight and rng.random() < 0.002:
+                deaths.append(HeroDeath(
+                    game_time=game_time, game_time_str="", killer=attacker, victim=target, killer_is_hero=True
+                ))
+        game_time += rng.uniform(10, 60)
+    return log, deaths
+
+
+def timed(detector: FightDetector, events, deaths, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = detector.detect_fights_from_combat(events, deaths)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--match-id", type=int, help="Benchmark a match from the replay cache")
+    parser.add_argument("--events", type=int, default=150_000, help="Synthetic event list size")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation (best time is reported)")
+    args = parser.parse_args()
+
+    if args.match_id:
+        data = ReplayCache().get(args.match_id)
+        if data is None:
+            sys.exit(f"Match {args.match_id} is not in the replay cache")
+        combat = CombatService()
+        events = combat.get_combat_log(data, detail_level=DetailLevel.FULL)
+        deaths = combat.get_hero_deaths(data)
+    else:
+        events, deaths = synthetic_match(args.events)
+
+    print(f"{len(events):,} FULL combat log events, {len(deaths)} hero deaths")
+
+    previous_time, expected = timed(PreviousFightDetector(), events, deaths, args.repeat)
+    current_time, actual = timed(FightDetector(), events, deaths, args.repeat)
+    if actual != expected:
+        sys.exit("Implementations detect different fights!")
+
+    print(f"{actual.total_fights} fights, {actual.teamfights} teamfights")
+    print(f"previous:       {previous_time * 1000:8.1f} ms")
+    print(f"sliding window: {current_time * 1000:8.1f} ms")
+    print(f"speedup: {previous_time / current_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
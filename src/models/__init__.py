@@ -53,10 +53,12 @@ from .tool_responses import (
     PositionPoint,
     PositionTimelineResponse,
     SnapshotAtTimeResponse,
+    SnapshotsAtTimesResponse,
     StatsAtMinuteResponse,
     TeamfightsResponse,
     TeamGraphs,
     TeamScores,
+    TimedSnapshot,
 )
 
 __all__ = [
@@ -112,8 +114,10 @@ __all__ = [
     "PositionPoint",
     "PositionTimelineResponse",
     "SnapshotAtTimeResponse",
+    "SnapshotsAtTimesResponse",
     "StatsAtMinuteResponse",
     "TeamfightsResponse",
     "TeamGraphs",
     "TeamScores",
+    "TimedSnapshot",
 ]
@@ -128,6 +128,10 @@ class CombatLogResponse(BaseModel):
         default=False,
         description="True if results were truncated due to max_events limit"
     )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Pass as cursor to get the next page; None when there are no more events"
+    )
     detail_level: str = Field(
         default="narrative",
         description="Detail level used: narrative, tactical, or full"
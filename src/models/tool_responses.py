@@ -434,6 +434,28 @@ class SnapshotAtTimeResponse(BaseModel):
     error: Optional[str] = None
 
 
+class TimedSnapshot(BaseModel):
+    """Game state served for one requested time."""
+
+    requested_time: float = Field(description="Requested game time in seconds")
+    tick: CoercedInt = Field(description="Game tick of the snapshot")
+    game_time: float = Field(description="Game time of the snapshot in seconds")
+    game_time_str: str = Field(description="Game time as M:SS")
+    radiant_gold: CoercedInt = Field(default=0, description="Radiant total gold")
+    dire_gold: CoercedInt = Field(default=0, description="Dire total gold")
+    heroes: List[HeroSnapshot] = Field(default_factory=list)
+
+
+class SnapshotsAtTimesResponse(BaseModel):
+    """Response for get_snapshots_at_times tool."""
+
+    success: bool
+    match_id: int
+    snapshots: List[TimedSnapshot] = Field(default_factory=list, description="One per requested time, in request order")
+    missing_times: List[float] = Field(default_factory=list, description="Requested times past the end of the replay")
+    error: Optional[str] = None
+
+
 class PositionPoint(BaseModel):
     """A position at a specific tick."""
 
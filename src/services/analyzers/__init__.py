@@ -4,5 +4,8 @@ Post-parse analyzers for derived data.
 
 from .fight_analyzer import FightAnalyzer
 from .fight_detector import FightDetector
+from .fight_index import FightIndex
+from .hero_timeline import HeroState, HeroTimeline
+from .interval_index import IntervalIndex
 
-__all__ = ["FightAnalyzer", "FightDetector"]
+__all__ = ["FightAnalyzer", "FightDetector", "FightIndex", "HeroState", "HeroTimeline", "IntervalIndex"]
@@ -257,11 +257,14 @@ class FightAnalyzer:
         """
         highlights = FightHighlights()
 
+        # Group hero hits by ability window once for both AoE passes
+        tracked_windows, aoe_windows = self._group_ability_hits(events)
+
         # Detect multi-hero abilities (big teamfight abilities like Chrono, Black Hole)
-        highlights.multi_hero_abilities = self._detect_multi_hero_abilities(events)
+        highlights.multi_hero_abilities = self._detect_multi_hero_abilities(tracked_windows)
 
         # Detect generic AoE hits (ANY ability hitting 3+ heroes)
-        highlights.generic_aoe_hits = self._detect_generic_aoe_hits(events)
+        highlights.generic_aoe_hits = self._detect_generic_aoe_hits(aoe_windows)
 
         # Detect kill streaks
         highlights.kill_streaks = self._detect_kill_streaks(deaths)
@@ -288,40 +291,29 @@ class FightAnalyzer:
 
         return highlights
 
-    def _detect_multi_hero_abilities(
-        self, events: List[CombatLogEvent]
-    ) -> List[MultiHeroAbility]:
-        """
-        Detect abilities that hit multiple heroes.
+    def _add_hit(self, windows: Dict[tuple, Dict], key: tuple, caster: str, target: str, game_time: float):
+        """Add a hero hit to its (ability, ...) window; the window's first hit sets caster and time."""
+        window = windows.get(key)
+        if window is None:
+            window = windows[key] = {"targets": set(), "caster": caster, "time": game_time, "ability": key[0]}
+        window["targets"].add(target)
 
-        Groups MODIFIER_ADD and ABILITY events by ability within 0.5s window.
+    def _group_ability_hits(self, events: List[CombatLogEvent]) -> Tuple[Dict[tuple, Dict], Dict[tuple, Dict]]:
         """
-        multi_hits: List[MultiHeroAbility] = []
+        Group hero hits into 0.5s ability windows in one pass over the events.
 
-        # Group events by ability within time windows
-        # Key: (ability, window_start) -> {targets, caster, first_time}
-        ability_windows: Dict[str, Dict] = defaultdict(
-            lambda: {"targets": set(), "caster": None, "time": None}
-        )
+        Returns:
+            Tuple of (big teamfight ability windows keyed by (ability, window),
+            any-ability windows keyed by (ability, caster, window))
+        """
+        tracked_windows: Dict[tuple, Dict] = {}
+        aoe_windows: Dict[tuple, Dict] = {}
 
         for event in events:
             ability = self._clean_ability_name(event.ability)
             if not ability:
                 continue
 
-            # Check if it's a tracked ability
-            tracked_ability = None
-            if ability in BIG_TEAMFIGHT_ABILITIES:
-                tracked_ability = ability
-            elif event.type == "MODIFIER_ADD":
-                # Check if modifier maps to a tracked ability
-                modifier_name = ability
-                if modifier_name in ABILITY_MODIFIERS:
-                    tracked_ability = ABILITY_MODIFIERS[modifier_name]
-
-            if not tracked_ability:
-                continue
-
             # Only count if target is a hero
             if not event.target_is_hero:
                 continue
@@ -333,22 +325,35 @@ class FightAnalyzer:
             if target == caster:
                 continue
 
-            # Create window key (round to 0.5s windows)
-            window_key = f"{tracked_ability}_{int(event.game_time * 2)}"
+            # Round to 0.5s windows
+            slot = int(event.game_time * 2)
 
-            window = ability_windows[window_key]
-            window["targets"].add(target)
-            if window["caster"] is None:
-                window["caster"] = caster
-                window["time"] = event.game_time
-                window["ability"] = tracked_ability
+            # Check if it's a tracked ability (or a modifier mapping to one)
+            tracked_ability = None
+            if ability in BIG_TEAMFIGHT_ABILITIES:
+                tracked_ability = ability
+            elif event.type == "MODIFIER_ADD":
+                tracked_ability = ABILITY_MODIFIERS.get(ability)
+            if tracked_ability:
+                self._add_hit(tracked_windows, (tracked_ability, slot), caster, target, event.game_time)
 
-        # Convert windows to MultiHeroAbility
-        for window_data in ability_windows.values():
-            window_ability: str = window_data.get("ability", "")
-            if not window_ability:
-                continue
+            # Any ability except basic attacks, per caster
+            if ability not in ("attack", "dota_unknown"):
+                self._add_hit(aoe_windows, (ability, caster, slot), caster, target, event.game_time)
+
+        return tracked_windows, aoe_windows
+
+    def _detect_multi_hero_abilities(self, ability_windows: Dict[tuple, Dict]) -> List[MultiHeroAbility]:
+        """
+        Detect abilities that hit multiple heroes.
 
+        Reads the big teamfight ability windows of _group_ability_hits
+        (MODIFIER_ADD and ABILITY events by ability within 0.5s).
+        """
+        multi_hits: List[MultiHeroAbility] = []
+
+        for window_data in ability_windows.values():
+            window_ability: str = window_data["ability"]
             display_name, min_heroes = BIG_TEAMFIGHT_ABILITIES.get(
                 window_ability, (window_ability, 2)
             )
@@ -372,57 +377,18 @@ class FightAnalyzer:
         multi_hits.sort(key=lambda x: x.game_time)
         return multi_hits
 
-    def _detect_generic_aoe_hits(
-        self, events: List[CombatLogEvent]
-    ) -> List[GenericAoEHit]:
+    def _detect_generic_aoe_hits(self, ability_windows: Dict[tuple, Dict]) -> List[GenericAoEHit]:
         """
         Detect ANY ability that hit 3+ heroes.
 
         This is pattern-based - no hardcoded ability list needed.
         Detects things like: 3-man Lina stun, 4-hero Warlock golem hit, etc.
+        Reads the any-ability windows of _group_ability_hits.
         """
         aoe_hits: List[GenericAoEHit] = []
 
-        # Group ALL ability/damage/modifier events by (ability, time_window)
-        # Key: (ability, window_start) -> {targets, caster, first_time}
-        ability_windows: Dict[str, Dict] = defaultdict(
-            lambda: {"targets": set(), "caster": None, "time": None}
-        )
-
-        for event in events:
-            ability = self._clean_ability_name(event.ability)
-            if not ability:
-                continue
-
-            # Skip basic attacks and non-hero targets
-            if ability in ("attack", "dota_unknown"):
-                continue
-            if not event.target_is_hero:
-                continue
-
-            target = self._clean_hero_name(event.target)
-            caster = self._clean_hero_name(event.attacker)
-
-            # Skip self-targeting
-            if target == caster:
-                continue
-
-            # Create window key (round to 0.5s windows)
-            window_key = f"{ability}_{caster}_{int(event.game_time * 2)}"
-
-            window = ability_windows[window_key]
-            window["targets"].add(target)
-            if window["caster"] is None:
-                window["caster"] = caster
-                window["time"] = event.game_time
-                window["ability"] = ability
-
-        # Convert windows to GenericAoEHit for abilities hitting 3+ heroes
         for window_data in ability_windows.values():
-            window_ability: str = window_data.get("ability", "")
-            if not window_ability:
-                continue
-
+            window_ability: str = window_data["ability"]
             targets = list(window_data["targets"])
             hero_count = len(targets)
 
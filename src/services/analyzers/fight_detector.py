@@ -7,10 +7,14 @@ before anyone dies, and properly captures the initiation phase.
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from itertools import pairwise
+from typing import Deque, List, Optional, Set
 
 from ..models.combat_data import CombatLogEvent, Fight, FightResult, HeroDeath
+from .fight_index import FightIndex
+from .interval_index import IntervalIndex
 
 logger = logging.getLogger(__name__)
 
@@ -193,6 +197,11 @@ class FightDetector:
 
         Uses combat intensity (events per second) to determine fight boundaries,
         not just time gaps. This separates sustained poke/siege from real fights.
+
+        One sweep over the time-ordered hero combat events: the events of the
+        last INTENSITY_WINDOW seconds are a deque trimmed from the left as
+        time advances (each event enters and leaves it once), and each window
+        keeps running counters. Out-of-order input is sorted first.
         """
         # Filter to hero combat events
         combat_events = [e for e in events if self._is_hero_combat_event(e)]
@@ -200,20 +209,22 @@ class FightDetector:
         if not combat_events:
             return []
 
-        # Sort by time
-        combat_events.sort(key=lambda e: e.game_time)
+        # Combat logs arrive time-ordered: only sort input that is not
+        if any(later.game_time < earlier.game_time for earlier, later in pairwise(combat_events)):
+            combat_events.sort(key=lambda e: e.game_time)
 
         windows = []
         current = CombatWindow()
         current.start_time = combat_events[0].game_time
         current.end_time = combat_events[0].game_time
-        recent_events: List[float] = []  # Track event times for intensity calc
+        recent_events: Deque[float] = deque()  # Event times within INTENSITY_WINDOW, oldest first
 
         for event in combat_events:
             event_time = event.game_time
 
-            # Remove old events from intensity tracking
-            recent_events = [t for t in recent_events if event_time - t <= INTENSITY_WINDOW]
+            # Drop events that left the intensity window
+            while recent_events and event_time - recent_events[0] > INTENSITY_WINDOW:
+                recent_events.popleft()
 
             # Calculate gap since last event
             gap = event_time - current.end_time if current.event_count > 0 else 0
@@ -234,7 +245,7 @@ class FightDetector:
                 # Start new window
                 current = CombatWindow()
                 current.start_time = event_time
-                recent_events = []
+                recent_events.clear()
 
             # Update current window
             current.end_time = event_time
@@ -266,19 +277,19 @@ class FightDetector:
 
     def _associate_deaths(self, windows: List[CombatWindow], deaths: List[HeroDeath]):
         """Associate deaths with their combat windows."""
+        # Death within window or shortly after (grace period for kill attribution)
+        window_index = IntervalIndex(windows, lambda w: w.start_time, lambda w: w.end_time)
         for death in deaths:
-            death_time = death.game_time
-
-            # Find window containing this death
-            for window in windows:
-                # Death within window or shortly after (grace period for kill attribution)
-                if window.start_time - 2.0 <= death_time <= window.end_time + 2.0:
-                    window.deaths.append(death)
-                    # Add killer and victim to participants
-                    window.heroes_involved.add(self._clean_hero_name(death.victim))
-                    if death.killer_is_hero:
-                        window.heroes_involved.add(self._clean_hero_name(death.killer))
-                    break
+            # First window containing this death
+            containing = window_index.containing_positions(death.game_time, before=2.0, after=2.0)
+            if not containing:
+                continue
+            window = windows[containing[0]]
+            window.deaths.append(death)
+            # Add killer and victim to participants
+            window.heroes_involved.add(self._clean_hero_name(death.victim))
+            if death.killer_is_hero:
+                window.heroes_involved.add(self._clean_hero_name(death.killer))
 
     def _window_to_fight(self, window: CombatWindow, fight_number: int) -> Fight:
         """Convert a CombatWindow to a Fight."""
@@ -377,36 +388,7 @@ class FightDetector:
         For combat-based detection, use get_fight_at_time_from_combat().
         """
         result = self.detect_fights(deaths)
-
-        if not result.fights:
-            return None
-
-        best_fight = None
-        best_distance = float('inf')
-
-        for fight in result.fights:
-            # Check if reference_time is within or near fight
-            if fight.start_time - 5.0 <= reference_time <= fight.end_time + 15.0:
-                if hero:
-                    hero_lower = hero.lower()
-                    if any(hero_lower in p.lower() for p in fight.participants):
-                        return fight
-                else:
-                    return fight
-
-            mid_time = (fight.start_time + fight.end_time) / 2
-            distance = abs(mid_time - reference_time)
-            if distance < best_distance:
-                if hero:
-                    hero_lower = hero.lower()
-                    if any(hero_lower in p.lower() for p in fight.participants):
-                        best_distance = distance
-                        best_fight = fight
-                else:
-                    best_distance = distance
-                    best_fight = fight
-
-        return best_fight
+        return FightIndex(result, ()).fight_at(reference_time, hero, before=5.0, after=15.0)
 
     def get_fight_at_time_from_combat(
         self,
@@ -428,36 +410,29 @@ class FightDetector:
             Fight containing reference_time, or None
         """
         result = self.detect_fights_from_combat(events, deaths)
+        return self._find_fight_at_time(result.fights, reference_time, hero)
+
+    def _find_fight_at_time(
+        self,
+        fights: List[Fight],
+        reference_time: float,
+        hero: Optional[str] = None,
+    ) -> Optional[Fight]:
+        """
+        Pick the fight at reference time from already detected fights.
 
-        if not result.fights:
-            return None
-
-        best_fight = None
-        best_distance = float('inf')
-
-        for fight in result.fights:
-            # Check if reference_time is within fight (with buffer)
-            if fight.start_time - 3.0 <= reference_time <= fight.end_time + 5.0:
-                if hero:
-                    hero_lower = hero.lower()
-                    if any(hero_lower in p.lower() for p in fight.participants):
-                        return fight
-                else:
-                    return fight
-
-            mid_time = (fight.start_time + fight.end_time) / 2
-            distance = abs(mid_time - reference_time)
-            if distance < best_distance:
-                if hero:
-                    hero_lower = hero.lower()
-                    if any(hero_lower in p.lower() for p in fight.participants):
-                        best_distance = distance
-                        best_fight = fight
-                else:
-                    best_distance = distance
-                    best_fight = fight
-
-        return best_fight
+        Returns the first fight whose window (with buffer) contains
+        reference_time, else the fight with the nearest midpoint.
+
+        Args:
+            fights: Detected fights, in time order
+            reference_time: Game time to search around
+            hero: Optional hero filter
+
+        Returns:
+            Fight containing reference_time, or None
+        """
+        return FightIndex(FightResult(fights=fights), ()).fight_at(reference_time, hero, before=3.0, after=5.0)
 
     def get_teamfights(self, deaths: List[HeroDeath]) -> List[Fight]:
         """Get only teamfights (3+ deaths) - legacy method."""
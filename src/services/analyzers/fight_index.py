@@ -0,0 +1,142 @@
+"""
+Memoised fight detection result of a match, indexed for lookups.
+
+FightService detects fights once per match and detector configuration (see
+ParsedReplayData.fight_index) and wraps the FightResult in a FightIndex:
+
+- fight id -> fight, for get_fight_by_id / get_deaths_in_fight
+- an IntervalIndex over fight windows, for "fight at time T"
+- per-hero fight lists, for hero-anchored lookups
+- highlights per fight, so FightAnalyzer runs once per fight, not per call
+
+Lookups keep FightDetector's rules: the first fight (in time order) whose
+buffered window contains T, else the fight with the nearest midpoint.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import logging
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from python_manta import CombatLogEntry
+
+from ..models.combat_data import Fight, FightHighlights, FightResult
+from .interval_index import IntervalIndex
+
+logger = logging.getLogger(__name__)
+
+
+class _FightLookup:
+    """Interval and midpoint indexes over one list of fights."""
+
+    def __init__(self, fights: List[Fight]):
+        self.fights = fights
+        self.intervals = IntervalIndex(fights, lambda f: f.start_time, lambda f: f.end_time)
+        # (midpoint, position), so equal midpoints keep time order
+        self.midpoints: List[Tuple[float, int]] = sorted(
+            ((f.start_time + f.end_time) / 2, i) for i, f in enumerate(fights)
+        )
+        self._mids = [mid for mid, _ in self.midpoints]
+
+    def nearest(self, t: float) -> Optional[Fight]:
+        """Fight with the midpoint nearest to t, earliest on ties."""
+        mids = self._mids
+        right = bisect_left(mids, t)
+        candidates = []
+        if right < len(mids):
+            candidates.append(right)
+        if right > 0:
+            candidates.append(bisect_left(mids, mids[right - 1]))  # First of equal midpoints
+        if not candidates:
+            return None
+        best = min(candidates, key=lambda i: (abs(mids[i] - t), self.midpoints[i][1]))
+        return self.fights[self.midpoints[best][1]]
+
+
+class FightIndex:
+    """
+    A match's detected fights with id, time and hero lookups.
+
+    Built once per (match, detector parameters) and shared by every tool
+    call on that match; treat the fights it returns as read-only.
+    """
+
+    def __init__(self, result: FightResult, entries: Sequence[CombatLogEntry]):
+        self.result = result
+        self._entries = entries
+        self._by_id: Dict[str, Fight] = {}
+        for fight in result.fights:
+            self._by_id.setdefault(fight.fight_id, fight)
+        self._all = _FightLookup(result.fights)
+        self._by_hero: Dict[str, _FightLookup] = {}
+        self._highlights: Dict[str, FightHighlights] = {}
+        self._lock = threading.Lock()
+
+    def covers(self, entries: Sequence[CombatLogEntry]) -> bool:
+        """Check if this index was detected from exactly these combat log entries."""
+        return entries is self._entries
+
+    @property
+    def fights(self) -> List[Fight]:
+        """Detected fights, in time order."""
+        return self.result.fights
+
+    def fight(self, fight_id: str) -> Optional[Fight]:
+        """Fight with an id, None if there is none."""
+        return self._by_id.get(fight_id)
+
+    def _lookup(self, hero: Optional[str]) -> _FightLookup:
+        if not hero:
+            return self._all
+        needle = hero.lower()
+        with self._lock:
+            lookup = self._by_hero.get(needle)
+        if lookup is None:
+            lookup = _FightLookup([
+                f for f in self.result.fights if any(needle in p.lower() for p in f.participants)
+            ])
+            with self._lock:
+                self._by_hero[needle] = lookup
+        return lookup
+
+    def hero_fights(self, hero: str) -> List[Fight]:
+        """Fights with a participant matching hero (case-insensitive substring)."""
+        return list(self._lookup(hero).fights)
+
+    def fight_at(
+        self,
+        reference_time: float,
+        hero: Optional[str] = None,
+        before: float = 3.0,
+        after: float = 5.0,
+    ) -> Optional[Fight]:
+        """
+        Fight at a reference time.
+
+        Args:
+            reference_time: Game time to search around
+            hero: Only fights this hero took part in
+            before: Seconds before a fight's start that still count as in it
+            after: Seconds after a fight's end that still count as in it
+
+        Returns:
+            First fight whose widened window contains reference_time, else the
+            fight with the nearest midpoint, or None if there are no fights
+        """
+        lookup = self._lookup(hero)
+        containing = lookup.intervals.containing_positions(reference_time, before, after)
+        if containing:
+            return lookup.fights[containing[0]]
+        return lookup.nearest(reference_time)
+
+    def highlights(self, fight: Fight, compute: Callable[[], FightHighlights]) -> FightHighlights:
+        """Highlights of a fight, computed on first request."""
+        with self._lock:
+            highlights = self._highlights.get(fight.fight_id)
+        if highlights is None:
+            highlights = compute()
+            with self._lock:
+                highlights = self._highlights.setdefault(fight.fight_id, highlights)
+        return highlights
@@ -0,0 +1,250 @@
+"""
+Per-hero state time series built from entity snapshots.
+
+Services look up a hero's position, level or farm at an event time many
+times per request (once per death, creep kill or rotation). Scanning every
+snapshot for each lookup is quadratic in match length, so the snapshots are
+turned once per match (see ParsedReplayData.hero_timeline) into one column
+per field and hero, indexed by snapshot time, and looked up with bisect.
+
+Lookups keep the services' rules: the snapshot nearest in time is used
+(earlier one on ties), optionally only within a maximum gap, and heroes are
+matched by case-insensitive substring of the name without npc_dota_hero_.
+Positions can also be linearly interpolated between a hero's snapshots.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import logging
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from python_manta import EntitySnapshot
+
+from ..combat.combat_log_symbols import clean_name
+
+logger = logging.getLogger(__name__)
+
+# Columns kept per hero: (field, array typecode)
+HERO_STATE_FIELDS = (
+    ("x", "d"),
+    ("y", "d"),
+    ("level", "q"),
+    ("gold", "q"),
+    ("last_hits", "q"),
+    ("denies", "q"),
+    ("health", "q"),
+)
+
+
+@dataclass
+class HeroState:
+    """A hero's state at one snapshot (or interpolated between two)."""
+
+    hero: str
+    game_time: float  # Time of the snapshot, or the requested time when interpolated
+    tick: int
+    player_id: int
+    x: float
+    y: float
+    level: int
+    gold: int
+    last_hits: int
+    denies: int
+    health: int
+
+
+class HeroSeries:
+    """One hero's state columns, ordered by snapshot time."""
+
+    def __init__(self, hero: str, player_id: int):
+        self.hero = hero
+        self.player_id = player_id
+        self.slots: List[int] = []  # Snapshot position in the timeline
+        self.columns: Dict[str, array] = {name: array(code) for name, code in HERO_STATE_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def append(self, slot: int, hero_snap) -> None:
+        self.slots.append(slot)
+        for name, _ in HERO_STATE_FIELDS:
+            self.columns[name].append(getattr(hero_snap, name) or 0)
+
+    def position_of(self, slot: int) -> Optional[int]:
+        """Row of this hero at a timeline slot, None if the hero was not in that snapshot."""
+        row = bisect_left(self.slots, slot)
+        if row < len(self.slots) and self.slots[row] == slot:
+            return row
+        return None
+
+
+class HeroTimeline:
+    """
+    Hero state columns for a match, indexed by snapshot time.
+
+    Built once from the entity snapshots; every lookup is a bisect over the
+    snapshot times plus one over the hero's own rows.
+    """
+
+    def __init__(self, snapshots: Sequence[EntitySnapshot]):
+        self._snapshots = snapshots
+        order = sorted(range(len(snapshots)), key=lambda i: snapshots[i].game_time)
+        self._times: List[float] = [snapshots[i].game_time for i in order]
+        self._ticks: List[int] = [snapshots[i].tick for i in order]
+        self._series: Dict[str, HeroSeries] = {}
+        self._slot_heroes: List[List[str]] = []  # Hero names per snapshot, in snapshot order
+        self._matches: Dict[str, List[str]] = {}
+
+        for slot, position in enumerate(order):
+            names = []
+            for hero_snap in snapshots[position].heroes:
+                hero = clean_name(hero_snap.hero_name)
+                if not hero:
+                    continue
+                series = self._series.get(hero)
+                if series is None:
+                    series = self._series[hero] = HeroSeries(hero, hero_snap.player_id)
+                if series.slots and series.slots[-1] == slot:
+                    continue  # Duplicate hero entry in one snapshot: keep the first, as lookups did
+                series.append(slot, hero_snap)
+                names.append(hero)
+            self._slot_heroes.append(names)
+
+    def covers(self, snapshots: Sequence[EntitySnapshot]) -> bool:
+        """Check if this timeline was built from exactly these snapshots."""
+        return snapshots is self._snapshots and len(snapshots) == len(self._times)
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    @property
+    def heroes(self) -> List[str]:
+        """Hero names, in order of first appearance."""
+        return list(self._series)
+
+    def series(self, hero: str) -> Optional[HeroSeries]:
+        """Series of the first hero matching a name (case-insensitive substring)."""
+        matches = self._matching(hero)
+        return self._series[matches[0]] if matches else None
+
+    def _matching(self, hero: str) -> List[str]:
+        needle = hero.lower()
+        matches = self._matches.get(needle)
+        if matches is None:
+            matches = self._matches[needle] = [name for name in self._series if needle in name.lower()]
+        return matches
+
+    def nearest_slot(self, game_time: float, max_gap: Optional[float] = None) -> Optional[int]:
+        """Slot of the snapshot nearest to game_time (earlier one on ties), None if none within max_gap."""
+        times = self._times
+        if not times:
+            return None
+        right = bisect_left(times, game_time)
+        if right == 0:
+            slot = 0
+        else:
+            before = bisect_left(times, times[right - 1])  # First of equal times, as a linear scan finds
+            slot = before if right == len(times) or game_time - times[before] <= times[right] - game_time else right
+        if max_gap is not None and abs(times[slot] - game_time) > max_gap:
+            return None
+        return slot
+
+    def _state(self, series: HeroSeries, row: int) -> HeroState:
+        columns = series.columns
+        slot = series.slots[row]
+        return HeroState(
+            hero=series.hero,
+            game_time=self._times[slot],
+            tick=self._ticks[slot],
+            player_id=series.player_id,
+            **{name: columns[name][row] for name, _ in HERO_STATE_FIELDS},
+        )
+
+    def state_at(
+        self,
+        hero: str,
+        game_time: float,
+        max_gap: Optional[float] = None,
+        interpolate: bool = False,
+    ) -> Optional[HeroState]:
+        """
+        Get a hero's state at a game time.
+
+        Args:
+            hero: Hero name (case-insensitive substring, e.g. "shaker")
+            game_time: Game time to look up
+            max_gap: Only use snapshots at most this many seconds away
+            interpolate: Interpolate x/y linearly between the hero's snapshots
+                around game_time (other fields come from the earlier one)
+
+        Returns:
+            HeroState, or None if the hero is not in the nearest snapshot
+            or no snapshot is close enough
+        """
+        if interpolate:
+            return self._interpolated(hero, game_time, max_gap)
+
+        slot = self.nearest_slot(game_time, max_gap)
+        if slot is None:
+            return None
+        needle = hero.lower()
+        for name in self._slot_heroes[slot]:
+            if needle in name.lower():
+                series = self._series[name]
+                return self._state(series, series.position_of(slot))
+        return None
+
+    def _interpolated(self, hero: str, game_time: float, max_gap: Optional[float]) -> Optional[HeroState]:
+        series = self.series(hero)
+        if series is None or not len(series):
+            return None
+        row = self._row_after(series, game_time)
+
+        if row == 0 or row == len(series):
+            edge = 0 if row == 0 else row - 1
+            if max_gap is not None and abs(self._times[series.slots[edge]] - game_time) > max_gap:
+                return None
+            return self._state(series, edge)
+
+        before, after = self._times[series.slots[row - 1]], self._times[series.slots[row]]
+        if max_gap is not None and min(game_time - before, after - game_time) > max_gap:
+            return None
+        state = self._state(series, row - 1)
+        fraction = (game_time - before) / (after - before) if after > before else 0.0
+        state.x += (series.columns["x"][row] - state.x) * fraction
+        state.y += (series.columns["y"][row] - state.y) * fraction
+        state.game_time = game_time
+        return state
+
+    def _row_after(self, series: HeroSeries, game_time: float) -> int:
+        """First row of a series with snapshot time after game_time."""
+        return bisect_left(series.slots, bisect_right(self._times, game_time))
+
+    def states_at(self, game_time: float, max_gap: Optional[float] = None) -> List[HeroState]:
+        """Every hero's state in the snapshot nearest to game_time, in snapshot order."""
+        slot = self.nearest_slot(game_time, max_gap)
+        if slot is None:
+            return []
+        states = []
+        for name in self._slot_heroes[slot]:
+            series = self._series[name]
+            states.append(self._state(series, series.position_of(slot)))
+        return states
+
+    def history(
+        self,
+        hero: str,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> List[HeroState]:
+        """A hero's states for snapshots with start_time <= game_time <= end_time, in time order."""
+        series = self.series(hero)
+        if series is None:
+            return []
+        lo = 0 if start_time is None else bisect_left(self._times, start_time)
+        hi = len(self._times) if end_time is None else bisect_right(self._times, end_time)
+        first, last = bisect_left(series.slots, lo), bisect_left(series.slots, hi)
+        return [self._state(series, row) for row in range(first, last)]
@@ -0,0 +1,103 @@
+"""
+Static time indexes for range and overlap queries.
+
+Services repeatedly ask "which deaths / rune pickups / fights fall in
+[t - a, t + b]" for many t (every rotation, rune spawn or fight). These
+indexes sort the items once and answer each query with bisect:
+
+- TimeIndex: items at a point in time; items between two times
+- IntervalIndex: items spanning [start, end]; items containing a time or
+  overlapping a range. Items are sorted by start with a running maximum of
+  their ends, so a query bisects to the first item whose running end
+  reaches the range and walks forward only until starts pass it: the
+  flattened form of an interval tree for a set built once and queried often.
+
+Results always keep the items' original order, so "first match" rules of
+the linear scans they replace still hold.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Callable, Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class TimeIndex(Generic[T]):
+    """Items indexed by a game time; results keep the items' original order."""
+
+    def __init__(self, items: Sequence[T], time: Callable[[T], float]):
+        self._items = list(items)
+        self._item_times: List[float] = [time(item) for item in self._items]
+        self._order: List[int] = sorted(range(len(self._items)), key=self._item_times.__getitem__)
+        self._times: List[float] = [self._item_times[i] for i in self._order]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def items(self) -> List[T]:
+        """Indexed items, in their original order."""
+        return list(self._items)
+
+    def positions_between(self, start: float, end: float) -> List[int]:
+        """Original positions of items with start <= time <= end, ascending."""
+        lo = bisect_left(self._times, start)
+        hi = bisect_right(self._times, end)
+        return sorted(self._order[lo:hi])
+
+    def between(self, start: float, end: float) -> List[T]:
+        """Items with start <= time <= end, in original order."""
+        return [self._items[i] for i in self.positions_between(start, end)]
+
+    def near(self, t: float, radius: float) -> List[T]:
+        """Items with abs(time - t) <= radius, in original order."""
+        times = self._item_times
+        return [
+            self._items[i] for i in self.positions_between(t - radius, t + radius) if abs(times[i] - t) <= radius
+        ]
+
+
+class IntervalIndex(Generic[T]):
+    """Items indexed by their [start, end] interval; results keep the items' original order."""
+
+    def __init__(self, items: Sequence[T], start: Callable[[T], float], end: Callable[[T], float]):
+        self._items = list(items)
+        order = sorted(range(len(self._items)), key=lambda i: start(self._items[i]))
+        self._order: List[int] = order
+        self._starts: List[float] = [start(self._items[i]) for i in order]
+        self._ends: List[float] = [end(self._items[i]) for i in order]
+        self._max_ends: List[float] = list(accumulate(self._ends, max))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def items(self) -> List[T]:
+        """Indexed items, in their original order."""
+        return list(self._items)
+
+    def containing_positions(self, t: float, before: float = 0.0, after: float = 0.0) -> List[int]:
+        """Original positions of items with start - before <= t <= end + after, ascending."""
+        # Bounds compare exactly as start - before <= t <= end + after would
+        first = bisect_left(self._max_ends, t, key=lambda e: e + after)
+        last = bisect_right(self._starts, t, key=lambda s: s - before)
+        ends, order = self._ends, self._order
+        return sorted(order[i] for i in range(first, last) if ends[i] + after >= t)
+
+    def containing(self, t: float, before: float = 0.0, after: float = 0.0) -> List[T]:
+        """Items with start - before <= t <= end + after, in original order."""
+        return [self._items[i] for i in self.containing_positions(t, before, after)]
+
+    def overlapping_positions(self, start: float, end: float) -> List[int]:
+        """Original positions of items with item start <= end and item end >= start, ascending."""
+        first = bisect_left(self._max_ends, start)
+        last = bisect_right(self._starts, end)
+        ends, order = self._ends, self._order
+        return sorted(order[i] for i in range(first, last) if ends[i] >= start)
+
+    def overlapping(self, start: float, end: float) -> List[T]:
+        """Items overlapping [start, end], in original order."""
+        return [self._items[i] for i in self.overlapping_positions(start, end)]
@@ -2,6 +2,8 @@
 Cache services for persistent data storage.
 """
 
+from .derived_cache import DerivedResultCache
+from .memory_cache import MemoryReplayCache
 from .replay_cache import ReplayCache
 
-__all__ = ["ReplayCache"]
+__all__ = ["ReplayCache", "MemoryReplayCache", "DerivedResultCache"]
@@ -0,0 +1,200 @@
+"""
+Pluggable compression codecs for ReplayCache values.
+
+Cached entries are pickled model_dump dicts full of repeated hero, ability
+and modifier names, so they compress very well. zstd (optionally with a
+dictionary trained on cached combat logs) and lz4 are used when their
+packages are installed; zlib from the standard library is the fallback.
+
+Install the optional codecs with: pip install mcp-replay-dota2[compression]
+"""
+
+import logging
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Optional codec libraries
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None  # type: ignore[assignment]
+
+DEFAULT_DICTIONARY_SIZE = 112 * 1024  # zstd's recommended default
+DICTIONARY_SAMPLE_SIZE = 64 * 1024
+
+
+class CodecUnavailableError(Exception):
+    """Raised when a codec (or the dictionary an entry was written with) is not available."""
+
+
+class Codec:
+    """Base codec: stores values uncompressed.
+
+    Subclasses override encode/decode. ``version`` is bumped whenever the
+    encoded format changes so old entries can be recognised.
+    """
+
+    name = "none"
+    version = 1
+
+    @property
+    def dictionary_id(self) -> int:
+        """Id of the dictionary used by encode, 0 if none."""
+        return 0
+
+    def encode(self, data: bytes) -> bytes:
+        return data
+
+    def decode(self, data: bytes, dictionary_id: int = 0) -> bytes:
+        return data
+
+
+class ZlibCodec(Codec):
+    """Standard library zlib. Always available."""
+
+    name = "zlib"
+    version = 1
+
+    def __init__(self, level: int = 6):
+        self.level = level
+
+    def encode(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decode(self, data: bytes, dictionary_id: int = 0) -> bytes:
+        return zlib.decompress(data)
+
+
+class Lz4Codec(Codec):
+    """lz4 frame format: fastest to decode, lower ratio."""
+
+    name = "lz4"
+    version = 1
+
+    def __init__(self):
+        if lz4_frame is None:
+            raise CodecUnavailableError("lz4 codec requires the 'lz4' package")
+
+    def encode(self, data: bytes) -> bytes:
+        return lz4_frame.compress(data)
+
+    def decode(self, data: bytes, dictionary_id: int = 0) -> bytes:
+        return lz4_frame.decompress(data)
+
+
+class ZstdCodec(Codec):
+    """
+    zstd, optionally with shared dictionaries.
+
+    Dictionaries are stored as ``<id>.zdict`` files in ``dictionary_dir``.
+    New entries use the newest dictionary; older entries keep decoding with
+    the dictionary they were written with as long as its file is kept.
+    """
+
+    name = "zstd"
+    version = 1
+
+    def __init__(self, level: int = 9, dictionary_dir: Optional[Path] = None):
+        if zstandard is None:
+            raise CodecUnavailableError("zstd codec requires the 'zstandard' package")
+        self.level = level
+        self._dictionary_dir = dictionary_dir
+        self._dictionaries: Dict[int, "zstandard.ZstdCompressionDict"] = {}
+        self._active: Optional["zstandard.ZstdCompressionDict"] = None
+        if dictionary_dir is not None:
+            self._load_dictionaries(dictionary_dir)
+
+    def _load_dictionaries(self, dictionary_dir: Path) -> None:
+        for path in sorted(dictionary_dir.glob("*.zdict"), key=lambda p: p.stat().st_mtime):
+            try:
+                self._add_dictionary(zstandard.ZstdCompressionDict(path.read_bytes()))
+            except (OSError, zstandard.ZstdError) as e:
+                logger.warning(f"Ignoring unreadable zstd dictionary {path}: {e}")
+
+    def _add_dictionary(self, dictionary: "zstandard.ZstdCompressionDict") -> None:
+        self._dictionaries[dictionary.dict_id()] = dictionary
+        self._active = dictionary
+
+    @property
+    def dictionary_id(self) -> int:
+        return self._active.dict_id() if self._active is not None else 0
+
+    def train_dictionary(self, samples: Sequence[bytes], size: int = DEFAULT_DICTIONARY_SIZE) -> int:
+        """Train a dictionary on sample payloads and use it for new entries.
+
+        Args:
+            samples: Representative uncompressed payloads (many small pieces work best)
+            size: Dictionary size in bytes
+
+        Returns:
+            Id of the new dictionary
+        """
+        dictionary = zstandard.train_dictionary(size, list(samples))
+        if self._dictionary_dir is not None:
+            self._dictionary_dir.mkdir(parents=True, exist_ok=True)
+            (self._dictionary_dir / f"{dictionary.dict_id()}.zdict").write_bytes(dictionary.as_bytes())
+        self._add_dictionary(dictionary)
+        logger.info(f"Trained zstd dictionary {dictionary.dict_id()} from {len(samples)} samples")
+        return dictionary.dict_id()
+
+    def encode(self, data: bytes) -> bytes:
+        compressor = zstandard.ZstdCompressor(level=self.level, dict_data=self._active)
+        return compressor.compress(data)
+
+    def decode(self, data: bytes, dictionary_id: int = 0) -> bytes:
+        dictionary = None
+        if dictionary_id:
+            dictionary = self._dictionaries.get(dictionary_id)
+            if dictionary is None:
+                raise CodecUnavailableError(f"zstd dictionary {dictionary_id} is not available")
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data)
+
+
+def available_codecs() -> List[str]:
+    """Names of codecs usable in this environment."""
+    names = ["none", "zlib"]
+    if lz4_frame is not None:
+        names.append("lz4")
+    if zstandard is not None:
+        names.append("zstd")
+    return names
+
+
+def default_codec_name() -> str:
+    """Best available codec: zstd, else zlib."""
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def create_codec(name: str, dictionary_dir: Optional[Path] = None) -> Codec:
+    """Create a codec by name.
+
+    Args:
+        name: "zstd", "lz4", "zlib" or "none"
+        dictionary_dir: Where zstd dictionaries are kept
+
+    Raises:
+        CodecUnavailableError: If the codec's package is not installed
+        ValueError: If the name is unknown
+    """
+    if name == "zstd":
+        return ZstdCodec(dictionary_dir=dictionary_dir)
+    if name == "lz4":
+        return Lz4Codec()
+    if name == "zlib":
+        return ZlibCodec()
+    if name == "none":
+        return Codec()
+    raise ValueError(f"Unknown cache codec '{name}'. Available: {', '.join(available_codecs())}")
+
+
+def split_samples(payload: bytes, sample_size: int = DICTIONARY_SAMPLE_SIZE) -> List[bytes]:
+    """Cut a payload into dictionary training samples."""
+    return [payload[i: i + sample_size] for i in range(0, len(payload), sample_size)]
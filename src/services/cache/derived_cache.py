@@ -0,0 +1,191 @@
+"""
+Cache for derived per-match analysis results.
+
+Fight detection, lane summaries, rotation and farming analyses are pure
+functions of a match's parsed data and their parameters. Results are keyed
+by (match_id, analysis name, parameters, algorithm version) plus the parse
+version and collectors of the data they came from, so bumping an
+algorithm's version or reparsing a match makes old results unreachable.
+
+Results are stored pickled: every hit returns a fresh object, so callers
+may mutate what they get back without corrupting the cache.
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from diskcache import Cache
+
+from ..models.replay_data import ParsedReplayData
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DERIVED_MEMORY_LIMIT = 256 * 1024**2  # 256MB of pickled results
+DEFAULT_DERIVED_SIZE_LIMIT = 1024**3  # 1GB on disk
+DEFAULT_DERIVED_TTL = 86400 * 7  # 7 days, same as ReplayCache
+
+T = TypeVar("T")
+
+
+def _params_digest(params: Dict[str, Any]) -> str:
+    """Stable digest of analysis parameters (non-JSON values are keyed by repr)."""
+    encoded = json.dumps(params, sort_keys=True, default=repr)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class DerivedResultCache:
+    """
+    Two-tier (memory LRU + disk) cache of analysis results per match.
+
+    Thread-safe. Entries for a match are tagged with its id so they can all
+    be dropped when the match is reparsed or deleted.
+    NO MCP DEPENDENCIES - can be used from any interface.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        memory_limit: int = DEFAULT_DERIVED_MEMORY_LIMIT,
+        size_limit: int = DEFAULT_DERIVED_SIZE_LIMIT,
+        ttl: int = DEFAULT_DERIVED_TTL,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the disk tier. None keeps results in memory only.
+            memory_limit: Maximum bytes of pickled results held in memory
+            size_limit: Maximum disk tier size in bytes
+            ttl: Time-to-live of disk entries in seconds
+        """
+        self._disk = Cache(directory=str(cache_dir), size_limit=size_limit) if cache_dir else None
+        if self._disk is not None:
+            self._disk.create_tag_index()  # Fast per-match invalidation
+        self._ttl = ttl
+        self._memory_limit = memory_limit
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(data: ParsedReplayData, analysis: str, version: int, params: Dict[str, Any]) -> str:
+        """Build the cache key for an analysis of a match."""
+        collectors = hashlib.sha1(",".join(sorted(data.collectors)).encode("utf-8")).hexdigest()[:8]
+        return (
+            f"{data.match_id}:{analysis}:v{version}:p{data.parse_version}:"
+            f"c{collectors}:{_params_digest(params)}"
+        )
+
+    def get_or_compute(
+        self,
+        data: ParsedReplayData,
+        analysis: str,
+        version: int,
+        params: Dict[str, Any],
+        compute: Callable[[], T],
+    ) -> T:
+        """Return a cached result, computing and storing it on a miss.
+
+        Args:
+            data: Parsed data the analysis runs on
+            analysis: Analysis name (e.g. "lane_summary")
+            version: Algorithm version; bump it when the analysis output changes
+            params: Every parameter the result depends on
+            compute: Produces the result on a miss
+
+        Returns:
+            The analysis result (a fresh copy on every hit)
+        """
+        key = self.make_key(data, analysis, version, params)
+
+        blob = self._get_blob(key)
+        if blob is not None:
+            return pickle.loads(blob)
+
+        result = compute()
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Not caching {analysis} for match {data.match_id}: {e}")
+            return result
+        self._put_blob(key, data.match_id, blob)
+        return result
+
+    def _get_blob(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            blob = self._memory.get(key)
+            if blob is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return blob
+
+        blob = self._disk.get(key) if self._disk is not None else None
+        with self._lock:
+            if blob is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        self._remember(key, blob)
+        return blob
+
+    def _put_blob(self, key: str, match_id: int, blob: bytes) -> None:
+        self._remember(key, blob)
+        if self._disk is not None:
+            self._disk.set(key, blob, expire=self._ttl, tag=str(match_id))
+
+    def _remember(self, key: str, blob: bytes) -> None:
+        if len(blob) > self._memory_limit:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = blob
+            self._memory_bytes += len(blob)
+            while self._memory_bytes > self._memory_limit:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def invalidate(self, match_id: int) -> int:
+        """Drop every result for a match.
+
+        Returns:
+            Number of entries removed
+        """
+        prefix = f"{match_id}:"
+        with self._lock:
+            keys = [key for key in self._memory if key.startswith(prefix)]
+            for key in keys:
+                self._memory_bytes -= len(self._memory.pop(key))
+        removed = len(keys)
+        if self._disk is not None:
+            removed = max(removed, self._disk.evict(str(match_id)))
+        return removed
+
+    def clear(self) -> None:
+        """Drop every result."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if self._disk is not None:
+            self._disk.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get derived cache statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "memory_count": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_count": len(self._disk) if self._disk is not None else 0,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
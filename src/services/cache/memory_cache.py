@@ -0,0 +1,170 @@
+"""
+In-process LRU tier for hot ParsedReplayData.
+
+Sits in front of the disk cache so repeated tool calls on the same match
+return the already-built object instead of unpickling and rebuilding every
+pydantic model.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.replay_data import ParsedReplayData
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_LIMIT = 2 * 1024**3  # 2GB
+
+# Approximate in-memory footprint of one materialised pydantic item, per collection.
+# Exact sizing would require walking every object graph; these weights are close
+# enough for eviction accounting.
+ITEM_SIZE_ESTIMATES = {
+    "combat_log": 1500,
+    "entities": 12000,  # One snapshot holds 10 heroes plus team state
+    "game_events": 800,
+    "modifiers": 900,
+    "attacks": 700,
+    "entity_deaths": 600,
+}
+BASE_SIZE_ESTIMATE = 64 * 1024  # Header, game info, metadata
+
+
+def estimate_replay_size(data: ParsedReplayData) -> int:
+    """Estimate the in-memory size of parsed replay data in bytes.
+
+    Args:
+        data: Parsed replay data
+
+    Returns:
+        Approximate size in bytes
+    """
+    counts = {
+        "combat_log": len(data.combat_log_entries),
+        "entities": len(data.entity_snapshots),
+        "game_events": len(getattr(data.game_events, "events", None) or []),
+        "modifiers": len(getattr(data.modifiers, "modifiers", None) or []),
+        "attacks": len(getattr(data.attacks, "events", None) or []),
+        "entity_deaths": len(getattr(data.entity_deaths, "events", None) or []),
+    }
+    trajectory_bytes = data.trajectories.nbytes if data.trajectories else 0
+    return BASE_SIZE_ESTIMATE + trajectory_bytes + sum(
+        count * ITEM_SIZE_ESTIMATES[name] for name, count in counts.items()
+    )
+
+
+class MemoryReplayCache:
+    """
+    Bounded in-memory LRU cache of ParsedReplayData keyed by match_id.
+
+    Evicts least recently used matches once the estimated memory footprint
+    exceeds the configured limit. Thread-safe.
+    NO MCP DEPENDENCIES - can be used from any interface.
+    """
+
+    def __init__(self, memory_limit: int = DEFAULT_MEMORY_LIMIT):
+        """Initialize the memory tier.
+
+        Args:
+            memory_limit: Maximum estimated memory in bytes. 0 disables the tier.
+        """
+        self._memory_limit = memory_limit
+        self._entries: "OrderedDict[int, Tuple[ParsedReplayData, int]]" = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, match_id: int) -> Optional[ParsedReplayData]:
+        """Get data for a match, marking it most recently used.
+
+        Args:
+            match_id: The match ID
+
+        Returns:
+            ParsedReplayData if present, None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(match_id)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(match_id)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, match_id: int, data: ParsedReplayData) -> None:
+        """Store data for a match, evicting older matches if over the limit.
+
+        Args:
+            match_id: The match ID
+            data: Parsed replay data
+        """
+        size = estimate_replay_size(data)
+        if size > self._memory_limit:
+            logger.debug(f"Match {match_id} ({size} bytes) exceeds memory tier limit, not stored")
+            return
+
+        with self._lock:
+            previous = self._entries.pop(match_id, None)
+            if previous is not None:
+                self._size_bytes -= previous[1]
+
+            self._entries[match_id] = (data, size)
+            self._size_bytes += size
+
+            while self._size_bytes > self._memory_limit and self._entries:
+                evicted_id, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self._evictions += 1
+                logger.debug(f"Evicted match {evicted_id} from memory tier")
+
+    def peek(self, match_id: int) -> Optional[ParsedReplayData]:
+        """Get data for a match without affecting LRU order or hit counters."""
+        with self._lock:
+            entry = self._entries.get(match_id)
+            return entry[0] if entry is not None else None
+
+    def has(self, match_id: int) -> bool:
+        """Check if a match is held in memory (does not affect LRU order)."""
+        with self._lock:
+            return match_id in self._entries
+
+    def delete(self, match_id: int) -> bool:
+        """Remove a match from memory.
+
+        Returns:
+            True if removed, False if not present
+        """
+        with self._lock:
+            entry = self._entries.pop(match_id, None)
+            if entry is None:
+                return False
+            self._size_bytes -= entry[1]
+            return True
+
+    def clear(self) -> None:
+        """Remove all matches from memory."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memory tier statistics.
+
+        Returns:
+            Dictionary with size, count and hit/miss counters
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size_bytes": self._size_bytes,
+                "limit_bytes": self._memory_limit,
+                "count": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
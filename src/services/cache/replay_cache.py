@@ -1,29 +1,49 @@
 """
 Replay data cache using diskcache.
 
-Stores ParsedReplayData from python-manta v2 single-pass parsing.
+Stores ParsedReplayData from python-manta v2 single-pass parsing, compressed
+with a pluggable codec (see codecs). Hot matches are also kept in an
+in-process LRU tier (see memory_cache). Analysis results derived from a
+match live alongside it (see derived_cache) and are dropped whenever the
+match is re-stored.
 """
 
 import logging
+import os
+import pickle
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
 
 from diskcache import Cache
 
-from ..models.replay_data import ParsedReplayData
+from ..models.replay_data import ALL_COLLECTORS, ParsedReplayData
+from .codecs import (
+    Codec,
+    CodecUnavailableError,
+    ZstdCodec,
+    create_codec,
+    default_codec_name,
+    split_samples,
+)
+from .derived_cache import DerivedResultCache
+from .memory_cache import DEFAULT_MEMORY_LIMIT, MemoryReplayCache
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "mcp_dota2" / "parsed_replays_v2"
 DEFAULT_TTL = 86400 * 7  # 7 days
 DEFAULT_SIZE_LIMIT = 5 * 1024**3  # 5GB
+DICTIONARY_TRAINING_MATCHES = 20
+DICTIONARY_ENTRIES_PER_SAMPLE = 200  # Combat log entries pickled into one training sample
 
 
 class ReplayCache:
     """
     Disk-based cache for parsed replay data.
 
-    Uses diskcache for persistent storage with LRU eviction.
+    Uses diskcache for persistent storage with LRU eviction, fronted by a
+    bounded in-memory tier that returns already-built objects for hot matches.
     NO MCP DEPENDENCIES - can be used from any interface.
     """
 
@@ -32,6 +52,8 @@ class ReplayCache:
         cache_dir: Optional[Path] = None,
         size_limit: int = DEFAULT_SIZE_LIMIT,
         ttl: int = DEFAULT_TTL,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        codec: Optional[str] = None,
     ):
         """Initialize the cache.
 
@@ -39,6 +61,11 @@ class ReplayCache:
             cache_dir: Directory for cache storage. Defaults to ~/.cache/mcp_dota2/parsed_replays_v2
             size_limit: Maximum cache size in bytes. Defaults to 5GB.
             ttl: Time-to-live in seconds. Defaults to 7 days.
+            memory_limit: Maximum estimated size of the in-memory tier in bytes.
+                Defaults to 2GB. 0 disables the memory tier.
+            codec: Compression codec for new entries ("zstd", "lz4", "zlib", "none").
+                Defaults to DOTA_CACHE_CODEC, else zstd if installed, else zlib.
+                Entries written with another codec stay readable.
         """
         self._cache_dir = cache_dir or DEFAULT_CACHE_DIR
         self._cache_dir.mkdir(parents=True, exist_ok=True)
@@ -47,6 +74,20 @@ class ReplayCache:
             size_limit=size_limit,
         )
         self._ttl = ttl
+        self._memory = MemoryReplayCache(memory_limit=memory_limit)
+        self._dictionary_dir = self._cache_dir / "dictionaries"
+        self._codec = create_codec(
+            codec or os.environ.get("DOTA_CACHE_CODEC") or default_codec_name(),
+            dictionary_dir=self._dictionary_dir,
+        )
+        self._decoders: Dict[str, Codec] = {self._codec.name: self._codec}
+        self.derived = DerivedResultCache(self._cache_dir / "derived", ttl=ttl)
+        # Collectors and parse version per entry, readable without decoding the entry
+        self._meta = Cache(directory=str(self._cache_dir / "meta"))
+        # Uncompressed vs stored bytes of entries written or read by this instance
+        self._raw_bytes = 0
+        self._stored_bytes = 0
+        self._stats_lock = threading.Lock()
 
     def get(self, match_id: int) -> Optional[ParsedReplayData]:
         """Get cached data for a match.
@@ -58,13 +99,25 @@ class ReplayCache:
             ParsedReplayData if cached, None otherwise
         """
         cache_key = f"replay_v2_{match_id}"
+
+        hot = self._memory.get(match_id)
+        if hot is not None:
+            logger.debug(f"Memory cache hit for match {match_id}")
+            return hot
+
         cached = self._cache.get(cache_key)
 
         if cached is not None:
             logger.debug(f"Cache hit for match {match_id}")
+            cache_dict = self._decode_entry(match_id, cached)
+            if cache_dict is None:
+                return None
             # LRU behavior: reset TTL on access
             self._cache.touch(cache_key, expire=self._ttl)
-            return ParsedReplayData.from_cache_dict(cached)
+            self._meta.touch(cache_key, expire=self._ttl)
+            data = ParsedReplayData.from_cache_dict(cache_dict)
+            self._memory.set(match_id, data)
+            return data
 
         logger.debug(f"Cache miss for match {match_id}")
         return None
@@ -77,9 +130,129 @@ class ReplayCache:
             data: Parsed replay data to cache
         """
         cache_key = f"replay_v2_{match_id}"
-        self._cache.set(cache_key, data.to_cache_dict(), expire=self._ttl)
+        self._cache.set(cache_key, self._encode_entry(data.to_cache_dict()), expire=self._ttl)
+        self._set_meta(cache_key, data.collectors, data.parse_version)
+        self._memory.set(match_id, data)
+        self.derived.invalidate(match_id)
         logger.info(f"Cached parsed data for match {match_id}")
 
+    def get_collectors(self, match_id: int) -> Optional[FrozenSet[str]]:
+        """Get the collectors a cached match was parsed with, without loading its data.
+
+        Does not affect LRU order, hit counters or the memory tier.
+
+        Args:
+            match_id: The match ID
+
+        Returns:
+            Collector names if the match is cached, None otherwise
+        """
+        hot = self._memory.peek(match_id)
+        if hot is not None:
+            return hot.collectors
+
+        cache_key = f"replay_v2_{match_id}"
+        meta = self._meta.get(cache_key)
+        if cache_key not in self._cache:
+            return None
+        if meta is not None:
+            return frozenset(meta["collectors"])
+
+        # Entry written before metadata was kept: decode it once, without building models
+        entry = self._cache.get(cache_key)
+        cache_dict = self._decode_entry(match_id, entry) if entry is not None else None
+        if cache_dict is None:
+            return None
+        # Entries cached before parse profiles existed were always full parses
+        collectors = frozenset(cache_dict.get("collectors", ALL_COLLECTORS))
+        self._set_meta(cache_key, collectors, cache_dict.get("parse_version", "2.0"))
+        return collectors
+
+    def _set_meta(self, cache_key: str, collectors: FrozenSet[str], parse_version: str) -> None:
+        self._meta.set(
+            cache_key, {"collectors": sorted(collectors), "parse_version": parse_version}, expire=self._ttl
+        )
+
+    def _encode_entry(self, cache_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Pickle and compress a cache dict into a stored entry."""
+        raw = pickle.dumps(cache_dict, protocol=pickle.HIGHEST_PROTOCOL)
+        payload = self._codec.encode(raw)
+        self._count_bytes(len(raw), len(payload))
+        return {
+            "codec": self._codec.name,
+            "codec_version": self._codec.version,
+            "dictionary_id": self._codec.dictionary_id,
+            "raw_size": len(raw),
+            "payload": payload,
+        }
+
+    def _decode_entry(self, match_id: int, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Decompress a stored entry back into a cache dict.
+
+        Returns None (treated as a miss) if the entry's codec, codec version
+        or dictionary is not available here.
+        """
+        if "codec" not in entry:
+            return entry  # Written before codecs existed: a plain cache dict
+
+        name = entry["codec"]
+        try:
+            decoder = self._decoders.get(name)
+            if decoder is None:
+                decoder = self._decoders[name] = create_codec(name, dictionary_dir=self._dictionary_dir)
+            if entry["codec_version"] > decoder.version:
+                raise CodecUnavailableError(f"{name} codec version {entry['codec_version']} is newer than supported")
+            raw = decoder.decode(entry["payload"], entry["dictionary_id"])
+        except Exception as e:  # Missing codec/dictionary or corrupt payload: treat as a miss
+            logger.warning(f"Cannot decode cached entry for match {match_id}: {e}")
+            return None
+
+        self._count_bytes(len(raw), len(entry["payload"]))
+        return pickle.loads(raw)
+
+    def _count_bytes(self, raw_size: int, stored_size: int) -> None:
+        with self._stats_lock:
+            self._raw_bytes += raw_size
+            self._stored_bytes += stored_size
+
+    def train_dictionary(self, match_ids: Optional[Iterable[int]] = None, size: Optional[int] = None) -> int:
+        """Train a zstd dictionary on cached combat logs and use it for new entries.
+
+        Args:
+            match_ids: Matches to sample. Defaults to up to DICTIONARY_TRAINING_MATCHES cached matches.
+            size: Dictionary size in bytes (codec default if None)
+
+        Returns:
+            Id of the new dictionary
+
+        Raises:
+            ValueError: If the cache codec is not zstd or there is nothing to sample
+        """
+        if not isinstance(self._codec, ZstdCodec):
+            raise ValueError(f"Dictionaries need the zstd codec, cache uses {self._codec.name}")
+
+        if match_ids is None:
+            match_ids = [
+                int(key[len("replay_v2_"):]) for key in self._cache.iterkeys()
+                if isinstance(key, str) and key.startswith("replay_v2_")
+            ][:DICTIONARY_TRAINING_MATCHES]
+
+        samples: List[bytes] = []
+        for match_id in match_ids:
+            data = self.get(match_id)
+            if data is None or data.combat_log is None:
+                continue
+            entries = data.combat_log.model_dump()["entries"]
+            for start in range(0, len(entries), DICTIONARY_ENTRIES_PER_SAMPLE):
+                chunk = pickle.dumps(entries[start: start + DICTIONARY_ENTRIES_PER_SAMPLE])
+                samples.extend(split_samples(chunk))
+
+        if not samples:
+            raise ValueError("No cached combat logs to train a dictionary on")
+        if size is None:
+            return self._codec.train_dictionary(samples)
+        return self._codec.train_dictionary(samples, size)
+
     def has(self, match_id: int) -> bool:
         """Check if match data is cached.
 
@@ -90,7 +263,7 @@ class ReplayCache:
             True if cached, False otherwise
         """
         cache_key = f"replay_v2_{match_id}"
-        return cache_key in self._cache
+        return self._memory.has(match_id) or cache_key in self._cache
 
     def delete(self, match_id: int) -> bool:
         """Remove cached data for a match.
@@ -102,7 +275,10 @@ class ReplayCache:
             True if deleted, False if not found
         """
         cache_key = f"replay_v2_{match_id}"
-        return self._cache.delete(cache_key)
+        in_memory = self._memory.delete(match_id)
+        self._meta.delete(cache_key)
+        self.derived.invalidate(match_id)
+        return self._cache.delete(cache_key) or in_memory
 
     def clear_expired(self) -> int:
         """Remove all expired entries.
@@ -110,11 +286,15 @@ class ReplayCache:
         Returns:
             Number of entries removed
         """
+        self._meta.expire()
         return self._cache.expire()
 
     def clear_all(self) -> None:
         """Clear entire cache."""
+        self._memory.clear()
         self._cache.clear()
+        self._meta.clear()
+        self.derived.clear()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -127,4 +307,19 @@ class ReplayCache:
             "count": len(self._cache),
             "directory": str(self._cache_dir),
             "ttl_seconds": self._ttl,
+            "memory": self._memory.get_stats(),
+            "codec": self._get_codec_stats(),
+            "derived": self.derived.get_stats(),
+        }
+
+    def _get_codec_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            raw, stored = self._raw_bytes, self._stored_bytes
+        return {
+            "name": self._codec.name,
+            "version": self._codec.version,
+            "dictionary_id": self._codec.dictionary_id,
+            "raw_bytes": raw,
+            "stored_bytes": stored,
+            "compression_ratio": round(raw / stored, 2) if stored else None,
         }
@@ -0,0 +1,55 @@
+"""
+Opaque cursors for paging through combat log results.
+
+A cursor points at the first entry of the next page: its rank in the match's
+CombatLogIndex plus that entry's tick, so a cursor from another match (or a
+re-parsed log) is detected instead of silently paging from the wrong place.
+It also carries a fingerprint of the filters it was issued for, so it cannot
+be replayed against a different query.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+CURSOR_VERSION = 1
+
+
+def filters_fingerprint(*filters: Any) -> str:
+    """Short stable fingerprint of the filters a page was requested with."""
+    return hashlib.sha1(repr(filters).encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class CombatLogCursor:
+    """Position of the next page in a filtered combat log."""
+
+    rank: int  # CombatLogIndex rank of the page's first entry
+    tick: int  # Tick of that entry
+    fingerprint: str  # filters_fingerprint of the query
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe string."""
+        payload = json.dumps([CURSOR_VERSION, self.rank, self.tick, self.fingerprint], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> "CombatLogCursor":
+        """Decode a cursor string.
+
+        Raises:
+            ValueError: If the cursor is malformed or from another cursor version
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            version, rank, tick, fingerprint = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid combat log cursor: {cursor!r}") from e
+        if version != CURSOR_VERSION or not isinstance(rank, int) or not isinstance(tick, int) or rank < 0:
+            raise ValueError(f"Invalid combat log cursor: {cursor!r}")
+        return cls(rank=rank, tick=tick, fingerprint=str(fingerprint))
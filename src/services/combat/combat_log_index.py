@@ -0,0 +1,260 @@
+"""
+Time-sorted index over a match's combat log.
+
+Built once per ParsedReplayData (see ParsedReplayData.combat_index) so range
+queries by game time, event type and unit touch only the matching entries
+instead of scanning the whole log on every call.
+
+Services describe what they need with a CombatLogQuery (time range, event
+types, a unit and the side it is on) and run it against the index.
+Query results are memoised per index, so tools asking the same question
+about a match share one lookup.
+
+Building the index also interns every attacker, target and inflictor name
+into the match's CombatLogSymbols and keeps their ids per rank, so services
+read precomputed clean/display names and compare units by id.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import heapq
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from python_manta import CombatLogEntry
+
+from .combat_log_symbols import CombatLogSymbols, clean_name
+
+if TYPE_CHECKING:
+    from .vectorized import CombatLogArrays
+
+# Which side of an entry a hero filter applies to
+ROLE_ANY = "any"
+ROLE_ATTACKER = "attacker"
+ROLE_TARGET = "target"
+
+QUERY_MEMO_SIZE = 128  # Memoised query results per index
+
+
+def unit_key(name: Optional[str]) -> str:
+    """Index key of a unit name: lowercase, without the npc_dota_hero_ prefix."""
+    return clean_name(name).lower()
+
+
+def _entry_type(entry: CombatLogEntry) -> int:
+    return entry.type.value if hasattr(entry.type, "value") else entry.type
+
+
+def _merge(postings: List[List[int]]) -> List[int]:
+    """Union of ascending postings lists, ascending and without duplicates."""
+    postings = [p for p in postings if p]
+    if not postings:
+        return []
+    if len(postings) == 1:
+        return postings[0]
+    merged: List[int] = []
+    for rank in heapq.merge(*postings):
+        if not merged or merged[-1] != rank:
+            merged.append(rank)
+    return merged
+
+
+@dataclass(frozen=True)
+class CombatLogQuery:
+    """
+    A combat log lookup: every given filter must match.
+
+    Unit filters use the same rule the services always have for heroes: a
+    case-insensitive substring of the unit name without npc_dota_hero_
+    (so "lina" or "roshan").
+    """
+
+    start_time: Optional[float] = None  # Inclusive
+    end_time: Optional[float] = None  # Inclusive
+    types: Optional[FrozenSet[int]] = None  # CombatLogType values
+    unit: Optional[str] = None
+    role: str = ROLE_ANY  # Side the unit must be on: ROLE_ANY, ROLE_ATTACKER or ROLE_TARGET
+
+    @classmethod
+    def build(
+        cls,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        types: Optional[Iterable[int]] = None,
+        unit: Optional[str] = None,
+        role: str = ROLE_ANY,
+    ) -> "CombatLogQuery":
+        """Create a normalised query (hashable types, lowercase unit)."""
+        if role not in (ROLE_ANY, ROLE_ATTACKER, ROLE_TARGET):
+            raise ValueError(f"Unknown unit role '{role}'")
+        return cls(
+            start_time=start_time,
+            end_time=end_time,
+            types=frozenset(types) if types is not None else None,
+            unit=unit.lower() if unit else None,
+            role=role,
+        )
+
+
+class CombatLogIndex:
+    """
+    Combat log entries ordered by game time, with inverted indexes.
+
+    Entries are addressed by rank: their position in game-time order (ties
+    keep log order). Postings lists hold ascending ranks, so each one is
+    itself time-ordered and can be cut to a time range with bisect.
+
+    - by type: CombatLogType value -> ranks
+    - by (role, unit): attacker/target unit key -> ranks
+    - by (role, unit, type): the same, per event type
+
+    Attacker, target and inflictor names are interned into ``symbols``;
+    ids(rank) gives an entry's three symbol ids.
+    """
+
+    def __init__(self, entries: Sequence[CombatLogEntry]):
+        self._entries = entries
+        self._order: List[int] = sorted(range(len(entries)), key=lambda i: entries[i].game_time)
+        self._times: List[float] = [entries[i].game_time for i in self._order]
+        self._by_type: Dict[int, List[int]] = {}
+        self._by_unit: Dict[Tuple, List[int]] = {}
+        self._unit_matches: Dict[str, List[str]] = {}
+        self.symbols = CombatLogSymbols()
+        self._attacker_ids = array("i")
+        self._target_ids = array("i")
+        self._inflictor_ids = array("i")
+        self._memo: "OrderedDict[CombatLogQuery, Sequence[int]]" = OrderedDict()
+        self._arrays: Optional["CombatLogArrays"] = None
+        self._lock = threading.Lock()
+
+        by_type, by_unit = self._by_type, self._by_unit
+        intern, keys = self.symbols.intern, self.symbols.keys
+        for rank, position in enumerate(self._order):
+            entry = entries[position]
+            entry_type = _entry_type(entry)
+            attacker_id = intern(entry.attacker_name)
+            target_id = intern(entry.target_name)
+            self._attacker_ids.append(attacker_id)
+            self._target_ids.append(target_id)
+            self._inflictor_ids.append(intern(entry.inflictor_name))
+            attacker = keys[attacker_id]
+            target = keys[target_id]
+            by_type.setdefault(entry_type, []).append(rank)
+            by_unit.setdefault((ROLE_ATTACKER, attacker), []).append(rank)
+            by_unit.setdefault((ROLE_ATTACKER, attacker, entry_type), []).append(rank)
+            by_unit.setdefault((ROLE_TARGET, target), []).append(rank)
+            by_unit.setdefault((ROLE_TARGET, target, entry_type), []).append(rank)
+        self._units = sorted({key[1] for key in by_unit})
+
+    def covers(self, entries: Sequence[CombatLogEntry]) -> bool:
+        """Check if this index was built over exactly these entries."""
+        return entries is self._entries and len(entries) == len(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @property
+    def units(self) -> List[str]:
+        """All unit keys seen as attacker or target."""
+        return list(self._units)
+
+    def arrays(self) -> "CombatLogArrays":
+        """NumPy columns of the log in rank order, built on first use (requires numpy)."""
+        if self._arrays is None:
+            from .vectorized import CombatLogArrays
+
+            arrays = CombatLogArrays([self._entries[position] for position in self._order], self.symbols)
+            with self._lock:
+                if self._arrays is None:
+                    self._arrays = arrays
+        return self._arrays
+
+    def rank_range(self, start_time: Optional[float] = None, end_time: Optional[float] = None) -> range:
+        """Ranks of entries with start_time <= game_time <= end_time (bounds optional)."""
+        lo = 0 if start_time is None else bisect_left(self._times, start_time)
+        hi = len(self._times) if end_time is None else bisect_right(self._times, end_time)
+        return range(lo, max(lo, hi))
+
+    def _cut(self, postings: List[int], ranks: range) -> List[int]:
+        if ranks.start == 0 and ranks.stop == len(self._times):
+            return postings
+        return postings[bisect_left(postings, ranks.start): bisect_left(postings, ranks.stop)]
+
+    def units_matching(self, name: str) -> List[str]:
+        """Unit keys containing name (case-insensitive substring, as services match heroes)."""
+        needle = name.lower()
+        with self._lock:
+            matches = self._unit_matches.get(needle)
+        if matches is None:
+            matches = [unit for unit in self._units if needle in unit]
+            with self._lock:
+                self._unit_matches[needle] = matches
+        return matches
+
+    def run_ranks(self, query: CombatLogQuery) -> Sequence[int]:
+        """Ranks of entries matching a query, in game time order."""
+        with self._lock:
+            ranks = self._memo.get(query)
+            if ranks is not None:
+                self._memo.move_to_end(query)
+                return ranks
+
+        ranks = self._lookup(query)
+        with self._lock:
+            self._memo[query] = ranks
+            if len(self._memo) > QUERY_MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return ranks
+
+    def _lookup(self, query: CombatLogQuery) -> Sequence[int]:
+        ranks = self.rank_range(query.start_time, query.end_time)
+
+        if query.unit:
+            roles = (ROLE_ATTACKER, ROLE_TARGET) if query.role == ROLE_ANY else (query.role,)
+            units = self.units_matching(query.unit)
+            if query.types is None:
+                keys = [(role, unit) for role in roles for unit in units]
+            else:
+                keys = [(role, unit, t) for role in roles for unit in units for t in query.types]
+            return _merge([self._cut(self._by_unit[key], ranks) for key in keys if key in self._by_unit])
+
+        if query.types is not None:
+            return _merge([self._cut(self._by_type.get(t, []), ranks) for t in query.types])
+
+        return ranks
+
+    def entry(self, rank: int) -> CombatLogEntry:
+        """Entry at a rank."""
+        return self._entries[self._order[rank]]
+
+    def ids(self, rank: int) -> Tuple[int, int, int]:
+        """Symbol ids of the attacker, target and inflictor of the entry at a rank."""
+        return self._attacker_ids[rank], self._target_ids[rank], self._inflictor_ids[rank]
+
+    def run(self, query: CombatLogQuery) -> List[CombatLogEntry]:
+        """Entries matching a query, in game time order."""
+        order, entries = self._order, self._entries
+        return [entries[order[rank]] for rank in self.run_ranks(query)]
+
+    def select(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        types: Optional[Iterable[int]] = None,
+        hero_filter: Optional[str] = None,
+        role: str = ROLE_ANY,
+    ) -> List[CombatLogEntry]:
+        """Entries matching every given filter, in game time order.
+
+        Args:
+            start_time: Only entries at or after this game time
+            end_time: Only entries at or before this game time
+            types: Only entries of these CombatLogType values
+            hero_filter: Only entries where this hero is the attacker or target
+            role: Restrict hero_filter to the attacker (ROLE_ATTACKER) or target (ROLE_TARGET)
+        """
+        return self.run(CombatLogQuery.build(start_time, end_time, types, hero_filter, role))
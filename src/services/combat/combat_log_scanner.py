@@ -0,0 +1,110 @@
+"""
+Single-pass combat log scanner feeding any number of collectors.
+
+A collector says which entries it wants with a CombatLogQuery and builds one
+result set from them (Roshan kills, rune pickups, purchases...). The scanner
+merges the collectors' index lookups and walks the matching entries once, in
+game time order, handing each entry to every collector that asked for it.
+Services use it to get several result sets from one traversal instead of
+one pass per result.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from itertools import repeat
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from python_manta import CombatLogEntry
+
+from .combat_log_index import CombatLogIndex, CombatLogQuery
+
+T = TypeVar("T")
+
+
+class CombatLogCollector(ABC):
+    """
+    Base collector: visited with each entry matching its query, in game time order.
+
+    Subclasses set ``name`` and ``query`` and implement visit() and result().
+    A collector instance holds the state of one scan.
+    """
+
+    name: str = ""
+    query: CombatLogQuery = CombatLogQuery()
+
+    @abstractmethod
+    def visit(self, entry: CombatLogEntry) -> None:
+        """Take one entry matching the query."""
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Result set built from the visited entries."""
+
+
+class EntryCollector(CombatLogCollector, Generic[T]):
+    """Collects build(entry, collected) for each visited entry, skipping None.
+
+    build gets the items collected so far, e.g. to number Roshan kills.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        query: CombatLogQuery,
+        build: Callable[[CombatLogEntry, List[T]], Optional[T]],
+    ):
+        self.name = name
+        self.query = query
+        self._build = build
+        self._items: List[T] = []
+
+    def visit(self, entry: CombatLogEntry) -> None:
+        item = self._build(entry, self._items)
+        if item is not None:
+            self._items.append(item)
+
+    def result(self) -> List[T]:
+        return self._items
+
+
+class CombatLogScanner:
+    """Runs registered collectors over a combat log index in one pass."""
+
+    def __init__(self, collectors: Iterable[CombatLogCollector] = ()):
+        self._collectors: List[CombatLogCollector] = []
+        for collector in collectors:
+            self.register(collector)
+
+    def register(self, collector: CombatLogCollector) -> CombatLogCollector:
+        """Add a collector. Names must be unique within a scanner."""
+        if any(c.name == collector.name for c in self._collectors):
+            raise ValueError(f"Collector '{collector.name}' is already registered")
+        self._collectors.append(collector)
+        return collector
+
+    def scan(self, index: CombatLogIndex) -> Dict[str, Any]:
+        """
+        Feed every collector its entries in one game-time-ordered pass.
+
+        Args:
+            index: CombatLogIndex of the match (ParsedReplayData.combat_index)
+
+        Returns:
+            Dictionary mapping collector name to its result
+        """
+        collectors = self._collectors
+        postings = [zip(index.run_ranks(collector.query), repeat(i)) for i, collector in enumerate(collectors)]
+        last_rank = -1
+        entry: Optional[CombatLogEntry] = None
+        for rank, i in heapq.merge(*postings):
+            if rank != last_rank:
+                entry, last_rank = index.entry(rank), rank
+            collectors[i].visit(entry)
+        return {collector.name: collector.result() for collector in collectors}
+
+
+def collect(index: CombatLogIndex, collector: CombatLogCollector) -> Any:
+    """Run a single collector and return its result."""
+    return CombatLogScanner([collector]).scan(index)[collector.name]
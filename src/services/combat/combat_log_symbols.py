@@ -0,0 +1,108 @@
+"""
+Interned unit and ability names of a match's combat log.
+
+Combat log entries carry full names (npc_dota_hero_faceless_void,
+item_bfury, ...) and services used to re-strip the hero prefix, lowercase
+and look up display names for every entry of every query. CombatLogSymbols
+interns each distinct name once per match (CombatLogIndex builds it with the
+index) and keeps its derived forms alongside an integer id:
+
+- name: the raw combat log name
+- clean: without the npc_dota_hero_ prefix (what responses show for units)
+- key: clean and lowercase (what hero filters match against)
+- display: constants_fetcher.get_display_name of the name (for abilities/items)
+
+Name tests then run once per distinct name and entries compare by id.
+Id 0 is the empty name, shared by None and "".
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import threading
+from typing import Callable, Dict, FrozenSet, List, Optional
+
+from ...utils.constants_fetcher import constants_fetcher
+
+HERO_PREFIX = "npc_dota_hero_"
+
+_UNRESOLVED = object()  # Display name not looked up yet
+
+
+def clean_name(name: Optional[str]) -> str:
+    """Name without the npc_dota_hero_ prefix."""
+    if not name:
+        return ""
+    if name.startswith(HERO_PREFIX):
+        return name[len(HERO_PREFIX):]
+    return name
+
+
+class CombatLogSymbols:
+    """Per-match table of interned combat log names."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {"": 0}
+        self.names: List[str] = [""]
+        self.clean_names: List[str] = [""]
+        self.keys: List[str] = [""]
+        self._display: List[object] = [None]
+        self._matching: Dict[str, FrozenSet[int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def intern(self, name: Optional[str]) -> int:
+        """Id of a name, adding it to the table if new."""
+        if not name:
+            return 0
+        symbol = self._ids.get(name)
+        if symbol is None:
+            with self._lock:
+                symbol = self._ids.get(name)
+                if symbol is None:
+                    clean = clean_name(name)
+                    self.names.append(name)
+                    self.clean_names.append(clean)
+                    self.keys.append(clean.lower())
+                    self._display.append(_UNRESOLVED)
+                    symbol = self._ids[name] = len(self.names) - 1
+                    self._matching.clear()
+        return symbol
+
+    def id_of(self, name: Optional[str]) -> Optional[int]:
+        """Id of a name, None if it is not in the table."""
+        return self._ids.get(name or "")
+
+    def name(self, symbol: int) -> str:
+        """Raw combat log name of an id."""
+        return self.names[symbol]
+
+    def clean(self, symbol: int) -> str:
+        """Name of an id without the npc_dota_hero_ prefix."""
+        return self.clean_names[symbol]
+
+    def key(self, symbol: int) -> str:
+        """Lowercase clean name of an id."""
+        return self.keys[symbol]
+
+    def display(self, symbol: int) -> Optional[str]:
+        """Display name of an id (looked up once per name), None for the empty name."""
+        display = self._display[symbol]
+        if display is _UNRESOLVED:
+            display = self._display[symbol] = constants_fetcher.get_display_name(self.names[symbol])
+        return display
+
+    def ids_where(self, predicate: Callable[[str], bool]) -> FrozenSet[int]:
+        """Ids of names for which predicate(name) is true, called once per distinct name."""
+        return frozenset(symbol for symbol, name in enumerate(self.names) if predicate(name))
+
+    def ids_matching(self, needle: str) -> FrozenSet[int]:
+        """Ids whose key contains needle (case-insensitive substring, as services match heroes)."""
+        needle = needle.lower()
+        matches = self._matching.get(needle)
+        if matches is None:
+            matches = frozenset(symbol for symbol, key in enumerate(self.keys) if needle in key)
+            with self._lock:
+                self._matching[needle] = matches
+        return matches
@@ -5,9 +5,12 @@ NO MCP DEPENDENCIES - can be used from any interface.
 """
 
 import logging
-from typing import TYPE_CHECKING, List, Optional, Tuple
+import os
+from bisect import bisect_left
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
-from python_manta import CombatLogType, Team
+from python_manta import CombatLogEntry, CombatLogType, Team
 
 from ...models.combat_log import (
     AbilityUsage,
@@ -34,10 +37,18 @@ from ...models.combat_log import (
 from ...utils.constants_fetcher import constants_fetcher
 from ...utils.position_tracker import PositionClassifier, classify_map_position
 from ..models.combat_data import (
+    AbilityTally,
     DamageEvent,
+    FightCombatStats,
+    HeroCombatAggregates,
     ObjectiveKill,
 )
 from ..models.replay_data import ParsedReplayData
+from .combat_log_cursor import CombatLogCursor, filters_fingerprint
+from .combat_log_index import ROLE_TARGET, CombatLogIndex, CombatLogQuery
+from .combat_log_scanner import CombatLogScanner, EntryCollector, collect
+from .combat_log_symbols import CombatLogSymbols
+from .vectorized import aggregate_hero_combat, numpy_available
 
 if TYPE_CHECKING:
     from src.models.game_context import GameContext
@@ -47,6 +58,32 @@ MAX_EVENTS_CAP = 500
 
 logger = logging.getLogger(__name__)
 
+# Objective deaths, looked up by the dying unit's name
+ROSHAN_DEATHS = CombatLogQuery.build(types=[CombatLogType.DEATH.value], unit="roshan", role=ROLE_TARGET)
+TORMENTOR_DEATHS = CombatLogQuery.build(types=[CombatLogType.DEATH.value], unit="miniboss", role=ROLE_TARGET)
+TOWER_DEATHS = CombatLogQuery.build(types=[CombatLogType.DEATH.value], unit="tower", role=ROLE_TARGET)
+COURIER_DEATHS = CombatLogQuery.build(types=[CombatLogType.DEATH.value], unit="courier", role=ROLE_TARGET)
+ALL_DEATHS = CombatLogQuery.build(types=[CombatLogType.DEATH.value])
+
+# get_hero_combat_analysis implementations
+AGGREGATION_BACKENDS = ("numpy", "python")
+
+
+def default_aggregation_backend() -> str:
+    """Vectorized numpy aggregation when numpy is installed, else the row-by-row loop."""
+    return "numpy" if numpy_available() else "python"
+
+
+# Rune map for modifier_rune_* inflictor names
+RUNE_MODIFIER_MAP = {
+    "modifier_rune_haste": "haste",
+    "modifier_rune_doubledamage": "double_damage",
+    "modifier_rune_arcane": "arcane",
+    "modifier_rune_regen": "regeneration",
+    "modifier_rune_invis": "invisibility",
+    "modifier_rune_shield": "shield",
+}
+
 RUNE_TYPE_MAP = {
     0: "double_damage",
     1: "haste",
@@ -69,6 +106,24 @@ class CombatService:
     - Objective kills
     """
 
+    def __init__(self, aggregation_backend: Optional[str] = None):
+        """
+        Args:
+            aggregation_backend: "numpy" or "python" for get_hero_combat_analysis.
+                Defaults to DOTA_COMBAT_BACKEND, else numpy when it is installed.
+
+        Raises:
+            ValueError: If the backend is unknown
+            ImportError: If the numpy backend is requested without numpy installed
+        """
+        backend = (aggregation_backend or os.environ.get("DOTA_COMBAT_BACKEND") or default_aggregation_backend())
+        backend = backend.lower()
+        if backend not in AGGREGATION_BACKENDS:
+            raise ValueError(f"Unknown aggregation backend '{backend}', expected one of {AGGREGATION_BACKENDS}")
+        if backend == "numpy" and not numpy_available():
+            raise ImportError("numpy aggregation backend requires numpy (pip install mcp-replay-dota2[vectorized])")
+        self._aggregation_backend = backend
+
     def _format_time(self, seconds: float) -> str:
         """Format game time as M:SS."""
         minutes = int(seconds // 60)
@@ -94,34 +149,15 @@ class CombatService:
         Returns:
             Tuple of (x, y, location_description) or (None, None, None)
         """
-        hero_lower = hero.lower()
-        best_snapshot = None
-        min_diff = float('inf')
-
-        for snapshot in data.entity_snapshots:
-            diff = abs(snapshot.game_time - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                best_snapshot = snapshot
-
-        if not best_snapshot or min_diff > 30.0:
+        state = data.hero_timeline.state_at(hero, target_time, max_gap=30.0)
+        if state is None:
             return (None, None, None)
 
-        for hero_snap in best_snapshot.heroes:
-            hero_name = hero_snap.hero_name or ""
-            if hero_name.startswith("npc_dota_hero_"):
-                clean_name = hero_name[14:]
-            else:
-                clean_name = hero_name
-
-            if hero_lower in clean_name.lower():
-                if classifier:
-                    pos = classifier.classify(hero_snap.x, hero_snap.y)
-                else:
-                    pos = classify_map_position(hero_snap.x, hero_snap.y)
-                return (hero_snap.x, hero_snap.y, pos.region)
-
-        return (None, None, None)
+        if classifier:
+            pos = classifier.classify(state.x, state.y)
+        else:
+            pos = classify_map_position(state.x, state.y)
+        return (state.x, state.y, pos.region)
 
     def _clean_hero_name(self, name: str) -> str:
         """Remove npc_dota_hero_ prefix from hero name."""
@@ -146,6 +182,14 @@ class CombatService:
             return "attack"
         return constants_fetcher.get_display_name(inflictor_name)
 
+    def _ability_display(
+        self, symbols: CombatLogSymbols, inflictor_id: int, attacker_is_hero: bool
+    ) -> Optional[str]:
+        """_normalize_ability_name for an interned inflictor (display name looked up once per match)."""
+        if not inflictor_id:
+            return "attack" if attacker_is_hero else None
+        return symbols.display(inflictor_id)
+
     def _is_hero(self, name: str) -> bool:
         """Check if a name represents a hero."""
         return name.startswith("npc_dota_hero_")
@@ -157,30 +201,69 @@ class CombatService:
         target_time: float,
     ) -> Optional[int]:
         """Get hero level at a specific game time from entity snapshots."""
-        hero_lower = hero.lower()
-        best_snapshot = None
-        min_diff = float('inf')
-
-        for snapshot in data.entity_snapshots:
-            diff = abs(snapshot.game_time - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                best_snapshot = snapshot
+        state = data.hero_timeline.state_at(hero, target_time, max_gap=60.0)
+        return state.level if state else None
 
-        if not best_snapshot or min_diff > 60.0:
+    def _hero_death(
+        self,
+        data: ParsedReplayData,
+        entry,
+        classifier: Optional[PositionClassifier],
+    ) -> Optional[HeroDeath]:
+        """Build a HeroDeath from a DEATH entry, None if the victim is not a hero."""
+        if not entry.is_target_hero:
             return None
 
-        for hero_snap in best_snapshot.heroes:
-            hero_name = hero_snap.hero_name or ""
-            if hero_name.startswith("npc_dota_hero_"):
-                clean_name = hero_name[14:]
-            else:
-                clean_name = hero_name
+        game_time = entry.game_time
+        killer = self._clean_hero_name(entry.attacker_name)
+        victim = self._clean_hero_name(entry.target_name)
 
-            if hero_lower in clean_name.lower():
-                return hero_snap.level if hasattr(hero_snap, 'level') else None
+        # Get victim position from entity snapshots
+        pos_x, pos_y, location_desc = self._get_hero_position_at_time(
+            data, victim, game_time, classifier
+        )
 
-        return None
+        # Extract hero levels from combat log entry
+        killer_level = None
+        victim_level = None
+        level_advantage = None
+
+        if hasattr(entry, 'attacker_hero_level') and entry.attacker_hero_level and entry.attacker_hero_level > 0:
+            killer_level = entry.attacker_hero_level
+        if hasattr(entry, 'target_hero_level') and entry.target_hero_level and entry.target_hero_level > 0:
+            victim_level = entry.target_hero_level
+
+        if killer_level is not None and victim_level is not None:
+            level_advantage = killer_level - victim_level
+
+        return HeroDeath(
+            game_time=game_time,
+            game_time_str=self._format_time(game_time),
+            tick=entry.tick,
+            killer=killer,
+            victim=victim,
+            killer_is_hero=entry.is_attacker_hero,
+            killer_level=killer_level,
+            victim_level=victim_level,
+            level_advantage=level_advantage,
+            ability=self._normalize_ability_name(entry.inflictor_name, entry.is_attacker_hero),
+            position_x=pos_x,
+            position_y=pos_y,
+            location=location_desc,
+        )
+
+    def hero_death_collector(
+        self,
+        data: ParsedReplayData,
+        hero_filter: Optional[str] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        game_context: Optional["GameContext"] = None,
+    ) -> EntryCollector[HeroDeath]:
+        """Collector for get_hero_deaths, to combine with others in one CombatLogScanner pass."""
+        classifier = game_context.position_classifier if game_context else None
+        query = CombatLogQuery.build(start_time, end_time, [CombatLogType.DEATH.value], hero_filter)
+        return EntryCollector("hero_deaths", query, lambda entry, _: self._hero_death(data, entry, classifier))
 
     def get_hero_deaths(
         self,
@@ -203,68 +286,8 @@ class CombatService:
         Returns:
             List of HeroDeath events sorted by game time
         """
-        deaths = []
-
-        # Get classifier from context if available
-        classifier = game_context.position_classifier if game_context else None
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DEATH.value:
-                continue
-
-            if not entry.is_target_hero:
-                continue
-
-            game_time = entry.game_time
-            if start_time is not None and game_time < start_time:
-                continue
-            if end_time is not None and game_time > end_time:
-                continue
-
-            killer = self._clean_hero_name(entry.attacker_name)
-            victim = self._clean_hero_name(entry.target_name)
-
-            if hero_filter:
-                hero_lower = hero_filter.lower()
-                if hero_lower not in killer.lower() and hero_lower not in victim.lower():
-                    continue
-
-            # Get victim position from entity snapshots
-            pos_x, pos_y, location_desc = self._get_hero_position_at_time(
-                data, victim, game_time, classifier
-            )
-
-            # Extract hero levels from combat log entry
-            killer_level = None
-            victim_level = None
-            level_advantage = None
-
-            if hasattr(entry, 'attacker_hero_level') and entry.attacker_hero_level and entry.attacker_hero_level > 0:
-                killer_level = entry.attacker_hero_level
-            if hasattr(entry, 'target_hero_level') and entry.target_hero_level and entry.target_hero_level > 0:
-                victim_level = entry.target_hero_level
-
-            if killer_level is not None and victim_level is not None:
-                level_advantage = killer_level - victim_level
-
-            death = HeroDeath(
-                game_time=game_time,
-                game_time_str=self._format_time(game_time),
-                tick=entry.tick,
-                killer=killer,
-                victim=victim,
-                killer_is_hero=entry.is_attacker_hero,
-                killer_level=killer_level,
-                victim_level=victim_level,
-                level_advantage=level_advantage,
-                ability=self._normalize_ability_name(entry.inflictor_name, entry.is_attacker_hero),
-                position_x=pos_x,
-                position_y=pos_y,
-                location=location_desc,
-            )
-            deaths.append(death)
-
+        collector = self.hero_death_collector(data, hero_filter, start_time, end_time, game_context)
+        deaths = collect(data.combat_index, collector)
         deaths.sort(key=lambda d: d.game_time)
         return deaths
 
@@ -291,28 +314,17 @@ class CombatService:
         """
         events = []
 
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DAMAGE.value:
-                continue
-
+        damage = data.combat_index.select(
+            start_time, end_time, types=[CombatLogType.DAMAGE.value], hero_filter=hero_filter
+        )
+        for entry in damage:
             if heroes_only and not (entry.is_attacker_hero and entry.is_target_hero):
                 continue
 
             game_time = entry.game_time
-            if start_time is not None and game_time < start_time:
-                continue
-            if end_time is not None and game_time > end_time:
-                continue
-
             attacker = self._clean_hero_name(entry.attacker_name)
             target = self._clean_hero_name(entry.target_name)
 
-            if hero_filter:
-                hero_lower = hero_filter.lower()
-                if hero_lower not in attacker.lower() and hero_lower not in target.lower():
-                    continue
-
             event = DamageEvent(
                 game_time=game_time,
                 tick=entry.tick,
@@ -328,6 +340,21 @@ class CombatService:
         events.sort(key=lambda e: e.game_time)
         return events
 
+    def _item_purchase(self, entry) -> ItemPurchase:
+        """Build an ItemPurchase from a PURCHASE entry."""
+        return ItemPurchase(
+            game_time=entry.game_time,
+            game_time_str=self._format_time(entry.game_time),
+            tick=entry.tick,
+            hero=self._clean_hero_name(entry.target_name),
+            item=entry.value_name if entry.value_name else entry.inflictor_name,
+        )
+
+    def item_purchase_collector(self, hero_filter: Optional[str] = None) -> EntryCollector[ItemPurchase]:
+        """Collector for get_item_purchases."""
+        query = CombatLogQuery.build(types=[CombatLogType.PURCHASE.value], unit=hero_filter, role=ROLE_TARGET)
+        return EntryCollector("item_purchases", query, lambda entry, _: self._item_purchase(entry))
+
     def get_item_purchases(
         self,
         data: ParsedReplayData,
@@ -343,30 +370,66 @@ class CombatService:
         Returns:
             List of ItemPurchase events sorted by game time
         """
-        purchases = []
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.PURCHASE.value:
-                continue
+        purchases = collect(data.combat_index, self.item_purchase_collector(hero_filter))
+        purchases.sort(key=lambda p: p.game_time)
+        return purchases
 
+    def _rune_pickup(
+        self,
+        entry,
+        hero_filter: Optional[str],
+        seen_times: Dict[Tuple[str, float], bool],
+    ) -> Optional[RunePickup]:
+        """Build a RunePickup from a PICKUP_RUNE or modifier_rune_* MODIFIER_ADD entry."""
+        entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
+
+        # Check PICKUP_RUNE events (type 21)
+        if entry_type == CombatLogType.PICKUP_RUNE.value:
             hero = self._clean_hero_name(entry.target_name)
-
-            if hero_filter:
-                if hero_filter.lower() not in hero.lower():
-                    continue
-
-            purchase = ItemPurchase(
+            if hero_filter and hero_filter.lower() not in hero.lower():
+                return None
+            rune_type = RUNE_TYPE_MAP.get(entry.value, f"unknown_{entry.value}")
+            return RunePickup(
                 game_time=entry.game_time,
                 game_time_str=self._format_time(entry.game_time),
                 tick=entry.tick,
                 hero=hero,
-                item=entry.value_name if entry.value_name else entry.inflictor_name,
+                rune_type=rune_type,
             )
-            purchases.append(purchase)
 
-        purchases.sort(key=lambda p: p.game_time)
-        return purchases
+        # Check MODIFIER_ADD events with modifier_rune_* inflictor
+        if entry_type == CombatLogType.MODIFIER_ADD.value:
+            inflictor = getattr(entry, 'inflictor_name', '')
+            if inflictor in RUNE_MODIFIER_MAP:
+                hero = self._clean_hero_name(entry.attacker_name)
+                if hero_filter and hero_filter.lower() not in hero.lower():
+                    return None
+
+                # Dedupe - same hero/time can have duplicate modifier events
+                key = (hero, round(entry.game_time, 1))
+                if key in seen_times:
+                    return None
+                seen_times[key] = True
+
+                return RunePickup(
+                    game_time=entry.game_time,
+                    game_time_str=self._format_time(entry.game_time),
+                    tick=entry.tick,
+                    hero=hero,
+                    rune_type=RUNE_MODIFIER_MAP[inflictor],
+                )
+
+        return None
+
+    def rune_pickup_collector(self, hero_filter: Optional[str] = None) -> EntryCollector[RunePickup]:
+        """Collector for get_rune_pickups."""
+        seen_times: Dict[Tuple[str, float], bool] = {}
+        query = CombatLogQuery.build(
+            types=[CombatLogType.PICKUP_RUNE.value, CombatLogType.MODIFIER_ADD.value], unit=hero_filter
+        )
+        return EntryCollector(
+            "rune_pickups", query, lambda entry, _: self._rune_pickup(entry, hero_filter, seen_times)
+        )
 
     def get_rune_pickups(
         self,
@@ -383,191 +446,171 @@ class CombatService:
         Returns:
             List of RunePickup events sorted by game time
         """
-        pickups = []
-        seen_times: dict[tuple[str, float], bool] = {}
-
-        # Rune map for modifier_rune_* inflictor names
-        rune_modifier_map = {
-            "modifier_rune_haste": "haste",
-            "modifier_rune_doubledamage": "double_damage",
-            "modifier_rune_arcane": "arcane",
-            "modifier_rune_regen": "regeneration",
-            "modifier_rune_invis": "invisibility",
-            "modifier_rune_shield": "shield",
-        }
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-
-            # Check PICKUP_RUNE events (type 21)
-            if entry_type == CombatLogType.PICKUP_RUNE.value:
-                hero = self._clean_hero_name(entry.target_name)
-                if hero_filter and hero_filter.lower() not in hero.lower():
-                    continue
-                rune_type = RUNE_TYPE_MAP.get(entry.value, f"unknown_{entry.value}")
-                pickup = RunePickup(
-                    game_time=entry.game_time,
-                    game_time_str=self._format_time(entry.game_time),
-                    tick=entry.tick,
-                    hero=hero,
-                    rune_type=rune_type,
-                )
-                pickups.append(pickup)
-                continue
-
-            # Check MODIFIER_ADD events with modifier_rune_* inflictor
-            if entry_type == CombatLogType.MODIFIER_ADD.value:
-                inflictor = getattr(entry, 'inflictor_name', '')
-                if inflictor in rune_modifier_map:
-                    hero = self._clean_hero_name(entry.attacker_name)
-                    if hero_filter and hero_filter.lower() not in hero.lower():
-                        continue
-
-                    # Dedupe - same hero/time can have duplicate modifier events
-                    key = (hero, round(entry.game_time, 1))
-                    if key in seen_times:
-                        continue
-                    seen_times[key] = True
-
-                    rune_type = rune_modifier_map[inflictor]
-                    pickup = RunePickup(
-                        game_time=entry.game_time,
-                        game_time_str=self._format_time(entry.game_time),
-                        tick=entry.tick,
-                        hero=hero,
-                        rune_type=rune_type,
-                    )
-                    pickups.append(pickup)
-
+        pickups = collect(data.combat_index, self.rune_pickup_collector(hero_filter))
         pickups.sort(key=lambda p: p.game_time)
         return pickups
 
-    def get_roshan_kills(self, data: ParsedReplayData) -> List[ObjectiveKill]:
-        """Get Roshan kill events."""
-        kills = []
-        kill_number = 0
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DEATH.value:
-                continue
-
-            if "roshan" not in entry.target_name.lower():
-                continue
+    def _roshan_kill(self, entry, collected: List[ObjectiveKill]) -> ObjectiveKill:
+        """Build an ObjectiveKill from a Roshan DEATH entry, numbered after the kills so far."""
+        kill_number = len(collected) + 1
+        killer = self._clean_hero_name(entry.attacker_name)
+        team = "radiant" if entry.attacker_team == Team.RADIANT.value else "dire"
+
+        return ObjectiveKill(
+            game_time=entry.game_time,
+            game_time_str=self._format_time(entry.game_time),
+            tick=entry.tick,
+            objective_type="roshan",
+            objective_name=f"Roshan #{kill_number}",
+            killer=killer if entry.is_attacker_hero else None,
+            team=team,
+            extra_info={"kill_number": kill_number},
+        )
 
-            kill_number += 1
-            killer = self._clean_hero_name(entry.attacker_name)
-            team = "radiant" if entry.attacker_team == Team.RADIANT.value else "dire"
+    def _tormentor_kill(self, entry) -> ObjectiveKill:
+        """Build an ObjectiveKill from a Tormentor DEATH entry."""
+        # Determine side based on position or team - miniboss doesn't have side in name
+        # Use attacker team to infer which side (enemy tormentor)
+        tormentor_side = "radiant" if entry.attacker_team == Team.RADIANT.value else "dire"
+        killer = self._clean_hero_name(entry.attacker_name)
+        team = "radiant" if entry.attacker_team == Team.RADIANT.value else "dire"
+
+        return ObjectiveKill(
+            game_time=entry.game_time,
+            game_time_str=self._format_time(entry.game_time),
+            tick=entry.tick,
+            objective_type="tormentor",
+            objective_name=f"Tormentor ({tormentor_side} side)",
+            killer=killer if entry.is_attacker_hero else None,
+            team=team,
+            extra_info={"side": tormentor_side},
+        )
 
-            kill = ObjectiveKill(
-                game_time=entry.game_time,
-                game_time_str=self._format_time(entry.game_time),
-                tick=entry.tick,
-                objective_type="roshan",
-                objective_name=f"Roshan #{kill_number}",
-                killer=killer if entry.is_attacker_hero else None,
-                team=team,
-                extra_info={"kill_number": kill_number},
-            )
-            kills.append(kill)
+    def _tower_kill(self, entry) -> Optional[ObjectiveKill]:
+        """Build an ObjectiveKill from a tower DEATH entry, None if the tower has no team."""
+        target = entry.target_name.lower()
+        if "badguys" not in target and "goodguys" not in target:
+            return None
 
-        return kills
+        # Parse tower info from name
+        tower_team = "dire" if "badguys" in target else "radiant"
+        destroyed_by = "radiant" if tower_team == "dire" else "dire"
+
+        return ObjectiveKill(
+            game_time=entry.game_time,
+            game_time_str=self._format_time(entry.game_time),
+            tick=entry.tick,
+            objective_type="tower",
+            objective_name=entry.target_name,
+            killer=self._clean_hero_name(entry.attacker_name) if entry.is_attacker_hero else None,
+            team=destroyed_by,
+            extra_info={"tower_team": tower_team},
+        )
 
-    def get_tormentor_kills(self, data: ParsedReplayData) -> List[ObjectiveKill]:
-        """Get Tormentor kill events."""
-        kills = []
+    def _barracks_kill(self, entry) -> Optional[ObjectiveKill]:
+        """Build an ObjectiveKill from a DEATH entry, None if it is not a barracks."""
+        target = entry.target_name.lower()
+        if "rax" not in target and "barrack" not in target:
+            return None
 
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DEATH.value:
-                continue
+        rax_team = "dire" if "badguys" in target else "radiant"
+        destroyed_by = "radiant" if rax_team == "dire" else "dire"
+        rax_type = "melee" if "melee" in target else "ranged"
+
+        return ObjectiveKill(
+            game_time=entry.game_time,
+            game_time_str=self._format_time(entry.game_time),
+            tick=entry.tick,
+            objective_type="barracks",
+            objective_name=entry.target_name,
+            killer=self._clean_hero_name(entry.attacker_name) if entry.is_attacker_hero else None,
+            team=destroyed_by,
+            extra_info={"barracks_team": rax_team, "barracks_type": rax_type},
+        )
 
-            target = entry.target_name.lower()
-            # Tormentor is named "npc_dota_miniboss" in replay data
-            if "miniboss" not in target:
-                continue
+    def _courier_kill(self, entry, classifier: Optional[PositionClassifier]) -> CourierKill:
+        """Build a CourierKill from a courier DEATH entry."""
+        target = entry.target_name.lower()
+
+        # Determine courier owner team
+        courier_team = "dire" if "badguys" in target else "radiant"
+
+        # Extract owner from target name (e.g., npc_dota_courier_2 -> player 2)
+        owner = "unknown"
+        if "_courier_" in target:
+            try:
+                parts = target.split("_courier_")
+                if len(parts) > 1 and parts[1].isdigit():
+                    owner = f"player_{parts[1]}"
+            except (IndexError, ValueError):
+                pass
+
+        killer = self._clean_hero_name(entry.attacker_name)
+
+        # Build position if available
+        position = None
+        if hasattr(entry, 'location_x') and entry.location_x is not None:
+            from ...models.combat_log import MapLocation
+            if classifier:
+                pos_info = classifier.classify(entry.location_x, entry.location_y)
+            else:
+                pos_info = classify_map_position(entry.location_x, entry.location_y)
+            position = MapLocation(
+                x=entry.location_x,
+                y=entry.location_y,
+                region=pos_info.region,
+                lane=pos_info.lane,
+                location=pos_info.location,
+            )
 
-            # Determine side based on position or team - miniboss doesn't have side in name
-            # Use attacker team to infer which side (enemy tormentor)
-            tormentor_side = "radiant" if entry.attacker_team == Team.RADIANT.value else "dire"
-            killer = self._clean_hero_name(entry.attacker_name)
-            team = "radiant" if entry.attacker_team == Team.RADIANT.value else "dire"
+        return CourierKill(
+            game_time=entry.game_time,
+            game_time_str=self._format_time(entry.game_time),
+            tick=entry.tick,
+            killer=killer,
+            killer_is_hero=entry.is_attacker_hero,
+            owner=owner,
+            team=courier_team,
+            position=position,
+        )
 
-            kill = ObjectiveKill(
-                game_time=entry.game_time,
-                game_time_str=self._format_time(entry.game_time),
-                tick=entry.tick,
-                objective_type="tormentor",
-                objective_name=f"Tormentor ({tormentor_side} side)",
-                killer=killer if entry.is_attacker_hero else None,
-                team=team,
-                extra_info={"side": tormentor_side},
-            )
-            kills.append(kill)
+    def roshan_kill_collector(self) -> EntryCollector[ObjectiveKill]:
+        """Collector for get_roshan_kills."""
+        return EntryCollector("roshan_kills", ROSHAN_DEATHS, self._roshan_kill)
 
-        return kills
+    def tormentor_kill_collector(self) -> EntryCollector[ObjectiveKill]:
+        """Collector for get_tormentor_kills."""
+        return EntryCollector("tormentor_kills", TORMENTOR_DEATHS, lambda entry, _: self._tormentor_kill(entry))
 
-    def get_tower_kills(self, data: ParsedReplayData) -> List[ObjectiveKill]:
-        """Get tower destruction events."""
-        kills = []
+    def tower_kill_collector(self) -> EntryCollector[ObjectiveKill]:
+        """Collector for get_tower_kills."""
+        return EntryCollector("tower_kills", TOWER_DEATHS, lambda entry, _: self._tower_kill(entry))
 
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DEATH.value:
-                continue
+    def barracks_kill_collector(self) -> EntryCollector[ObjectiveKill]:
+        """Collector for get_barracks_kills."""
+        return EntryCollector("barracks_kills", ALL_DEATHS, lambda entry, _: self._barracks_kill(entry))
 
-            target = entry.target_name.lower()
-            if "tower" not in target or "badguys" not in target and "goodguys" not in target:
-                continue
+    def courier_kill_collector(self, game_context: Optional["GameContext"] = None) -> EntryCollector[CourierKill]:
+        """Collector for get_courier_kills."""
+        classifier = game_context.position_classifier if game_context else None
+        return EntryCollector("courier_kills", COURIER_DEATHS, lambda entry, _: self._courier_kill(entry, classifier))
 
-            # Parse tower info from name
-            tower_team = "dire" if "badguys" in target else "radiant"
-            destroyed_by = "radiant" if tower_team == "dire" else "dire"
+    def get_roshan_kills(self, data: ParsedReplayData) -> List[ObjectiveKill]:
+        """Get Roshan kill events."""
+        return collect(data.combat_index, self.roshan_kill_collector())
 
-            kill = ObjectiveKill(
-                game_time=entry.game_time,
-                game_time_str=self._format_time(entry.game_time),
-                tick=entry.tick,
-                objective_type="tower",
-                objective_name=entry.target_name,
-                killer=self._clean_hero_name(entry.attacker_name) if entry.is_attacker_hero else None,
-                team=destroyed_by,
-                extra_info={"tower_team": tower_team},
-            )
-            kills.append(kill)
+    def get_tormentor_kills(self, data: ParsedReplayData) -> List[ObjectiveKill]:
+        """Get Tormentor kill events."""
+        # Tormentor is named "npc_dota_miniboss" in replay data
+        return collect(data.combat_index, self.tormentor_kill_collector())
 
-        return kills
+    def get_tower_kills(self, data: ParsedReplayData) -> List[ObjectiveKill]:
+        """Get tower destruction events."""
+        return collect(data.combat_index, self.tower_kill_collector())
 
     def get_barracks_kills(self, data: ParsedReplayData) -> List[ObjectiveKill]:
         """Get barracks destruction events."""
-        kills = []
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DEATH.value:
-                continue
-
-            target = entry.target_name.lower()
-            if "rax" not in target and "barrack" not in target:
-                continue
-
-            rax_team = "dire" if "badguys" in target else "radiant"
-            destroyed_by = "radiant" if rax_team == "dire" else "dire"
-            rax_type = "melee" if "melee" in target else "ranged"
-
-            kill = ObjectiveKill(
-                game_time=entry.game_time,
-                game_time_str=self._format_time(entry.game_time),
-                tick=entry.tick,
-                objective_type="barracks",
-                objective_name=entry.target_name,
-                killer=self._clean_hero_name(entry.attacker_name) if entry.is_attacker_hero else None,
-                team=destroyed_by,
-                extra_info={"barracks_team": rax_team, "barracks_type": rax_type},
-            )
-            kills.append(kill)
-
-        return kills
+        return collect(data.combat_index, self.barracks_kill_collector())
 
     def get_courier_kills(
         self,
@@ -581,64 +624,39 @@ class CombatService:
             data: ParsedReplayData from ReplayService
             game_context: Optional GameContext for version-aware position classification
         """
-        kills = []
+        return collect(data.combat_index, self.courier_kill_collector(game_context))
 
-        # Get classifier from context if available
-        classifier = game_context.position_classifier if game_context else None
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DEATH.value:
-                continue
-
-            target = entry.target_name.lower()
-            if "courier" not in target:
-                continue
+    def get_event_families(
+        self,
+        data: ParsedReplayData,
+        game_context: Optional["GameContext"] = None,
+    ) -> Dict[str, list]:
+        """
+        Get every standard event family from one pass over the combat log.
 
-            # Determine courier owner team
-            courier_team = "dire" if "badguys" in target else "radiant"
-
-            # Extract owner from target name (e.g., npc_dota_courier_2 -> player 2)
-            owner = "unknown"
-            if "_courier_" in target:
-                try:
-                    parts = target.split("_courier_")
-                    if len(parts) > 1 and parts[1].isdigit():
-                        owner = f"player_{parts[1]}"
-                except (IndexError, ValueError):
-                    pass
-
-            killer = self._clean_hero_name(entry.attacker_name)
-
-            # Build position if available
-            position = None
-            if hasattr(entry, 'location_x') and entry.location_x is not None:
-                from ...models.combat_log import MapLocation
-                if classifier:
-                    pos_info = classifier.classify(entry.location_x, entry.location_y)
-                else:
-                    pos_info = classify_map_position(entry.location_x, entry.location_y)
-                position = MapLocation(
-                    x=entry.location_x,
-                    y=entry.location_y,
-                    region=pos_info.region,
-                    lane=pos_info.lane,
-                    location=pos_info.location,
-                )
+        Covers hero deaths, item purchases, rune pickups and Roshan, Tormentor,
+        tower, barracks and courier kills. Cheap to run right after parsing to
+        have all of them ready.
 
-            kill = CourierKill(
-                game_time=entry.game_time,
-                game_time_str=self._format_time(entry.game_time),
-                tick=entry.tick,
-                killer=killer,
-                killer_is_hero=entry.is_attacker_hero,
-                owner=owner,
-                team=courier_team,
-                position=position,
-            )
-            kills.append(kill)
+        Args:
+            data: ParsedReplayData from ReplayService
+            game_context: Optional GameContext for version-aware position classification
 
-        return kills
+        Returns:
+            Dictionary mapping family name (the collector name, e.g. "roshan_kills")
+            to its events, sorted by game time
+        """
+        scanner = CombatLogScanner([
+            self.hero_death_collector(data, game_context=game_context),
+            self.item_purchase_collector(),
+            self.rune_pickup_collector(),
+            self.roshan_kill_collector(),
+            self.tormentor_kill_collector(),
+            self.tower_kill_collector(),
+            self.barracks_kill_collector(),
+            self.courier_kill_collector(game_context),
+        ])
+        return scanner.scan(data.combat_index)
 
     def _get_event_type_name(self, entry_type: int) -> str:
         """Get human-readable event type name."""
@@ -705,6 +723,90 @@ class CombatService:
 
         return True
 
+    def _iter_combat_log(
+        self,
+        data: ParsedReplayData,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        hero_filter: Optional[str] = None,
+        ability_filter: Optional[str] = None,
+        types: Optional[List[int]] = None,
+        detail_level: DetailLevel = DetailLevel.FULL,
+        from_rank: int = 0,
+    ) -> Iterator[Tuple[int, CombatLogEntry]]:
+        """Lazily yield (rank, entry) of entries passing every filter, in game time order, from a rank on."""
+        # The index narrows to the time/type/hero slice, so only those entries are visited
+        index = data.combat_index
+        ranks = index.run_ranks(CombatLogQuery.build(start_time, end_time, types, hero_filter))
+
+        # Ability filter resolved once per distinct inflictor name
+        ability_ids = None
+        if ability_filter:
+            ability_filter_lower = ability_filter.lower()
+            ability_ids = index.symbols.ids_where(lambda name: ability_filter_lower in name.lower())
+
+        for position in range(bisect_left(ranks, from_rank), len(ranks)):
+            rank = ranks[position]
+            entry = index.entry(rank)
+            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
+
+            # Apply detail level filter
+            if not self._passes_detail_level_filter(
+                entry_type,
+                entry.is_attacker_hero,
+                entry.is_target_hero,
+                detail_level,
+            ):
+                continue
+
+            # Ability filter
+            if ability_ids is not None and index.ids(rank)[2] not in ability_ids:
+                continue
+
+            yield rank, entry
+
+    def _combat_log_event(self, index: CombatLogIndex, rank: int) -> CombatLogEvent:
+        """Build the CombatLogEvent for the combat log entry at an index rank."""
+        entry = index.entry(rank)
+        symbols = index.symbols
+        attacker_id, target_id, inflictor_id = index.ids(rank)
+        entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
+        game_time = entry.game_time
+        attacker = symbols.clean(attacker_id)
+        target = symbols.clean(target_id)
+
+        # Determine if ability "hit" (for ABILITY events)
+        hit = None
+        if entry_type == CombatLogType.ABILITY.value:
+            hit = entry.is_target_hero if hasattr(entry, 'is_target_hero') else None
+
+        # Extract hero levels for DEATH events
+        attacker_level = None
+        target_level = None
+        if entry_type == CombatLogType.DEATH.value and entry.is_target_hero:
+            atk_lvl = getattr(entry, 'attacker_hero_level', None)
+            if atk_lvl and atk_lvl > 0:
+                attacker_level = atk_lvl
+            tgt_lvl = getattr(entry, 'target_hero_level', None)
+            if tgt_lvl and tgt_lvl > 0:
+                target_level = tgt_lvl
+
+        return CombatLogEvent(
+            type=self._get_event_type_name(entry_type),
+            game_time=game_time,
+            game_time_str=self._format_time(game_time),
+            tick=entry.tick,
+            attacker=attacker,
+            attacker_is_hero=entry.is_attacker_hero,
+            attacker_level=attacker_level,
+            target=target,
+            target_is_hero=entry.is_target_hero,
+            target_level=target_level,
+            ability=self._ability_display(symbols, inflictor_id, entry.is_attacker_hero),
+            value=entry.value if hasattr(entry, 'value') else None,
+            hit=hit,
+        )
+
     def get_combat_log(
         self,
         data: ParsedReplayData,
@@ -732,91 +834,69 @@ class CombatService:
         Returns:
             List of CombatLogEvent sorted by game time
         """
-        events = []
-        ability_filter_lower = ability_filter.lower() if ability_filter else None
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-
-            # Type filter
-            if types is not None and entry_type not in types:
-                continue
-
-            # Time filter
-            game_time = entry.game_time
-            if start_time is not None and game_time < start_time:
-                continue
-            if end_time is not None and game_time > end_time:
-                continue
-
-            # Apply detail level filter
-            if not self._passes_detail_level_filter(
-                entry_type,
-                entry.is_attacker_hero,
-                entry.is_target_hero,
-                detail_level,
-            ):
-                continue
-
-            attacker = self._clean_hero_name(entry.attacker_name)
-            target = self._clean_hero_name(entry.target_name)
+        matching = self._iter_combat_log(
+            data, start_time, end_time, hero_filter, ability_filter, types, detail_level
+        )
+        index = data.combat_index
+        return [self._combat_log_event(index, rank) for rank, _ in islice(matching, max_events)]
 
-            # Hero filter
-            if hero_filter:
-                hero_lower = hero_filter.lower()
-                if hero_lower not in attacker.lower() and hero_lower not in target.lower():
-                    continue
+    def get_combat_log_page(
+        self,
+        data: ParsedReplayData,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        hero_filter: Optional[str] = None,
+        ability_filter: Optional[str] = None,
+        types: Optional[List[int]] = None,
+        detail_level: DetailLevel = DetailLevel.FULL,
+        page_size: int = DEFAULT_MAX_EVENTS,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[CombatLogEvent], Optional[str]]:
+        """
+        Get one page of filtered combat log events.
 
-            # Ability filter
-            if ability_filter_lower:
-                ability = entry.inflictor_name or ""
-                if ability_filter_lower not in ability.lower():
-                    continue
+        Only the returned page is built; the next page resumes from the cursor
+        without rescanning earlier entries.
 
-            # Determine if ability "hit" (for ABILITY events)
-            hit = None
-            if entry_type == CombatLogType.ABILITY.value:
-                hit = entry.is_target_hero if hasattr(entry, 'is_target_hero') else None
-
-            # Extract hero levels for DEATH events
-            attacker_level = None
-            target_level = None
-            if entry_type == CombatLogType.DEATH.value and entry.is_target_hero:
-                atk_lvl = getattr(entry, 'attacker_hero_level', None)
-                if atk_lvl and atk_lvl > 0:
-                    attacker_level = atk_lvl
-                tgt_lvl = getattr(entry, 'target_hero_level', None)
-                if tgt_lvl and tgt_lvl > 0:
-                    target_level = tgt_lvl
-
-            event = CombatLogEvent(
-                type=self._get_event_type_name(entry_type),
-                game_time=game_time,
-                game_time_str=self._format_time(game_time),
-                tick=entry.tick,
-                attacker=attacker,
-                attacker_is_hero=entry.is_attacker_hero,
-                attacker_level=attacker_level,
-                target=target,
-                target_is_hero=entry.is_target_hero,
-                target_level=target_level,
-                ability=self._normalize_ability_name(entry.inflictor_name, entry.is_attacker_hero),
-                value=entry.value if hasattr(entry, 'value') else None,
-                hit=hit,
-            )
-            events.append(event)
+        Args:
+            data: ParsedReplayData from ReplayService
+            start_time, end_time, hero_filter, ability_filter, types, detail_level:
+                Filters, as for get_combat_log. Must be the same on every page.
+            page_size: Maximum events in the page
+            cursor: next_cursor from the previous page, None for the first page
 
-            # Check max_events cap
-            if max_events is not None and len(events) >= max_events:
-                break
+        Returns:
+            Tuple of (events sorted by game time, cursor of the next page or None if this is the last)
 
-        events.sort(key=lambda e: e.game_time)
+        Raises:
+            ValueError: If the cursor is malformed, was issued for other filters or another log
+        """
+        fingerprint = filters_fingerprint(
+            data.match_id, start_time, end_time, hero_filter, ability_filter,
+            sorted(types) if types is not None else None, detail_level.value,
+        )
+        from_rank = 0
+        index = data.combat_index
+        if cursor:
+            position = CombatLogCursor.decode(cursor)
+            if (
+                position.fingerprint != fingerprint
+                or position.rank >= len(index)
+                or index.entry(position.rank).tick != position.tick
+            ):
+                raise ValueError("Combat log cursor does not match this match and these filters")
+            from_rank = position.rank
 
-        # Apply max_events after sorting (in case we added unsorted)
-        if max_events is not None and len(events) > max_events:
-            events = events[:max_events]
+        matching = self._iter_combat_log(
+            data, start_time, end_time, hero_filter, ability_filter, types, detail_level, from_rank
+        )
+        events = [self._combat_log_event(index, rank) for rank, _ in islice(matching, page_size)]
 
-        return events
+        following = next(matching, None)
+        if following is None:
+            return events, None
+        rank, entry = following
+        return events, CombatLogCursor(rank=rank, tick=entry.tick, fingerprint=fingerprint).encode()
 
     # ============ Response methods (return API Response models) ============
 
@@ -850,23 +930,26 @@ class CombatService:
         ability_filter: Optional[str] = None,
         detail_level: DetailLevel = DetailLevel.NARRATIVE,
         max_events: int = DEFAULT_MAX_EVENTS,
+        cursor: Optional[str] = None,
     ) -> CombatLogResponse:
-        """Get combat log and return API response model."""
+        """Get one page of the combat log and return API response model.
+
+        Pass the response's next_cursor back as cursor to get the following page.
+        """
         # Cap max_events to prevent abuse
         effective_max = min(max_events, MAX_EVENTS_CAP)
 
-        events = self.get_combat_log(
+        events, next_cursor = self.get_combat_log_page(
             data,
             start_time=start_time,
             end_time=end_time,
             hero_filter=hero_filter,
             ability_filter=ability_filter,
             detail_level=detail_level,
-            max_events=effective_max,
+            page_size=effective_max,
+            cursor=cursor,
         )
 
-        truncated = len(events) >= effective_max
-
         return CombatLogResponse(
             success=True,
             match_id=match_id,
@@ -877,7 +960,8 @@ class CombatService:
                 hero_filter=hero_filter,
             ),
             events=events,
-            truncated=truncated,
+            truncated=next_cursor is not None,
+            next_cursor=next_cursor,
             detail_level=detail_level.value,
         )
 
@@ -955,10 +1039,16 @@ class CombatService:
         match_id: int,
     ) -> ObjectiveKillsResponse:
         """Get all objective kills and return API response model."""
-        roshan_objs = self.get_roshan_kills(data)
-        tormentor_objs = self.get_tormentor_kills(data)
-        tower_objs = self.get_tower_kills(data)
-        barracks_objs = self.get_barracks_kills(data)
+        objectives = CombatLogScanner([
+            self.roshan_kill_collector(),
+            self.tormentor_kill_collector(),
+            self.tower_kill_collector(),
+            self.barracks_kill_collector(),
+        ]).scan(data.combat_index)
+        roshan_objs = objectives["roshan_kills"]
+        tormentor_objs = objectives["tormentor_kills"]
+        tower_objs = objectives["tower_kills"]
+        barracks_objs = objectives["barracks_kills"]
 
         roshan_kills = [
             RoshanKill(
@@ -1026,161 +1116,177 @@ class CombatService:
             barracks_kills=barracks_kills,
         )
 
-    def get_hero_combat_analysis(
+    def _count_ability_event(
+        self,
+        entry,
+        entry_type: int,
+        is_our_hero_attacker: bool,
+        hero_lower: str,
+        ability_filter_lower: Optional[str],
+        tally: AbilityTally,
+    ) -> None:
+        """Count an ABILITY cast or credit a MODIFIER_ADD hit to an already cast ability."""
+        if entry_type == CombatLogType.ABILITY.value and is_our_hero_attacker:
+            ability = entry.inflictor_name
+            if ability and ability != "dota_unknown":
+                # Apply ability filter if specified
+                if ability_filter_lower and ability_filter_lower not in ability.lower():
+                    return
+                tally.casts[ability] = tally.casts.get(ability, 0) + 1
+                if entry.is_target_hero:
+                    tally.hits[ability] = tally.hits.get(ability, 0) + 1
+
+        elif entry_type == CombatLogType.MODIFIER_ADD.value:
+            modifier = entry.inflictor_name
+            if modifier and modifier != "dota_unknown" and entry.is_target_hero:
+                if is_our_hero_attacker or (modifier and hero_lower in modifier.lower()):
+                    for tracked_ability in tally.casts.keys():
+                        ability_base = tracked_ability.split("_")[-1]
+                        if ability_base in modifier.lower():
+                            tally.hits[tracked_ability] = tally.hits.get(tracked_ability, 0) + 1
+                            break
+
+    def _aggregate_hero_combat_python(
         self,
         data: ParsedReplayData,
-        match_id: int,
         hero: str,
-        fights: List,
+        windows: List[Tuple[float, float]],
         ability_filter: Optional[str] = None,
-    ) -> HeroCombatAnalysisResponse:
-        """
-        Analyze a hero's combat involvement across the entire match.
-
-        Args:
-            data: ParsedReplayData from ReplayService
-            match_id: Match ID for response
-            hero: Hero name to analyze
-            fights: List of Fight objects from FightService
-            ability_filter: Only show this ability in results
-
-        Returns:
-            HeroCombatAnalysisResponse with match-wide stats and per-fight breakdown
-        """
+    ) -> HeroCombatAggregates:
+        """Row-by-row hero combat aggregation (used when numpy is not available)."""
         hero_lower = hero.lower()
         ability_filter_lower = ability_filter.lower() if ability_filter else None
-        hero_fights: List[FightParticipation] = []
-        total_kills = 0
-        total_deaths = 0
-        total_assists = 0
-        total_teamfights = 0
-
-        # Track level advantages for kills/deaths
-        kill_level_advantages: List[int] = []
-        death_level_disadvantages: List[int] = []
+        aggregates = HeroCombatAggregates()
+        index = data.combat_index
+        symbols = index.symbols
+        ours = symbols.ids_matching(hero_lower)
 
         # First pass: count ALL ability usage across the entire match
-        match_ability_casts: dict = {}
-        match_ability_hits: dict = {}
-
-        for entry in data.combat_log_entries:
+        ability_ranks = index.run_ranks(
+            CombatLogQuery.build(types=[CombatLogType.ABILITY.value, CombatLogType.MODIFIER_ADD.value])
+        )
+        for rank in ability_ranks:
+            entry = index.entry(rank)
             entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            attacker = self._clean_hero_name(entry.attacker_name)
-            attacker_lower = attacker.lower()
-            is_our_hero_attacker = hero_lower in attacker_lower
-
-            if entry_type == CombatLogType.ABILITY.value and is_our_hero_attacker:
-                ability = entry.inflictor_name
-                if ability and ability != "dota_unknown":
-                    # Apply ability filter if specified
-                    if ability_filter_lower and ability_filter_lower not in ability.lower():
-                        continue
-                    match_ability_casts[ability] = match_ability_casts.get(ability, 0) + 1
-                    if entry.is_target_hero:
-                        match_ability_hits[ability] = match_ability_hits.get(ability, 0) + 1
-
-            elif entry_type == CombatLogType.MODIFIER_ADD.value:
-                modifier = entry.inflictor_name
-                if modifier and modifier != "dota_unknown" and entry.is_target_hero:
-                    if is_our_hero_attacker or (modifier and hero_lower in modifier.lower()):
-                        for tracked_ability in match_ability_casts.keys():
-                            ability_base = tracked_ability.split("_")[-1]
-                            if ability_base in modifier.lower():
-                                match_ability_hits[tracked_ability] = match_ability_hits.get(tracked_ability, 0) + 1
-                                break
+            is_our_hero_attacker = index.ids(rank)[0] in ours
+            self._count_ability_event(
+                entry, entry_type, is_our_hero_attacker, hero_lower, ability_filter_lower,
+                aggregates.match_abilities,
+            )
 
         # Second pass: per-fight breakdown
-        for fight in fights:
-            if not any(hero_lower in p.lower() for p in fight.participants):
-                continue
-
-            fight_start = fight.start_time - 2.0
-            fight_end = fight.end_time + 2.0
-
-            kills = 0
-            deaths = 0
-            assists = 0
-            damage_dealt = 0
-            damage_received = 0
-            ability_casts: dict = {}
-            ability_hits: dict = {}
+        for fight_start, fight_end in windows:
+            stats = FightCombatStats()
             heroes_damaged_by_hero: set = set()
 
-            for entry in data.combat_log_entries:
+            for rank in index.rank_range(fight_start, fight_end):
+                entry = index.entry(rank)
                 entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-                if entry.game_time < fight_start or entry.game_time > fight_end:
-                    continue
 
-                attacker = self._clean_hero_name(entry.attacker_name)
-                target = self._clean_hero_name(entry.target_name)
-                attacker_lower = attacker.lower()
-                target_lower = target.lower()
-                is_our_hero_attacker = hero_lower in attacker_lower
-                is_our_hero_target = hero_lower in target_lower
+                attacker_id, target_id, _ = index.ids(rank)
+                target_lower = symbols.key(target_id)
+                is_our_hero_attacker = attacker_id in ours
+                is_our_hero_target = target_id in ours
 
                 if entry_type == CombatLogType.DEATH.value and entry.is_target_hero:
                     if is_our_hero_attacker:
-                        kills += 1
+                        stats.kills += 1
                         # Track level advantage on kills
                         if hasattr(entry, 'attacker_hero_level') and hasattr(entry, 'target_hero_level'):
                             attacker_lvl = entry.attacker_hero_level
                             target_lvl = entry.target_hero_level
                             if attacker_lvl and attacker_lvl > 0 and target_lvl and target_lvl > 0:
-                                kill_level_advantages.append(attacker_lvl - target_lvl)
+                                aggregates.kill_level_advantages.append(attacker_lvl - target_lvl)
                     elif is_our_hero_target:
-                        deaths += 1
+                        stats.deaths += 1
                         # Track level disadvantage on deaths
                         if hasattr(entry, 'attacker_hero_level') and hasattr(entry, 'target_hero_level'):
                             attacker_lvl = entry.attacker_hero_level
                             target_lvl = entry.target_hero_level
                             if attacker_lvl and attacker_lvl > 0 and target_lvl and target_lvl > 0:
-                                death_level_disadvantages.append(attacker_lvl - target_lvl)
+                                aggregates.death_level_disadvantages.append(attacker_lvl - target_lvl)
                     elif target_lower in heroes_damaged_by_hero:
-                        assists += 1
+                        stats.assists += 1
 
                 elif entry_type == CombatLogType.DAMAGE.value:
                     if is_our_hero_attacker and entry.is_target_hero:
-                        damage_dealt += entry.value or 0
+                        stats.damage_dealt += entry.value or 0
                         heroes_damaged_by_hero.add(target_lower)
                     elif is_our_hero_target and entry.is_attacker_hero:
-                        damage_received += entry.value or 0
-
-                elif entry_type == CombatLogType.ABILITY.value and is_our_hero_attacker:
-                    ability = entry.inflictor_name
-                    if ability and ability != "dota_unknown":
-                        # Apply ability filter if specified
-                        if ability_filter_lower and ability_filter_lower not in ability.lower():
-                            continue
-                        ability_casts[ability] = ability_casts.get(ability, 0) + 1
-                        if entry.is_target_hero:
-                            ability_hits[ability] = ability_hits.get(ability, 0) + 1
-
-                elif entry_type == CombatLogType.MODIFIER_ADD.value:
-                    modifier = entry.inflictor_name
-                    if modifier and modifier != "dota_unknown" and entry.is_target_hero:
-                        if is_our_hero_attacker or (modifier and hero_lower in modifier.lower()):
-                            for tracked_ability in ability_casts.keys():
-                                ability_base = tracked_ability.split("_")[-1]
-                                if ability_base in modifier.lower():
-                                    ability_hits[tracked_ability] = ability_hits.get(tracked_ability, 0) + 1
-                                    break
-
-            abilities_used = []
-            for ability_name, cast_count in ability_casts.items():
-                hits = ability_hits.get(ability_name, 0)
-                hit_rate = (hits / cast_count * 100) if cast_count > 0 else 0.0
-                abilities_used.append(AbilityUsage(
-                    ability=ability_name,
-                    total_casts=cast_count,
-                    hero_hits=hits,
-                    hit_rate=round(hit_rate, 1),
-                ))
-
-            abilities_used.sort(key=lambda a: a.total_casts, reverse=True)
-
-            total_kills += kills
-            total_deaths += deaths
-            total_assists += assists
+                        stats.damage_received += entry.value or 0
+
+                else:
+                    self._count_ability_event(
+                        entry, entry_type, is_our_hero_attacker, hero_lower, ability_filter_lower, stats.abilities
+                    )
+
+            aggregates.fights.append(stats)
+
+        return aggregates
+
+    def _aggregate_hero_combat(
+        self,
+        data: ParsedReplayData,
+        hero: str,
+        windows: List[Tuple[float, float]],
+        ability_filter: Optional[str] = None,
+    ) -> HeroCombatAggregates:
+        """Hero combat aggregates over the match and each fight window, using the configured backend."""
+        if self._aggregation_backend == "numpy":
+            return aggregate_hero_combat(data.combat_index.arrays(), hero, windows, ability_filter)
+        return self._aggregate_hero_combat_python(data, hero, windows, ability_filter)
+
+    def _ability_usage(self, tally: AbilityTally) -> List[AbilityUsage]:
+        """AbilityUsage per cast ability, most cast first."""
+        abilities_used = []
+        for ability_name, cast_count in tally.casts.items():
+            hits = tally.hits.get(ability_name, 0)
+            hit_rate = (hits / cast_count * 100) if cast_count > 0 else 0.0
+            abilities_used.append(AbilityUsage(
+                ability=ability_name,
+                total_casts=cast_count,
+                hero_hits=hits,
+                hit_rate=round(hit_rate, 1),
+            ))
+        abilities_used.sort(key=lambda a: a.total_casts, reverse=True)
+        return abilities_used
+
+    def get_hero_combat_analysis(
+        self,
+        data: ParsedReplayData,
+        match_id: int,
+        hero: str,
+        fights: List,
+        ability_filter: Optional[str] = None,
+    ) -> HeroCombatAnalysisResponse:
+        """
+        Analyze a hero's combat involvement across the entire match.
+
+        Args:
+            data: ParsedReplayData from ReplayService
+            match_id: Match ID for response
+            hero: Hero name to analyze
+            fights: List of Fight objects from FightService
+            ability_filter: Only show this ability in results
+
+        Returns:
+            HeroCombatAnalysisResponse with match-wide stats and per-fight breakdown
+        """
+        hero_lower = hero.lower()
+        hero_fights: List[FightParticipation] = []
+        total_kills = 0
+        total_deaths = 0
+        total_assists = 0
+        total_teamfights = 0
+
+        participated = [f for f in fights if any(hero_lower in p.lower() for p in f.participants)]
+        windows = [(f.start_time - 2.0, f.end_time + 2.0) for f in participated]
+        aggregates = self._aggregate_hero_combat(data, hero, windows, ability_filter)
+
+        for fight, stats in zip(participated, aggregates.fights):
+            total_kills += stats.kills
+            total_deaths += stats.deaths
+            total_assists += stats.assists
             if fight.is_teamfight:
                 total_teamfights += 1
 
@@ -1195,28 +1301,20 @@ class CombatService:
                 fight_end_str=fight.end_time_str,
                 is_teamfight=fight.is_teamfight,
                 hero_level=hero_level,
-                kills=kills,
-                deaths=deaths,
-                assists=assists,
-                abilities_used=abilities_used,
-                damage_dealt=damage_dealt,
-                damage_received=damage_received,
+                kills=stats.kills,
+                deaths=stats.deaths,
+                assists=stats.assists,
+                abilities_used=self._ability_usage(stats.abilities),
+                damage_dealt=stats.damage_dealt,
+                damage_received=stats.damage_received,
             ))
 
         # Build ability_summary from match-wide stats (not just fights)
-        ability_summary = []
-        for ability_name, cast_count in match_ability_casts.items():
-            hits = match_ability_hits.get(ability_name, 0)
-            hit_rate = (hits / cast_count * 100) if cast_count > 0 else 0.0
-            ability_summary.append(AbilityUsage(
-                ability=ability_name,
-                total_casts=cast_count,
-                hero_hits=hits,
-                hit_rate=round(hit_rate, 1),
-            ))
-        ability_summary.sort(key=lambda a: a.total_casts, reverse=True)
+        ability_summary = self._ability_usage(aggregates.match_abilities)
 
         # Calculate average level advantages
+        kill_level_advantages = aggregates.kill_level_advantages
+        death_level_disadvantages = aggregates.death_level_disadvantages
         avg_kill_advantage = None
         avg_death_disadvantage = None
         if kill_level_advantages:
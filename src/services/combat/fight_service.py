@@ -3,6 +3,10 @@ Fight service - high-level API for fight analysis.
 
 Combines CombatService and FightDetector for convenient fight queries.
 Uses combat-intensity based detection to catch fights without deaths.
+Detection runs once per match and detector parameters: the result is
+memoised on the ParsedReplayData as a FightIndex (id, time and hero lookups,
+highlights per fight), and also cached across processes when a
+DerivedResultCache is given.
 """
 
 import logging
@@ -11,12 +15,17 @@ from typing import List, Optional, Set
 from ...models.combat_log import DetailLevel
 from ..analyzers.fight_analyzer import FightAnalyzer
 from ..analyzers.fight_detector import FightDetector
+from ..analyzers.fight_index import FightIndex
+from ..cache.derived_cache import DerivedResultCache
 from ..models.combat_data import Fight, FightResult, HeroDeath
 from ..models.replay_data import ParsedReplayData
 from .combat_service import CombatService
 
 logger = logging.getLogger(__name__)
 
+# Bump when fight detection output changes, to invalidate cached results
+FIGHT_DETECTION_VERSION = 1
+
 
 class FightService:
     """
@@ -34,10 +43,65 @@ class FightService:
         combat_service: Optional[CombatService] = None,
         fight_detector: Optional[FightDetector] = None,
         fight_analyzer: Optional[FightAnalyzer] = None,
+        derived_cache: Optional[DerivedResultCache] = None,
     ):
         self._combat = combat_service or CombatService()
         self._detector = fight_detector or FightDetector()
         self._analyzer = fight_analyzer or FightAnalyzer()
+        self._derived = derived_cache
+
+    def _params(self) -> dict:
+        return {
+            "combat_gap": self._detector.combat_gap,
+            "teamfight_threshold": self._detector.teamfight_threshold,
+        }
+
+    def _cached(self, data: ParsedReplayData, analysis: str, compute) -> FightResult:
+        """Run a detection, reusing the cached result for this match and detector settings."""
+        if self._derived is None:
+            return compute()
+        return self._derived.get_or_compute(data, analysis, FIGHT_DETECTION_VERSION, self._params(), compute)
+
+    def _index(self, data: ParsedReplayData, analysis: str, compute) -> FightIndex:
+        """Detected fights of a match for an analysis, memoised per detector settings."""
+        key = (analysis, FIGHT_DETECTION_VERSION, tuple(sorted(self._params().items())))
+        return data.fight_index(
+            key, lambda: FightIndex(self._cached(data, analysis, compute), data.combat_log_entries)
+        )
+
+    def get_fight_index(self, data: ParsedReplayData) -> FightIndex:
+        """
+        Get the indexed death-based fights of a match (detected on first use).
+
+        Args:
+            data: ParsedReplayData from ReplayService
+
+        Returns:
+            FightIndex over the result of get_all_fights
+        """
+        def compute() -> FightResult:
+            deaths = self._combat.get_hero_deaths(data)
+            return self._detector.detect_fights(deaths)
+
+        return self._index(data, "fights", compute)
+
+    def get_fight_index_from_combat(self, data: ParsedReplayData) -> FightIndex:
+        """
+        Get the indexed combat-intensity fights of a match (detected on first use).
+
+        Args:
+            data: ParsedReplayData from ReplayService
+
+        Returns:
+            FightIndex over the result of get_all_fights_from_combat
+        """
+        def compute() -> FightResult:
+            # Get all combat events (DAMAGE, ABILITY, ITEM)
+            all_events = self._combat.get_combat_log(data, detail_level=DetailLevel.FULL)
+            deaths = self._combat.get_hero_deaths(data)
+            return self._detector.detect_fights_from_combat(all_events, deaths)
+
+        return self._index(data, "fights_from_combat", compute)
 
     def get_all_fights(self, data: ParsedReplayData) -> FightResult:
         """
@@ -49,8 +113,7 @@ class FightService:
         Returns:
             FightResult with all fights, statistics
         """
-        deaths = self._combat.get_hero_deaths(data)
-        return self._detector.detect_fights(deaths)
+        return self.get_fight_index(data).result
 
     def get_all_fights_from_combat(self, data: ParsedReplayData) -> FightResult:
         """
@@ -66,10 +129,7 @@ class FightService:
         Returns:
             FightResult with detected fights
         """
-        # Get all combat events (DAMAGE, ABILITY, ITEM)
-        all_events = self._combat.get_combat_log(data, detail_level=DetailLevel.FULL)
-        deaths = self._combat.get_hero_deaths(data)
-        return self._detector.detect_fights_from_combat(all_events, deaths)
+        return self.get_fight_index_from_combat(data).result
 
     def get_fight_by_id(
         self,
@@ -86,11 +146,7 @@ class FightService:
         Returns:
             Fight if found, None otherwise
         """
-        result = self.get_all_fights(data)
-        for fight in result.fights:
-            if fight.fight_id == fight_id:
-                return fight
-        return None
+        return self.get_fight_index(data).fight(fight_id)
 
     def get_fight_at_time(
         self,
@@ -109,8 +165,8 @@ class FightService:
         Returns:
             Fight if found, None otherwise
         """
-        deaths = self._combat.get_hero_deaths(data)
-        return self._detector.get_fight_at_time(deaths, reference_time, hero)
+        # Same windows as FightDetector.get_fight_at_time: 5s before a fight to 15s after
+        return self.get_fight_index(data).fight_at(reference_time, hero, before=5.0, after=15.0)
 
     def get_teamfights(
         self,
@@ -227,13 +283,7 @@ class FightService:
         Returns:
             List of fights involving the hero
         """
-        result = self.get_all_fights(data)
-        hero_lower = hero.lower()
-
-        return [
-            f for f in result.fights
-            if any(hero_lower in p.lower() for p in f.participants)
-        ]
+        return self.get_fight_index(data).hero_fights(hero)
 
     def _filter_events_by_detail_level(
         self,
@@ -349,20 +399,13 @@ class FightService:
         Returns:
             Dictionary with fight info, combat events, and highlights, or None if no fight found
         """
-        # Get all combat events ONCE for detection, response, and highlights
-        # This avoids iterating over the entire combat log 3 times
-        all_events = self._combat.get_combat_log(
-            data, detail_level=DetailLevel.FULL
-        )
-        deaths = self._combat.get_hero_deaths(data)
-
         if use_combat_detection:
-            # Use combat-intensity based detection
-            fight = self._detector.get_fight_at_time_from_combat(
-                all_events, deaths, reference_time, hero
-            )
+            # Use combat-intensity based detection (reuses detected fights for this match)
+            index = self.get_fight_index_from_combat(data)
+            fight = index.fight_at(reference_time, hero)
         else:
             # Legacy death-based detection
+            index = self.get_fight_index(data)
             fight = self.get_fight_at_time(data, reference_time, hero)
 
         if not fight:
@@ -372,28 +415,28 @@ class FightService:
         start_time = fight.start_time - 2.0
         end_time = fight.end_time + 2.0
 
-        # Filter events from already-loaded all_events instead of re-iterating combat log
-        # This is O(n) on the already-loaded list, not O(n) on raw combat log entries
-        highlight_events = [
-            e for e in all_events
-            if start_time <= e.game_time <= end_time
-        ]
+        # Only the fight window is read, via the combat log index
+        highlight_events = self._combat.get_combat_log(
+            data, start_time=start_time, end_time=end_time, detail_level=DetailLevel.FULL
+        )
 
         # Apply detail level filter for response events
         response_events = self._filter_events_by_detail_level(
             highlight_events, detail_level, max_events
         )
 
-        # Get team rosters for ace detection
-        radiant_heroes, dire_heroes = self._get_team_heroes(data)
+        def analyze():
+            # Get team rosters for ace detection
+            radiant_heroes, dire_heroes = self._get_team_heroes(data)
+            return self._analyzer.analyze_fight(
+                events=highlight_events,
+                deaths=fight.deaths,
+                radiant_heroes=radiant_heroes,
+                dire_heroes=dire_heroes,
+            )
 
-        # Analyze fight for highlights
-        highlights = self._analyzer.analyze_fight(
-            events=highlight_events,
-            deaths=fight.deaths,
-            radiant_heroes=radiant_heroes,
-            dire_heroes=dire_heroes,
-        )
+        # Analyze fight for highlights (once per fight and match)
+        highlights = index.highlights(fight, analyze)
 
         return {
             "fight_id": fight.fight_id,
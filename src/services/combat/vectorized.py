@@ -0,0 +1,266 @@
+"""
+NumPy-backed combat log columns and vectorized hero combat aggregations.
+
+CombatLogArrays holds a match's combat log as one array per field (type,
+game time, attacker/target/inflictor string ids, value, hero flags and
+levels), in the same game-time order as CombatLogIndex ranks. Unit and
+ability names are interned once, so every name test the services make
+("is this our hero", "does this ability match the filter") runs once per
+distinct string and is then broadcast over the log.
+
+aggregate_hero_combat() computes the numbers behind
+CombatService.get_hero_combat_analysis (damage sums, cast/hit counts and
+kills/deaths/assists per fight window) with the same rules as the
+row-by-row implementation, which stays available as the fallback.
+
+Install numpy with: pip install mcp-replay-dota2[vectorized]
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import logging
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from python_manta import CombatLogEntry, CombatLogType
+
+from ..models.combat_data import AbilityTally, FightCombatStats, HeroCombatAggregates
+from .combat_log_index import _entry_type, unit_key
+from .combat_log_symbols import CombatLogSymbols
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_INFLICTOR = "dota_unknown"
+
+
+def numpy_available() -> bool:
+    """Check if numpy is installed."""
+    return np is not None
+
+
+class CombatLogArrays:
+    """
+    Column-per-field numpy view of a combat log.
+
+    Row N is the entry at CombatLogIndex rank N (game-time order). Names are
+    interned into ``symbols`` (``strings`` lists them by id); None and empty
+    names share id 0.
+    """
+
+    def __init__(self, entries: Sequence[CombatLogEntry], symbols: Optional[CombatLogSymbols] = None):
+        if np is None:
+            raise ImportError("numpy is required for CombatLogArrays (pip install mcp-replay-dota2[vectorized])")
+
+        # Share the index's symbol table when given, so string ids match CombatLogIndex.ids()
+        self.symbols = symbols if symbols is not None else CombatLogSymbols()
+        intern = self.symbols.intern
+
+        count = len(entries)
+        self.type = np.fromiter((_entry_type(e) for e in entries), dtype=np.int16, count=count)
+        self.game_time = np.fromiter((e.game_time for e in entries), dtype=np.float64, count=count)
+        self.attacker = np.fromiter((intern(e.attacker_name) for e in entries), dtype=np.int32, count=count)
+        self.target = np.fromiter((intern(e.target_name) for e in entries), dtype=np.int32, count=count)
+        self.inflictor = np.fromiter((intern(e.inflictor_name) for e in entries), dtype=np.int32, count=count)
+        self.value = np.fromiter((e.value or 0 for e in entries), dtype=np.int64, count=count)
+        self.attacker_hero = np.fromiter((bool(e.is_attacker_hero) for e in entries), dtype=bool, count=count)
+        self.target_hero = np.fromiter((bool(e.is_target_hero) for e in entries), dtype=bool, count=count)
+        self.attacker_level = np.fromiter((e.attacker_hero_level or 0 for e in entries), dtype=np.int32, count=count)
+        self.target_level = np.fromiter((e.target_hero_level or 0 for e in entries), dtype=np.int32, count=count)
+
+        self.strings: List[str] = list(self.symbols.names)
+
+        # Unit key id of every string, so names differing only by prefix/case compare equal
+        keys: Dict[str, int] = {}
+        self.unit_keys = np.array([keys.setdefault(k, len(keys)) for k in self.symbols.keys], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.type)
+
+    def string_mask(self, predicate: Callable[[str], bool]) -> "np.ndarray":
+        """Boolean mask over string ids: predicate applied once per distinct string."""
+        return np.fromiter((predicate(s) for s in self.strings), dtype=bool, count=len(self.strings))
+
+    def rank_ranges(self, windows: Sequence[Tuple[float, float]]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Row ranges [lo, hi) of entries with start <= game_time <= end, per window."""
+        starts = np.array([w[0] for w in windows], dtype=np.float64)
+        ends = np.array([w[1] for w in windows], dtype=np.float64)
+        lo = np.searchsorted(self.game_time, starts, side="left")
+        hi = np.maximum(lo, np.searchsorted(self.game_time, ends, side="right"))
+        return lo, hi
+
+
+def _window_counts(mask: "np.ndarray", lo: "np.ndarray", hi: "np.ndarray", weights=None) -> "np.ndarray":
+    """Number (or weight sum) of True rows of mask in each [lo, hi) range."""
+    values = mask if weights is None else np.where(mask, weights, 0)
+    cumulative = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+    return cumulative[hi] - cumulative[lo]
+
+
+class _AbilityMatcher:
+    """Tallies casts and hero hits; caches which modifiers credit which ability."""
+
+    def __init__(self, arrays: CombatLogArrays):
+        self._arrays = arrays
+        self._credits: Dict[Tuple[int, int], bool] = {}
+
+    def _credits_ability(self, ability_id: int, modifier_id: int) -> bool:
+        key = (ability_id, modifier_id)
+        credited = self._credits.get(key)
+        if credited is None:
+            strings = self._arrays.strings
+            credited = self._credits[key] = strings[ability_id].split("_")[-1] in strings[modifier_id].lower()
+        return credited
+
+    def tally(self, cast_rows: "np.ndarray", modifier_rows: "np.ndarray") -> AbilityTally:
+        """Casts and hits of the given rows, abilities in first-cast order.
+
+        A modifier credits a hit to the first ability (in first-cast order)
+        already cast before it whose last name part appears in the modifier.
+        """
+        if not len(cast_rows):
+            return AbilityTally()
+        arrays = self._arrays
+
+        cast_ids = arrays.inflictor[cast_rows]
+        abilities, first, inverse = np.unique(cast_ids, return_index=True, return_inverse=True)
+        order = np.argsort(first, kind="stable")
+        slot_of = np.empty_like(order)
+        slot_of[order] = np.arange(len(order))
+        abilities = abilities[order]
+        first_rows = cast_rows[first[order]]
+        cast_slots = slot_of[inverse]
+
+        casts = np.bincount(cast_slots, minlength=len(abilities))
+        hits = np.bincount(cast_slots[arrays.target_hero[cast_rows]], minlength=len(abilities))
+
+        if len(modifier_rows):
+            modifiers, modifier_slots = np.unique(arrays.inflictor[modifier_rows], return_inverse=True)
+            matches = np.array(
+                [[self._credits_ability(int(a), int(m)) for m in modifiers] for a in abilities], dtype=bool
+            ).reshape(len(abilities), len(modifiers))
+            candidates = matches[:, modifier_slots] & (first_rows[:, None] < modifier_rows[None, :])
+            credited = candidates.any(axis=0)
+            hits += np.bincount(candidates.argmax(axis=0)[credited], minlength=len(abilities))
+
+        names = [arrays.strings[a] for a in abilities]
+        return AbilityTally(
+            casts={name: int(c) for name, c in zip(names, casts)},
+            hits={name: int(h) for name, h in zip(names, hits) if h},
+        )
+
+
+def _between(rows: "np.ndarray", lo: "np.ndarray", hi: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Slice bounds of the ascending row numbers that fall in each [lo, hi) range."""
+    return np.searchsorted(rows, lo, side="left"), np.searchsorted(rows, hi, side="left")
+
+
+def _rows_in(rows: "np.ndarray", spans: Tuple["np.ndarray", "np.ndarray"], window: int) -> "np.ndarray":
+    return rows[spans[0][window]:spans[1][window]]
+
+
+def aggregate_hero_combat(
+    arrays: CombatLogArrays,
+    hero: str,
+    windows: Sequence[Tuple[float, float]],
+    ability_filter: Optional[str] = None,
+) -> HeroCombatAggregates:
+    """
+    Vectorized hero combat aggregation over a whole match and fight windows.
+
+    Args:
+        arrays: CombatLogArrays of the match
+        hero: Hero name (case-insensitive substring of the unit name)
+        windows: (start, end) game time ranges, inclusive, one per fight
+        ability_filter: Only count abilities containing this name
+
+    Returns:
+        HeroCombatAggregates matching the row-by-row implementation
+    """
+    hero_lower = hero.lower()
+    filter_lower = ability_filter.lower() if ability_filter else None
+    matcher = _AbilityMatcher(arrays)
+
+    ours = arrays.string_mask(lambda s: hero_lower in unit_key(s))
+    usable = arrays.string_mask(lambda s: bool(s) and s != UNKNOWN_INFLICTOR)
+    castable = usable & arrays.string_mask(lambda s: not filter_lower or filter_lower in s.lower())
+    names_hero = usable & arrays.string_mask(lambda s: hero_lower in s.lower())
+
+    kind = arrays.type
+    attacker_ours = ours[arrays.attacker]
+    target_ours = ours[arrays.target]
+
+    cast_rows = np.flatnonzero((kind == CombatLogType.ABILITY.value) & attacker_ours & castable[arrays.inflictor])
+    modifier_rows = np.flatnonzero(
+        (kind == CombatLogType.MODIFIER_ADD.value)
+        & usable[arrays.inflictor]
+        & arrays.target_hero
+        & (attacker_ours | names_hero[arrays.inflictor])
+    )
+
+    aggregates = HeroCombatAggregates(match_abilities=matcher.tally(cast_rows, modifier_rows))
+    if not windows:
+        return aggregates
+
+    hero_deaths = (kind == CombatLogType.DEATH.value) & arrays.target_hero
+    kills = hero_deaths & attacker_ours
+    deaths = hero_deaths & ~attacker_ours & target_ours
+    other_deaths = hero_deaths & ~attacker_ours & ~target_ours
+    damage = kind == CombatLogType.DAMAGE.value
+    dealt = damage & attacker_ours & arrays.target_hero
+    received = damage & ~dealt & target_ours & arrays.attacker_hero
+
+    lo, hi = arrays.rank_ranges(windows)
+    kill_counts = _window_counts(kills, lo, hi)
+    death_counts = _window_counts(deaths, lo, hi)
+    dealt_sums = _window_counts(dealt, lo, hi, arrays.value)
+    received_sums = _window_counts(received, lo, hi, arrays.value)
+
+    kill_rows, death_rows = np.flatnonzero(kills), np.flatnonzero(deaths)
+    other_death_rows, dealt_rows = np.flatnonzero(other_deaths), np.flatnonzero(dealt)
+    level_gaps = arrays.attacker_level - arrays.target_level
+    both_levels = (arrays.attacker_level > 0) & (arrays.target_level > 0)
+
+    cast_spans = _between(cast_rows, lo, hi)
+    modifier_spans = _between(modifier_rows, lo, hi)
+    kill_spans = _between(kill_rows, lo, hi)
+    death_spans = _between(death_rows, lo, hi)
+    other_death_spans = _between(other_death_rows, lo, hi)
+    dealt_spans = _between(dealt_rows, lo, hi)
+
+    for w in range(len(windows)):
+        window_kills = _rows_in(kill_rows, kill_spans, w)
+        window_deaths = _rows_in(death_rows, death_spans, w)
+        aggregates.kill_level_advantages.extend(level_gaps[window_kills[both_levels[window_kills]]].tolist())
+        aggregates.death_level_disadvantages.extend(level_gaps[window_deaths[both_levels[window_deaths]]].tolist())
+
+        aggregates.fights.append(FightCombatStats(
+            kills=int(kill_counts[w]),
+            deaths=int(death_counts[w]),
+            assists=_count_assists(
+                arrays, _rows_in(dealt_rows, dealt_spans, w), _rows_in(other_death_rows, other_death_spans, w)
+            ),
+            damage_dealt=int(dealt_sums[w]),
+            damage_received=int(received_sums[w]),
+            abilities=matcher.tally(
+                _rows_in(cast_rows, cast_spans, w), _rows_in(modifier_rows, modifier_spans, w)
+            ),
+        ))
+
+    return aggregates
+
+
+def _count_assists(arrays: CombatLogArrays, dealt_rows: "np.ndarray", death_rows: "np.ndarray") -> int:
+    """Hero deaths whose target the hero had already damaged earlier in the window."""
+    if not len(dealt_rows) or not len(death_rows):
+        return 0
+    damaged_keys, first = np.unique(arrays.unit_keys[arrays.target[dealt_rows]], return_index=True)
+    first_damaged = dealt_rows[first]
+
+    death_keys = arrays.unit_keys[arrays.target[death_rows]]
+    slots = np.minimum(np.searchsorted(damaged_keys, death_keys), len(damaged_keys) - 1)
+    assisted = (damaged_keys[slots] == death_keys) & (first_damaged[slots] < death_rows)
+    return int(assisted.sum())
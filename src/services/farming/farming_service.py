@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from python_manta import CombatLogType, NeutralCampType
 
 from ...utils.position_tracker import PositionClassifier, classify_map_position
+from ..cache.derived_cache import DerivedResultCache
+from ..combat.combat_log_index import ROLE_ATTACKER
 from ..models.farming_data import (
     CampClear,
     CreepKill,
@@ -90,6 +92,9 @@ CAMP_TIERS = {
     "small": ["small_kobold", "small_troll", "small_ghost", "small_vhoul", "small_gnoll"],
 }
 
+# Bump when farming pattern output changes, to invalidate cached results
+FARMING_PATTERN_VERSION = 1
+
 # NeutralCampType enum to string tier mapping
 NEUTRAL_CAMP_TYPE_TO_TIER = {
     NeutralCampType.SMALL.value: "small",
@@ -110,6 +115,15 @@ class FarmingService:
     - Farming transition detection
     """
 
+    def __init__(self, derived_cache: Optional[DerivedResultCache] = None):
+        """
+        Initialize the farming service.
+
+        Args:
+            derived_cache: Optional cache for farming patterns per match
+        """
+        self._derived = derived_cache
+
     def _format_time(self, seconds: float) -> str:
         """Format game time as M:SS."""
         minutes = int(seconds // 60)
@@ -187,21 +201,12 @@ class FarmingService:
             List of CreepKill events sorted by game time
         """
         kills = []
-        hero_lower = hero.lower()
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DEATH.value:
-                continue
-
-            if entry.game_time < start_time or entry.game_time > end_time:
-                continue
-
-            # Check if this hero killed the creep
-            attacker_name = self._clean_hero_name(entry.attacker_name)
-            if hero_lower not in attacker_name.lower():
-                continue
 
+        # Deaths this hero caused
+        deaths = data.combat_index.select(
+            start_time, end_time, types=[CombatLogType.DEATH.value], hero_filter=hero, role=ROLE_ATTACKER
+        )
+        for entry in deaths:
             # Skip hero deaths
             if self._is_hero(entry.target_name):
                 continue
@@ -252,29 +257,15 @@ class FarmingService:
         Returns:
             Tuple of (x, y, map_area) or (None, None, None) if not found
         """
-        hero_lower = hero.lower()
-        best_snapshot = None
-        min_diff = float('inf')
-
-        for snapshot in data.entity_snapshots:
-            diff = abs(snapshot.game_time - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                best_snapshot = snapshot
-
-        if not best_snapshot:
+        state = data.hero_timeline.state_at(hero, target_time)
+        if state is None:
             return (None, None, None)
 
-        for hero_snap in best_snapshot.heroes:
-            player_hero = self._clean_hero_name(hero_snap.hero_name)
-            if hero_lower in player_hero.lower():
-                if classifier:
-                    pos = classifier.classify(hero_snap.x, hero_snap.y)
-                else:
-                    pos = classify_map_position(hero_snap.x, hero_snap.y)
-                return (hero_snap.x, hero_snap.y, pos.region)
-
-        return (None, None, None)
+        if classifier:
+            pos = classifier.classify(state.x, state.y)
+        else:
+            pos = classify_map_position(state.x, state.y)
+        return (state.x, state.y, pos.region)
 
     def _get_stats_at_time(
         self,
@@ -288,30 +279,16 @@ class FarmingService:
         Returns:
             Dict with gold, last_hits, denies, level
         """
-        hero_lower = hero.lower()
-        best_snapshot = None
-        min_diff = float('inf')
-
-        for snapshot in data.entity_snapshots:
-            diff = abs(snapshot.game_time - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                best_snapshot = snapshot
-
-        if not best_snapshot:
+        state = data.hero_timeline.state_at(hero, target_time)
+        if state is None:
             return {"gold": 0, "last_hits": 0, "denies": 0, "level": 1}
 
-        for hero_snap in best_snapshot.heroes:
-            player_hero = self._clean_hero_name(hero_snap.hero_name)
-            if hero_lower in player_hero.lower():
-                return {
-                    "gold": hero_snap.gold,
-                    "last_hits": hero_snap.last_hits,
-                    "denies": hero_snap.denies,
-                    "level": hero_snap.level,
-                }
-
-        return {"gold": 0, "last_hits": 0, "denies": 0, "level": 1}
+        return {
+            "gold": state.gold,
+            "last_hits": state.last_hits,
+            "denies": state.denies,
+            "level": state.level,
+        }
 
     def _detect_transitions(
         self,
@@ -436,27 +413,18 @@ class FarmingService:
         Returns:
             List of LevelTiming for levels reached in the time range
         """
-        hero_lower = hero.lower()
         level_timings: List[LevelTiming] = []
         last_level = 0
 
-        for snapshot in sorted(data.entity_snapshots, key=lambda s: s.game_time):
-            if snapshot.game_time < start_time or snapshot.game_time > end_time:
-                continue
-
-            for hero_snap in snapshot.heroes:
-                player_hero = self._clean_hero_name(hero_snap.hero_name)
-                if hero_lower in player_hero.lower():
-                    current_level = hero_snap.level
-                    # Record each new level
-                    while last_level < current_level:
-                        last_level += 1
-                        level_timings.append(LevelTiming(
-                            level=last_level,
-                            time=round(snapshot.game_time, 1),
-                            time_str=self._format_time(snapshot.game_time),
-                        ))
-                    break
+        for state in data.hero_timeline.history(hero, start_time, end_time):
+            # Record each new level
+            while last_level < state.level:
+                last_level += 1
+                level_timings.append(LevelTiming(
+                    level=last_level,
+                    time=round(state.game_time, 1),
+                    time_str=self._format_time(state.game_time),
+                ))
 
         return level_timings
 
@@ -483,6 +451,30 @@ class FarmingService:
         Returns:
             FarmingPatternResponse with complete farming analysis
         """
+        if self._derived is None:
+            return self._build_farming_pattern(data, hero, start_minute, end_minute, item_timings, game_context)
+        params = {
+            "hero": hero,
+            "start_minute": start_minute,
+            "end_minute": end_minute,
+            "item_timings": item_timings,
+            "patch": game_context.patch_version if game_context else None,
+        }
+        return self._derived.get_or_compute(
+            data, "farming_pattern", FARMING_PATTERN_VERSION, params,
+            lambda: self._build_farming_pattern(data, hero, start_minute, end_minute, item_timings, game_context),
+        )
+
+    def _build_farming_pattern(
+        self,
+        data: ParsedReplayData,
+        hero: str,
+        start_minute: int,
+        end_minute: int,
+        item_timings: Optional[List[ItemTiming]],
+        game_context: Optional["GameContext"],
+    ) -> FarmingPatternResponse:
+        """Compute a hero's farming pattern (uncached)."""
         start_time = start_minute * 60.0
         end_time = end_minute * 60.0
 
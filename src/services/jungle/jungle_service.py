@@ -11,6 +11,8 @@ from typing import Dict, List, Optional
 
 from python_manta import CombatLogType
 
+from ..combat.combat_log_index import ROLE_ATTACKER, CombatLogQuery
+from ..combat.combat_log_scanner import EntryCollector, collect
 from ..models.jungle_data import CampStack, JungleSummary
 from ..models.replay_data import ParsedReplayData
 
@@ -56,34 +58,30 @@ class JungleService:
         Returns:
             List of CampStack events sorted by game time
         """
-        stacks = []
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.NEUTRAL_CAMP_STACK.value:
-                continue
-
-            stacker = self._clean_hero_name(entry.attacker_name)
-
-            if hero_filter:
-                if hero_filter.lower() not in stacker.lower():
-                    continue
-
-            stack = CampStack(
-                game_time=entry.game_time,
-                game_time_str=self._format_time(entry.game_time),
-                tick=entry.tick,
-                stacker=stacker,
-                camp_type=self._infer_camp_type(entry),
-                stack_count=entry.value if entry.value > 0 else 1,
-                position_x=entry.location_x if hasattr(entry, 'location_x') else None,
-                position_y=entry.location_y if hasattr(entry, 'location_y') else None,
-            )
-            stacks.append(stack)
-
+        stacks = collect(data.combat_index, self.camp_stack_collector(hero_filter))
         stacks.sort(key=lambda s: s.game_time)
         return stacks
 
+    def _camp_stack(self, entry) -> CampStack:
+        """Build a CampStack from a NEUTRAL_CAMP_STACK entry."""
+        return CampStack(
+            game_time=entry.game_time,
+            game_time_str=self._format_time(entry.game_time),
+            tick=entry.tick,
+            stacker=self._clean_hero_name(entry.attacker_name),
+            camp_type=self._infer_camp_type(entry),
+            stack_count=entry.value if entry.value > 0 else 1,
+            position_x=entry.location_x if hasattr(entry, 'location_x') else None,
+            position_y=entry.location_y if hasattr(entry, 'location_y') else None,
+        )
+
+    def camp_stack_collector(self, hero_filter: Optional[str] = None) -> EntryCollector[CampStack]:
+        """Collector for get_camp_stacks, to combine with others in one CombatLogScanner pass."""
+        query = CombatLogQuery.build(
+            types=[CombatLogType.NEUTRAL_CAMP_STACK.value], unit=hero_filter, role=ROLE_ATTACKER
+        )
+        return EntryCollector("camp_stacks", query, lambda entry, _: self._camp_stack(entry))
+
     def _infer_camp_type(self, entry) -> Optional[str]:
         """Infer camp type from combat log entry (if possible)."""
         # The combat log may have info in target_name or value_name
@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from python_manta import CombatLogType
 
+from ..cache.derived_cache import DerivedResultCache
+from ..combat.combat_log_index import ROLE_ATTACKER, ROLE_TARGET
 from ..models.lane_data import (
     CreepWave,
     HeroLanePhase,
@@ -43,6 +45,9 @@ DEFAULT_LANE_BOUNDARIES: Dict[str, Dict[str, float]] = {
 
 LANING_PHASE_END = 600  # 10 minutes
 
+# Bump when lane summary output changes, to invalidate cached results
+LANE_SUMMARY_VERSION = 1
+
 
 class LaneService:
     """
@@ -56,6 +61,15 @@ class LaneService:
     - Wave nuke detection
     """
 
+    def __init__(self, derived_cache: Optional[DerivedResultCache] = None):
+        """
+        Initialize the lane service.
+
+        Args:
+            derived_cache: Optional cache for lane summaries per match
+        """
+        self._derived = derived_cache
+
     def _format_time(self, seconds: float) -> str:
         """Format game time as M:SS."""
         minutes = int(seconds // 60)
@@ -109,26 +123,12 @@ class LaneService:
         lane_boundaries: Optional[Dict[str, Dict[str, float]]] = None,
     ) -> Tuple[Optional[float], Optional[float], str]:
         """Get hero position at a specific time."""
-        hero_lower = hero.lower()
-        best_snapshot = None
-        min_diff = float('inf')
-
-        for snapshot in data.entity_snapshots:
-            diff = abs(snapshot.game_time - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                best_snapshot = snapshot
-
-        if not best_snapshot or min_diff > 30.0:
+        state = data.hero_timeline.state_at(hero, target_time, max_gap=30.0)
+        if state is None:
             return (None, None, "unknown")
 
-        for hero_snap in best_snapshot.heroes:
-            hero_name = self._clean_hero_name(hero_snap.hero_name)
-            if hero_lower in hero_name.lower():
-                lane = self._classify_lane(hero_snap.x, hero_snap.y, lane_boundaries)
-                return (hero_snap.x, hero_snap.y, lane)
-
-        return (None, None, "unknown")
+        lane = self._classify_lane(state.x, state.y, lane_boundaries)
+        return (state.x, state.y, lane)
 
     def _is_lane_creep(self, name: str) -> bool:
         """Check if target is a lane creep."""
@@ -165,17 +165,12 @@ class LaneService:
             List of LaneLastHit events sorted by game time
         """
         last_hits = []
-        hero_filter_lower = hero_filter.lower() if hero_filter else None
         lane_boundaries = self._get_lane_boundaries(game_context)
 
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DEATH.value:
-                continue
-
-            if entry.game_time < 0 or entry.game_time > end_time:
-                continue
-
+        deaths = data.combat_index.select(
+            0, end_time, types=[CombatLogType.DEATH.value], hero_filter=hero_filter, role=ROLE_ATTACKER
+        )
+        for entry in deaths:
             if not entry.is_attacker_hero:
                 continue
 
@@ -183,9 +178,6 @@ class LaneService:
                 continue
 
             hero = self._clean_hero_name(entry.attacker_name)
-            if hero_filter_lower and hero_filter_lower not in hero.lower():
-                continue
-
             pos_x, pos_y, lane = self._get_hero_position_at_time(
                 data, hero, entry.game_time, lane_boundaries
             )
@@ -224,27 +216,16 @@ class LaneService:
             List of LaneHarass events sorted by game time
         """
         harass_events = []
-        hero_filter_lower = hero_filter.lower() if hero_filter else None
         lane_boundaries = self._get_lane_boundaries(game_context)
 
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DAMAGE.value:
-                continue
-
-            if entry.game_time < 0 or entry.game_time > end_time:
-                continue
-
+        damage = data.combat_index.select(0, end_time, types=[CombatLogType.DAMAGE.value], hero_filter=hero_filter)
+        for entry in damage:
             if not entry.is_attacker_hero or not entry.is_target_hero:
                 continue
 
             attacker = self._clean_hero_name(entry.attacker_name)
             target = self._clean_hero_name(entry.target_name)
 
-            if hero_filter_lower:
-                if hero_filter_lower not in attacker.lower() and hero_filter_lower not in target.lower():
-                    continue
-
             pos_x, pos_y, lane = self._get_hero_position_at_time(
                 data, attacker, entry.game_time, lane_boundaries
             )
@@ -285,17 +266,11 @@ class LaneService:
             List of TowerProximityEvent sorted by game time
         """
         events = []
-        hero_filter_lower = hero_filter.lower() if hero_filter else None
 
-        for entry in data.combat_log_entries:
+        aura_types = [CombatLogType.MODIFIER_ADD.value, CombatLogType.MODIFIER_REMOVE.value]
+        for entry in data.combat_index.select(0, end_time, types=aura_types, hero_filter=hero_filter, role=ROLE_TARGET):
             entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
 
-            if entry_type not in (CombatLogType.MODIFIER_ADD.value, CombatLogType.MODIFIER_REMOVE.value):
-                continue
-
-            if entry.game_time < 0 or entry.game_time > end_time:
-                continue
-
             inflictor = getattr(entry, 'inflictor_name', '') or ''
             if 'modifier_tower_aura_bonus' not in inflictor:
                 continue
@@ -304,8 +279,6 @@ class LaneService:
                 continue
 
             hero = self._clean_hero_name(entry.target_name)
-            if hero_filter_lower and hero_filter_lower not in hero.lower():
-                continue
 
             # Determine tower team from target team (tower aura applies to allied heroes)
             tower_team = "radiant" if entry.target_team == 2 else "dire"
@@ -348,17 +321,12 @@ class LaneService:
         """
         # Collect all ability damage to lane creeps
         ability_damage: Dict[str, List[dict]] = defaultdict(list)
-        hero_filter_lower = hero_filter.lower() if hero_filter else None
         lane_boundaries = self._get_lane_boundaries(game_context)
 
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DAMAGE.value:
-                continue
-
-            if entry.game_time < 0 or entry.game_time > end_time:
-                continue
-
+        damage_events = data.combat_index.select(
+            0, end_time, types=[CombatLogType.DAMAGE.value], hero_filter=hero_filter, role=ROLE_ATTACKER
+        )
+        for entry in damage_events:
             if not entry.is_attacker_hero:
                 continue
 
@@ -370,8 +338,6 @@ class LaneService:
                 continue  # Skip right-click damage
 
             hero = self._clean_hero_name(entry.attacker_name)
-            if hero_filter_lower and hero_filter_lower not in hero.lower():
-                continue
 
             key = f"{hero}:{ability}:{int(entry.game_time / time_window)}"
             ability_damage[key].append({
@@ -441,12 +407,9 @@ class LaneService:
             "modifier_twin_gate_warp_channel": "twin_gate",
         }
 
-        for entry in data.combat_log_entries:
+        for entry in data.combat_index.select(0, end_time):
             entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
 
-            if entry.game_time < 0 or entry.game_time > end_time:
-                continue
-
             # Check for smoke break (MODIFIER_REMOVE of smoke)
             if entry_type == CombatLogType.MODIFIER_REMOVE.value:
                 inflictor = getattr(entry, 'inflictor_name', '') or ''
@@ -567,17 +530,12 @@ class LaneService:
             List of NeutralAggro events sorted by game time
         """
         aggro_events = []
-        hero_filter_lower = hero_filter.lower() if hero_filter else None
         lane_boundaries = self._get_lane_boundaries(game_context)
 
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DAMAGE.value:
-                continue
-
-            if entry.game_time < 0 or entry.game_time > end_time:
-                continue
-
+        damage_events = data.combat_index.select(
+            0, end_time, types=[CombatLogType.DAMAGE.value], hero_filter=hero_filter, role=ROLE_ATTACKER
+        )
+        for entry in damage_events:
             if not entry.is_attacker_hero:
                 continue
 
@@ -585,8 +543,6 @@ class LaneService:
                 continue
 
             hero = self._clean_hero_name(entry.attacker_name)
-            if hero_filter_lower and hero_filter_lower not in hero.lower():
-                continue
 
             pos_x, pos_y, _ = self._get_hero_position_at_time(
                 data, hero, entry.game_time, lane_boundaries
@@ -630,16 +586,11 @@ class LaneService:
             List of TowerPressure events sorted by game time
         """
         pressure_events = []
-        hero_filter_lower = hero_filter.lower() if hero_filter else None
-
-        for entry in data.combat_log_entries:
-            entry_type = entry.type.value if hasattr(entry.type, 'value') else entry.type
-            if entry_type != CombatLogType.DAMAGE.value:
-                continue
-
-            if entry.game_time < 0 or entry.game_time > end_time:
-                continue
 
+        damage_events = data.combat_index.select(
+            0, end_time, types=[CombatLogType.DAMAGE.value], hero_filter=hero_filter, role=ROLE_TARGET
+        )
+        for entry in damage_events:
             if not self._is_tower(entry.attacker_name):
                 continue
 
@@ -647,8 +598,6 @@ class LaneService:
                 continue
 
             hero = self._clean_hero_name(entry.target_name)
-            if hero_filter_lower and hero_filter_lower not in hero.lower():
-                continue
 
             tower_team = self._get_tower_team(entry.attacker_name)
             tower_lane = self._get_tower_lane(entry.attacker_name)
@@ -674,31 +623,15 @@ class LaneService:
         target_time = minute * 60
         positions = []
 
-        best_snapshot = None
-        min_diff = float('inf')
-
-        for snapshot in data.entity_snapshots:
-            diff = abs(snapshot.game_time - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                best_snapshot = snapshot
-
-        if not best_snapshot:
-            return positions
-
-        for hero_snap in best_snapshot.heroes:
-            hero_name = self._clean_hero_name(hero_snap.hero_name)
-            if not hero_name:
-                continue
-
-            team = 'radiant' if hero_snap.player_id < 5 else 'dire'
+        for state in data.hero_timeline.states_at(target_time):
+            team = 'radiant' if state.player_id < 5 else 'dire'
 
             positions.append(HeroPosition(
-                game_time=best_snapshot.game_time,
-                tick=best_snapshot.tick,
-                hero=hero_name,
-                x=hero_snap.x,
-                y=hero_snap.y,
+                game_time=state.game_time,
+                tick=state.tick,
+                hero=state.hero,
+                x=state.x,
+                y=state.y,
                 team=team,
             ))
 
@@ -713,28 +646,12 @@ class LaneService:
         target_time = minute * 60
         cs_data = {}
 
-        best_snapshot = None
-        min_diff = float('inf')
-
-        for snapshot in data.entity_snapshots:
-            diff = abs(snapshot.game_time - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                best_snapshot = snapshot
-
-        if not best_snapshot:
-            return cs_data
-
-        for hero_snap in best_snapshot.heroes:
-            hero_name = self._clean_hero_name(hero_snap.hero_name)
-            if not hero_name:
-                continue
-
-            cs_data[hero_name] = {
-                'last_hits': hero_snap.last_hits,
-                'denies': hero_snap.denies,
-                'gold': hero_snap.gold,
-                'level': hero_snap.level,
+        for state in data.hero_timeline.states_at(target_time):
+            cs_data[state.hero] = {
+                'last_hits': state.last_hits,
+                'denies': state.denies,
+                'gold': state.gold,
+                'level': state.level,
             }
 
         return cs_data
@@ -756,6 +673,24 @@ class LaneService:
         Returns:
             LaneSummaryResponse with comprehensive lane data
         """
+        if self._derived is None:
+            return self._build_lane_summary(data, match_id, game_context)
+        params = {
+            "match_id": match_id,
+            "patch": game_context.patch_version if game_context else None,
+        }
+        return self._derived.get_or_compute(
+            data, "lane_summary", LANE_SUMMARY_VERSION, params,
+            lambda: self._build_lane_summary(data, match_id, game_context),
+        )
+
+    def _build_lane_summary(
+        self,
+        data: ParsedReplayData,
+        match_id: int,
+        game_context: Optional["GameContext"],
+    ) -> LaneSummaryResponse:
+        """Compute the laning phase summary (uncached)."""
         lane_boundaries = self._get_lane_boundaries(game_context)
 
         cs_5min = self.get_cs_at_minute(data, 5)
@@ -1200,12 +1135,7 @@ class LaneService:
         creep_pattern = "creep_goodguys" if team == "radiant" else "creep_badguys"
 
         deaths = []
-        for entry in data.combat_log_entries:
-            if entry.type != CombatLogType.DEATH.value:
-                continue
-            if entry.game_time > end_time:
-                continue
-
+        for entry in data.combat_index.select(end_time=end_time, types=[CombatLogType.DEATH.value]):
             target = entry.target_name or ""
             if creep_pattern not in target:
                 continue
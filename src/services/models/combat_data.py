@@ -3,7 +3,7 @@ Data models for combat analysis.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # Import shared models from API layer (re-export for backwards compatibility)
 from ...models.combat_log import CombatLogEvent, HeroDeath  # noqa: F401
@@ -61,6 +61,36 @@ class FightResult:
         return self.total_fights - self.teamfights
 
 
+@dataclass
+class AbilityTally:
+    """Cast and hero-hit counts per ability. casts is in first-cast order."""
+
+    casts: Dict[str, int] = field(default_factory=dict)
+    hits: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class FightCombatStats:
+    """A hero's raw combat numbers inside one fight window."""
+
+    kills: int = 0
+    deaths: int = 0
+    assists: int = 0
+    damage_dealt: int = 0
+    damage_received: int = 0
+    abilities: AbilityTally = field(default_factory=AbilityTally)
+
+
+@dataclass
+class HeroCombatAggregates:
+    """Raw aggregates behind a hero combat analysis."""
+
+    match_abilities: AbilityTally = field(default_factory=AbilityTally)
+    fights: List[FightCombatStats] = field(default_factory=list)  # One per fight window, in order
+    kill_level_advantages: List[int] = field(default_factory=list)
+    death_level_disadvantages: List[int] = field(default_factory=list)
+
+
 @dataclass
 class ItemPurchase:
     """An item purchase event."""
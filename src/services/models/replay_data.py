@@ -4,8 +4,8 @@ Data models for parsed replay data.
 Wraps python-manta v2 ParseResult with additional derived data.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Protocol
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Hashable, List, Optional, Protocol
 
 from python_manta import (
     CombatLogEntry,
@@ -33,6 +33,41 @@ try:
 except ImportError:
     EntityDeathsResult = None  # type: ignore[misc, assignment]
 
+if TYPE_CHECKING:
+    from ..analyzers.fight_index import FightIndex
+    from ..analyzers.hero_timeline import HeroTimeline
+    from ..combat.combat_log_index import CombatLogIndex
+    from ..seek.checkpoint_index import CheckpointIndex
+    from ..seek.trajectories import HeroTrajectories
+
+
+# Collectors of python-manta's single-pass parse, named by their Parser.parse argument.
+# "messages" carries CDOTAMatchMetadataFile, which becomes ParsedReplayData.metadata.
+COLLECTOR_FIELDS: Dict[str, str] = {
+    "header": "header",
+    "game_info": "game_info",
+    "combat_log": "combat_log",
+    "entities": "entities",
+    "game_events": "game_events",
+    "modifiers": "modifiers",
+    "messages": "metadata",
+    "attacks": "attacks",
+    "entity_deaths": "entity_deaths",
+    "trajectories": "trajectories",
+}
+# Optional collectors are only run when a profile asks for them.
+# "trajectories" samples the entity collector densely in the same pass (see seek.trajectories).
+OPTIONAL_COLLECTORS: FrozenSet[str] = frozenset({"trajectories"})
+ALL_COLLECTORS: FrozenSet[str] = frozenset(COLLECTOR_FIELDS) - OPTIONAL_COLLECTORS
+
+# Named parse profiles: the collectors a kind of request needs
+PARSE_PROFILES: Dict[str, FrozenSet[str]] = {
+    "draft": frozenset({"header", "game_info"}),
+    "combat": frozenset({"header", "game_info", "combat_log"}),
+    "full": ALL_COLLECTORS,
+    "dense": ALL_COLLECTORS | OPTIONAL_COLLECTORS,
+}
+
 
 class ProgressCallback(Protocol):
     """Protocol for progress reporting callbacks."""
@@ -80,6 +115,23 @@ class ParsedReplayData:
     # Index for seeking (built on first parse)
     demo_index: Optional[DemoIndex] = None
 
+    # Dense per-hero states (optional "trajectories" collector)
+    trajectories: Optional["HeroTrajectories"] = None
+
+    # Collectors this data was parsed with; others are missing, not empty
+    collectors: FrozenSet[str] = ALL_COLLECTORS
+
+    # Time-sorted combat log index, built on first use (not cached, not compared)
+    _combat_index: Optional["CombatLogIndex"] = field(default=None, init=False, repr=False, compare=False)
+    # Per-hero state columns from entity snapshots, built on first use (not cached, not compared)
+    _hero_timeline: Optional["HeroTimeline"] = field(default=None, init=False, repr=False, compare=False)
+    # Entity checkpoints for approximate seeks, built on first use (not cached, not compared)
+    _checkpoint_index: Optional["CheckpointIndex"] = field(default=None, init=False, repr=False, compare=False)
+    # Detected fights per detector configuration, built on first use (not cached, not compared)
+    _fight_indexes: Dict[Hashable, "FightIndex"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     # Convenience accessors
     @property
     def combat_log_entries(self) -> List[CombatLogEntry]:
@@ -88,6 +140,17 @@ class ParsedReplayData:
             return self.combat_log.entries
         return []
 
+    @property
+    def combat_index(self) -> "CombatLogIndex":
+        """Get the time-sorted combat log index, building it on first use."""
+        from ..combat.combat_log_index import CombatLogIndex
+
+        entries = self.combat_log_entries
+        index = self._combat_index
+        if index is None or not index.covers(entries):
+            index = self._combat_index = CombatLogIndex(entries)
+        return index
+
     @property
     def entity_snapshots(self) -> List[EntitySnapshot]:
         """Get entity snapshots."""
@@ -95,6 +158,40 @@ class ParsedReplayData:
             return self.entities.snapshots
         return []
 
+    @property
+    def hero_timeline(self) -> "HeroTimeline":
+        """Get the per-hero state time series, building it on first use."""
+        from ..analyzers.hero_timeline import HeroTimeline
+
+        snapshots = self.entity_snapshots
+        timeline = self._hero_timeline
+        if timeline is None or not timeline.covers(snapshots):
+            timeline = self._hero_timeline = HeroTimeline(snapshots)
+        return timeline
+
+    @property
+    def checkpoint_index(self) -> "CheckpointIndex":
+        """Get the entity checkpoint index for approximate seeks, building it on first use."""
+        from ..seek.checkpoint_index import CheckpointIndex
+
+        snapshots = self.entity_snapshots
+        index = self._checkpoint_index
+        if index is None or not index.covers(snapshots):
+            index = self._checkpoint_index = CheckpointIndex(snapshots)
+        return index
+
+    def fight_index(self, key: Hashable, build: Callable[[], "FightIndex"]) -> "FightIndex":
+        """Get the detected fights for a detector configuration, building them on first use.
+
+        Args:
+            key: Detection method and detector parameters
+            build: Runs the detection (only if not already memoised for this combat log)
+        """
+        index = self._fight_indexes.get(key)
+        if index is None or not index.covers(self.combat_log_entries):
+            index = self._fight_indexes[key] = build()
+        return index
+
     @property
     def winner(self) -> Optional[str]:
         """Get match winner (radiant/dire)."""
@@ -124,20 +221,39 @@ class ParsedReplayData:
         from python_manta import CombatLogType
 
         return [
-            e for e in self.combat_log_entries
-            if e.type == CombatLogType.DEATH.value
-            and e.is_target_hero
+            e for e in self.combat_index.select(types=[CombatLogType.DEATH.value])
+            if e.is_target_hero
         ]
 
     def get_kills_in_time_range(
         self, start_time: float, end_time: float
     ) -> List[CombatLogEntry]:
         """Get hero deaths in a time range."""
+        from python_manta import CombatLogType
+
         return [
-            e for e in self.get_hero_deaths()
-            if start_time <= e.game_time <= end_time
+            e for e in self.combat_index.select(start_time, end_time, types=[CombatLogType.DEATH.value])
+            if e.is_target_hero
         ]
 
+    def has_collectors(self, collectors: FrozenSet[str]) -> bool:
+        """Check if every given collector has been parsed."""
+        return collectors <= self.collectors
+
+    def merged_with(self, other: "ParsedReplayData") -> "ParsedReplayData":
+        """Combine with data parsed for further collectors.
+
+        Fields of the collectors in other.collectors are taken from other,
+        everything else from self.
+        """
+        updates = {COLLECTOR_FIELDS[name]: getattr(other, COLLECTOR_FIELDS[name]) for name in other.collectors}
+        return replace(
+            self,
+            collectors=self.collectors | other.collectors,
+            demo_index=other.demo_index or self.demo_index,
+            **updates,
+        )
+
     def to_cache_dict(self) -> Dict[str, Any]:
         """Serialize for cache storage."""
         return {
@@ -154,11 +270,15 @@ class ParsedReplayData:
             "entity_deaths": self.entity_deaths.model_dump() if self.entity_deaths else None,
             "metadata": self.metadata,
             "demo_index": self.demo_index.model_dump() if self.demo_index else None,
+            "trajectories": self.trajectories.to_cache_dict() if self.trajectories else None,
+            "collectors": sorted(self.collectors),
         }
 
     @classmethod
     def from_cache_dict(cls, data: Dict[str, Any]) -> "ParsedReplayData":
         """Deserialize from cache storage."""
+        from ..seek.trajectories import HeroTrajectories
+
         return cls(
             match_id=data["match_id"],
             replay_path=data["replay_path"],
@@ -177,6 +297,9 @@ class ParsedReplayData:
             ),
             metadata=data.get("metadata"),
             demo_index=DemoIndex(**data["demo_index"]) if data.get("demo_index") else None,
+            trajectories=HeroTrajectories.from_cache_dict(data["trajectories"]) if data.get("trajectories") else None,
+            # Entries cached before parse profiles existed were always full parses
+            collectors=frozenset(data["collectors"]) if "collectors" in data else ALL_COLLECTORS,
         )
 
     @classmethod
@@ -187,6 +310,8 @@ class ParsedReplayData:
         result: ParseResult,
         metadata: Optional[Dict[str, Any]] = None,
         demo_index: Optional[DemoIndex] = None,
+        collectors: FrozenSet[str] = ALL_COLLECTORS,
+        trajectories: Optional["HeroTrajectories"] = None,
     ) -> "ParsedReplayData":
         """Create from python-manta v2 ParseResult."""
         # Handle attacks - only available in python-manta 1.4.5.4+
@@ -206,4 +331,6 @@ class ParsedReplayData:
             entity_deaths=entity_deaths_data,
             metadata=metadata,
             demo_index=demo_index,
+            trajectories=trajectories,
+            collectors=collectors,
         )
@@ -0,0 +1,292 @@
+"""
+Incremental bz2 decompression for replay downloads.
+
+Lets downloaded chunks be decompressed as they arrive so the .dem file is
+written in a single pass, without a temporary .dem.bz2 on disk. Already
+downloaded .bz2 files can be split at bzip2 block boundaries and the
+blocks decompressed in parallel; the file is scanned and read block by
+block, never loaded whole.
+NO MCP DEPENDENCIES - plain file and bz2 handling.
+"""
+
+import bisect
+import bz2
+import itertools
+import logging
+import os
+from collections import deque
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import BinaryIO, Deque, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MIN_REPLAY_SIZE = 10 * 1024 * 1024  # 10 MB; smaller output means a truncated or bogus replay
+
+
+class StreamingBz2Writer:
+    """
+    Decompress a bz2 byte stream chunk by chunk into an output file.
+
+    Output is written to a ``.part`` file next to the destination and only
+    renamed into place by finish() once the compressed stream ended cleanly
+    and the result passes the minimum size check, so a partial replay is
+    never picked up as complete. Handles multi-stream bz2 files (as written
+    by parallel compressors) the same way bz2.open does.
+    """
+
+    def __init__(self, output_file: Path, min_size: Optional[int] = None):
+        """Open the temporary output file.
+
+        Args:
+            output_file: Final path of the decompressed replay
+            min_size: Minimum decompressed size in bytes. Defaults to MIN_REPLAY_SIZE.
+        """
+        self.output_file = output_file
+        self.min_size = MIN_REPLAY_SIZE if min_size is None else min_size
+        self.compressed_bytes = 0
+        self.decompressed_bytes = 0
+        self._part_file = output_file.with_suffix(output_file.suffix + ".part")
+        self._decompressor = bz2.BZ2Decompressor()
+        self._out: Optional[BinaryIO] = open(self._part_file, "wb")
+
+    def feed(self, chunk: bytes) -> None:
+        """Decompress a chunk of compressed data and append it to the output.
+
+        Raises:
+            OSError: If the data is not valid bz2
+        """
+        self.compressed_bytes += len(chunk)
+        data = chunk
+        while data:
+            if self._decompressor.eof:
+                # Start of the next stream in a multi-stream file
+                self._decompressor = bz2.BZ2Decompressor()
+            output = self._decompressor.decompress(data)
+            if output:
+                self._out.write(output)
+                self.decompressed_bytes += len(output)
+            data = self._decompressor.unused_data if self._decompressor.eof else b""
+
+    def finish(self) -> Optional[Path]:
+        """Validate the output and move it into place.
+
+        Returns:
+            Path to the decompressed replay, or None if the stream was
+            truncated or the output is too small
+        """
+        self._close_output()
+
+        if not self._decompressor.eof:
+            logger.error(f"Compressed stream ended early for {self.output_file}")
+            self.abort()
+            return None
+
+        if self.decompressed_bytes < self.min_size:
+            logger.error(f"Extracted file too small: {self.decompressed_bytes} bytes (min {self.min_size})")
+            self.abort()
+            return None
+
+        os.replace(self._part_file, self.output_file)
+        logger.info(
+            f"Extracted replay to {self.output_file} ({self.decompressed_bytes / (1024*1024):.1f} MB)"
+        )
+        return self.output_file
+
+    def abort(self) -> None:
+        """Discard any partial output."""
+        self._close_output()
+        if self._part_file.exists():
+            self._part_file.unlink()
+
+    def _close_output(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+
+# bzip2 markers: every compressed block starts with BLOCK_MAGIC and every stream
+# ends with EOS_MAGIC. Both sit at arbitrary bit (not byte) offsets.
+BLOCK_MAGIC = 0x314159265359
+EOS_MAGIC = 0x177245385090
+_MAGIC_BITS = 48
+_MAGIC_MASK = (1 << _MAGIC_BITS) - 1
+
+_MARKER_SPAN_BYTES = 7  # A 48-bit marker at any bit shift lies within 7 bytes
+
+PARALLEL_WINDOW_PER_WORKER = 4  # Blocks in flight per worker, bounds buffered output
+SCAN_CHUNK_SIZE = 8 * 1024 * 1024  # Bytes read at a time when locating blocks
+
+
+def _shifted_patterns(magic: int) -> List[Tuple[int, bytes]]:
+    """For each bit shift 0-7, the five whole bytes a marker starting at that shift covers.
+
+    A marker starting at bit s of byte b always fully covers bytes b+1..b+5, so a
+    plain byte search for these patterns finds every candidate position.
+    """
+    return [(s, (magic << (8 - s)).to_bytes(7, "big")[1:6]) for s in range(8)]
+
+
+def _read_bits(data: bytes, bit_pos: int, nbits: int) -> int:
+    byte_pos, shift = divmod(bit_pos, 8)
+    width = (shift + nbits + 7) // 8
+    window = data[byte_pos: byte_pos + width].ljust(width, b"\0")
+    return (int.from_bytes(window, "big") >> (width * 8 - shift - nbits)) & ((1 << nbits) - 1)
+
+
+def _find_marker(data: bytes, magic: int) -> List[int]:
+    """Bit offsets of every occurrence of a 48-bit marker lying wholly within data."""
+    positions = []
+    limit = len(data) * 8 - _MAGIC_BITS
+    for shift, pattern in _shifted_patterns(magic):
+        start = data.find(pattern)
+        while start != -1:
+            bit_pos = (start - 1) * 8 + shift
+            if 0 <= bit_pos <= limit and _read_bits(data, bit_pos, _MAGIC_BITS) == magic:
+                positions.append(bit_pos)
+            start = data.find(pattern, start + 1)
+    return positions
+
+
+def find_bz2_blocks(data: bytes) -> List[Tuple[int, int]]:
+    """Locate compressed blocks in a (possibly multi-stream) bz2 file.
+
+    Args:
+        data: Raw .bz2 file contents
+
+    Returns:
+        (start_bit, end_bit) per block in file order. A block runs from its
+        magic up to the next block or end-of-stream marker. Byte patterns
+        inside compressed data can look like a marker; such false splits are
+        caught when the block fails its CRC.
+    """
+    blocks = _find_marker(data, BLOCK_MAGIC)
+    return _pair_blocks(blocks, _find_marker(data, EOS_MAGIC))
+
+
+def scan_bz2_blocks(f: BinaryIO, chunk_size: int = SCAN_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """Locate compressed blocks like find_bz2_blocks, reading the file chunk by chunk.
+
+    Consecutive chunks overlap by a marker's span, so markers straddling a
+    chunk boundary are found; memory use stays at one chunk.
+
+    Args:
+        f: Open binary .bz2 file
+        chunk_size: Bytes read at a time
+
+    Returns:
+        (start_bit, end_bit) per block in file order, as absolute bit offsets
+    """
+    blocks, eos = set(), set()
+    f.seek(0)
+    tail = b""
+    offset = 0  # File offset of the first byte of the current buffer
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        data = tail + chunk
+        blocks.update(offset * 8 + pos for pos in _find_marker(data, BLOCK_MAGIC))
+        eos.update(offset * 8 + pos for pos in _find_marker(data, EOS_MAGIC))
+        tail = data[-_MARKER_SPAN_BYTES:]
+        offset += len(data) - len(tail)
+    return _pair_blocks(blocks, eos)
+
+
+def _pair_blocks(blocks: Iterable[int], eos: Iterable[int]) -> List[Tuple[int, int]]:
+    """(start_bit, end_bit) per block: each block ends at the next block or end-of-stream marker."""
+    blocks = sorted(set(blocks))
+    ends = sorted(set(blocks) | set(eos))
+
+    result = []
+    for start in blocks:
+        index = bisect.bisect_right(ends, start)
+        if index == len(ends):
+            raise ValueError(f"bz2 block at bit {start} has no end marker")
+        result.append((start, ends[index]))
+    return result
+
+
+def decompress_bz2_block(chunk: bytes, start_bit: int, end_bit: int) -> bytes:
+    """Decompress one bz2 block by wrapping it in a standalone single-block stream.
+
+    Module-level so it can run in a process pool.
+
+    Args:
+        chunk: Bytes covering the block
+        start_bit: Bit offset of the block magic within chunk
+        end_bit: Bit offset just past the block within chunk
+
+    Returns:
+        Decompressed block data
+
+    Raises:
+        OSError: If the block is invalid or fails its CRC
+    """
+    nbits = end_bit - start_bit
+    block = _read_bits(chunk, start_bit, nbits)
+    # A single-block stream's combined CRC equals the block CRC, stored right after the magic
+    block_crc = (block >> (nbits - _MAGIC_BITS - 32)) & 0xFFFFFFFF
+
+    total_bits = nbits + _MAGIC_BITS + 32
+    padding = -total_bits % 8
+    stream = ((((block << _MAGIC_BITS) | EOS_MAGIC) << 32) | block_crc) << padding
+    # Level 9 declares the largest block size, so any original level decodes
+    return bz2.decompress(b"BZh9" + stream.to_bytes((total_bits + padding) // 8, "big"))
+
+
+def decompress_bz2_parallel(bz2_file: Path, output_file: Path, executor: Executor, workers: int) -> int:
+    """Decompress a bz2 file block by block across a worker pool.
+
+    Blocks are located with a chunked scan, then read from the file one at
+    a time as they are submitted. They are decompressed out of order by the
+    pool and written to the output in file order. Only a bounded window of
+    blocks is in flight, so buffered input and output stay small.
+
+    Args:
+        bz2_file: Compressed input
+        output_file: Destination for the decompressed data
+        executor: Pool that runs decompress_bz2_block
+        workers: Pool size, used to size the in-flight window
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        ValueError: If no blocks are found
+        OSError: If any block fails to decompress
+    """
+    with open(bz2_file, "rb") as source:
+        blocks = scan_bz2_blocks(source)
+        if not blocks:
+            raise ValueError(f"No bz2 blocks found in {bz2_file}")
+
+        logger.info(f"Decompressing {len(blocks)} bz2 blocks from {bz2_file} with {workers} workers")
+
+        def submit(start_bit: int, end_bit: int) -> Future:
+            first_byte = start_bit // 8
+            last_byte = (end_bit + 7) // 8
+            offset = first_byte * 8
+            source.seek(first_byte)
+            chunk = source.read(last_byte - first_byte)
+            return executor.submit(decompress_bz2_block, chunk, start_bit - offset, end_bit - offset)
+
+        written = 0
+        window = max(1, workers * PARALLEL_WINDOW_PER_WORKER)
+        pending: Deque[Future] = deque()
+        remaining = iter(blocks)
+        try:
+            with open(output_file, "wb") as out:
+                for block in itertools.islice(remaining, window):
+                    pending.append(submit(*block))
+                while pending:
+                    output = pending.popleft().result()
+                    out.write(output)
+                    written += len(output)
+                    next_block = next(remaining, None)
+                    if next_block is not None:
+                        pending.append(submit(*next_block))
+        finally:
+            for future in pending:
+                future.cancel()
+    return written
@@ -0,0 +1,101 @@
+"""
+Batch prefetch support: a resumable on-disk manifest and run summary.
+
+The manifest records the outcome of every match in a prefetch run so an
+interrupted or partially failed run can be restarted and skip matches that
+are already done.
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..models.replay_data import PARSE_PROFILES
+
+logger = logging.getLogger(__name__)
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class PrefetchSummary:
+    """Outcome of a prefetch run."""
+
+    completed: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)  # Already cached or done in the manifest
+    failed: Dict[int, str] = field(default_factory=dict)  # match_id -> last error
+
+    @property
+    def total(self) -> int:
+        return len(self.completed) + len(self.skipped) + len(self.failed)
+
+
+class PrefetchManifest:
+    """
+    JSON file tracking per-match prefetch status.
+
+    Each entry holds the status, parse profile, attempt count, last error and
+    update time.
+    Writes are atomic (temp file + rename) so a killed run never leaves a
+    corrupt manifest.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Load an existing manifest, or start an empty one.
+
+        Args:
+            path: Manifest file. None keeps the manifest in memory only.
+        """
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if path and path.exists():
+            try:
+                self._entries = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable prefetch manifest {path}: {e}")
+
+    def is_done(self, match_id: int, profile: str = "full") -> bool:
+        """Check if a match was prefetched with (at least) the given parse profile."""
+        entry = self._entries.get(str(match_id))
+        if entry is None or entry["status"] != STATUS_DONE:
+            return False
+        done_with = PARSE_PROFILES.get(entry.get("profile", "full"), frozenset())
+        return PARSE_PROFILES[profile] <= done_with
+
+    def attempts(self, match_id: int) -> int:
+        entry = self._entries.get(str(match_id))
+        return entry["attempts"] if entry else 0
+
+    def record(
+        self, match_id: int, status: str, attempts: int, error: Optional[str] = None, profile: str = "full"
+    ) -> None:
+        """Record a match outcome and persist the manifest."""
+        self._entries[str(match_id)] = {
+            "status": status,
+            "profile": profile,
+            "attempts": attempts,
+            "error": error,
+            "updated_at": time.time(),
+        }
+        self.save()
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self._entries, indent=2, sort_keys=True))
+        os.replace(tmp_path, self.path)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Count matches per status."""
+        stats: Dict[str, int] = {}
+        for entry in self._entries.values():
+            stats[entry["status"]] = stats.get(entry["status"], 0) + 1
+        return stats
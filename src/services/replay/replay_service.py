@@ -8,17 +8,23 @@ NO MCP DEPENDENCIES - progress is reported via callback protocol.
 import asyncio
 import bz2
 import logging
+import multiprocessing
 import os
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, TypeVar
 
-import requests
+import aiohttp
 from opendota import OpenDota, ReplayNotAvailableError
 from opendota.models.parse_job import ParseStatus
 from python_manta import CombatLogType, Parser
 
 from ..cache.replay_cache import ReplayCache
-from ..models.replay_data import ParsedReplayData, ProgressCallback
+from ..models.replay_data import ALL_COLLECTORS, PARSE_PROFILES, ParsedReplayData, ProgressCallback
+from ..seek.checkpoint_index import CHECKPOINT_INTERVAL_TICKS
+from ..seek.trajectories import TRAJECTORY_INTERVAL_TICKS, HeroTrajectories, thin_snapshots
+from .decompression import MIN_REPLAY_SIZE, StreamingBz2Writer, decompress_bz2_parallel
+from .prefetch import STATUS_DONE, STATUS_FAILED, PrefetchManifest, PrefetchSummary
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +38,265 @@ def _get_default_replay_dir() -> Path:
 
 DEFAULT_REPLAY_DIR = _get_default_replay_dir()
 
+DEFAULT_PARSE_WORKERS = 2
+PROGRESS_HEARTBEAT_SECONDS = 5.0
+DOWNLOAD_TIMEOUT = 300  # seconds for connect and per-read
+DOWNLOAD_CHUNK_SIZE = 65536  # 64KB network reads
+DECOMPRESS_BATCH_SIZE = 1024 * 1024  # Hand compressed data to the decompressor in ~1MB batches
+PARALLEL_EXTRACT_MIN_SIZE = 32 * 1024 * 1024  # Smaller files are not worth a process pool
+MAX_ENTITY_SNAPSHOTS = 200
+
+# Batch prefetch defaults
+PREFETCH_DOWNLOAD_CONCURRENCY = 4
+PREFETCH_PARSE_CONCURRENCY = 2
+PREFETCH_MAX_ATTEMPTS = 3
+PREFETCH_RETRY_DELAY = 60.0  # seconds, doubled after each failed attempt
+PREFETCH_PARSE_WAIT = 900.0  # seconds to wait for OpenDota per attempt
+
+T = TypeVar("T")
+
+
+def _spawn_process_pool(workers: int) -> ProcessPoolExecutor:
+    # spawn: forking a process that runs an event loop and threads is unsafe
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _create_default_executor() -> Executor:
+    """Create the worker pool for parsing and decompression.
+
+    Configured via environment:
+    - DOTA_PARSE_EXECUTOR: "thread" (default) or "process"
+    - DOTA_PARSE_WORKERS: number of workers (default 2)
+    """
+    workers = int(os.environ.get("DOTA_PARSE_WORKERS", DEFAULT_PARSE_WORKERS))
+    kind = os.environ.get("DOTA_PARSE_EXECUTOR", "thread").lower()
+    if kind == "process":
+        return _spawn_process_pool(workers)
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="replay-worker")
+
+
+def parse_replay_file(
+    match_id: int, replay_path: str, collectors: FrozenSet[str] = ALL_COLLECTORS
+) -> ParsedReplayData:
+    """Parse replay with python-manta v2 single-pass API.
+
+    Module-level so it can run in a thread or process pool.
+
+    Args:
+        match_id: The match ID
+        replay_path: Path to the .dem file
+        collectors: Collectors to run (see PARSE_PROFILES); others are skipped
+    """
+    replay_str = str(replay_path)
+
+    parser = Parser(replay_str)
+
+    # Single-pass parse with the requested collectors
+    logger.info(f"Parsing replay {replay_path} ({', '.join(sorted(collectors))})")
+
+    # Build parse config - attacks is optional (requires python-manta 1.4.5.4+)
+    parse_config = {
+        "header": True,
+        "game_info": True,
+        "combat_log": {
+            "types": [
+                CombatLogType.DAMAGE.value,
+                CombatLogType.HEAL.value,
+                CombatLogType.MODIFIER_ADD.value,
+                CombatLogType.MODIFIER_REMOVE.value,
+                CombatLogType.DEATH.value,
+                CombatLogType.ABILITY.value,
+                CombatLogType.ITEM.value,
+                CombatLogType.PURCHASE.value,
+                CombatLogType.ABILITY_TRIGGER.value,
+                CombatLogType.NEUTRAL_CAMP_STACK.value,
+                CombatLogType.PICKUP_RUNE.value,
+                CombatLogType.INTERRUPT_CHANNEL.value,
+            ],
+            "max_entries": 100000,
+        },
+        "entities": {
+            "interval_ticks": CHECKPOINT_INTERVAL_TICKS,  # ~30 second snapshots, also seek checkpoints
+            "max_snapshots": MAX_ENTITY_SNAPSHOTS,
+        },
+        "game_events": {
+            "max_events": 10000,
+        },
+        "modifiers": {
+            "max_modifiers": 50000,
+        },
+        "messages": {
+            "message_types": ['CDOTAMatchMetadataFile'],
+            "max_messages": 0,  # No limit - need to find metadata at end of file
+        },
+    }
+
+    # Check if attacks collector is available (python-manta 1.4.5.4+)
+    import inspect
+    parse_sig = inspect.signature(parser.parse)
+    if 'attacks' in parse_sig.parameters:
+        parse_config["attacks"] = {
+            "max_events": 50000,  # Capture attacks for neutral aggro/tower pressure
+        }
+        logger.info("Attacks collector enabled")
+    else:
+        logger.info("Attacks collector not available (requires python-manta 1.4.5.4+)")
+
+    # Check if entity_deaths collector is available (python-manta 1.4.5.4+)
+    if 'entity_deaths' in parse_sig.parameters:
+        parse_config["entity_deaths"] = {
+            "creeps_only": True,  # Only track creep deaths for wave detection
+            "max_events": 10000,
+        }
+        logger.info("Entity deaths collector enabled")
+    else:
+        logger.info("Entity deaths collector not available (requires python-manta 1.4.5.4+)")
+
+    parse_names = set(collectors)
+    if "trajectories" in collectors:
+        # Dense hero trajectories ride on the entity collector of the same pass
+        parse_config["entities"] = {"interval_ticks": TRAJECTORY_INTERVAL_TICKS, "max_snapshots": 0}
+        parse_names.add("entities")
+
+    parse_config = {name: config for name, config in parse_config.items() if name in parse_names}
+    result = parser.parse(**parse_config)
+
+    if not result.success:
+        raise ValueError(f"Parsing failed: {result.error}")
+
+    trajectories = None
+    if "trajectories" in collectors:
+        dense = result.entities.snapshots if result.entities else []
+        trajectories = HeroTrajectories.from_snapshots(dense)
+        logger.info(f"Captured {len(trajectories)} trajectory samples ({trajectories.nbytes // 1024} KB)")
+        if "entities" not in collectors:
+            result.entities = None
+        elif result.entities:
+            # Keep the sparse snapshots the entities collector alone would have kept
+            thinned = thin_snapshots(dense, CHECKPOINT_INTERVAL_TICKS, MAX_ENTITY_SNAPSHOTS)
+            result.entities = result.entities.model_copy(update={"snapshots": thinned, "snapshot_count": len(thinned)})
+
+    # Extract metadata from messages (CDOTAMatchMetadataFile for timeline data)
+    metadata = _extract_metadata_from_result(result)
+
+    logger.info(f"Parsed {len(result.combat_log.entries) if result.combat_log else 0} combat log entries")
+    logger.info(f"Parsed {len(result.entities.snapshots) if result.entities else 0} entity snapshots")
+    if hasattr(result, 'attacks') and result.attacks:
+        logger.info(f"Parsed {len(result.attacks.events)} attack events")
+    if hasattr(result, 'entity_deaths') and result.entity_deaths:
+        logger.info(f"Parsed {len(result.entity_deaths.events)} entity death events")
+
+    return ParsedReplayData.from_parse_result(
+        match_id=match_id,
+        replay_path=replay_str,
+        result=result,
+        metadata=metadata,
+        collectors=frozenset(collectors),
+        trajectories=trajectories,
+    )
+
+
+def _extract_metadata_from_result(result) -> Optional[dict]:
+    """Extract CDOTAMatchMetadataFile from parse result messages."""
+    try:
+        if result.messages and result.messages.messages:
+            for msg in result.messages.messages:
+                if msg.type == 'CDOTAMatchMetadataFile':
+                    logger.info("Found CDOTAMatchMetadataFile metadata")
+                    return msg.data
+    except Exception as e:
+        logger.warning(f"Failed to extract metadata: {e}")
+    return None
+
+
+def extract_bz2_file(bz2_file: Path, output_file: Path) -> Optional[Path]:
+    """Extract bz2 compressed file.
+
+    Module-level so it can run in a thread or process pool.
+    """
+    try:
+        logger.info(f"Extracting {bz2_file}")
+
+        with bz2.open(bz2_file, 'rb') as f_in:
+            with open(output_file, 'wb') as f_out:
+                chunk_size = 1024 * 1024  # 1MB chunks
+                while True:
+                    chunk = f_in.read(chunk_size)
+                    if not chunk:
+                        break
+                    f_out.write(chunk)
+
+        # Verify extracted file is reasonable size
+        file_size = output_file.stat().st_size
+        if file_size < MIN_REPLAY_SIZE:
+            logger.error(f"Extracted file too small: {file_size} bytes (min {MIN_REPLAY_SIZE})")
+            if output_file.exists():
+                output_file.unlink()
+            return None
+
+        logger.info(f"Extracted replay to {output_file} ({file_size / (1024*1024):.1f} MB)")
+        return output_file
+
+    except Exception as e:
+        logger.error(f"Failed to extract bz2: {e}")
+        if output_file.exists():
+            output_file.unlink()
+        return None
+
+
+def extract_bz2_file_parallel(
+    bz2_file: Path, output_file: Path, executor: Executor, workers: int
+) -> Optional[Path]:
+    """Extract a bz2 file by decompressing its blocks across a worker pool.
+
+    Returns:
+        Path to extracted file, or None if the result is too small
+
+    Raises:
+        ValueError, OSError: If the file cannot be split or a block fails;
+            callers fall back to extract_bz2_file
+    """
+    file_size = decompress_bz2_parallel(bz2_file, output_file, executor, workers)
+    if file_size < MIN_REPLAY_SIZE:
+        logger.error(f"Extracted file too small: {file_size} bytes (min {MIN_REPLAY_SIZE})")
+        output_file.unlink()
+        return None
+
+    logger.info(f"Extracted replay to {output_file} ({file_size / (1024*1024):.1f} MB, parallel)")
+    return output_file
+
+
+class _InFlightLoad:
+    """A shared download/parse for one match, fanning progress out to every waiter."""
+
+    def __init__(self):
+        self.task: asyncio.Task
+        self._subscribers: List[ProgressCallback] = []
+        self._last_progress: Optional[Tuple[int, int, str]] = None
+
+    async def subscribe(self, callback: ProgressCallback) -> None:
+        """Add a waiter's progress callback, replaying the latest update to it."""
+        self._subscribers.append(callback)
+        if self._last_progress is not None:
+            await self._notify(callback, *self._last_progress)
+
+    def unsubscribe(self, callback: ProgressCallback) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    async def report(self, current: int, total: int, message: str) -> None:
+        """ProgressCallback passed to the shared load."""
+        self._last_progress = (current, total, message)
+        for callback in list(self._subscribers):
+            await self._notify(callback, current, total, message)
+
+    async def _notify(self, callback: ProgressCallback, current: int, total: int, message: str) -> None:
+        # A waiter whose client went away must not fail the shared load
+        try:
+            await callback(current, total, message)
+        except Exception as e:
+            logger.debug(f"Progress callback failed: {e}")
+
 
 class ReplayService:
     """
@@ -39,7 +304,7 @@ class ReplayService:
 
     Handles:
     - Downloading replays from OpenDota
-    - Parsing with python-manta v2 (single-pass)
+    - Parsing with python-manta v2 (single-pass) in a worker pool
     - Caching parsed data
     - Progress reporting via callbacks
 
@@ -50,50 +315,128 @@ class ReplayService:
         self,
         cache: Optional[ReplayCache] = None,
         replay_dir: Optional[Path] = None,
+        executor: Optional[Executor] = None,
     ):
         """Initialize the replay service.
 
         Args:
             cache: ReplayCache instance. Creates default if not provided.
             replay_dir: Directory for replay files. Defaults to ~/dota2/replays
+            executor: Worker pool for parsing and bz2 extraction. Defaults to a
+                pool configured by DOTA_PARSE_EXECUTOR / DOTA_PARSE_WORKERS.
         """
         self._cache = cache or ReplayCache()
         self._replay_dir = replay_dir or DEFAULT_REPLAY_DIR
         self._replay_dir.mkdir(parents=True, exist_ok=True)
+        self._owns_executor = executor is None
+        self._executor = executor or _create_default_executor()
+        # DOTA_REPLAY_STREAMING=0 opts into download-then-extract via a temporary .bz2. Streaming
+        # overlaps decompression with a network-bound download; the two-pass mode instead lets
+        # CPU-bound ingest workers (fast links, large replays) extract block-parallel.
+        self._stream_extract = os.environ.get("DOTA_REPLAY_STREAMING", "1") != "0"
+        # Workers for block-parallel extraction in two-pass mode; DOTA_DECOMPRESS_WORKERS=1 disables it
+        self._decompress_workers = int(os.environ.get("DOTA_DECOMPRESS_WORKERS", os.cpu_count() or 1))
+        self._decompress_pool: Optional[Executor] = None
+        # DOTA_HERO_TRAJECTORIES=1 captures dense hero trajectories with every full parse
+        self._full_profile = "dense" if os.environ.get("DOTA_HERO_TRAJECTORIES", "0") == "1" else "full"
+        self._in_flight: Dict[int, _InFlightLoad] = {}
 
     async def get_parsed_data(
         self,
         match_id: int,
         progress: Optional[ProgressCallback] = None,
-        _retry_count: int = 0,
+        profile: str = "full",
     ) -> ParsedReplayData:
-        """Get complete parsed data for a match.
+        """Get parsed data for a match.
 
-        Returns cached data if available, otherwise downloads and parses.
+        Returns cached data if it already has the collectors the profile
+        needs. Otherwise downloads (if needed) and parses only the missing
+        collectors, merging them into the cached entry, so a cheap first
+        request (e.g. the draft) does not pay for a full parse.
         Automatically retries once if parsing fails due to corruption.
 
+        Concurrent calls for the same uncached match share a single
+        download/parse: later callers await the first call's work and
+        receive its progress updates.
+
         Args:
             match_id: The match ID
             progress: Optional callback for progress updates
-            _retry_count: Internal counter for retries (do not set manually)
+            profile: Parse profile from PARSE_PROFILES ("draft", "combat", "full",
+                or "dense": full plus hero trajectories)
 
         Returns:
-            ParsedReplayData with all extracted data
+            ParsedReplayData with at least the profile's collectors
 
         Raises:
-            ValueError: If replay cannot be downloaded or parsed after retries
+            ValueError: If the profile is unknown, or the replay cannot be
+                downloaded or parsed after retries
         """
-        max_retries = 1
+        if profile not in PARSE_PROFILES:
+            raise ValueError(f"Unknown parse profile '{profile}'. Available: {', '.join(PARSE_PROFILES)}")
+        if profile == "full":
+            profile = self._full_profile
+        required = PARSE_PROFILES[profile]
 
         # Check cache first
         if progress:
             await progress(0, 100, "Checking cache...")
 
-        cached = self._cache.get(match_id)
-        if cached:
+        loop = asyncio.get_running_loop()
+        while True:
+            # Disk hits decompress and unpickle the entry: keep that off the event loop
+            cached = await self._run_blocking(self._cache.get, match_id, in_thread=True)
+            if cached and cached.has_collectors(required):
+                if progress:
+                    await progress(100, 100, "Loaded from cache")
+                return cached
+
+            flight = self._in_flight.get(match_id)
+            if flight is None or flight.task.get_loop() is not loop or flight.task.done():
+                missing = required - cached.collectors if cached else required
+                flight = _InFlightLoad()
+                flight.task = loop.create_task(self._load_parsed_data(match_id, missing, flight.report))
+                self._in_flight[match_id] = flight
+                flight.task.add_done_callback(lambda _, flight=flight: self._release_flight(match_id, flight))
+            else:
+                logger.info(f"Joining in-flight download/parse for match {match_id}")
+
             if progress:
-                await progress(100, 100, "Loaded from cache")
-            return cached
+                await flight.subscribe(progress)
+            try:
+                # Shield so one caller disconnecting does not cancel the shared work
+                data = await asyncio.shield(flight.task)
+            finally:
+                if progress:
+                    flight.unsubscribe(progress)
+
+            if data.has_collectors(required):
+                return data
+            # Joined a load for fewer collectors; go again for the rest
+
+    def _release_flight(self, match_id: int, flight: "_InFlightLoad") -> None:
+        """Remove a finished load from the in-flight registry."""
+        if self._in_flight.get(match_id) is flight:
+            del self._in_flight[match_id]
+        if not flight.task.cancelled() and flight.task.exception() is not None:
+            logger.debug(f"In-flight load for match {match_id} failed: {flight.task.exception()}")
+
+    async def _load_parsed_data(
+        self,
+        match_id: int,
+        collectors: FrozenSet[str],
+        progress: Optional[ProgressCallback] = None,
+        _retry_count: int = 0,
+    ) -> ParsedReplayData:
+        """Download, parse and cache a match (the uncached path of get_parsed_data).
+
+        Args:
+            match_id: The match ID
+            collectors: Collectors to parse; merged into any cached entry
+            progress: Optional callback for progress updates
+            _retry_count: Internal counter for retries (do not set manually)
+        """
+        max_retries = 1
 
         # Download replay
         if progress:
@@ -109,7 +452,7 @@ class ReplayService:
             await progress(50, 100, "Parsing replay...")
 
         try:
-            data = self._parse_replay(match_id, replay_path, progress)
+            data = await self._parse_replay(match_id, replay_path, progress, collectors=collectors)
         except ValueError as e:
             # Parsing failed - delete corrupt replay
             logger.error(f"Parsing failed for match {match_id}: {e}")
@@ -118,22 +461,25 @@ class ReplayService:
                 logger.info(f"Deleted corrupt replay file for match {match_id}")
 
             # Also clear cache in case there's stale data
-            self._cache.delete(match_id)
+            await self._run_blocking(self._cache.delete, match_id, in_thread=True)
 
             # Retry once
             if _retry_count < max_retries:
                 logger.info(f"Retrying download/parse for match {match_id} (attempt {_retry_count + 1})")
                 if progress:
                     await progress(5, 100, "Replay corrupt, retrying download...")
-                return await self.get_parsed_data(match_id, progress, _retry_count + 1)
+                return await self._load_parsed_data(match_id, collectors, progress, _retry_count + 1)
 
             raise ValueError(f"Replay parsing failed after {max_retries + 1} attempts: {e}")
 
-        # Cache result
+        # Cache result, keeping collectors parsed by earlier requests
         if progress:
             await progress(95, 100, "Caching results...")
 
-        self._cache.set(match_id, data)
+        existing = await self._run_blocking(self._cache.get, match_id, in_thread=True)
+        if existing:
+            data = existing.merged_with(data)
+        await self._run_blocking(self._cache.set, match_id, data, in_thread=True)
 
         if progress:
             await progress(100, 100, "Complete")
@@ -173,9 +519,101 @@ class ReplayService:
 
         return replay_path
 
-    def is_cached(self, match_id: int) -> bool:
-        """Check if match data is cached."""
-        return self._cache.has(match_id)
+    async def prefetch(
+        self,
+        match_ids: Iterable[int],
+        download_concurrency: int = PREFETCH_DOWNLOAD_CONCURRENCY,
+        parse_concurrency: int = PREFETCH_PARSE_CONCURRENCY,
+        max_attempts: int = PREFETCH_MAX_ATTEMPTS,
+        retry_delay: float = PREFETCH_RETRY_DELAY,
+        wait_timeout: float = PREFETCH_PARSE_WAIT,
+        manifest: Optional[PrefetchManifest] = None,
+        progress: Optional[ProgressCallback] = None,
+        profile: str = "full",
+    ) -> PrefetchSummary:
+        """Download, parse and cache many matches.
+
+        Downloads and parses are throttled separately, so network-bound
+        downloads keep flowing while CPU-bound parses queue. A failed match
+        (e.g. OpenDota has not parsed it yet) is retried with exponential
+        backoff. Matches already cached are skipped, which makes an interrupted
+        run resumable; the manifest records progress and attempts, but a match
+        it marks done is fetched again if its cache entry has been evicted.
+
+        Args:
+            match_ids: Matches to prefetch (duplicates are ignored)
+            download_concurrency: Max simultaneous downloads (including OpenDota parse waits)
+            parse_concurrency: Max simultaneous parses
+            max_attempts: Attempts per match before it is marked failed
+            retry_delay: Seconds before the first retry, doubled each time
+            wait_timeout: Max seconds to wait for OpenDota to parse a match per attempt
+            manifest: Progress manifest to resume from and update
+            progress: Optional callback, called once per finished match
+            profile: Parse profile to warm (see get_parsed_data)
+
+        Returns:
+            PrefetchSummary of completed, skipped and failed matches
+        """
+        ids = list(dict.fromkeys(match_ids))
+        manifest = manifest or PrefetchManifest()
+        summary = PrefetchSummary()
+        download_slots = asyncio.Semaphore(download_concurrency)
+        parse_slots = asyncio.Semaphore(parse_concurrency)
+
+        async def finished(match_id: int, outcome: str) -> None:
+            if progress:
+                await progress(summary.total, len(ids), f"Match {match_id}: {outcome}")
+
+        async def prefetch_one(match_id: int) -> None:
+            # The manifest only records progress: an entry evicted since it was marked done is fetched again
+            if self.is_cached(match_id, profile):
+                if not manifest.is_done(match_id, profile):
+                    manifest.record(match_id, STATUS_DONE, manifest.attempts(match_id), profile=profile)
+                summary.skipped.append(match_id)
+                await finished(match_id, "already cached")
+                return
+
+            attempts = manifest.attempts(match_id)
+            error = ""
+            for attempt in range(max_attempts):
+                attempts += 1
+                try:
+                    async with download_slots:
+                        replay_path = await self._download_replay(match_id, wait_timeout=wait_timeout)
+                    if not replay_path:
+                        raise ValueError(f"Could not download replay for match {match_id}")
+                    async with parse_slots:
+                        await self.get_parsed_data(match_id, profile=profile)
+                except Exception as e:
+                    error = str(e)
+                    if attempt + 1 < max_attempts:
+                        delay = retry_delay * 2 ** attempt
+                        logger.info(f"Prefetch of match {match_id} failed ({error}), retrying in {delay:.0f}s")
+                        await asyncio.sleep(delay)
+                    continue
+
+                manifest.record(match_id, STATUS_DONE, attempts, profile=profile)
+                summary.completed.append(match_id)
+                await finished(match_id, "cached")
+                return
+
+            logger.error(f"Prefetch of match {match_id} failed after {max_attempts} attempts: {error}")
+            manifest.record(match_id, STATUS_FAILED, attempts, error, profile=profile)
+            summary.failed[match_id] = error
+            await finished(match_id, f"failed ({error})")
+
+        await asyncio.gather(*(prefetch_one(match_id) for match_id in ids))
+        return summary
+
+    def is_cached(self, match_id: int, profile: Optional[str] = None) -> bool:
+        """Check if match data is cached, optionally with every collector of a parse profile.
+
+        Reads only the entry's metadata: the data itself is not loaded.
+        """
+        if profile is None:
+            return self._cache.has(match_id)
+        collectors = self._cache.get_collectors(match_id)
+        return collectors is not None and PARSE_PROFILES[profile] <= collectors
 
     def is_downloaded(self, match_id: int) -> bool:
         """Check if replay file is downloaded."""
@@ -279,6 +717,9 @@ class ReplayService:
                 logger.error(f"Replay not available for match {match_id}: {e}")
                 return None
 
+            if self._stream_extract:
+                return await self._download_streaming(match_id, replay_url, dem_file, progress)
+
             # Download bz2 file
             bz2_file = await self._download_bz2(match_id, replay_url, progress)
             if not bz2_file:
@@ -288,7 +729,7 @@ class ReplayService:
             if progress:
                 await progress(45, 100, "Extracting replay...")
 
-            extracted = self._extract_bz2(bz2_file, dem_file)
+            extracted = await self._extract_bz2(bz2_file, dem_file, progress)
 
             # Cleanup bz2
             if extracted and bz2_file.exists():
@@ -302,41 +743,122 @@ class ReplayService:
         finally:
             await opendota.close()
 
-    async def _download_bz2(
+    async def _download_streaming(
         self,
         match_id: int,
         url: str,
+        dem_file: Path,
         progress: Optional[ProgressCallback] = None,
     ) -> Optional[Path]:
-        """Download compressed replay file with progress."""
-        bz2_file = self._replay_dir / f"{match_id}.dem.bz2"
+        """Download and decompress in one pass, without a temporary bz2 file.
+
+        Compressed chunks are fed to an incremental bz2 decompressor as they
+        arrive. The same content-length and minimum-size checks as the
+        two-pass path apply; a failed download leaves no partial .dem behind.
+        """
+        writer = StreamingBz2Writer(dem_file)
+        loop = asyncio.get_running_loop()
 
         try:
-            logger.info(f"Downloading replay from {url}")
+            logger.info(f"Streaming replay from {url}")
 
-            response = requests.get(url, stream=True, timeout=300)
-            response.raise_for_status()
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=DOWNLOAD_TIMEOUT, sock_read=DOWNLOAD_TIMEOUT)
+            async with aiohttp.ClientSession(timeout=timeout, auto_decompress=False) as session:
+                async with session.get(url) as response:
+                    response.raise_for_status()
 
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            chunk_size = 65536  # 64KB chunks
+                    total_size = int(response.headers.get('content-length', 0))
+                    downloaded = 0
+                    batch = bytearray()
 
-            with open(bz2_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if chunk:
-                        f.write(chunk)
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        batch += chunk
                         downloaded += len(chunk)
 
+                        if len(batch) >= DECOMPRESS_BATCH_SIZE:
+                            # Decompressor is stateful, so it runs on the loop's default
+                            # thread pool rather than the (possibly process) parse pool
+                            await loop.run_in_executor(None, writer.feed, bytes(batch))
+                            batch.clear()
+
                         if progress and total_size > 0:
-                            # Map download progress to 10-40% range
-                            pct = 10 + int((downloaded / total_size) * 30)
+                            # Map download progress to 10-45% range (extraction is folded in)
+                            pct = 10 + int((downloaded / total_size) * 35)
                             mb_done = downloaded / (1024 * 1024)
                             mb_total = total_size / (1024 * 1024)
                             await progress(
                                 pct, 100,
-                                f"Downloading... {mb_done:.1f}/{mb_total:.1f} MB"
+                                f"Downloading and extracting... {mb_done:.1f}/{mb_total:.1f} MB"
                             )
 
+                    if batch:
+                        await loop.run_in_executor(None, writer.feed, bytes(batch))
+
+            # Verify download completed
+            if total_size > 0 and downloaded != total_size:
+                logger.error(f"Incomplete download: got {downloaded} bytes, expected {total_size}")
+                writer.abort()
+                return None
+
+            logger.info(f"Downloaded replay for match {match_id} ({downloaded} bytes compressed)")
+            return writer.finish()
+
+        except aiohttp.ClientResponseError as e:
+            if e.status in (404, 502):
+                logger.error(
+                    f"Replay expired: Valve returned {e.status} for match {match_id}. "
+                    "Old replays are deleted from Valve's servers after ~2 weeks."
+                )
+            else:
+                logger.error(f"HTTP error downloading replay: {e}")
+            writer.abort()
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Network error downloading replay: {e}")
+            writer.abort()
+            return None
+        except OSError as e:
+            logger.error(f"Failed to extract replay stream: {e}")
+            writer.abort()
+            return None
+        except BaseException:
+            writer.abort()
+            raise
+
+    async def _download_bz2(
+        self,
+        match_id: int,
+        url: str,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Optional[Path]:
+        """Download compressed replay file with progress."""
+        bz2_file = self._replay_dir / f"{match_id}.dem.bz2"
+
+        try:
+            logger.info(f"Downloading replay from {url}")
+
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=DOWNLOAD_TIMEOUT, sock_read=DOWNLOAD_TIMEOUT)
+            async with aiohttp.ClientSession(timeout=timeout, auto_decompress=False) as session:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+
+                    total_size = int(response.headers.get('content-length', 0))
+                    downloaded = 0
+                    with open(bz2_file, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                            downloaded += len(chunk)
+
+                            if progress and total_size > 0:
+                                # Map download progress to 10-40% range
+                                pct = 10 + int((downloaded / total_size) * 30)
+                                mb_done = downloaded / (1024 * 1024)
+                                mb_total = total_size / (1024 * 1024)
+                                await progress(
+                                    pct, 100,
+                                    f"Downloading... {mb_done:.1f}/{mb_total:.1f} MB"
+                                )
+
             # Verify download completed
             if total_size > 0 and downloaded != total_size:
                 logger.error(f"Incomplete download: got {downloaded} bytes, expected {total_size}")
@@ -347,11 +869,10 @@ class ReplayService:
             logger.info(f"Downloaded replay to {bz2_file} ({downloaded} bytes)")
             return bz2_file
 
-        except requests.HTTPError as e:
-            status_code = e.response.status_code if e.response is not None else None
-            if status_code in (404, 502):
+        except aiohttp.ClientResponseError as e:
+            if e.status in (404, 502):
                 logger.error(
-                    f"Replay expired: Valve returned {status_code} for match {match_id}. "
+                    f"Replay expired: Valve returned {e.status} for match {match_id}. "
                     "Old replays are deleted from Valve's servers after ~2 weeks."
                 )
             else:
@@ -359,150 +880,93 @@ class ReplayService:
             if bz2_file.exists():
                 bz2_file.unlink()
             return None
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Network error downloading replay: {e}")
             if bz2_file.exists():
                 bz2_file.unlink()
             return None
 
-    def _extract_bz2(self, bz2_file: Path, output_file: Path) -> Optional[Path]:
-        """Extract bz2 compressed file."""
-        try:
-            logger.info(f"Extracting {bz2_file}")
-
-            with bz2.open(bz2_file, 'rb') as f_in:
-                with open(output_file, 'wb') as f_out:
-                    chunk_size = 1024 * 1024  # 1MB chunks
-                    while True:
-                        chunk = f_in.read(chunk_size)
-                        if not chunk:
-                            break
-                        f_out.write(chunk)
-
-            # Verify extracted file is reasonable size (min 10MB for valid replay)
-            file_size = output_file.stat().st_size
-            min_size = 10 * 1024 * 1024  # 10 MB
-            if file_size < min_size:
-                logger.error(f"Extracted file too small: {file_size} bytes (min {min_size})")
+    async def _extract_bz2(
+        self,
+        bz2_file: Path,
+        output_file: Path,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Optional[Path]:
+        """Extract bz2 compressed file in the worker pool.
+
+        Only used in two-pass mode (DOTA_REPLAY_STREAMING=0). Large files are
+        decompressed block-parallel across a process pool, falling back to
+        sequential extraction if that fails.
+        """
+        if self._decompress_workers > 1 and bz2_file.stat().st_size >= PARALLEL_EXTRACT_MIN_SIZE:
+            if self._decompress_pool is None:
+                self._decompress_pool = _spawn_process_pool(self._decompress_workers)
+            try:
+                # The orchestrator holds a pool handle, so it runs on a thread, not in self._executor
+                return await self._run_blocking(
+                    extract_bz2_file_parallel, bz2_file, output_file,
+                    self._decompress_pool, self._decompress_workers,
+                    progress=progress, percent=45, message="Extracting replay...", in_thread=True,
+                )
+            except (ValueError, OSError, BrokenExecutor) as e:
+                logger.warning(f"Parallel bz2 extraction failed, falling back to sequential: {e}")
                 if output_file.exists():
                     output_file.unlink()
-                return None
 
-            logger.info(f"Extracted replay to {output_file} ({file_size / (1024*1024):.1f} MB)")
-            return output_file
-
-        except Exception as e:
-            logger.error(f"Failed to extract bz2: {e}")
-            if output_file.exists():
-                output_file.unlink()
-            return None
+        return await self._run_blocking(
+            extract_bz2_file, bz2_file, output_file,
+            progress=progress, percent=45, message="Extracting replay...",
+        )
 
-    def _parse_replay(
+    async def _parse_replay(
         self,
         match_id: int,
         replay_path: Path,
         progress: Optional[ProgressCallback] = None,
+        collectors: FrozenSet[str] = ALL_COLLECTORS,
     ) -> ParsedReplayData:
-        """Parse replay with python-manta v2 single-pass API."""
-        replay_str = str(replay_path)
-
-        parser = Parser(replay_str)
-
-        # Single-pass parse with all collectors
-        logger.info(f"Parsing replay {replay_path}")
-
-        # Build parse config - attacks is optional (requires python-manta 1.4.5.4+)
-        parse_config = {
-            "header": True,
-            "game_info": True,
-            "combat_log": {
-                "types": [
-                    CombatLogType.DAMAGE.value,
-                    CombatLogType.HEAL.value,
-                    CombatLogType.MODIFIER_ADD.value,
-                    CombatLogType.MODIFIER_REMOVE.value,
-                    CombatLogType.DEATH.value,
-                    CombatLogType.ABILITY.value,
-                    CombatLogType.ITEM.value,
-                    CombatLogType.PURCHASE.value,
-                    CombatLogType.ABILITY_TRIGGER.value,
-                    CombatLogType.NEUTRAL_CAMP_STACK.value,
-                    CombatLogType.PICKUP_RUNE.value,
-                    CombatLogType.INTERRUPT_CHANNEL.value,
-                ],
-                "max_entries": 100000,
-            },
-            "entities": {
-                "interval_ticks": 900,  # ~30 second snapshots
-                "max_snapshots": 200,
-            },
-            "game_events": {
-                "max_events": 10000,
-            },
-            "modifiers": {
-                "max_modifiers": 50000,
-            },
-            "messages": {
-                "message_types": ['CDOTAMatchMetadataFile'],
-                "max_messages": 0,  # No limit - need to find metadata at end of file
-            },
-        }
-
-        # Check if attacks collector is available (python-manta 1.4.5.4+)
-        import inspect
-        parse_sig = inspect.signature(parser.parse)
-        if 'attacks' in parse_sig.parameters:
-            parse_config["attacks"] = {
-                "max_events": 50000,  # Capture attacks for neutral aggro/tower pressure
-            }
-            logger.info("Attacks collector enabled")
-        else:
-            logger.info("Attacks collector not available (requires python-manta 1.4.5.4+)")
-
-        # Check if entity_deaths collector is available (python-manta 1.4.5.4+)
-        if 'entity_deaths' in parse_sig.parameters:
-            parse_config["entity_deaths"] = {
-                "creeps_only": True,  # Only track creep deaths for wave detection
-                "max_events": 10000,
-            }
-            logger.info("Entity deaths collector enabled")
-        else:
-            logger.info("Entity deaths collector not available (requires python-manta 1.4.5.4+)")
-
-        result = parser.parse(**parse_config)
-
-        if not result.success:
-            raise ValueError(f"Parsing failed: {result.error}")
-
-        # Extract metadata from messages (CDOTAMatchMetadataFile for timeline data)
-        metadata = self._extract_metadata_from_result(result)
-
-        logger.info(f"Parsed {len(result.combat_log.entries) if result.combat_log else 0} combat log entries")
-        logger.info(f"Parsed {len(result.entities.snapshots) if result.entities else 0} entity snapshots")
-        if hasattr(result, 'attacks') and result.attacks:
-            logger.info(f"Parsed {len(result.attacks.events)} attack events")
-        if hasattr(result, 'entity_deaths') and result.entity_deaths:
-            logger.info(f"Parsed {len(result.entity_deaths.events)} entity death events")
-
-        return ParsedReplayData.from_parse_result(
-            match_id=match_id,
-            replay_path=replay_str,
-            result=result,
-            metadata=metadata,
-            demo_index=None,  # Will be added in Phase 4
+        """Parse replay in the worker pool with python-manta v2 single-pass API."""
+        return await self._run_blocking(
+            parse_replay_file, match_id, str(replay_path), collectors,
+            progress=progress, percent=50, message="Parsing replay...",
         )
 
-    def _extract_metadata_from_result(self, result) -> Optional[dict]:
-        """Extract CDOTAMatchMetadataFile from parse result messages."""
-        try:
-            if result.messages and result.messages.messages:
-                for msg in result.messages.messages:
-                    if msg.type == 'CDOTAMatchMetadataFile':
-                        logger.info("Found CDOTAMatchMetadataFile metadata")
-                        return msg.data
-        except Exception as e:
-            logger.warning(f"Failed to extract metadata: {e}")
-        return None
+    async def _run_blocking(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        progress: Optional[ProgressCallback] = None,
+        percent: int = 0,
+        message: str = "",
+        in_thread: bool = False,
+    ) -> T:
+        """Run a blocking function in the worker pool without stalling the event loop.
+
+        While the job runs, a heartbeat progress update is sent every
+        PROGRESS_HEARTBEAT_SECONDS so clients see the long step is alive.
+        With in_thread, the job runs on the loop's default thread pool instead,
+        for functions whose arguments cannot be sent to a worker process.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None if in_thread else self._executor, func, *args)
+        if not progress:
+            return await future
+
+        started = loop.time()
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=PROGRESS_HEARTBEAT_SECONDS)
+            if done:
+                return future.result()
+            elapsed = loop.time() - started
+            await progress(percent, 100, f"{message} ({elapsed:.0f}s)")
+
+    def close(self) -> None:
+        """Shut down the worker pools this service created."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._decompress_pool is not None:
+            self._decompress_pool.shutdown(wait=False, cancel_futures=True)
+            self._decompress_pool = None
 
     def get_replay_file_size(self, match_id: int) -> Optional[float]:
         """Get replay file size in MB."""
@@ -10,8 +10,11 @@ import math
 from collections import defaultdict
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from ..analyzers.interval_index import IntervalIndex, TimeIndex
+from ..cache.derived_cache import DerivedResultCache
+from ..combat.combat_log_scanner import CombatLogScanner
 from ..combat.combat_service import CombatService
-from ..combat.fight_service import FightService
+from ..combat.fight_service import FIGHT_DETECTION_VERSION, FightService
 from ..models.combat_data import Fight, HeroDeath, RunePickup
 from ..models.replay_data import ParsedReplayData
 from ..models.rotation_data import (
@@ -55,6 +58,9 @@ ROTATION_CORRELATION_WINDOW = 60.0  # seconds to look for rune/kill correlation
 WISDOM_FIGHT_RADIUS = 2000  # units from wisdom rune to count as "nearby"
 MIN_ROTATION_DURATION = 15.0  # minimum seconds away from lane to count as rotation
 
+# Bump when rotation analysis output changes, to invalidate cached results
+ROTATION_ANALYSIS_VERSION = 1
+
 
 class RotationService:
     """
@@ -72,9 +78,11 @@ class RotationService:
         self,
         combat_service: Optional[CombatService] = None,
         fight_service: Optional[FightService] = None,
+        derived_cache: Optional[DerivedResultCache] = None,
     ):
         self._combat = combat_service or CombatService()
         self._fight = fight_service or FightService()
+        self._derived = derived_cache
 
     def _format_time(self, seconds: float) -> str:
         """Format game time as M:SS."""
@@ -211,37 +219,23 @@ class RotationService:
         Returns:
             Tuple of (x, y, lane) or None if not found
         """
-        hero_lower = hero.lower()
-        best_snapshot = None
-        min_diff = float('inf')
-
-        for snapshot in data.entity_snapshots:
-            diff = abs(snapshot.game_time - target_time)
-            if diff < min_diff:
-                min_diff = diff
-                best_snapshot = snapshot
-
-        if not best_snapshot or min_diff > 30:  # Too far from target time
+        state = data.hero_timeline.state_at(hero, target_time, max_gap=30)
+        if state is None:
             return None
 
-        for hero_snap in best_snapshot.heroes:
-            player_hero = self._clean_hero_name(hero_snap.hero_name)
-            if hero_lower in player_hero.lower():
-                lane = self._classify_lane(hero_snap.x, hero_snap.y, lane_boundaries)
-                return (hero_snap.x, hero_snap.y, lane)
-
-        return None
+        lane = self._classify_lane(state.x, state.y, lane_boundaries)
+        return (state.x, state.y, lane)
 
     def _find_rune_before_rotation(
         self,
-        rune_pickups: List[RunePickup],
+        rune_pickups: TimeIndex[RunePickup],
         hero: str,
         rotation_time: float,
     ) -> Optional[RuneCorrelation]:
         """Find rune pickup by hero within 60s before rotation."""
         hero_lower = hero.lower()
 
-        for pickup in rune_pickups:
+        for pickup in rune_pickups.between(rotation_time - ROTATION_CORRELATION_WINDOW, rotation_time):
             if hero_lower not in pickup.hero.lower():
                 continue
 
@@ -258,20 +252,18 @@ class RotationService:
 
     def _find_fight_outcome(
         self,
-        fights: List[Fight],
-        deaths: List[HeroDeath],
+        fights: IntervalIndex[Fight],
+        deaths: TimeIndex[HeroDeath],
         hero: str,
         rotation_time: float,
         to_lane: str,
     ) -> RotationOutcome:
         """Determine outcome of rotation from fights and deaths."""
         hero_lower = hero.lower()
+        window_end = rotation_time + ROTATION_CORRELATION_WINDOW
 
         # Look for deaths within window after rotation
-        deaths_in_window = []
-        for death in deaths:
-            if rotation_time <= death.game_time <= rotation_time + ROTATION_CORRELATION_WINDOW:
-                deaths_in_window.append(death)
+        deaths_in_window = deaths.between(rotation_time, window_end)
 
         if not deaths_in_window:
             return RotationOutcome(type="no_engagement", deaths_in_window=0)
@@ -289,12 +281,10 @@ class RotationService:
 
         # Find associated fight
         fight_id = None
-        for fight in fights:
-            if (fight.start_time <= rotation_time + ROTATION_CORRELATION_WINDOW and
-                    fight.end_time >= rotation_time):
-                if any(hero_lower in p.lower() for p in fight.participants):
-                    fight_id = fight.fight_id
-                    break
+        for fight in fights.overlapping(rotation_time, window_end):
+            if any(hero_lower in p.lower() for p in fight.participants):
+                fight_id = fight.fight_id
+                break
 
         # Determine outcome type
         if hero_died and kills_by_hero:
@@ -320,9 +310,9 @@ class RotationService:
         self,
         data: ParsedReplayData,
         lane_assignments: Dict[str, Tuple[str, str]],
-        rune_pickups: List[RunePickup],
-        deaths: List[HeroDeath],
-        fights: List[Fight],
+        rune_pickups: TimeIndex[RunePickup],
+        deaths: TimeIndex[HeroDeath],
+        fights: IntervalIndex[Fight],
         start_minute: int,
         end_minute: int,
         lane_boundaries: Optional[Dict[str, Dict[str, float]]] = None,
@@ -338,9 +328,9 @@ class RotationService:
         Args:
             data: ParsedReplayData from ReplayService
             lane_assignments: Dict mapping hero to (lane, role)
-            rune_pickups: List of rune pickup events
-            deaths: List of hero death events
-            fights: List of fight events
+            rune_pickups: Rune pickup events by game time
+            deaths: Hero death events by game time
+            fights: Fight events by fight window
             start_minute: Start of analysis range
             end_minute: End of analysis range
             lane_boundaries: Optional lane boundaries for version-aware classification
@@ -428,7 +418,7 @@ class RotationService:
 
     def _build_power_rune_events(
         self,
-        rune_pickups: List[RunePickup],
+        rune_pickups: TimeIndex[RunePickup],
         rotations: List[Rotation],
         start_minute: int,
         end_minute: int,
@@ -439,29 +429,28 @@ class RotationService:
         start_time = start_minute * 60.0
         end_time = end_minute * 60.0
 
+        # First rotation correlated with each rune pickup time
+        rotation_by_pickup: Dict[float, Rotation] = {}
+        for rot in rotations:
+            if rot.rune_before:
+                rotation_by_pickup.setdefault(rot.rune_before.pickup_time, rot)
+
         # Generate expected spawn times
         spawn_time = POWER_RUNE_FIRST_SPAWN
         while spawn_time <= end_time:
             if spawn_time >= start_time:
                 # Check for pickups around this spawn
                 for location in ["top", "bot"]:
-                    # Find pickup near this time
-                    pickup = None
-                    for p in rune_pickups:
-                        if abs(p.game_time - spawn_time) <= 30:  # Within 30s of spawn
-                            pickup = p
-                            break
+                    # Find pickup near this time (within 30s of spawn)
+                    nearby = rune_pickups.near(spawn_time, 30)
+                    pickup = nearby[0] if nearby else None
 
                     # Check if led to rotation
                     led_to_rotation = False
                     rotation_id = None
-                    if pickup:
-                        for rot in rotations:
-                            if (rot.rune_before and
-                                    rot.rune_before.pickup_time == pickup.game_time):
-                                led_to_rotation = True
-                                rotation_id = rot.rotation_id
-                                break
+                    if pickup and pickup.game_time in rotation_by_pickup:
+                        led_to_rotation = True
+                        rotation_id = rotation_by_pickup[pickup.game_time].rotation_id
 
                     events.append(PowerRuneEvent(
                         spawn_time=spawn_time,
@@ -479,8 +468,8 @@ class RotationService:
 
     def _build_wisdom_rune_events(
         self,
-        deaths: List[HeroDeath],
-        fights: List[Fight],
+        deaths: TimeIndex[HeroDeath],
+        fights: TimeIndex[Fight],
         start_minute: int,
         end_minute: int,
     ) -> List[WisdomRuneEvent]:
@@ -499,9 +488,7 @@ class RotationService:
                 ]:
                     # Count deaths near this position around spawn time
                     nearby_deaths = []
-                    for death in deaths:
-                        if abs(death.game_time - spawn_time) > 60:
-                            continue
+                    for death in deaths.near(spawn_time, 60):
                         if death.position_x is None or death.position_y is None:
                             continue
                         dist = self._distance(
@@ -512,15 +499,14 @@ class RotationService:
 
                     # Find associated fight
                     fight_id = None
-                    for fight in fights:
-                        if abs(fight.start_time - spawn_time) <= 60:
-                            # Check if any death was near wisdom rune
-                            for d in fight.deaths:
-                                if d in nearby_deaths:
-                                    fight_id = fight.fight_id
-                                    break
-                            if fight_id:
+                    for fight in fights.near(spawn_time, 60):
+                        # Check if any death was near wisdom rune
+                        for d in fight.deaths:
+                            if d in nearby_deaths:
+                                fight_id = fight.fight_id
                                 break
+                        if fight_id:
+                            break
 
                     events.append(WisdomRuneEvent(
                         spawn_time=spawn_time,
@@ -608,6 +594,27 @@ class RotationService:
         Returns:
             RotationAnalysisResponse with all rotation data
         """
+        if self._derived is None:
+            return self._build_rotation_analysis(data, start_minute, end_minute, game_context)
+        params = {
+            "start_minute": start_minute,
+            "end_minute": end_minute,
+            "patch": game_context.patch_version if game_context else None,
+            "fights_version": FIGHT_DETECTION_VERSION,
+        }
+        return self._derived.get_or_compute(
+            data, "rotation_analysis", ROTATION_ANALYSIS_VERSION, params,
+            lambda: self._build_rotation_analysis(data, start_minute, end_minute, game_context),
+        )
+
+    def _build_rotation_analysis(
+        self,
+        data: ParsedReplayData,
+        start_minute: int,
+        end_minute: int,
+        game_context: Optional["GameContext"],
+    ) -> RotationAnalysisResponse:
+        """Compute the rotation analysis (uncached)."""
         lane_boundaries = self._get_lane_boundaries(game_context)
 
         # Get lane assignments from early game
@@ -623,14 +630,20 @@ class RotationService:
             )
 
         # Get supporting data
-        rune_pickups = self._combat.get_rune_pickups(data)
-        deaths = self._combat.get_hero_deaths(data, game_context=game_context)
-        fight_result = self._fight.get_all_fights(data)
-        fights = fight_result.fights
+        events = CombatLogScanner([
+            self._combat.rune_pickup_collector(),
+            self._combat.hero_death_collector(data, game_context=game_context),
+        ]).scan(data.combat_index)
+        # Indexed by time once, for the per-rotation and per-spawn window lookups
+        rune_pickups = TimeIndex(events["rune_pickups"], lambda p: p.game_time)
+        deaths = TimeIndex(events["hero_deaths"], lambda d: d.game_time)
+        fights = self._fight.get_all_fights(data).fights
+        fight_windows = IntervalIndex(fights, lambda f: f.start_time, lambda f: f.end_time)
+        fight_starts = TimeIndex(fights, lambda f: f.start_time)
 
         # Detect rotations
         rotations = self._detect_rotations(
-            data, lane_assignments, rune_pickups, deaths, fights,
+            data, lane_assignments, rune_pickups, deaths, fight_windows,
             start_minute, end_minute, lane_boundaries,
         )
 
@@ -639,7 +652,7 @@ class RotationService:
             rune_pickups, rotations, start_minute, end_minute
         )
         wisdom_runes = self._build_wisdom_rune_events(
-            deaths, fights, start_minute, end_minute
+            deaths, fight_starts, start_minute, end_minute
         )
 
         # Build summary
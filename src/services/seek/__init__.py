@@ -2,6 +2,10 @@
 Dense seek services for high-resolution replay analysis.
 """
 
+from .checkpoint_index import CheckpointIndex
+from .parser_pool import ParserPool, ReplaySession
 from .seek_service import SeekService
+from .snapshot_cache import SnapshotCache
+from .trajectories import HeroTrajectories
 
-__all__ = ["SeekService"]
+__all__ = ["CheckpointIndex", "HeroTrajectories", "ParserPool", "ReplaySession", "SeekService", "SnapshotCache"]
@@ -0,0 +1,59 @@
+"""
+Entity-state checkpoints of one replay, for approximate seeks.
+
+The entity collector of the initial parse captures a snapshot every
+CHECKPOINT_INTERVAL_TICKS; CheckpointIndex orders them by tick (see
+ParsedReplayData.checkpoint_index).
+
+A seek the caller allows to be approximate (a tolerance in ticks) is
+answered from the nearest checkpoint within the tolerance at constant cost,
+whatever the tick. Exact seeks still decode in python-manta from the start
+of the replay: its snapshot() takes only a target tick and cannot resume
+from a checkpoint or keyframe offset.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import logging
+from bisect import bisect_left
+from typing import List, Optional, Sequence
+
+from python_manta import EntitySnapshot
+
+logger = logging.getLogger(__name__)
+
+# Ticks between entity checkpoints (~30 seconds)
+CHECKPOINT_INTERVAL_TICKS = 900
+
+
+class CheckpointIndex:
+    """Entity-state checkpoints of a replay, ordered by tick."""
+
+    def __init__(self, checkpoints: Sequence[EntitySnapshot]):
+        self._snapshots = checkpoints
+        self.checkpoints: List[EntitySnapshot] = sorted(checkpoints, key=lambda s: s.tick)
+        self._checkpoint_ticks = [s.tick for s in self.checkpoints]
+
+    def covers(self, checkpoints: Sequence[EntitySnapshot]) -> bool:
+        """Check if this index was built from exactly these snapshots."""
+        return checkpoints is self._snapshots
+
+    def checkpoint_at(self, tick: int, tolerance_ticks: int = 0) -> Optional[EntitySnapshot]:
+        """
+        Checkpoint nearest a tick.
+
+        Args:
+            tick: Target tick
+            tolerance_ticks: How far before or after the tick the checkpoint may be
+                (default 0: only a checkpoint at the exact tick)
+
+        Returns:
+            The nearest checkpoint (the earlier one on a tie), or None if there is
+            none within tolerance_ticks
+        """
+        position = bisect_left(self._checkpoint_ticks, tick)
+        candidates = self.checkpoints[max(0, position - 1):position + 1]
+        if not candidates:
+            return None
+        checkpoint = min(candidates, key=lambda s: abs(s.tick - tick))
+        return checkpoint if abs(checkpoint.tick - tick) <= tolerance_ticks else None
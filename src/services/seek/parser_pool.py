@@ -0,0 +1,119 @@
+"""
+Pooled python-manta parser sessions for tick-level replay queries.
+
+A python-manta Parser binds one replay file: it loads the native library and,
+for .bz2 replays, decompresses the file once per Parser instance. SeekService
+used to build a fresh Parser for every snapshot, so a sampled fight paid that
+setup plus a seek from the start of the replay once per sample.
+
+ReplaySession keeps one Parser per replay and offers:
+
+- snapshot(tick): a single seek, for point queries
+- snapshots(ticks): a forward-only multi-tick decode. The ticks must be
+  ascending; python-manta's entity collector captures all of them in one
+  sequential pass over the replay instead of one seek per tick.
+
+ParserPool hands out sessions per replay path and keeps the most recently
+used ones open.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Sequence
+
+from python_manta import Parser
+from python_manta.manta_python import EntitySnapshot, EntityStateSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SESSIONS = 4
+
+
+class ReplaySession:
+    """
+    A reusable parser bound to one replay file.
+
+    Calls are serialised per session; sessions for different replays run
+    independently.
+    """
+
+    def __init__(self, replay_path: str, parser_factory: Callable[[str], Parser] = Parser):
+        self.replay_path = replay_path
+        self._parser = parser_factory(replay_path)
+        self._lock = threading.Lock()
+
+    def snapshot(self, tick: int, include_illusions: bool = False) -> EntityStateSnapshot:
+        """Entity state at one tick (a single seek)."""
+        with self._lock:
+            return self._parser.snapshot(tick, include_illusions=include_illusions)
+
+    def snapshots(self, ticks: Sequence[int]) -> List[EntitySnapshot]:
+        """
+        Entity state at several ticks in one forward decode.
+
+        Args:
+            ticks: Strictly ascending ticks to capture
+
+        Returns:
+            Captured snapshots in tick order
+
+        Raises:
+            ValueError: If ticks are not strictly ascending, or decoding fails
+        """
+        ticks = list(ticks)
+        if not ticks:
+            return []
+        if any(later <= earlier for earlier, later in zip(ticks, ticks[1:])):
+            raise ValueError("Multi-tick snapshots are forward-only: ticks must be strictly ascending")
+
+        with self._lock:
+            result = self._parser.parse(entities={"target_ticks": ticks, "max_snapshots": len(ticks)})
+
+        if result.entities is None or not result.entities.success:
+            error = result.entities.error if result.entities else "no entity data"
+            raise ValueError(f"Snapshots at {len(ticks)} ticks failed: {error}")
+        logger.debug(f"Decoded {len(result.entities.snapshots)} snapshots from {self.replay_path} in one pass")
+        return sorted(result.entities.snapshots, key=lambda s: s.tick)
+
+
+class ParserPool:
+    """Replay sessions by path, keeping the most recently used ones open."""
+
+    def __init__(
+        self,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        parser_factory: Callable[[str], Parser] = Parser,
+    ):
+        self.max_sessions = max_sessions
+        self._parser_factory = parser_factory
+        self._sessions: "OrderedDict[str, ReplaySession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def session(self, replay_path: str) -> ReplaySession:
+        """Session for a replay, opened on first use."""
+        replay_path = str(replay_path)
+        with self._lock:
+            session = self._sessions.get(replay_path)
+            if session is not None:
+                self._sessions.move_to_end(replay_path)
+                return session
+
+        session = ReplaySession(replay_path, self._parser_factory)
+        with self._lock:
+            session = self._sessions.setdefault(replay_path, session)
+            self._sessions.move_to_end(replay_path)
+            while len(self._sessions) > self.max_sessions:
+                evicted, _ = self._sessions.popitem(last=False)
+                logger.debug(f"Closed parser session for {evicted}")
+        return session
+
+    def clear(self) -> None:
+        """Drop all sessions."""
+        with self._lock:
+            self._sessions.clear()
@@ -2,13 +2,23 @@
 Dense seek service for high-resolution replay analysis.
 
 Uses python-manta v2's snapshot() and parse_range() for tick-level queries.
+Parsers are pooled per replay (see parser_pool); sampled ranges are decoded
+in one forward pass rather than one seek per sample. Seeks landing on (or
+within the caller's tolerance of) one of the replay's entity checkpoints
+are served without decoding, and sampled ranges covered by dense hero
+trajectories (parse profile "dense") are served from memory.
+Decoded snapshots are kept in an LRU cache keyed by replay and quantised
+tick (see snapshot_cache), shared by point queries, fight replays and
+position timelines. Batches of point queries decode every uncached tick in
+one sorted forward pass and return results in request order.
 NO MCP DEPENDENCIES.
 """
 
 import logging
-from typing import Dict, List, Optional
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from python_manta import Parser, Team
+from python_manta import Team
 from python_manta.manta_python import EntityStateSnapshot
 from python_manta.manta_python import HeroSnapshot as MantaHeroSnapshot
 
@@ -18,6 +28,10 @@ from ..models.seek_data import (
     HeroSnapshot,
     PositionTimeline,
 )
+from .checkpoint_index import CheckpointIndex
+from .parser_pool import ParserPool
+from .snapshot_cache import SnapshotCache
+from .trajectories import HeroTrajectories, TrajectoryFrame
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +49,24 @@ class SeekService:
     - Fight replays with dense sampling
     """
 
+    def __init__(
+        self,
+        parser_pool: Optional[ParserPool] = None,
+        snapshot_cache: Optional[SnapshotCache] = None,
+    ):
+        """
+        Args:
+            parser_pool: Parser sessions for decoding
+            snapshot_cache: Cache of decoded snapshots (default: a SnapshotCache
+                with 5-tick quantisation)
+        """
+        self._pool = parser_pool if parser_pool is not None else ParserPool()
+        self._snapshots = snapshot_cache if snapshot_cache is not None else SnapshotCache()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Snapshot cache statistics (size, hits, misses, hit rate)."""
+        return self._snapshots.get_stats()
+
     def _format_time(self, seconds: float) -> str:
         """Format game time as M:SS."""
         minutes = int(seconds // 60)
@@ -51,11 +83,20 @@ class SeekService:
         """Convert game time (seconds) to approximate tick."""
         return int(game_time * TICKS_PER_SECOND)
 
+    def _sample_ticks(self, start_time: float, end_time: float, interval_seconds: float) -> List[int]:
+        """Ticks from start_time to end_time (inclusive) every interval_seconds."""
+        interval_ticks = max(1, int(interval_seconds * TICKS_PER_SECOND))
+        return list(range(self._time_to_tick(start_time), self._time_to_tick(end_time) + 1, interval_ticks))
+
+    def _team_name(self, team: int) -> str:
+        """Team name for a python-manta team number."""
+        return "radiant" if team == Team.RADIANT.value else "dire"
+
     def _manta_hero_to_snapshot(self, hero: MantaHeroSnapshot) -> HeroSnapshot:
         """Convert python-manta HeroSnapshot to our model."""
         return HeroSnapshot(
             hero=self._clean_hero_name(hero.hero_name),
-            team="radiant" if hero.team == Team.RADIANT.value else "dire",
+            team=self._team_name(hero.team),
             player_id=hero.player_id,
             x=hero.x,
             y=hero.y,
@@ -71,6 +112,8 @@ class SeekService:
         self,
         replay_path: str,
         tick: int,
+        checkpoints: Optional[CheckpointIndex] = None,
+        tolerance_ticks: int = 0,
     ) -> Optional[GameSnapshot]:
         """
         Get game state at a specific tick.
@@ -78,20 +121,170 @@ class SeekService:
         Args:
             replay_path: Path to the .dem replay file
             tick: Target tick number
+            checkpoints: Checkpoint index of the replay (ParsedReplayData.checkpoint_index)
+            tolerance_ticks: Accept the nearest checkpoint up to this many ticks before
+                or after the target (default 0: only a checkpoint at the exact tick)
 
         Returns:
             GameSnapshot with hero positions and states, or None on error
         """
-        parser = Parser(replay_path)
-        result: EntityStateSnapshot = parser.snapshot(tick, include_illusions=False)
+        tick = self._snapshots.quantise(tick)
+        cached = self._snapshots.get(replay_path, tick)
+        if cached is not None:
+            return cached
+
+        if checkpoints is not None:
+            # Not cached: an inexact checkpoint only answers callers that accept the tolerance
+            checkpoint = checkpoints.checkpoint_at(tick, tolerance_ticks)
+            if checkpoint is not None:
+                return self._to_game_snapshot(checkpoint.tick, checkpoint.game_time, checkpoint.heroes)
+
+        result: EntityStateSnapshot = self._pool.session(replay_path).snapshot(tick, include_illusions=False)
 
         if not result.success:
             logger.warning(f"Snapshot at tick {tick} failed: {result.error}")
             return None
 
+        snapshot = self._to_game_snapshot(result.tick, result.game_time, result.heroes)
+        self._snapshots.set(replay_path, tick, snapshot)
+        return snapshot
+
+    def get_snapshots_at_ticks(
+        self,
+        replay_path: str,
+        ticks: Sequence[int],
+        trajectories: Optional[HeroTrajectories] = None,
+    ) -> List[GameSnapshot]:
+        """
+        Get game state at several ticks in one forward pass over the replay.
+
+        Ticks already in the snapshot cache are not decoded again.
+
+        Args:
+            replay_path: Path to the .dem replay file
+            ticks: Target tick numbers (any order; duplicates are decoded once)
+            trajectories: Dense hero trajectories of the replay (ParsedReplayData.trajectories);
+                used instead of decoding when they cover the ticks
+
+        Returns:
+            GameSnapshots in tick order
+        """
+        ticks = sorted(set(ticks))
+        if self._covered(trajectories, ticks):
+            return [self._frame_to_game_snapshot(trajectories.frame(tick)) for tick in ticks]
+
+        found: Dict[int, Optional[GameSnapshot]] = {}
+        missing: List[int] = []
+        for tick in ticks:
+            found[tick] = self._snapshots.get(replay_path, tick)
+            if found[tick] is None:
+                missing.append(tick)
+
+        if missing:
+            found.update(self._assign_snapshots(replay_path, missing, self._decode_ticks(replay_path, missing)))
+
+        snapshots = {s.tick: s for s in found.values() if s is not None}
+        return [snapshots[tick] for tick in sorted(snapshots)]
+
+    def _decode_ticks(self, replay_path: str, ticks: List[int]) -> List[GameSnapshot]:
+        """Decode ascending ticks in one forward pass with the pooled session."""
+        return [
+            self._to_game_snapshot(s.tick, s.game_time, s.heroes)
+            for s in self._pool.session(replay_path).snapshots(ticks)
+        ]
+
+    def _assign_snapshots(
+        self, replay_path: str, ticks: List[int], snapshots: List[GameSnapshot]
+    ) -> Dict[int, Optional[GameSnapshot]]:
+        """Match decoded snapshots to the ascending ticks they were decoded for, caching each."""
+        assigned: Dict[int, Optional[GameSnapshot]] = {}
+        # The collector captures each target at the first tick at or after it
+        snapshot_ticks = [s.tick for s in snapshots]
+        for tick in ticks:
+            position = bisect_left(snapshot_ticks, tick)
+            assigned[tick] = snapshots[position] if position < len(snapshots) else None
+            if assigned[tick] is not None:
+                self._snapshots.set(replay_path, tick, assigned[tick])
+        return assigned
+
+    def get_snapshots_batch(
+        self,
+        replay_path: str,
+        ticks: Sequence[int],
+        checkpoints: Optional[CheckpointIndex] = None,
+        tolerance_ticks: int = 0,
+    ) -> List[Optional[GameSnapshot]]:
+        """
+        Get game state at many ticks, decoding all uncached ticks in one forward pass.
+
+        Ticks are quantised like get_snapshot_at_tick. Ticks already cached, or
+        with a checkpoint within tolerance_ticks, are answered from memory; the
+        rest are sorted, deduplicated and decoded in a single pass with the
+        pooled session, then mapped back to the request.
+
+        Args:
+            replay_path: Path to the .dem replay file
+            ticks: Target tick numbers, in any order and possibly repeated
+            checkpoints: Checkpoint index of the replay (ParsedReplayData.checkpoint_index)
+            tolerance_ticks: Accept the nearest checkpoint up to this many ticks before
+                or after a target (default 0: only a checkpoint at the exact tick)
+
+        Returns:
+            One GameSnapshot per requested tick, in request order; None where the
+            replay ends before the tick
+        """
+        requested = [self._snapshots.quantise(tick) for tick in ticks]
+        found: Dict[int, Optional[GameSnapshot]] = {}
+        pending: List[int] = []
+        for tick in sorted(set(requested)):
+            found[tick] = self._snapshots.get(replay_path, tick)
+            if found[tick] is not None:
+                continue
+            checkpoint = checkpoints.checkpoint_at(tick, tolerance_ticks) if checkpoints is not None else None
+            if checkpoint is not None:
+                found[tick] = self._to_game_snapshot(checkpoint.tick, checkpoint.game_time, checkpoint.heroes)
+            else:
+                pending.append(tick)
+
+        if pending:
+            logger.debug(f"Decoding {len(pending)} of {len(requested)} batch ticks of {replay_path} in one pass")
+            found.update(self._assign_snapshots(replay_path, pending, self._decode_ticks(replay_path, pending)))
+
+        return [found[tick] for tick in requested]
+
+    def _covered(self, trajectories: Optional[HeroTrajectories], ticks: Sequence[int]) -> bool:
+        """Check if trajectories exist and span ascending ticks."""
+        return trajectories is not None and bool(ticks) and trajectories.covers(ticks[0], ticks[-1])
+
+    def _frame_to_game_snapshot(self, frame: TrajectoryFrame) -> GameSnapshot:
+        """Build a GameSnapshot from a trajectory frame."""
+        return GameSnapshot(
+            tick=frame.tick,
+            game_time=frame.game_time,
+            game_time_str=self._format_time(frame.game_time),
+            heroes=[
+                HeroSnapshot(
+                    hero=p.hero,
+                    team=p.team,
+                    player_id=p.player_id,
+                    x=p.x,
+                    y=p.y,
+                    health=p.health,
+                    max_health=p.max_health,
+                    mana=int(p.mana),
+                    max_mana=int(p.max_mana),
+                    level=p.level,
+                    alive=p.alive,
+                )
+                for p in frame.heroes
+            ],
+        )
+
+    def _to_game_snapshot(self, tick: int, game_time: float, manta_heroes: List[MantaHeroSnapshot]) -> GameSnapshot:
+        """Build a GameSnapshot from python-manta hero states, skipping illusions and clones."""
         heroes = [
             self._manta_hero_to_snapshot(h)
-            for h in result.heroes
+            for h in manta_heroes
             if not h.is_illusion and not h.is_clone
         ]
 
@@ -100,9 +293,9 @@ class SeekService:
         dire_heroes = [h for h in heroes if h.team == "dire"]
 
         return GameSnapshot(
-            tick=result.tick,
-            game_time=result.game_time,
-            game_time_str=self._format_time(result.game_time),
+            tick=tick,
+            game_time=game_time,
+            game_time_str=self._format_time(game_time),
             heroes=heroes,
             radiant_gold=sum(h.gold for h in radiant_heroes),
             dire_gold=sum(h.gold for h in dire_heroes),
@@ -112,6 +305,8 @@ class SeekService:
         self,
         replay_path: str,
         game_time: float,
+        checkpoints: Optional[CheckpointIndex] = None,
+        tolerance_seconds: float = 0.0,
     ) -> Optional[GameSnapshot]:
         """
         Get game state at a specific game time.
@@ -119,12 +314,45 @@ class SeekService:
         Args:
             replay_path: Path to the .dem replay file
             game_time: Target game time in seconds
+            checkpoints: Checkpoint index of the replay (ParsedReplayData.checkpoint_index)
+            tolerance_seconds: Accept the nearest checkpoint up to this many seconds before
+                or after the target
 
         Returns:
             GameSnapshot with hero positions and states, or None on error
         """
         tick = self._time_to_tick(game_time)
-        return self.get_snapshot_at_tick(replay_path, tick)
+        return self.get_snapshot_at_tick(
+            replay_path, tick, checkpoints=checkpoints, tolerance_ticks=self._time_to_tick(tolerance_seconds)
+        )
+
+    def get_snapshots_at_times(
+        self,
+        replay_path: str,
+        game_times: Sequence[float],
+        checkpoints: Optional[CheckpointIndex] = None,
+        tolerance_seconds: float = 0.0,
+    ) -> List[Optional[GameSnapshot]]:
+        """
+        Get game state at many game times (see get_snapshots_batch).
+
+        Args:
+            replay_path: Path to the .dem replay file
+            game_times: Target game times in seconds, in any order and possibly repeated
+            checkpoints: Checkpoint index of the replay (ParsedReplayData.checkpoint_index)
+            tolerance_seconds: Accept the nearest checkpoint up to this many seconds before
+                or after a target
+
+        Returns:
+            One GameSnapshot per requested time, in request order; None past the end
+            of the replay
+        """
+        return self.get_snapshots_batch(
+            replay_path,
+            [self._time_to_tick(t) for t in game_times],
+            checkpoints=checkpoints,
+            tolerance_ticks=self._time_to_tick(tolerance_seconds),
+        )
 
     def get_position_timeline(
         self,
@@ -133,6 +361,7 @@ class SeekService:
         end_time: float,
         hero_filter: Optional[str] = None,
         interval_seconds: float = 1.0,
+        trajectories: Optional[HeroTrajectories] = None,
     ) -> List[PositionTimeline]:
         """
         Get hero positions over a time range at regular intervals.
@@ -143,63 +372,54 @@ class SeekService:
             end_time: End time in seconds
             hero_filter: Only include this hero (optional)
             interval_seconds: Sampling interval in seconds (default 1.0)
+            trajectories: Dense hero trajectories of the replay (ParsedReplayData.trajectories);
+                used instead of decoding when they cover the range
 
         Returns:
             List of PositionTimeline, one per hero
         """
-        parser = Parser(replay_path)
-        interval_ticks = int(interval_seconds * TICKS_PER_SECOND)
-
-        start_tick = self._time_to_tick(start_time)
-        end_tick = self._time_to_tick(end_time)
-
-        # Collect positions at each sample point
+        # Collect positions at each sample point: from memory, or in one forward pass
         hero_positions: Dict[str, List[tuple]] = {}
+        hero_teams: Dict[str, str] = {}
 
-        current_tick = start_tick
-        while current_tick <= end_tick:
-            result = parser.snapshot(current_tick, include_illusions=False)
-
-            if result.success:
-                for h in result.heroes:
-                    if h.is_illusion or h.is_clone:
-                        continue
+        ticks = self._sample_ticks(start_time, end_time, interval_seconds)
+        if self._covered(trajectories, ticks):
+            samples = self._trajectory_positions(trajectories, ticks, hero_filter)
+        else:
+            samples = self._decoded_positions(replay_path, ticks)
 
-                    hero_name = self._clean_hero_name(h.hero_name)
-                    if hero_filter and hero_filter.lower() not in hero_name.lower():
-                        continue
+        for tick, game_time, heroes in samples:
+            for hero_name, team, x, y in heroes:
+                if hero_filter and hero_filter.lower() not in hero_name.lower():
+                    continue
 
-                    if hero_name not in hero_positions:
-                        hero_positions[hero_name] = []
+                if hero_name not in hero_positions:
+                    hero_positions[hero_name] = []
+                    # Team from the first sample the hero appears in
+                    hero_teams[hero_name] = team
 
-                    hero_positions[hero_name].append((
-                        result.tick,
-                        result.game_time,
-                        h.x,
-                        h.y,
-                    ))
-
-            current_tick += interval_ticks
+                hero_positions[hero_name].append((tick, game_time, x, y))
 
         # Build timeline objects
-        timelines = []
-        for hero_name, positions in hero_positions.items():
-            # Determine team from first snapshot
-            team = "unknown"
-            result = parser.snapshot(start_tick, include_illusions=False)
-            if result.success:
-                for h in result.heroes:
-                    if self._clean_hero_name(h.hero_name) == hero_name:
-                        team = "radiant" if h.team == Team.RADIANT.value else "dire"
-                        break
-
-            timelines.append(PositionTimeline(
-                hero=hero_name,
-                team=team,
-                positions=positions,
-            ))
-
-        return timelines
+        return [
+            PositionTimeline(hero=hero_name, team=hero_teams[hero_name], positions=positions)
+            for hero_name, positions in hero_positions.items()
+        ]
+
+    def _decoded_positions(
+        self, replay_path: str, ticks: List[int]
+    ) -> Iterable[Tuple[int, float, List[Tuple[str, str, float, float]]]]:
+        """(tick, game_time, [(hero, team, x, y)]) per sample, decoded from the replay or the snapshot cache."""
+        for snapshot in self.get_snapshots_at_ticks(replay_path, ticks):
+            yield snapshot.tick, snapshot.game_time, [(h.hero, h.team, h.x, h.y) for h in snapshot.heroes]
+
+    def _trajectory_positions(
+        self, trajectories: HeroTrajectories, ticks: List[int], hero_filter: Optional[str]
+    ) -> Iterable[Tuple[int, float, List[Tuple[str, str, float, float]]]]:
+        """(tick, game_time, [(hero, team, x, y)]) per sample, from dense trajectories."""
+        for tick in ticks:
+            frame = trajectories.frame(tick, hero_filter)
+            yield frame.tick, frame.game_time, [(p.hero, p.team, p.x, p.y) for p in frame.heroes]
 
     def get_fight_replay(
         self,
@@ -207,6 +427,7 @@ class SeekService:
         start_time: float,
         end_time: float,
         interval_seconds: float = 0.5,
+        trajectories: Optional[HeroTrajectories] = None,
     ) -> FightReplay:
         """
         Get high-resolution data for a fight.
@@ -218,27 +439,23 @@ class SeekService:
             start_time: Fight start time in seconds
             end_time: Fight end time in seconds
             interval_seconds: Sampling interval (default 0.5s for 2 samples/second)
+            trajectories: Dense hero trajectories of the replay (ParsedReplayData.trajectories);
+                used instead of decoding when they cover the fight
 
         Returns:
             FightReplay with snapshots during the fight
         """
-        interval_ticks = int(interval_seconds * TICKS_PER_SECOND)
-
-        start_tick = self._time_to_tick(start_time)
-        end_tick = self._time_to_tick(end_time)
-
-        snapshots = []
-        current_tick = start_tick
-
-        while current_tick <= end_tick:
-            snapshot = self.get_snapshot_at_tick(replay_path, current_tick)
-            if snapshot:
-                snapshots.append(snapshot)
-            current_tick += interval_ticks
+        # From memory, or one forward decode for every sample of the fight
+        snapshots = self.get_snapshots_at_ticks(
+            replay_path, self._sample_ticks(start_time, end_time, interval_seconds), trajectories=trajectories
+        )
+        return self._fight_replay(start_time, end_time, snapshots)
 
+    def _fight_replay(self, start_time: float, end_time: float, snapshots: List[GameSnapshot]) -> FightReplay:
+        """Build a FightReplay from the snapshots sampled during it."""
         return FightReplay(
-            start_tick=start_tick,
-            end_tick=end_tick,
+            start_tick=self._time_to_tick(start_time),
+            end_tick=self._time_to_tick(end_time),
             start_time=start_time,
             end_time=end_time,
             start_time_str=self._format_time(start_time),
@@ -253,6 +470,7 @@ class SeekService:
         end_time: float,
         hero: str,
         interval_seconds: float = 0.2,
+        trajectories: Optional[HeroTrajectories] = None,
     ) -> Optional[PositionTimeline]:
         """
         Get detailed movement data for a hero during a fight.
@@ -265,6 +483,7 @@ class SeekService:
             end_time: Fight end time in seconds
             hero: Hero name to track
             interval_seconds: Sampling interval (default 0.2s for 5 samples/second)
+            trajectories: Dense hero trajectories of the replay (ParsedReplayData.trajectories)
 
         Returns:
             PositionTimeline for the hero, or None if hero not found
@@ -275,6 +494,7 @@ class SeekService:
             end_time=end_time,
             hero_filter=hero,
             interval_seconds=interval_seconds,
+            trajectories=trajectories,
         )
 
         if not timelines:
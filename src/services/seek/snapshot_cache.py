@@ -0,0 +1,124 @@
+"""
+In-process LRU cache of decoded game snapshots.
+
+Clients keep asking for the same instants of a match: fight starts, first
+blood, Roshan kills. Each such request decoded the replay again. Snapshots
+are kept here keyed by (replay path, requested tick).
+
+Point queries are quantised first: SeekService rounds their tick to the
+nearest `tick_quantum` ticks (5 ticks, ~0.17s, by default) before looking
+up or decoding, so requests a few ticks apart share one entry. Sampled
+ranges (fight replays, position timelines) keep their exact sample ticks;
+ranges starting on whole seconds land on the same grid as point queries.
+
+Cached snapshots are shared between callers and must be treated as
+read-only.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.seek_data import GameSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_CACHE_ENTRIES = 4096  # A few KB per snapshot of 10 heroes
+DEFAULT_TICK_QUANTUM = 5
+
+
+class SnapshotCache:
+    """
+    Bounded LRU cache of GameSnapshots keyed by (replay path, tick).
+
+    Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_SNAPSHOT_CACHE_ENTRIES, tick_quantum: int = DEFAULT_TICK_QUANTUM):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum snapshots kept. 0 disables the cache.
+            tick_quantum: Point queries are rounded to the nearest multiple of this
+                (1 for exact ticks)
+        """
+        self._max_entries = max_entries
+        self._tick_quantum = max(1, tick_quantum)
+        self._entries: "OrderedDict[Tuple[str, int], GameSnapshot]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def quantise(self, tick: int) -> int:
+        """Nearest multiple of the tick quantum."""
+        quantum = self._tick_quantum
+        return (tick + quantum // 2) // quantum * quantum
+
+    def get(self, replay_path: str, tick: int) -> Optional[GameSnapshot]:
+        """Get the snapshot decoded for a tick, marking it most recently used.
+
+        Args:
+            replay_path: Path to the .dem replay file
+            tick: Requested tick
+
+        Returns:
+            GameSnapshot if present, None otherwise
+        """
+        key = (str(replay_path), tick)
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return snapshot
+
+    def set(self, replay_path: str, tick: int, snapshot: GameSnapshot) -> None:
+        """Store the snapshot decoded for a tick, evicting the oldest if full.
+
+        Args:
+            replay_path: Path to the .dem replay file
+            tick: Requested tick
+            snapshot: Decoded snapshot
+        """
+        if self._max_entries <= 0:
+            return
+        key = (str(replay_path), tick)
+        with self._lock:
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._evictions += 1
+                logger.debug(f"Evicted snapshot {evicted} from snapshot cache")
+
+    def clear(self) -> None:
+        """Remove all snapshots."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get snapshot cache statistics.
+
+        Returns:
+            Dictionary with size, quantum and hit/miss counters
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "count": len(self._entries),
+                "max_entries": self._max_entries,
+                "tick_quantum": self._tick_quantum,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
@@ -0,0 +1,254 @@
+"""
+Dense per-hero trajectories captured during the main parse.
+
+The main parse keeps entity snapshots every ~30 seconds, so movement and
+fight-replay requests decoded the replay again at 1s or 0.2s resolution.
+With the optional "trajectories" collector (parse profile "dense"), the
+entity collector of the same single pass samples every
+TRAJECTORY_INTERVAL_TICKS instead and the hero states are kept here as
+compact typed arrays: float32 positions and mana, uint16 health, uint8
+level and alive flag. That is ~26 bytes per hero-second, a few hundred KB
+per match, pickled into the replay cache as is.
+
+Frames at arbitrary ticks come from the latest sample at or before the
+tick; positions are interpolated linearly towards the next sample.
+
+NO MCP DEPENDENCIES - can be used from any interface.
+"""
+
+import logging
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from python_manta import EntitySnapshot, Team
+
+from ..combat.combat_log_symbols import clean_name
+
+logger = logging.getLogger(__name__)
+
+# Ticks between trajectory samples (~1 second)
+TRAJECTORY_INTERVAL_TICKS = 30
+
+# Columns kept per hero: (field, array typecode)
+TRAJECTORY_COLUMNS = (
+    ("x", "f"),
+    ("y", "f"),
+    ("health", "H"),
+    ("max_health", "H"),
+    ("mana", "f"),
+    ("max_mana", "f"),
+    ("level", "B"),
+    ("alive", "B"),
+)
+_UINT16_MAX = 0xFFFF
+
+
+@dataclass
+class TrajectoryPoint:
+    """A hero's state in a trajectory frame."""
+
+    hero: str
+    team: str
+    player_id: int
+    x: float
+    y: float
+    health: int
+    max_health: int
+    mana: float
+    max_mana: float
+    level: int
+    alive: bool
+
+
+@dataclass
+class TrajectoryFrame:
+    """Hero states at one tick."""
+
+    tick: int
+    game_time: float
+    heroes: List[TrajectoryPoint]
+
+
+class HeroTrack:
+    """One hero's state columns, one row per sample the hero appears in."""
+
+    def __init__(self, hero: str, team: str, player_id: int):
+        self.hero = hero
+        self.team = team
+        self.player_id = player_id
+        self.slots = array("i")  # Sample position of each row
+        self.columns: Dict[str, array] = {name: array(code) for name, code in TRAJECTORY_COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def append(self, slot: int, hero_snap) -> None:
+        self.slots.append(slot)
+        columns = self.columns
+        columns["x"].append(hero_snap.x)
+        columns["y"].append(hero_snap.y)
+        columns["health"].append(min(max(hero_snap.health, 0), _UINT16_MAX))
+        columns["max_health"].append(min(max(hero_snap.max_health, 0), _UINT16_MAX))
+        columns["mana"].append(hero_snap.mana)
+        columns["max_mana"].append(hero_snap.max_mana)
+        columns["level"].append(hero_snap.level)
+        columns["alive"].append(1 if hero_snap.is_alive else 0)
+
+    def row_of(self, slot: int) -> Optional[int]:
+        """Row of this hero at a sample, None if the hero was not in it."""
+        row = bisect_right(self.slots, slot) - 1
+        if row >= 0 and self.slots[row] == slot:
+            return row
+        return None
+
+    @property
+    def nbytes(self) -> int:
+        return self.slots.itemsize * len(self.slots) + sum(c.itemsize * len(c) for c in self.columns.values())
+
+
+class HeroTrajectories:
+    """Per-hero state samples of a match, ordered by tick."""
+
+    def __init__(self, ticks: array, game_times: array, tracks: Dict[str, HeroTrack]):
+        self.ticks = ticks
+        self.game_times = game_times
+        self.tracks = tracks
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Sequence[EntitySnapshot]) -> "HeroTrajectories":
+        """Build trajectories from dense entity snapshots, skipping illusions and clones."""
+        ticks, game_times = array("i"), array("d")
+        tracks: Dict[str, HeroTrack] = {}
+        for snapshot in sorted(snapshots, key=lambda s: s.tick):
+            if ticks and snapshot.tick == ticks[-1]:
+                continue
+            slot = len(ticks)
+            ticks.append(snapshot.tick)
+            game_times.append(snapshot.game_time)
+            for hero_snap in snapshot.heroes:
+                if hero_snap.is_illusion or hero_snap.is_clone:
+                    continue
+                hero = clean_name(hero_snap.hero_name)
+                if not hero:
+                    continue
+                track = tracks.get(hero)
+                if track is None:
+                    team = "radiant" if hero_snap.team == Team.RADIANT.value else "dire"
+                    track = tracks[hero] = HeroTrack(hero, team, hero_snap.player_id)
+                if track.slots and track.slots[-1] == slot:
+                    continue  # Duplicate hero entry in one snapshot: keep the first
+                track.append(slot, hero_snap)
+        return cls(ticks, game_times, tracks)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the sample arrays in bytes."""
+        return (
+            self.ticks.itemsize * len(self.ticks)
+            + self.game_times.itemsize * len(self.game_times)
+            + sum(track.nbytes for track in self.tracks.values())
+        )
+
+    def covers(self, start_tick: int, end_tick: int) -> bool:
+        """Check if samples span [start_tick, end_tick]."""
+        return bool(self.ticks) and self.ticks[0] <= start_tick and end_tick <= self.ticks[-1]
+
+    def frame(self, tick: int, hero_filter: Optional[str] = None) -> Optional[TrajectoryFrame]:
+        """
+        Hero states at a tick.
+
+        Args:
+            tick: Target tick
+            hero_filter: Only heroes whose name contains this (case-insensitive)
+
+        Returns:
+            TrajectoryFrame, or None if the tick is outside the samples
+        """
+        ticks = self.ticks
+        slot = bisect_right(ticks, tick) - 1
+        if slot < 0 or tick > ticks[-1]:
+            return None
+        fraction = 0.0
+        if tick != ticks[slot]:
+            fraction = (tick - ticks[slot]) / (ticks[slot + 1] - ticks[slot])
+        game_time = self.game_times[slot]
+        if fraction:
+            game_time += (self.game_times[slot + 1] - game_time) * fraction
+
+        needle = hero_filter.lower() if hero_filter else None
+        heroes = []
+        for track in self.tracks.values():
+            if needle and needle not in track.hero.lower():
+                continue
+            row = track.row_of(slot)
+            if row is None:
+                continue
+            columns = track.columns
+            x, y = columns["x"][row], columns["y"][row]
+            if fraction and row + 1 < len(track) and track.slots[row + 1] == slot + 1:
+                x += (columns["x"][row + 1] - x) * fraction
+                y += (columns["y"][row + 1] - y) * fraction
+            heroes.append(TrajectoryPoint(
+                hero=track.hero,
+                team=track.team,
+                player_id=track.player_id,
+                x=x,
+                y=y,
+                health=columns["health"][row],
+                max_health=columns["max_health"][row],
+                mana=columns["mana"][row],
+                max_mana=columns["max_mana"][row],
+                level=columns["level"][row],
+                alive=bool(columns["alive"][row]),
+            ))
+        return TrajectoryFrame(tick=tick, game_time=game_time, heroes=heroes)
+
+    def to_cache_dict(self) -> Dict[str, Any]:
+        """Serialize for cache storage (arrays pickle as raw bytes)."""
+        return {
+            "ticks": self.ticks,
+            "game_times": self.game_times,
+            "tracks": [
+                {
+                    "hero": t.hero,
+                    "team": t.team,
+                    "player_id": t.player_id,
+                    "slots": t.slots,
+                    "columns": t.columns,
+                }
+                for t in self.tracks.values()
+            ],
+        }
+
+    @classmethod
+    def from_cache_dict(cls, data: Dict[str, Any]) -> "HeroTrajectories":
+        """Deserialize from cache storage."""
+        tracks: Dict[str, HeroTrack] = {}
+        for item in data["tracks"]:
+            track = tracks[item["hero"]] = HeroTrack(item["hero"], item["team"], item["player_id"])
+            track.slots = item["slots"]
+            track.columns = item["columns"]
+        return cls(data["ticks"], data["game_times"], tracks)
+
+
+def thin_snapshots(snapshots: Sequence[EntitySnapshot], interval_ticks: int, limit: int) -> List[EntitySnapshot]:
+    """
+    Every interval_ticks-th snapshot of a dense series, as a sparser collector run would keep.
+
+    Args:
+        snapshots: Snapshots in tick order
+        interval_ticks: Minimum ticks between kept snapshots
+        limit: Maximum snapshots kept (0 for no limit)
+    """
+    kept: List[EntitySnapshot] = []
+    for snapshot in snapshots:
+        if limit and len(kept) >= limit:
+            break
+        if not kept or snapshot.tick - kept[-1].tick >= interval_ticks:
+            kept.append(snapshot)
+    return kept
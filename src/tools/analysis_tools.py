@@ -1,5 +1,6 @@
 """Analysis MCP tools: jungle, lane, farming patterns, rotations, positions."""
 
+import asyncio
 from typing import List, Optional
 
 from fastmcp import Context
@@ -249,12 +250,14 @@ def register_analysis_tools(mcp, services):
 
         try:
             data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
-            timelines = seek_service.get_position_timeline(
+            timelines = await asyncio.to_thread(
+                seek_service.get_position_timeline,
                 replay_path=data.replay_path,
                 start_time=start_time,
                 end_time=end_time,
                 hero_filter=hero_filter,
                 interval_seconds=interval_seconds,
+                trajectories=data.trajectories,
             )
             hero_timelines = [
                 HeroPositionTimeline(
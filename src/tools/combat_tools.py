@@ -110,6 +110,7 @@ def register_combat_tools(mcp, services):
         ability_filter: Optional[str] = None,
         detail_level: Literal["narrative", "tactical", "full"] = "narrative",
         max_events: int = 200,
+        cursor: Optional[str] = None,
         ctx: Optional[Context] = None,
     ) -> CombatLogResponse:
         """
@@ -117,6 +118,8 @@ def register_combat_tools(mcp, services):
 
         Use for analyzing non-fight moments (e.g., Roshan attempts, specific plays).
         detail_level: "narrative" (deaths/abilities), "tactical" (+damage), "full" (all).
+        Results are paged: if next_cursor is set, call again with the same filters and
+        cursor=next_cursor to get the following events.
 
         Args:
             match_id: The Dota 2 match ID
@@ -125,7 +128,8 @@ def register_combat_tools(mcp, services):
             hero_filter: Filter to specific hero
             ability_filter: Filter to specific ability
             detail_level: "narrative", "tactical", or "full"
-            max_events: Maximum events to return
+            max_events: Maximum events to return per page
+            cursor: next_cursor from a previous call, to continue where it stopped
         """
         async def progress_callback(current: int, total: int, message: str) -> None:
             if ctx:
@@ -133,12 +137,13 @@ def register_combat_tools(mcp, services):
 
         try:
             level = DetailLevel(detail_level)
-            data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
+            data = await replay_service.get_parsed_data(match_id, progress=progress_callback, profile="combat")
             return combat_service.get_combat_log_response(
                 data, match_id, start_time, end_time, hero_filter,
                 ability_filter=ability_filter,
                 detail_level=level,
                 max_events=max_events,
+                cursor=cursor,
             )
         except ValueError as e:
             return CombatLogResponse(success=False, match_id=match_id, error=str(e))
@@ -175,7 +180,7 @@ def register_combat_tools(mcp, services):
                 await ctx.report_progress(current, total)
 
         try:
-            data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
+            data = await replay_service.get_parsed_data(match_id, progress=progress_callback, profile="combat")
             return combat_service.get_item_purchases_response(data, match_id, hero_filter)
         except ValueError as e:
             return ItemPurchasesResponse(success=False, match_id=match_id, error=str(e))
@@ -206,7 +211,7 @@ def register_combat_tools(mcp, services):
                 await ctx.report_progress(current, total)
 
         try:
-            data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
+            data = await replay_service.get_parsed_data(match_id, progress=progress_callback, profile="combat")
             game_context = GameContext.from_parsed_data(data)
             return combat_service.get_courier_kills_response(
                 data, match_id, game_context=game_context
@@ -245,7 +250,7 @@ def register_combat_tools(mcp, services):
                 await ctx.report_progress(current, total)
 
         try:
-            data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
+            data = await replay_service.get_parsed_data(match_id, progress=progress_callback, profile="combat")
             return combat_service.get_objective_kills_response(data, match_id)
         except ValueError as e:
             return ObjectiveKillsResponse(success=False, match_id=match_id, error=str(e))
@@ -280,7 +285,7 @@ def register_combat_tools(mcp, services):
                 await ctx.report_progress(current, total)
 
         try:
-            data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
+            data = await replay_service.get_parsed_data(match_id, progress=progress_callback, profile="combat")
             return combat_service.get_rune_pickups_response(data, match_id)
         except ValueError as e:
             return RunePickupsResponse(success=False, match_id=match_id, error=str(e))
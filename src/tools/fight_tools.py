@@ -1,5 +1,6 @@
 """Fight-related MCP tools: fight detection, teamfights, fight replay."""
 
+import asyncio
 from typing import Literal, Optional
 
 from fastmcp import Context
@@ -433,11 +434,13 @@ def register_fight_tools(mcp, services):
         try:
             data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
 
-            fight_replay = seek_service.get_fight_replay(
+            fight_replay = await asyncio.to_thread(
+                seek_service.get_fight_replay,
                 replay_path=data.replay_path,
                 start_time=start_time,
                 end_time=end_time,
                 interval_seconds=interval_seconds,
+                trajectories=data.trajectories,
             )
 
             snapshots = [
@@ -1,6 +1,7 @@
 """Match-related MCP tools: match info, timeline, stats, draft, players."""
 
-from typing import Dict, Literal, Optional
+import asyncio
+from typing import Dict, List, Literal, Optional
 
 from fastmcp import Context
 
@@ -19,9 +20,12 @@ from ..models.tool_responses import (
     PlayerStatsAtMinute,
     PlayerTimeline,
     SnapshotAtTimeResponse,
+    SnapshotsAtTimesResponse,
     StatsAtMinuteResponse,
     TeamGraphs,
+    TimedSnapshot,
 )
+from ..services.models.seek_data import GameSnapshot
 
 
 def register_match_tools(mcp, services):
@@ -216,7 +220,7 @@ def register_match_tools(mcp, services):
                 await ctx.report_progress(current, total)
 
         try:
-            data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
+            data = await replay_service.get_parsed_data(match_id, progress=progress_callback, profile="draft")
         except ValueError as e:
             return MatchDraftResponse(success=False, match_id=match_id, error=str(e))
 
@@ -262,7 +266,7 @@ def register_match_tools(mcp, services):
                 await ctx.report_progress(current, total)
 
         try:
-            data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
+            data = await replay_service.get_parsed_data(match_id, progress=progress_callback, profile="combat")
         except ValueError as e:
             return MatchInfoResponse(success=False, match_id=match_id, error=str(e))
 
@@ -488,40 +492,48 @@ def register_match_tools(mcp, services):
                 error=f"Failed to get hero positions at minute {minute}: {e}",
             )
 
+    def _snapshot_heroes(snapshot: GameSnapshot) -> List[HeroSnapshot]:
+        return [
+            HeroSnapshot(
+                hero=h.hero,
+                team=h.team,
+                player_id=h.player_id,
+                x=round(h.x, 1),
+                y=round(h.y, 1),
+                health=h.health,
+                max_health=h.max_health,
+                mana=h.mana,
+                max_mana=h.max_mana,
+                level=h.level,
+                alive=h.alive,
+            )
+            for h in snapshot.heroes
+        ]
+
     @mcp.tool
     async def get_snapshot_at_time(
-        match_id: int, game_time: float, ctx: Optional[Context] = None
+        match_id: int,
+        game_time: float,
+        tolerance_seconds: float = 0.0,
+        ctx: Optional[Context] = None,
     ) -> SnapshotAtTimeResponse:
-        """Get game state snapshot at a specific game time."""
+        """Get game state snapshot at a specific game time (within tolerance_seconds of it, if set)."""
         async def progress_callback(current: int, total: int, message: str) -> None:
             if ctx:
                 await ctx.report_progress(current, total)
 
         try:
             data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
-            snapshot = seek_service.get_snapshot_at_time(data.replay_path, game_time)
+            snapshot = await asyncio.to_thread(
+                seek_service.get_snapshot_at_time,
+                data.replay_path, game_time, checkpoints=data.checkpoint_index, tolerance_seconds=tolerance_seconds
+            )
             if not snapshot:
                 return SnapshotAtTimeResponse(
                     success=False,
                     match_id=match_id,
                     error=f"Could not get snapshot at time {game_time}",
                 )
-            heroes = [
-                HeroSnapshot(
-                    hero=h.hero,
-                    team=h.team,
-                    player_id=h.player_id,
-                    x=round(h.x, 1),
-                    y=round(h.y, 1),
-                    health=h.health,
-                    max_health=h.max_health,
-                    mana=h.mana,
-                    max_mana=h.max_mana,
-                    level=h.level,
-                    alive=h.alive,
-                )
-                for h in snapshot.heroes
-            ]
             return SnapshotAtTimeResponse(
                 success=True,
                 match_id=match_id,
@@ -530,7 +542,7 @@ def register_match_tools(mcp, services):
                 game_time_str=snapshot.game_time_str,
                 radiant_gold=snapshot.radiant_gold,
                 dire_gold=snapshot.dire_gold,
-                heroes=heroes,
+                heroes=_snapshot_heroes(snapshot),
             )
         except ValueError as e:
             return SnapshotAtTimeResponse(success=False, match_id=match_id, error=str(e))
@@ -538,3 +550,50 @@ def register_match_tools(mcp, services):
             return SnapshotAtTimeResponse(
                 success=False, match_id=match_id, error=f"Failed to get snapshot: {e}"
             )
+
+    @mcp.tool
+    async def get_snapshots_at_times(
+        match_id: int,
+        game_times: List[float],
+        tolerance_seconds: float = 0.0,
+        ctx: Optional[Context] = None,
+    ) -> SnapshotsAtTimesResponse:
+        """Get game state snapshots at several game times in one call, in request order."""
+        async def progress_callback(current: int, total: int, message: str) -> None:
+            if ctx:
+                await ctx.report_progress(current, total)
+
+        if not game_times:
+            return SnapshotsAtTimesResponse(success=False, match_id=match_id, error="No game times requested")
+
+        try:
+            data = await replay_service.get_parsed_data(match_id, progress=progress_callback)
+            snapshots = await asyncio.to_thread(
+                seek_service.get_snapshots_at_times,
+                data.replay_path, game_times, checkpoints=data.checkpoint_index, tolerance_seconds=tolerance_seconds
+            )
+            timed = [
+                TimedSnapshot(
+                    requested_time=requested,
+                    tick=snapshot.tick,
+                    game_time=snapshot.game_time,
+                    game_time_str=snapshot.game_time_str,
+                    radiant_gold=snapshot.radiant_gold,
+                    dire_gold=snapshot.dire_gold,
+                    heroes=_snapshot_heroes(snapshot),
+                )
+                for requested, snapshot in zip(game_times, snapshots)
+                if snapshot is not None
+            ]
+            return SnapshotsAtTimesResponse(
+                success=True,
+                match_id=match_id,
+                snapshots=timed,
+                missing_times=[t for t, snapshot in zip(game_times, snapshots) if snapshot is None],
+            )
+        except ValueError as e:
+            return SnapshotsAtTimesResponse(success=False, match_id=match_id, error=str(e))
+        except Exception as e:
+            return SnapshotsAtTimesResponse(
+                success=False, match_id=match_id, error=f"Failed to get snapshots: {e}"
+            )
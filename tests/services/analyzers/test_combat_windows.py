@@ -0,0 +1,156 @@
+"""
+Tests for single-pass combat window construction and ability grouping.
+
+Uses synthetic combat events and checks the sliding-window passes against
+the list-rebuilding loops they replaced, so no replay file is required.
+"""
+
+import random
+from collections import defaultdict
+
+from src.services.analyzers.fight_analyzer import ABILITY_MODIFIERS, BIG_TEAMFIGHT_ABILITIES, FightAnalyzer
+from src.services.analyzers.fight_detector import INTENSITY_WINDOW, MIN_INTENSITY_EVENTS, FightDetector
+from src.services.models.combat_data import CombatLogEvent, HeroDeath
+
+HEROES = ["axe", "lina", "earthshaker", "faceless_void", "crystal_maiden", "tidehunter"]
+ABILITIES = [
+    "attack",
+    "dota_unknown",
+    "lina_dragon_slave",
+    "earthshaker_fissure",
+    "faceless_void_chronosphere",
+    "modifier_faceless_void_chronosphere_freeze",
+    "tidehunter_ravage",
+    "item_blink",
+]
+
+
+def _make_events(count: int = 3000, seed: int = 4):
+    rng = random.Random(seed)
+    events, deaths = [], []
+    game_time = 0.0
+    for _ in range(count):
+        game_time += rng.choice([0.0, 0.1, 0.4, 1.0, 2.9, 3.0, 3.5, 7.0, 20.0])
+        attacker, target = rng.choice(HEROES), rng.choice(HEROES)
+        events.append(CombatLogEvent(
+            type=rng.choice(["DAMAGE", "ABILITY", "MODIFIER_ADD"]),
+            game_time=game_time,
+            game_time_str="",
+            attacker=attacker,
+            attacker_is_hero=rng.random() < 0.9,
+            target=target,
+            target_is_hero=rng.random() < 0.8,
+            ability=rng.choice(ABILITIES),
+        ))
+        if rng.random() < 0.03:
+            deaths.append(HeroDeath(
+                game_time=game_time + rng.choice([-2.0, 0.0, 2.0, 5.0]),
+                game_time_str="",
+                killer=attacker,
+                victim=target,
+                killer_is_hero=True,
+            ))
+    return events, deaths
+
+
+def _reference_window_bounds(detector: FightDetector, events):
+    """Window (start, end, event count) of the loop that rebuilt the intensity list per event."""
+    combat_events = sorted((e for e in events if detector._is_hero_combat_event(e)), key=lambda e: e.game_time)
+    bounds = []
+    start = end = None
+    count = 0
+    recent = []
+    for event in combat_events:
+        t = event.game_time
+        recent = [r for r in recent if t - r <= INTENSITY_WINDOW]
+        gap = t - end if count else 0
+        if count and (gap > detector.combat_gap or (gap > INTENSITY_WINDOW and len(recent) < MIN_INTENSITY_EVENTS)):
+            bounds.append((start, end, count))
+            start, count, recent = t, 0, []
+        if start is None:
+            start = t
+        end = t
+        count += 1
+        recent.append(t)
+    if count:
+        bounds.append((start, end, count))
+    return bounds
+
+
+def _reference_ability_windows(analyzer: FightAnalyzer, events):
+    """(tracked, any-ability) windows of the two separate grouping passes."""
+    tracked, aoe = defaultdict(dict), defaultdict(dict)
+    for event in events:
+        ability = analyzer._clean_ability_name(event.ability)
+        if not ability or not event.target_is_hero:
+            continue
+        target, caster = analyzer._clean_hero_name(event.target), analyzer._clean_hero_name(event.attacker)
+        if target == caster:
+            continue
+        slot = int(event.game_time * 2)
+        tracked_ability = ability if ability in BIG_TEAMFIGHT_ABILITIES else None
+        if not tracked_ability and event.type == "MODIFIER_ADD":
+            tracked_ability = ABILITY_MODIFIERS.get(ability)
+        groups = []
+        if tracked_ability:
+            groups.append((tracked, (tracked_ability, slot), tracked_ability))
+        if ability not in ("attack", "dota_unknown"):
+            groups.append((aoe, (ability, caster, slot), ability))
+        for windows, key, window_ability in groups:
+            window = windows[key]
+            window.setdefault("targets", set()).add(target)
+            window.setdefault("caster", caster)
+            window.setdefault("time", event.game_time)
+            window.setdefault("ability", window_ability)
+    return dict(tracked), dict(aoe)
+
+
+class TestCombatWindows:
+    """Tests for FightDetector window construction."""
+
+    def test_windows_match_reference(self):
+        events, _ = _make_events()
+        for gap in (2.0, 8.0, 15.0):
+            detector = FightDetector(combat_gap=gap)
+            windows = detector._build_combat_windows(events)
+            assert [(w.start_time, w.end_time, w.event_count) for w in windows] == _reference_window_bounds(
+                detector, events
+            )
+
+    def test_deaths_go_to_first_containing_window(self):
+        events, deaths = _make_events()
+        detector = FightDetector()
+        windows = detector._build_combat_windows(events)
+        detector._associate_deaths(windows, deaths)
+
+        for death in deaths:
+            owners = [w for w in windows if any(d is death for d in w.deaths)]
+            containing = [w for w in windows if w.start_time - 2.0 <= death.game_time <= w.end_time + 2.0]
+            assert owners == containing[:1]
+
+    def test_unordered_events_give_same_fights(self):
+        events, deaths = _make_events()
+        shuffled = list(events)
+        random.Random(1).shuffle(shuffled)
+        detector = FightDetector()
+
+        assert detector.detect_fights_from_combat(shuffled, deaths) == detector.detect_fights_from_combat(
+            events, deaths
+        )
+
+
+class TestAbilityGrouping:
+    """Tests for FightAnalyzer ability window grouping."""
+
+    def test_grouping_matches_separate_passes(self):
+        events, _ = _make_events()
+        analyzer = FightAnalyzer()
+
+        assert analyzer._group_ability_hits(events) == _reference_ability_windows(analyzer, events)
+
+    def test_highlights_found(self):
+        events, deaths = _make_events()
+        highlights = FightAnalyzer().analyze_fight(events, deaths)
+
+        assert highlights.multi_hero_abilities
+        assert highlights.multi_hero_abilities == sorted(highlights.multi_hero_abilities, key=lambda x: x.game_time)
@@ -0,0 +1,174 @@
+"""
+Tests for memoised fight detection and its lookups.
+
+Uses synthetic fights and combat logs and checks indexed lookups against the
+linear FightDetector scans, so no replay file is required.
+"""
+
+import random
+
+from python_manta import CombatLogEntry, CombatLogResult, CombatLogType
+
+from src.services.analyzers.fight_analyzer import FightAnalyzer
+from src.services.analyzers.fight_detector import FightDetector
+from src.services.analyzers.fight_index import FightIndex
+from src.services.combat.fight_service import FightService
+from src.services.models.combat_data import Fight, FightResult
+from src.services.models.replay_data import ParsedReplayData
+
+HEROES = ["axe", "lina", "shadow_shaman", "shadow_demon", "earthshaker"]
+
+
+def _make_fights(count: int = 60, seed: int = 3):
+    rng = random.Random(seed)
+    fights = []
+    start = 0.0
+    for i in range(count):
+        start += rng.choice([5.0, 20.0, 90.0])
+        end = start + rng.choice([0.0, 4.0, 12.5])
+        fights.append(Fight(
+            fight_id=f"fight_{i + 1}",
+            start_time=start,
+            start_time_str="",
+            end_time=end,
+            end_time_str="",
+            duration=end - start,
+            participants=sorted(rng.sample(HEROES, rng.randint(1, 3))),
+        ))
+        start = end
+    return fights
+
+
+def _make_data(seed: int = 8) -> ParsedReplayData:
+    rng = random.Random(seed)
+    entries = []
+    game_time = 0.0
+    for i in range(400):
+        game_time += rng.choice([0.5, 3.0, 40.0])
+        attacker, target = rng.sample(HEROES, 2)
+        entries.append(CombatLogEntry(
+            tick=i,
+            net_tick=i,
+            type=CombatLogType.DEATH.value,
+            type_name="",
+            game_time=game_time,
+            attacker_name=f"npc_dota_hero_{attacker}",
+            target_name=f"npc_dota_hero_{target}",
+            is_attacker_hero=True,
+            is_target_hero=True,
+            inflictor_name="dota_unknown",
+        ))
+    return ParsedReplayData(
+        match_id=1, replay_path="/tmp/1.dem", combat_log=CombatLogResult(entries=entries, success=True)
+    )
+
+
+class _CountingDetector(FightDetector):
+    """Counts detection runs."""
+
+    def __init__(self):
+        super().__init__()
+        self.runs = 0
+
+    def detect_fights(self, deaths):
+        self.runs += 1
+        return super().detect_fights(deaths)
+
+
+class _CountingAnalyzer(FightAnalyzer):
+    """Counts highlight passes."""
+
+    def __init__(self):
+        super().__init__()
+        self.runs = 0
+
+    def analyze_fight(self, *args, **kwargs):
+        self.runs += 1
+        return super().analyze_fight(*args, **kwargs)
+
+
+def _linear_fight_at(fights, reference_time, hero, before=3.0, after=5.0):
+    """The scan FightDetector used before the index."""
+    best_fight, best_distance = None, float("inf")
+    for fight in fights:
+        matches = not hero or any(hero.lower() in p.lower() for p in fight.participants)
+        if fight.start_time - before <= reference_time <= fight.end_time + after and matches:
+            return fight
+        distance = abs((fight.start_time + fight.end_time) / 2 - reference_time)
+        if distance < best_distance and matches:
+            best_distance, best_fight = distance, fight
+    return best_fight
+
+
+class TestFightIndex:
+    """Tests for FightIndex lookups."""
+
+    def test_fight_at_matches_linear_scan(self):
+        fights = _make_fights()
+        index = FightIndex(FightResult(fights=fights, total_fights=len(fights)), [])
+        rng = random.Random(1)
+
+        for _ in range(400):
+            t = rng.uniform(-100, fights[-1].end_time + 100)
+            hero = rng.choice([None, "axe", "SHADOW", "invoker"])
+            assert index.fight_at(t, hero) is _linear_fight_at(fights, t, hero)
+            assert index.fight_at(t, hero, 5.0, 15.0) is _linear_fight_at(fights, t, hero, 5.0, 15.0)
+
+    def test_id_and_hero_lookups(self):
+        fights = _make_fights()
+        index = FightIndex(FightResult(fights=fights), [])
+
+        assert index.fight("fight_7") is fights[6]
+        assert index.fight("fight_999") is None
+        assert index.hero_fights("lina") == [f for f in fights if "lina" in f.participants]
+
+    def test_empty_result(self):
+        index = FightIndex(FightResult(), [])
+        assert index.fight_at(100.0) is None
+        assert index.hero_fights("axe") == []
+
+
+class TestFightServiceMemo:
+    """Tests for fight detection memoised per match."""
+
+    def test_detection_runs_once_per_match(self):
+        detector = _CountingDetector()
+        service = FightService(fight_detector=detector)
+        data = _make_data()
+
+        result = service.get_all_fights(data)
+        assert service.get_teamfights(data) == [f for f in result.fights if f.total_deaths >= 3]
+        assert service.get_fight_by_id(data, "fight_2") is result.fights[1]
+        assert service.get_deaths_in_fight(data, "fight_2") == result.fights[1].deaths
+        assert service.get_fight_summary(data)["total_fights"] == result.total_fights
+        assert FightService(fight_detector=detector).get_all_fights(data) is result  # Shared through the data
+        assert detector.runs == 1
+
+        other = FightService(fight_detector=_CountingDetector())
+        other._detector.combat_gap = 4.0
+        other.get_all_fights(data)
+        assert other._detector.runs == 1  # Other parameters detect again
+
+    def test_fight_at_time_matches_detector(self):
+        service = FightService()
+        data = _make_data()
+        deaths = service._combat.get_hero_deaths(data)
+        detector = FightDetector()
+
+        for t in (0.0, 250.0, 1200.0, 5000.0):
+            for hero in (None, "axe", "earth"):
+                expected = _linear_fight_at(detector.detect_fights(deaths).fights, t, hero, 5.0, 15.0)
+                assert service.get_fight_at_time(data, t, hero) == expected
+
+    def test_highlights_computed_once_per_fight(self):
+        analyzer = _CountingAnalyzer()
+        service = FightService(fight_analyzer=analyzer)
+        data = _make_data()
+        fight = service.get_all_fights(data).fights[0]
+
+        first = service.get_fight_combat_log(data, fight.start_time, use_combat_detection=False)
+        second = service.get_fight_combat_log(data, fight.start_time, use_combat_detection=False)
+
+        assert first["fight_id"] == second["fight_id"] == fight.fight_id
+        assert first["highlights"] is second["highlights"]
+        assert analyzer.runs == 1
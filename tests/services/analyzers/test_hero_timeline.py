@@ -0,0 +1,140 @@
+"""
+Tests for the per-hero state time series.
+
+Uses synthetic entity snapshots and checks lookups against the linear
+nearest-snapshot scan the services used before, so no replay file is required.
+"""
+
+import random
+
+from python_manta import EntityParseResult, EntitySnapshot, HeroSnapshot
+
+from src.services.analyzers.hero_timeline import HeroTimeline
+from src.services.combat.combat_service import CombatService
+from src.services.models.replay_data import ParsedReplayData
+
+HEROES = ["npc_dota_hero_axe", "npc_dota_hero_lina", "npc_dota_hero_shadow_shaman", "npc_dota_hero_shadow_demon"]
+
+
+def _make_snapshots(count: int = 300, seed: int = 4):
+    rng = random.Random(seed)
+    snapshots = []
+    game_time = -90.0
+    for i in range(count):
+        game_time += rng.choice([0.0, 1.0, 2.5, 30.0])  # Repeated times and gaps
+        heroes = [
+            HeroSnapshot(
+                hero_name=name,
+                player_id=player_id,
+                x=rng.uniform(-8000, 8000),
+                y=rng.uniform(-8000, 8000),
+                level=1 + i // 20,
+                gold=i * 10,
+                last_hits=i // 3,
+                denies=i // 7,
+                health=rng.randint(0, 2000),
+            )
+            for player_id, name in enumerate(HEROES)
+            if rng.random() > 0.1  # Heroes sometimes missing from a snapshot
+        ]
+        snapshots.append(EntitySnapshot(tick=i * 30, game_time=game_time, heroes=heroes))
+    return snapshots
+
+
+def _linear_lookup(snapshots, hero, target_time, max_gap=None):
+    """The scan the services used before the timeline."""
+    best_snapshot = None
+    min_diff = float("inf")
+    for snapshot in snapshots:
+        diff = abs(snapshot.game_time - target_time)
+        if diff < min_diff:
+            min_diff = diff
+            best_snapshot = snapshot
+    if not best_snapshot or (max_gap is not None and min_diff > max_gap):
+        return None
+    for hero_snap in best_snapshot.heroes:
+        if hero.lower() in hero_snap.hero_name[len("npc_dota_hero_"):].lower():
+            return best_snapshot, hero_snap
+    return None
+
+
+class TestHeroTimeline:
+    """Tests for HeroTimeline lookups."""
+
+    def test_nearest_lookups_match_linear_scan(self):
+        snapshots = _make_snapshots()
+        timeline = HeroTimeline(snapshots)
+        rng = random.Random(9)
+
+        for _ in range(500):
+            target = rng.uniform(-150.0, snapshots[-1].game_time + 60.0)
+            hero = rng.choice(["axe", "LINA", "shadow", "invoker"])
+            max_gap = rng.choice([None, 1.0, 30.0])
+
+            state = timeline.state_at(hero, target, max_gap=max_gap)
+            expected = _linear_lookup(snapshots, hero, target, max_gap)
+            if expected is None:
+                assert state is None
+                continue
+            snapshot, hero_snap = expected
+            assert (state.game_time, state.tick) == (snapshot.game_time, snapshot.tick)
+            assert (state.x, state.y, state.level, state.gold) == (
+                hero_snap.x, hero_snap.y, hero_snap.level, hero_snap.gold
+            )
+            assert (state.last_hits, state.denies, state.health) == (
+                hero_snap.last_hits, hero_snap.denies, hero_snap.health
+            )
+
+    def test_interpolates_position_between_snapshots(self):
+        axe = HEROES[0]
+        snapshots = [
+            EntitySnapshot(tick=0, game_time=10.0, heroes=[HeroSnapshot(hero_name=axe, x=0.0, y=100.0, level=3)]),
+            EntitySnapshot(tick=30, game_time=20.0, heroes=[HeroSnapshot(hero_name=axe, x=100.0, y=0.0, level=4)]),
+        ]
+        timeline = HeroTimeline(snapshots)
+
+        state = timeline.state_at("axe", 12.5, interpolate=True)
+        assert (state.x, state.y, state.level, state.game_time) == (25.0, 75.0, 3, 12.5)
+        assert timeline.state_at("axe", 40.0, interpolate=True).x == 100.0
+        assert timeline.state_at("axe", 40.0, max_gap=5.0, interpolate=True) is None
+
+    def test_states_at_and_history(self):
+        snapshots = _make_snapshots()
+        timeline = HeroTimeline(snapshots)
+
+        states = timeline.states_at(200.0)
+        snapshot = _linear_lookup(snapshots, "", 200.0)[0]
+        assert [s.hero for s in states] == [h.hero_name[len("npc_dota_hero_"):] for h in snapshot.heroes]
+
+        history = timeline.history("lina", 0.0, 500.0)
+        assert [s.game_time for s in history] == sorted(s.game_time for s in history)
+        assert all(0.0 <= s.game_time <= 500.0 for s in history)
+        assert len(history) == sum(
+            1 for s in snapshots if 0.0 <= s.game_time <= 500.0 and any("lina" in h.hero_name for h in s.heroes)
+        )
+
+    def test_empty_timeline(self):
+        timeline = HeroTimeline([])
+        assert timeline.state_at("axe", 10.0) is None
+        assert timeline.states_at(10.0) == []
+        assert timeline.history("axe") == []
+
+
+class TestServicesUseTimeline:
+    """Tests for service lookups served by the timeline."""
+
+    def test_parsed_data_builds_timeline_once(self):
+        data = ParsedReplayData(
+            match_id=1, replay_path="/tmp/1.dem", entities=EntityParseResult(snapshots=_make_snapshots(), success=True)
+        )
+        assert data.hero_timeline is data.hero_timeline
+
+    def test_combat_service_level_lookup(self):
+        snapshots = _make_snapshots()
+        data = ParsedReplayData(
+            match_id=1, replay_path="/tmp/1.dem", entities=EntityParseResult(snapshots=snapshots, success=True)
+        )
+        expected = _linear_lookup(snapshots, "axe", 300.0, 60.0)
+
+        level = CombatService()._get_hero_level_at_time(data, "axe", 300.0)
+        assert level == (expected[1].level if expected else None)
@@ -0,0 +1,64 @@
+"""
+Tests for the shared time and interval indexes.
+
+Checks every query against a brute-force scan over random items.
+"""
+
+import random
+
+from src.services.analyzers.interval_index import IntervalIndex, TimeIndex
+
+
+def _make_intervals(count: int = 300, seed: int = 5):
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(count):
+        start = rng.uniform(0, 1000)
+        intervals.append((start, start + rng.choice([0.0, 1.0, 30.0, 400.0])))
+    return intervals
+
+
+class TestIntervalIndex:
+    """Tests for IntervalIndex stabbing and overlap queries."""
+
+    def test_containing_matches_brute_force(self):
+        intervals = _make_intervals()
+        index = IntervalIndex(intervals, lambda i: i[0], lambda i: i[1])
+        rng = random.Random(6)
+
+        for _ in range(300):
+            t = rng.uniform(-50, 1500)
+            before, after = rng.choice([(0.0, 0.0), (3.0, 5.0), (5.0, 15.0)])
+            expected = [i for i in intervals if i[0] - before <= t <= i[1] + after]
+            assert index.containing(t, before, after) == expected
+
+    def test_overlapping_matches_brute_force(self):
+        intervals = _make_intervals()
+        index = IntervalIndex(intervals, lambda i: i[0], lambda i: i[1])
+        rng = random.Random(7)
+
+        for _ in range(300):
+            start = rng.uniform(-50, 1500)
+            end = start + rng.choice([0.0, 10.0, 60.0])
+            assert index.overlapping(start, end) == [i for i in intervals if i[0] <= end and i[1] >= start]
+
+    def test_empty(self):
+        index = IntervalIndex([], lambda i: i, lambda i: i)
+        assert index.containing(1.0) == []
+        assert index.overlapping(0.0, 1.0) == []
+
+
+class TestTimeIndex:
+    """Tests for TimeIndex range queries."""
+
+    def test_between_and_near_keep_original_order(self):
+        rng = random.Random(8)
+        times = [rng.choice([rng.uniform(0, 500), 100.0]) for _ in range(400)]  # Unsorted, with repeats
+        index = TimeIndex(list(enumerate(times)), lambda item: item[1])
+
+        for _ in range(200):
+            t = rng.uniform(-20, 520)
+            radius = rng.choice([0.0, 5.0, 60.0])
+            assert index.between(t - radius, t) == [(i, x) for i, x in enumerate(times) if t - radius <= x <= t]
+            assert index.near(t, radius) == [(i, x) for i, x in enumerate(times) if abs(x - t) <= radius]
+        assert [i for i, _ in index.between(100.0, 100.0)] == [i for i, x in enumerate(times) if x == 100.0]
@@ -0,0 +1,124 @@
+"""
+Tests for compressed ReplayCache entries and pluggable codecs.
+
+Uses synthetic ParsedReplayData so no replay file is required.
+"""
+
+import pytest
+from python_manta import CombatLogEntry, CombatLogResult
+
+from src.services.cache.codecs import available_codecs, create_codec
+from src.services.cache.replay_cache import ReplayCache
+from src.services.models.replay_data import ParsedReplayData
+
+HEROES = ["npc_dota_hero_axe", "npc_dota_hero_lina", "npc_dota_hero_pudge", "npc_dota_hero_zeus"]
+
+
+def _make_data(match_id: int, entries: int = 500) -> ParsedReplayData:
+    combat_log = CombatLogResult(
+        entries=[
+            CombatLogEntry(
+                tick=i,
+                net_tick=i,
+                type=0,
+                type_name="DOTA_COMBATLOG_DAMAGE",
+                game_time=float(i),
+                attacker_name=HEROES[i % 4],
+                target_name=HEROES[(i + 1) % 4],
+                value=i % 300,
+            )
+            for i in range(entries)
+        ],
+        success=True,
+    )
+    return ParsedReplayData(match_id=match_id, replay_path=f"/tmp/{match_id}.dem", combat_log=combat_log)
+
+
+class TestCodecs:
+    """Tests for individual codecs."""
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_round_trip(self, name):
+        codec = create_codec(name)
+        payload = b"npc_dota_hero_axe" * 1000
+        assert codec.decode(codec.encode(payload)) == payload
+
+    def test_unknown_codec_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown cache codec"):
+            create_codec("brotli")
+
+
+class TestCompressedReplayCache:
+    """Tests for ReplayCache storing codec-compressed entries."""
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_entries_round_trip_through_disk(self, tmp_path, name):
+        ReplayCache(cache_dir=tmp_path, codec=name).set(1, _make_data(1))
+
+        cached = ReplayCache(cache_dir=tmp_path, codec=name).get(1)
+        assert len(cached.combat_log_entries) == 500
+        assert cached.combat_log_entries[4].attacker_name == "npc_dota_hero_axe"
+
+    def test_entry_records_codec(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path, codec="zlib")
+        cache.set(1, _make_data(1))
+
+        entry = cache._cache.get("replay_v2_1")
+        assert entry["codec"] == "zlib"
+        assert entry["codec_version"] == 1
+
+    def test_stats_report_compression_ratio(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path, codec="zlib")
+        cache.set(1, _make_data(1))
+
+        stats = cache.get_stats()["codec"]
+        assert stats["name"] == "zlib"
+        assert stats["compression_ratio"] > 5
+
+    def test_entries_from_another_codec_stay_readable(self, tmp_path):
+        ReplayCache(cache_dir=tmp_path, codec="none").set(1, _make_data(1))
+
+        assert ReplayCache(cache_dir=tmp_path, codec="zlib").get(1) is not None
+
+    def test_uncompressed_legacy_entries_are_readable(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path, codec="zlib")
+        cache._cache.set("replay_v2_1", _make_data(1).to_cache_dict())
+
+        assert len(cache.get(1).combat_log_entries) == 500
+
+    def test_dictionary_needs_zstd(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path, codec="zlib")
+        with pytest.raises(ValueError, match="zstd"):
+            cache.train_dictionary()
+
+
+class TestZstdDictionary:
+    """Tests for zstd dictionaries trained on cached combat logs."""
+
+    @pytest.fixture(autouse=True)
+    def _require_zstd(self):
+        pytest.importorskip("zstandard")
+
+    def test_trained_dictionary_is_used_and_persisted(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path, codec="zstd")
+        for match_id in range(1, 4):
+            cache.set(match_id, _make_data(match_id, entries=2000))
+
+        dictionary_id = cache.train_dictionary(size=4096)
+        cache.set(4, _make_data(4))
+        assert cache._cache.get("replay_v2_4")["dictionary_id"] == dictionary_id
+
+        reopened = ReplayCache(cache_dir=tmp_path, codec="zstd", memory_limit=0)
+        assert len(reopened.get(4).combat_log_entries) == 500
+        assert len(reopened.get(1).combat_log_entries) == 2000
+
+    def test_missing_dictionary_is_a_miss(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path, codec="zstd")
+        for match_id in range(1, 4):
+            cache.set(match_id, _make_data(match_id, entries=2000))
+        cache.train_dictionary(size=4096)
+        cache.set(4, _make_data(4))
+
+        for path in (tmp_path / "dictionaries").glob("*.zdict"):
+            path.unlink()
+        assert ReplayCache(cache_dir=tmp_path, codec="zstd", memory_limit=0).get(4) is None
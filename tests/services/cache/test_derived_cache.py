@@ -0,0 +1,172 @@
+"""
+Tests for the per-match derived result cache.
+
+Uses synthetic ParsedReplayData so no replay file is required.
+"""
+
+import dataclasses
+
+from python_manta import CombatLogEntry, CombatLogResult
+
+from src.services.analyzers.fight_detector import FightDetector
+from src.services.cache.derived_cache import DerivedResultCache
+from src.services.cache.replay_cache import ReplayCache
+from src.services.combat.fight_service import FightService
+from src.services.models.replay_data import PARSE_PROFILES, ParsedReplayData
+
+
+def _make_data(match_id: int = 1) -> ParsedReplayData:
+    combat_log = CombatLogResult(
+        entries=[
+            CombatLogEntry(
+                tick=i,
+                net_tick=i,
+                type=4,
+                type_name="DOTA_COMBATLOG_DEATH",
+                game_time=600.0 + i * 5,
+                attacker_name="npc_dota_hero_axe",
+                target_name=target,
+                target_is_hero=True,
+                is_target_hero=True,
+            )
+            for i, target in enumerate(["npc_dota_hero_lina", "npc_dota_hero_zeus", "npc_dota_hero_pudge"])
+        ],
+        success=True,
+    )
+    return ParsedReplayData(match_id=match_id, replay_path=f"/tmp/{match_id}.dem", combat_log=combat_log)
+
+
+class Counter:
+    def __init__(self, result):
+        self.calls = 0
+        self.result = result
+
+    def __call__(self):
+        self.calls += 1
+        return self.result
+
+
+class TestDerivedResultCache:
+    """Tests for keying, invalidation and persistence."""
+
+    def test_hit_returns_fresh_copy(self):
+        cache = DerivedResultCache()
+        data = _make_data()
+        compute = Counter({"fights": [1, 2, 3]})
+
+        first = cache.get_or_compute(data, "fights", 1, {}, compute)
+        first["fights"].append(4)
+        second = cache.get_or_compute(data, "fights", 1, {}, compute)
+
+        assert compute.calls == 1
+        assert second == {"fights": [1, 2, 3]}
+        assert cache.get_stats()["hits"] == 1
+
+    def test_version_params_and_parse_change_miss(self):
+        cache = DerivedResultCache()
+        data = _make_data()
+        compute = Counter("result")
+
+        cache.get_or_compute(data, "fights", 1, {"gap": 8.0}, compute)
+        cache.get_or_compute(data, "fights", 2, {"gap": 8.0}, compute)
+        cache.get_or_compute(data, "fights", 1, {"gap": 10.0}, compute)
+        cache.get_or_compute(data, "lane_summary", 1, {"gap": 8.0}, compute)
+
+        reparsed = _make_data()
+        reparsed.parse_version = data.parse_version + ".1"
+        cache.get_or_compute(reparsed, "fights", 1, {"gap": 8.0}, compute)
+
+        partial = dataclasses.replace(data, collectors=PARSE_PROFILES["combat"])
+        cache.get_or_compute(partial, "fights", 1, {"gap": 8.0}, compute)
+
+        assert compute.calls == 6
+
+    def test_invalidate_drops_only_that_match(self):
+        cache = DerivedResultCache()
+        compute = Counter("result")
+        cache.get_or_compute(_make_data(1), "fights", 1, {}, compute)
+        cache.get_or_compute(_make_data(2), "fights", 1, {}, compute)
+
+        assert cache.invalidate(1) == 1
+        cache.get_or_compute(_make_data(1), "fights", 1, {}, compute)
+        cache.get_or_compute(_make_data(2), "fights", 1, {}, compute)
+
+        assert compute.calls == 3
+
+    def test_results_persist_on_disk(self, tmp_path):
+        compute = Counter(["fight_1"])
+        DerivedResultCache(tmp_path).get_or_compute(_make_data(), "fights", 1, {}, compute)
+
+        restarted = DerivedResultCache(tmp_path)
+        assert restarted.get_or_compute(_make_data(), "fights", 1, {}, compute) == ["fight_1"]
+        assert compute.calls == 1
+
+    def test_memory_tier_is_bounded(self):
+        cache = DerivedResultCache(memory_limit=1000)
+        data = _make_data()
+        for i in range(20):
+            cache.get_or_compute(data, "blob", 1, {"i": i}, lambda: b"x" * 200)
+
+        assert cache.get_stats()["memory_bytes"] <= 1000
+
+    def test_unpicklable_results_are_not_cached(self):
+        cache = DerivedResultCache()
+        compute = Counter(lambda: None)
+        cache.get_or_compute(_make_data(), "fn", 1, {}, compute)
+        cache.get_or_compute(_make_data(), "fn", 1, {}, compute)
+        assert compute.calls == 2
+
+
+class TestReplayCacheIntegration:
+    """Tests for derived results living alongside ReplayCache entries."""
+
+    def test_storing_a_match_invalidates_its_results(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path)
+        data = _make_data()
+        cache.set(1, data)
+        compute = Counter("result")
+
+        cache.derived.get_or_compute(data, "fights", 1, {}, compute)
+        cache.set(1, data)
+        cache.derived.get_or_compute(data, "fights", 1, {}, compute)
+
+        assert compute.calls == 2
+        assert "derived" in cache.get_stats()
+
+
+class CountingDetector(FightDetector):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def detect_fights(self, deaths):
+        self.calls += 1
+        return super().detect_fights(deaths)
+
+
+class TestFightServiceCaching:
+    """Tests for FightService reusing cached detection."""
+
+    def test_fight_lookups_detect_once(self):
+        detector = CountingDetector()
+        service = FightService(fight_detector=detector, derived_cache=DerivedResultCache())
+        data = _make_data()
+
+        result = service.get_all_fights(data)
+        fight = service.get_fight_by_id(data, result.fights[0].fight_id)
+        teamfights = service.get_teamfights(data)
+
+        assert detector.calls == 1
+        assert fight.fight_id == result.fights[0].fight_id
+        assert len(teamfights) == 1
+
+    def test_detector_settings_are_part_of_the_key(self):
+        cache = DerivedResultCache()
+        data = _make_data()
+        FightService(fight_detector=CountingDetector(), derived_cache=cache).get_all_fights(data)
+
+        detector = CountingDetector()
+        detector.combat_gap = 1.0
+        FightService(fight_detector=detector, derived_cache=cache).get_all_fights(data)
+
+        assert detector.calls == 1
@@ -0,0 +1,171 @@
+"""
+Tests for the in-process LRU tier in front of ReplayCache.
+
+Uses synthetic ParsedReplayData so no replay file is required.
+"""
+
+import pytest
+from python_manta import CombatLogEntry, CombatLogResult
+
+from src.services.cache.memory_cache import (
+    BASE_SIZE_ESTIMATE,
+    ITEM_SIZE_ESTIMATES,
+    MemoryReplayCache,
+    estimate_replay_size,
+)
+from src.services.cache.replay_cache import ReplayCache
+from src.services.models.replay_data import ALL_COLLECTORS, PARSE_PROFILES, ParsedReplayData
+
+
+def _make_data(match_id: int, entries: int = 0) -> ParsedReplayData:
+    combat_log = CombatLogResult(
+        entries=[
+            CombatLogEntry(tick=i, net_tick=i, type=0, type_name="DOTA_COMBATLOG_DAMAGE", game_time=float(i))
+            for i in range(entries)
+        ],
+        success=True,
+    )
+    return ParsedReplayData(match_id=match_id, replay_path=f"/tmp/{match_id}.dem", combat_log=combat_log)
+
+
+class TestEstimateReplaySize:
+    """Tests for memory footprint estimation."""
+
+    def test_empty_data_is_base_size(self):
+        data = ParsedReplayData(match_id=1, replay_path="/tmp/1.dem")
+        assert estimate_replay_size(data) == BASE_SIZE_ESTIMATE
+
+    def test_scales_with_combat_log_entries(self):
+        data = _make_data(1, entries=10)
+        assert estimate_replay_size(data) == BASE_SIZE_ESTIMATE + 10 * ITEM_SIZE_ESTIMATES["combat_log"]
+
+
+class TestMemoryReplayCache:
+    """Tests for LRU behaviour and counters."""
+
+    def test_get_returns_same_object(self):
+        cache = MemoryReplayCache()
+        data = _make_data(1)
+        cache.set(1, data)
+        assert cache.get(1) is data
+
+    def test_hit_and_miss_counters(self):
+        cache = MemoryReplayCache()
+        cache.set(1, _make_data(1))
+        cache.get(1)
+        cache.get(1)
+        cache.get(2)
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.667, abs=0.001)
+
+    def test_evicts_least_recently_used_when_over_limit(self):
+        one_match = estimate_replay_size(_make_data(1, entries=10))
+        cache = MemoryReplayCache(memory_limit=one_match * 2)
+        cache.set(1, _make_data(1, entries=10))
+        cache.set(2, _make_data(2, entries=10))
+        cache.get(1)  # 2 is now least recently used
+        cache.set(3, _make_data(3, entries=10))
+
+        assert cache.has(1)
+        assert not cache.has(2)
+        assert cache.has(3)
+        assert cache.get_stats()["evictions"] == 1
+        assert cache.get_stats()["size_bytes"] == one_match * 2
+
+    def test_oversized_match_is_not_stored(self):
+        cache = MemoryReplayCache(memory_limit=BASE_SIZE_ESTIMATE)
+        cache.set(1, _make_data(1, entries=10))
+        assert not cache.has(1)
+        assert cache.get_stats()["size_bytes"] == 0
+
+    def test_zero_limit_disables_tier(self):
+        cache = MemoryReplayCache(memory_limit=0)
+        cache.set(1, _make_data(1))
+        assert cache.get(1) is None
+
+    def test_delete_releases_size(self):
+        cache = MemoryReplayCache()
+        cache.set(1, _make_data(1))
+        assert cache.delete(1) is True
+        assert cache.delete(1) is False
+        assert cache.get_stats()["size_bytes"] == 0
+
+
+class TestReplayCacheMemoryTier:
+    """Tests for ReplayCache using the memory tier in front of diskcache."""
+
+    def test_set_then_get_skips_disk_rebuild(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path)
+        data = _make_data(42, entries=3)
+        cache.set(42, data)
+        assert cache.get(42) is data
+
+    def test_disk_hit_populates_memory_tier(self, tmp_path):
+        ReplayCache(cache_dir=tmp_path).set(42, _make_data(42, entries=3))
+
+        cache = ReplayCache(cache_dir=tmp_path)
+        first = cache.get(42)
+        second = cache.get(42)
+
+        assert first is not None
+        assert len(first.combat_log_entries) == 3
+        assert second is first
+        assert cache.get_stats()["memory"]["hits"] == 1
+
+    def test_delete_removes_from_memory_tier(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path)
+        cache.set(42, _make_data(42))
+        assert cache.delete(42) is True
+        assert cache.get(42) is None
+        assert not cache.has(42)
+
+
+class TestCollectorRecords:
+    """Tests for the collectors each cached match was parsed with."""
+
+    def test_collectors_survive_disk_round_trip(self, tmp_path):
+        data = ParsedReplayData(match_id=42, replay_path="/tmp/42.dem", collectors=PARSE_PROFILES["draft"])
+        ReplayCache(cache_dir=tmp_path).set(42, data)
+
+        cached = ReplayCache(cache_dir=tmp_path).get(42)
+        assert cached.collectors == PARSE_PROFILES["draft"]
+        assert not cached.has_collectors(PARSE_PROFILES["combat"])
+
+    def test_collectors_read_without_loading_data(self, tmp_path):
+        data = ParsedReplayData(match_id=42, replay_path="/tmp/42.dem", collectors=PARSE_PROFILES["draft"])
+        ReplayCache(cache_dir=tmp_path).set(42, data)
+
+        cache = ReplayCache(cache_dir=tmp_path)
+        assert cache.get_collectors(42) == PARSE_PROFILES["draft"]
+        assert cache.get_collectors(43) is None
+        assert cache.get_stats()["memory"]["count"] == 0
+
+        cache.delete(42)
+        assert cache.get_collectors(42) is None
+
+    def test_collectors_of_entries_without_metadata(self, tmp_path):
+        cache = ReplayCache(cache_dir=tmp_path)
+        cache.set(42, ParsedReplayData(match_id=42, replay_path="/tmp/42.dem", collectors=PARSE_PROFILES["draft"]))
+        cache._meta.clear()
+
+        fresh = ReplayCache(cache_dir=tmp_path)
+        assert fresh.get_collectors(42) == PARSE_PROFILES["draft"]
+        assert fresh._meta.get("replay_v2_42")["collectors"] == sorted(PARSE_PROFILES["draft"])
+        assert fresh.get_stats()["memory"]["count"] == 0
+
+    def test_entries_without_collectors_are_full_parses(self):
+        cache_dict = _make_data(42).to_cache_dict()
+        del cache_dict["collectors"]
+        assert ParsedReplayData.from_cache_dict(cache_dict).collectors == ALL_COLLECTORS
+
+    def test_merge_keeps_existing_collectors(self):
+        draft = ParsedReplayData(match_id=42, replay_path="/tmp/42.dem", collectors=PARSE_PROFILES["draft"])
+        combat_only = _make_data(42, entries=3)
+        combat_only.collectors = frozenset({"combat_log"})
+
+        merged = draft.merged_with(combat_only)
+
+        assert merged.collectors == PARSE_PROFILES["combat"]
+        assert len(merged.combat_log_entries) == 3
@@ -0,0 +1,116 @@
+"""
+Tests for cursor-paged combat log responses.
+
+Uses a synthetic combat log and checks that paging through it returns
+exactly the unpaged result, so no replay file is required.
+"""
+
+import random
+
+import pytest
+from python_manta import CombatLogEntry, CombatLogResult, CombatLogType
+
+from src.models.combat_log import DetailLevel
+from src.services.combat.combat_log_cursor import CombatLogCursor
+from src.services.combat.combat_service import CombatService
+from src.services.models.replay_data import ParsedReplayData
+
+UNITS = ["npc_dota_hero_axe", "npc_dota_hero_lina", "npc_dota_creep_goodguys_melee"]
+TYPES = [
+    CombatLogType.DAMAGE.value,
+    CombatLogType.DEATH.value,
+    CombatLogType.ABILITY.value,
+    CombatLogType.PURCHASE.value,
+]
+
+
+def _make_data(count: int = 1500, seed: int = 2, match_id: int = 1) -> ParsedReplayData:
+    rng = random.Random(seed)
+    entries = []
+    game_time = -30.0
+    for i in range(count):
+        game_time += rng.choice([0.0, 0.2, 1.0])
+        attacker = rng.choice(UNITS)
+        target = rng.choice(UNITS)
+        entries.append(CombatLogEntry(
+            tick=i,
+            net_tick=i,
+            type=rng.choice(TYPES),
+            type_name="",
+            game_time=game_time,
+            attacker_name=attacker,
+            target_name=target,
+            is_attacker_hero=attacker.startswith("npc_dota_hero_"),
+            is_target_hero=target.startswith("npc_dota_hero_"),
+            inflictor_name=rng.choice(["lina_laguna_blade", "axe_culling_blade", "dota_unknown"]),
+            value=i % 300,
+        ))
+    return ParsedReplayData(
+        match_id=match_id, replay_path="/tmp/1.dem", combat_log=CombatLogResult(entries=entries, success=True)
+    )
+
+
+def _page_through(service, data, page_size, **filters):
+    events, cursor, pages = [], None, 0
+    while True:
+        page, cursor = service.get_combat_log_page(data, page_size=page_size, cursor=cursor, **filters)
+        events.extend(page)
+        pages += 1
+        if cursor is None:
+            return events, pages
+
+
+class TestCombatLogPaging:
+    """Tests for get_combat_log_page and cursors."""
+
+    @pytest.mark.parametrize("filters", [
+        {},
+        {"start_time": 50.0, "end_time": 300.0, "detail_level": DetailLevel.NARRATIVE},
+        {"hero_filter": "lina", "ability_filter": "laguna"},
+        {"types": [CombatLogType.DEATH.value, CombatLogType.ABILITY.value]},
+    ])
+    def test_pages_add_up_to_unpaged_log(self, filters):
+        service = CombatService()
+        data = _make_data()
+
+        expected = service.get_combat_log(data, **filters)
+        events, pages = _page_through(service, data, 37, **filters)
+
+        assert events == expected
+        assert pages == max(1, -(-len(expected) // 37))
+
+    def test_response_sets_next_cursor_only_when_more_events(self):
+        service = CombatService()
+        data = _make_data()
+
+        first = service.get_combat_log_response(data, 1, detail_level=DetailLevel.FULL, max_events=100)
+        assert first.truncated and first.next_cursor
+        assert first.total_events == 100
+
+        second = service.get_combat_log_response(
+            data, 1, detail_level=DetailLevel.FULL, max_events=100, cursor=first.next_cursor
+        )
+        assert second.events[0].tick > first.events[-1].tick
+
+        everything = service.get_combat_log_response(data, 1, start_time=0.0, end_time=5.0, max_events=500)
+        assert not everything.truncated and everything.next_cursor is None
+
+    def test_cursor_for_other_filters_is_rejected(self):
+        service = CombatService()
+        data = _make_data()
+        _, cursor = service.get_combat_log_page(data, hero_filter="lina", page_size=10)
+
+        with pytest.raises(ValueError, match="does not match"):
+            service.get_combat_log_page(data, hero_filter="axe", page_size=10, cursor=cursor)
+        with pytest.raises(ValueError, match="does not match"):
+            service.get_combat_log_page(_make_data(match_id=2), hero_filter="lina", page_size=10, cursor=cursor)
+
+    def test_malformed_cursor_is_rejected(self):
+        with pytest.raises(ValueError, match="Invalid combat log cursor"):
+            CombatLogCursor.decode("not-a-cursor")
+        with pytest.raises(ValueError, match="Invalid combat log cursor"):
+            CombatService().get_combat_log_page(_make_data(), cursor="e30")
+
+    def test_cursor_round_trip(self):
+        cursor = CombatLogCursor(rank=4812, tick=19230, fingerprint="9c1f04b27d5a")
+        assert CombatLogCursor.decode(cursor.encode()) == cursor
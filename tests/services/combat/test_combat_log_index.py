@@ -0,0 +1,175 @@
+"""
+Tests for the time-sorted combat log index.
+
+Uses a synthetic combat log and checks every query against a brute-force
+scan, so no replay file is required.
+"""
+
+import random
+import time
+
+import pytest
+from python_manta import CombatLogEntry, CombatLogResult, CombatLogType
+
+from src.models.combat_log import DetailLevel
+from src.services.combat.combat_log_index import (
+    ROLE_ATTACKER,
+    ROLE_TARGET,
+    CombatLogIndex,
+    CombatLogQuery,
+    unit_key,
+)
+from src.services.combat.combat_service import CombatService
+from src.services.models.replay_data import ParsedReplayData
+
+UNITS = [
+    "npc_dota_hero_axe",
+    "npc_dota_hero_lina",
+    "npc_dota_hero_shadow_shaman",
+    "npc_dota_hero_shadow_demon",
+    "npc_dota_creep_goodguys_melee",
+    "npc_dota_neutral_kobold",
+]
+TYPES = [
+    CombatLogType.DAMAGE.value,
+    CombatLogType.DEATH.value,
+    CombatLogType.ABILITY.value,
+    CombatLogType.MODIFIER_ADD.value,
+    CombatLogType.PURCHASE.value,
+]
+
+
+def _make_entries(count: int = 3000, seed: int = 7):
+    rng = random.Random(seed)
+    entries = []
+    game_time = -60.0
+    for i in range(count):
+        game_time += rng.choice([0.0, 0.0, 0.1, 0.5, 1.0])  # Repeated times exercise tie handling
+        attacker = rng.choice(UNITS)
+        target = rng.choice(UNITS)
+        entries.append(CombatLogEntry(
+            tick=i,
+            net_tick=i,
+            type=rng.choice(TYPES),
+            type_name="",
+            game_time=game_time,
+            attacker_name=attacker,
+            target_name=target,
+            is_attacker_hero=attacker.startswith("npc_dota_hero_"),
+            is_target_hero=target.startswith("npc_dota_hero_"),
+            inflictor_name="lina_laguna_blade",
+            value=i % 500,
+        ))
+    return entries
+
+
+def _brute_force(entries, start_time=None, end_time=None, types=None, hero_filter=None, role="any"):
+    selected = []
+    for entry in entries:
+        if start_time is not None and entry.game_time < start_time:
+            continue
+        if end_time is not None and entry.game_time > end_time:
+            continue
+        if types is not None and entry.type not in types:
+            continue
+        if hero_filter:
+            needle = hero_filter.lower()
+            on_attacker = role != ROLE_TARGET and needle in unit_key(entry.attacker_name)
+            on_target = role != ROLE_ATTACKER and needle in unit_key(entry.target_name)
+            if not on_attacker and not on_target:
+                continue
+        selected.append(entry)
+    return sorted(selected, key=lambda e: e.game_time)
+
+
+class TestCombatLogIndex:
+    """Tests for index queries against a brute-force scan."""
+
+    def test_queries_match_brute_force(self):
+        entries = _make_entries()
+        index = CombatLogIndex(entries)
+
+        queries = [
+            {},
+            {"start_time": 100.0, "end_time": 110.0},
+            {"start_time": 100.0},
+            {"end_time": 0.0},
+            {"types": [CombatLogType.DEATH.value]},
+            {"types": [CombatLogType.DEATH.value, CombatLogType.DAMAGE.value], "start_time": 50.0, "end_time": 300.0},
+            {"hero_filter": "shadow"},
+            {"hero_filter": "LINA", "start_time": 10.0, "end_time": 20.0},
+            {"hero_filter": "axe", "types": [CombatLogType.ABILITY.value], "end_time": 500.0},
+            {"hero_filter": "invoker"},
+            {"start_time": 300.0, "end_time": 200.0},
+            {"hero_filter": "shadow", "role": ROLE_ATTACKER},
+            {"hero_filter": "axe", "role": ROLE_TARGET, "types": [CombatLogType.PURCHASE.value]},
+            {"hero_filter": "kobold", "role": ROLE_TARGET, "start_time": 20.0, "end_time": 400.0},
+        ]
+        for query in queries:
+            assert index.select(**query) == _brute_force(entries, **query), query
+
+    def test_query_results_are_memoised(self):
+        index = CombatLogIndex(_make_entries())
+        query = CombatLogQuery.build(types=[CombatLogType.DEATH.value], unit="Lina", role=ROLE_TARGET)
+
+        same = CombatLogQuery.build(types={CombatLogType.DEATH.value}, unit="lina", role=ROLE_TARGET)
+        assert index.run_ranks(same) is index.run_ranks(query)
+
+    def test_unknown_role_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown unit role"):
+            CombatLogQuery.build(unit="axe", role="killer")
+
+    def test_unsorted_log_is_returned_in_time_order(self):
+        entries = _make_entries(200)
+        shuffled = entries[:]
+        random.Random(1).shuffle(shuffled)
+
+        selected = CombatLogIndex(shuffled).select(start_time=0.0, end_time=50.0)
+        assert [e.game_time for e in selected] == sorted(e.game_time for e in selected)
+        assert len(selected) == len(_brute_force(entries, 0.0, 50.0))
+
+    def test_parsed_data_builds_index_once(self):
+        data = ParsedReplayData(
+            match_id=1, replay_path="/tmp/1.dem", combat_log=CombatLogResult(entries=_make_entries(100), success=True)
+        )
+        assert data.combat_index is data.combat_index
+
+        data.combat_log = CombatLogResult(entries=_make_entries(50), success=True)
+        assert len(data.combat_index) == 50
+
+    def test_window_query_is_fast(self):
+        index = CombatLogIndex(_make_entries(100_000))
+
+        started = time.perf_counter()
+        for i in range(100):  # Distinct windows, so no query is memoised
+            index.select(start_time=1000.0 + i, end_time=1010.0 + i, hero_filter="lina")
+        elapsed_ms = (time.perf_counter() - started) * 1000 / 100
+
+        assert elapsed_ms < 5.0
+
+
+class TestCombatServiceWithIndex:
+    """Tests for CombatService queries served by the index."""
+
+    def test_combat_log_filters_match_brute_force(self):
+        entries = _make_entries()
+        data = ParsedReplayData(
+            match_id=1, replay_path="/tmp/1.dem", combat_log=CombatLogResult(entries=entries, success=True)
+        )
+        events = CombatService().get_combat_log(
+            data, start_time=100.0, end_time=200.0, hero_filter="shadow_shaman", detail_level=DetailLevel.FULL
+        )
+
+        expected = _brute_force(entries, 100.0, 200.0, hero_filter="shadow_shaman")
+        assert [(e.tick, e.game_time) for e in events] == [(e.tick, e.game_time) for e in expected]
+
+    def test_purchases_match_the_buying_hero_only(self):
+        entries = _make_entries()
+        data = ParsedReplayData(
+            match_id=1, replay_path="/tmp/1.dem", combat_log=CombatLogResult(entries=entries, success=True)
+        )
+        purchases = CombatService().get_item_purchases(data, hero_filter="lina")
+
+        expected = _brute_force(entries, types=[CombatLogType.PURCHASE.value], hero_filter="lina", role=ROLE_TARGET)
+        assert [p.tick for p in purchases] == [e.tick for e in expected]
+        assert all(p.hero == "lina" for p in purchases)
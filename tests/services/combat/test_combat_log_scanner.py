@@ -0,0 +1,172 @@
+"""
+Tests for the single-pass combat log scanner.
+
+Uses a synthetic combat log and checks results from one scan against the
+per-family service getters, so no replay file is required.
+"""
+
+import random
+
+import pytest
+from python_manta import CombatLogEntry, CombatLogResult, CombatLogType
+
+from src.services.combat.combat_log_index import ROLE_TARGET, CombatLogQuery
+from src.services.combat.combat_log_scanner import CombatLogCollector, CombatLogScanner, EntryCollector, collect
+from src.services.combat.combat_service import CombatService
+from src.services.jungle.jungle_service import JungleService
+from src.services.models.replay_data import ParsedReplayData
+
+UNITS = [
+    "npc_dota_hero_axe",
+    "npc_dota_hero_lina",
+    "npc_dota_roshan",
+    "npc_dota_miniboss",
+    "npc_dota_goodguys_tower1_top",
+    "npc_dota_badguys_tower2_mid",
+    "npc_dota_badguys_melee_rax_bot",
+    "npc_dota_courier_3",
+    "npc_dota_neutral_kobold",
+]
+TYPES = [
+    CombatLogType.DEATH.value,
+    CombatLogType.DEATH.value,
+    CombatLogType.PURCHASE.value,
+    CombatLogType.PICKUP_RUNE.value,
+    CombatLogType.MODIFIER_ADD.value,
+    CombatLogType.NEUTRAL_CAMP_STACK.value,
+    CombatLogType.DAMAGE.value,
+]
+INFLICTORS = ["item_blink", "modifier_rune_haste", "modifier_rune_regen", "lina_laguna_blade"]
+
+
+def _make_data(count: int = 2000, seed: int = 11) -> ParsedReplayData:
+    rng = random.Random(seed)
+    entries = []
+    game_time = -60.0
+    for i in range(count):
+        game_time += rng.choice([0.0, 0.5, 1.0])
+        attacker = rng.choice(UNITS)
+        target = rng.choice(UNITS)
+        entries.append(CombatLogEntry(
+            tick=i,
+            net_tick=i,
+            type=rng.choice(TYPES),
+            type_name="",
+            game_time=game_time,
+            attacker_name=attacker,
+            target_name=target,
+            is_attacker_hero=attacker.startswith("npc_dota_hero_"),
+            is_target_hero=target.startswith("npc_dota_hero_"),
+            inflictor_name=rng.choice(INFLICTORS),
+            value=rng.randint(0, 6),
+            attacker_team=rng.choice([2, 3]),
+        ))
+    return ParsedReplayData(
+        match_id=1, replay_path="/tmp/1.dem", combat_log=CombatLogResult(entries=entries, success=True)
+    )
+
+
+class _TickRecorder(CombatLogCollector):
+    """Records the ticks it is visited with."""
+
+    def __init__(self, name, query):
+        self.name = name
+        self.query = query
+        self.ticks = []
+
+    def visit(self, entry):
+        self.ticks.append(entry.tick)
+
+    def result(self):
+        return self.ticks
+
+
+class TestCombatLogScanner:
+    """Tests for CombatLogScanner dispatch."""
+
+    def test_incomplete_collector_fails_on_creation(self):
+        class _NoResult(CombatLogCollector):
+            def visit(self, entry):
+                pass
+
+        with pytest.raises(TypeError):
+            _NoResult()
+
+    def test_each_collector_sees_its_query_in_time_order(self):
+        data = _make_data()
+        deaths = CombatLogQuery.build(types=[CombatLogType.DEATH.value])
+        lina_targeted = CombatLogQuery.build(unit="lina", role=ROLE_TARGET)
+
+        results = CombatLogScanner([_TickRecorder("deaths", deaths), _TickRecorder("lina", lina_targeted)]).scan(
+            data.combat_index
+        )
+
+        assert results["deaths"] == [e.tick for e in data.combat_index.run(deaths)]
+        assert results["lina"] == [e.tick for e in data.combat_index.run(lina_targeted)]
+        assert set(results["deaths"]) & set(results["lina"])  # Shared entries go to both collectors
+
+    def test_duplicate_collector_names_are_rejected(self):
+        scanner = CombatLogScanner([_TickRecorder("a", CombatLogQuery())])
+        with pytest.raises(ValueError, match="already registered"):
+            scanner.register(_TickRecorder("a", CombatLogQuery()))
+
+    def test_entry_collector_skips_none_and_sees_collected(self):
+        data = _make_data()
+        collector = EntryCollector(
+            "numbered_deaths",
+            CombatLogQuery.build(types=[CombatLogType.DEATH.value]),
+            lambda entry, collected: len(collected) if entry.is_target_hero else None,
+        )
+
+        numbers = collect(data.combat_index, collector)
+        assert numbers == list(range(len(data.get_hero_deaths())))
+
+    def test_empty_log(self):
+        data = ParsedReplayData(match_id=1, replay_path="/tmp/1.dem")
+        assert CombatService().get_event_families(data)["roshan_kills"] == []
+
+
+class TestServiceCollectors:
+    """Tests for service results gathered in one scan."""
+
+    def test_event_families_match_individual_getters(self):
+        data = _make_data()
+        service = CombatService()
+
+        families = service.get_event_families(data)
+
+        assert families["hero_deaths"] == service.get_hero_deaths(data)
+        assert families["item_purchases"] == service.get_item_purchases(data)
+        assert families["rune_pickups"] == service.get_rune_pickups(data)
+        assert families["roshan_kills"] == service.get_roshan_kills(data)
+        assert families["tormentor_kills"] == service.get_tormentor_kills(data)
+        assert families["tower_kills"] == service.get_tower_kills(data)
+        assert families["barracks_kills"] == service.get_barracks_kills(data)
+        assert families["courier_kills"] == service.get_courier_kills(data)
+        assert all(families.values())
+
+    def test_roshan_kills_are_numbered_in_order(self):
+        kills = CombatService().get_roshan_kills(_make_data())
+        assert [k.extra_info["kill_number"] for k in kills] == list(range(1, len(kills) + 1))
+
+    def test_objective_response_counts(self):
+        data = _make_data()
+        service = CombatService()
+
+        response = service.get_objective_kills_response(data, 1)
+
+        assert len(response.roshan_kills) == len(service.get_roshan_kills(data))
+        assert len(response.tower_kills) == len(service.get_tower_kills(data))
+        assert len(response.barracks_kills) == len(service.get_barracks_kills(data))
+
+    def test_jungle_stacks_combine_with_combat_collectors(self):
+        data = _make_data()
+        jungle = JungleService()
+
+        results = CombatLogScanner([
+            jungle.camp_stack_collector(hero_filter="axe"),
+            CombatService().rune_pickup_collector(hero_filter="axe"),
+        ]).scan(data.combat_index)
+
+        assert results["camp_stacks"] == jungle.get_camp_stacks(data, hero_filter="axe")
+        assert results["rune_pickups"] == CombatService().get_rune_pickups(data, hero_filter="axe")
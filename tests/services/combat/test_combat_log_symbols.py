@@ -0,0 +1,133 @@
+"""
+Tests for the interned combat log name table.
+
+Uses a synthetic combat log and checks interned lookups against the
+per-entry name handling the services used before, so no replay file is required.
+"""
+
+import random
+
+import pytest
+from python_manta import CombatLogEntry, CombatLogResult, CombatLogType
+
+from src.services.combat.combat_log_symbols import CombatLogSymbols
+from src.services.combat.combat_service import CombatService
+from src.services.combat.vectorized import numpy_available
+from src.services.models.replay_data import ParsedReplayData
+
+UNITS = ["npc_dota_hero_axe", "npc_dota_hero_Lina", "npc_dota_creep_goodguys_melee", "npc_dota_roshan", ""]
+INFLICTORS = ["", "dota_unknown", "item_bfury", "lina_laguna_blade", "axe_berserkers_call", "modifier_axe_call"]
+TYPES = [
+    CombatLogType.DAMAGE.value,
+    CombatLogType.DEATH.value,
+    CombatLogType.ABILITY.value,
+    CombatLogType.MODIFIER_ADD.value,
+]
+
+
+def _make_data(count: int = 1000, seed: int = 6) -> ParsedReplayData:
+    rng = random.Random(seed)
+    entries = []
+    game_time = -20.0
+    for i in range(count):
+        game_time += rng.choice([0.0, 0.5, 1.0])
+        attacker = rng.choice(UNITS)
+        target = rng.choice(UNITS)
+        entries.append(CombatLogEntry(
+            tick=i,
+            net_tick=i,
+            type=rng.choice(TYPES),
+            type_name="",
+            game_time=game_time,
+            attacker_name=attacker,
+            target_name=target,
+            is_attacker_hero=attacker.startswith("npc_dota_hero_"),
+            is_target_hero=target.startswith("npc_dota_hero_"),
+            inflictor_name=rng.choice(INFLICTORS),
+            value=rng.randint(0, 400),
+            attacker_hero_level=rng.randint(0, 25),
+            target_hero_level=rng.randint(0, 25),
+        ))
+    return ParsedReplayData(
+        match_id=1, replay_path="/tmp/1.dem", combat_log=CombatLogResult(entries=entries, success=True)
+    )
+
+
+class TestCombatLogSymbols:
+    """Tests for CombatLogSymbols."""
+
+    def test_interning_and_derived_names(self):
+        symbols = CombatLogSymbols()
+        axe = symbols.intern("npc_dota_hero_Axe")
+
+        assert symbols.intern("npc_dota_hero_Axe") == axe
+        assert symbols.intern(None) == symbols.intern("") == 0
+        assert (symbols.name(axe), symbols.clean(axe), symbols.key(axe)) == ("npc_dota_hero_Axe", "Axe", "axe")
+        assert symbols.id_of("npc_dota_hero_lina") is None
+        assert symbols.display(0) is None
+
+    def test_display_names_match_constants(self):
+        service = CombatService()
+        symbols = CombatLogSymbols()
+        for name in INFLICTORS[1:]:
+            assert symbols.display(symbols.intern(name)) == service._normalize_ability_name(name, False)
+
+    def test_ids_matching_uses_unit_keys(self):
+        symbols = CombatLogSymbols()
+        ids = [symbols.intern(name) for name in UNITS[:4]]
+
+        assert symbols.ids_matching("LINA") == {ids[1]}
+        assert symbols.ids_matching("hero") == frozenset()  # Prefix is not part of the key
+        assert symbols.ids_matching("an") == {ids[3]}
+        antimage = symbols.intern("npc_dota_hero_antimage")
+        assert symbols.ids_matching("an") == {ids[3], antimage}  # Memo is dropped when the table grows
+
+
+class TestIndexedSymbols:
+    """Tests for symbol ids kept by the combat log index."""
+
+    def test_index_ids_match_entries(self):
+        index = _make_data().combat_index
+        symbols = index.symbols
+
+        for rank in range(len(index)):
+            entry = index.entry(rank)
+            attacker_id, target_id, inflictor_id = index.ids(rank)
+            assert symbols.name(attacker_id) == entry.attacker_name
+            assert symbols.name(target_id) == entry.target_name
+            assert symbols.name(inflictor_id) == entry.inflictor_name
+        assert len(symbols) == len(set(UNITS) | set(INFLICTORS))
+
+    def test_combat_log_events_match_per_entry_names(self):
+        service = CombatService()
+        data = _make_data()
+
+        events = service.get_combat_log(data, ability_filter="A")
+        entries = [e for e in data.combat_index.select() if "a" in e.inflictor_name.lower()]
+
+        assert len(events) == len(entries)
+        for event, entry in zip(events, entries):
+            assert event.attacker == service._clean_hero_name(entry.attacker_name)
+            assert event.target == service._clean_hero_name(entry.target_name)
+            assert event.ability == service._normalize_ability_name(entry.inflictor_name, entry.is_attacker_hero)
+
+    @pytest.mark.skipif(not numpy_available(), reason="numpy not installed")
+    def test_arrays_share_index_symbols(self):
+        index = _make_data().combat_index
+        arrays = index.arrays()
+
+        assert arrays.symbols is index.symbols
+        assert [tuple(int(c[r]) for c in (arrays.attacker, arrays.target, arrays.inflictor)) for r in range(20)] == [
+            index.ids(r) for r in range(20)
+        ]
+
+    @pytest.mark.skipif(not numpy_available(), reason="numpy not installed")
+    def test_python_aggregation_matches_numpy(self):
+        data = _make_data()
+        windows = [(0.0, 100.0), (150.0, 400.0)]
+
+        python = CombatService(aggregation_backend="python")._aggregate_hero_combat(data, "lina", windows)
+        vectorized = CombatService(aggregation_backend="numpy")._aggregate_hero_combat(data, "lina", windows)
+
+        assert python == vectorized
+        assert python.fights[0].damage_dealt > 0
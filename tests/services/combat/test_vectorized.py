@@ -0,0 +1,138 @@
+"""
+Tests for the numpy hero combat aggregation.
+
+Runs get_hero_combat_analysis with both aggregation backends over a
+synthetic combat log and checks the responses are identical, so no replay
+file is required.
+"""
+
+import random
+
+import pytest
+from python_manta import CombatLogEntry, CombatLogResult, CombatLogType
+
+from src.services.combat.combat_service import CombatService
+from src.services.models.combat_data import Fight
+from src.services.models.replay_data import ParsedReplayData
+
+pytest.importorskip("numpy")
+
+HEROES = [
+    "npc_dota_hero_earthshaker",
+    "npc_dota_hero_lina",
+    "npc_dota_hero_shadow_shaman",
+    "npc_dota_hero_shadow_demon",
+]
+UNITS = HEROES + ["npc_dota_creep_badguys_melee", "npc_dota_neutral_kobold", "npc_dota_goodguys_tower1_mid"]
+INFLICTORS = [
+    "",
+    "dota_unknown",
+    "earthshaker_fissure",
+    "earthshaker_echo_slam",
+    "lina_light_strike_array",
+    "shadow_shaman_shackles",
+    "modifier_earthshaker_fissure_stun",
+    "modifier_lina_light_strike_array",
+    "modifier_shadow_shaman_shackles",
+    "modifier_stunned",
+]
+TYPES = [
+    CombatLogType.DAMAGE.value,
+    CombatLogType.DAMAGE.value,
+    CombatLogType.DEATH.value,
+    CombatLogType.ABILITY.value,
+    CombatLogType.MODIFIER_ADD.value,
+    CombatLogType.HEAL.value,
+]
+
+
+def _make_data(count: int = 4000, seed: int = 3) -> ParsedReplayData:
+    rng = random.Random(seed)
+    entries = []
+    game_time = -30.0
+    for i in range(count):
+        game_time += rng.choice([0.0, 0.1, 0.3, 1.0])
+        attacker = rng.choice(UNITS)
+        target = rng.choice(UNITS)
+        entries.append(CombatLogEntry(
+            tick=i,
+            net_tick=i,
+            type=rng.choice(TYPES),
+            type_name="",
+            game_time=game_time,
+            attacker_name=attacker,
+            target_name=target,
+            is_attacker_hero=attacker in HEROES,
+            is_target_hero=target in HEROES,
+            inflictor_name=rng.choice(INFLICTORS),
+            value=rng.choice([0, 35, 120, 400]),
+            attacker_hero_level=rng.choice([0, 6, 11, 18]),
+            target_hero_level=rng.choice([0, 5, 12, 18]),
+        ))
+    return ParsedReplayData(
+        match_id=1, replay_path="/tmp/1.dem", combat_log=CombatLogResult(entries=entries, success=True)
+    )
+
+
+def _make_fights(count: int = 12, seed: int = 5):
+    rng = random.Random(seed)
+    fights = []
+    for i in range(count):
+        start = rng.uniform(0.0, 1200.0)
+        end = start + rng.uniform(0.0, 40.0)
+        participants = rng.sample(["earthshaker", "lina", "shadow_shaman", "shadow_demon"], 2)
+        fights.append(Fight(
+            fight_id=f"fight_{i}",
+            start_time=start,
+            start_time_str="",
+            end_time=end,
+            end_time_str="",
+            duration=end - start,
+            participants=participants,
+        ))
+    return sorted(fights, key=lambda f: f.start_time)
+
+
+class TestVectorizedHeroCombat:
+    """Tests for numpy vs row-by-row get_hero_combat_analysis."""
+
+    @pytest.mark.parametrize("hero", ["earthshaker", "Lina", "shadow"])
+    @pytest.mark.parametrize("ability_filter", [None, "fissure", "SHACKLES"])
+    def test_backends_give_identical_results(self, hero, ability_filter):
+        data = _make_data()
+        fights = _make_fights()
+
+        expected = CombatService(aggregation_backend="python").get_hero_combat_analysis(
+            data, 1, hero, fights, ability_filter
+        )
+        actual = CombatService(aggregation_backend="numpy").get_hero_combat_analysis(
+            data, 1, hero, fights, ability_filter
+        )
+
+        assert actual == expected
+        assert expected.total_fights > 0
+
+    def test_synthetic_log_exercises_every_stat(self):
+        response = CombatService(aggregation_backend="numpy").get_hero_combat_analysis(
+            _make_data(), 1, "earthshaker", _make_fights()
+        )
+
+        assert response.total_kills and response.total_deaths and response.total_assists
+        assert response.avg_kill_level_advantage is not None
+        assert any(f.damage_dealt and f.damage_received for f in response.fights)
+        assert any(a.hero_hits > a.total_casts / 2 for a in response.ability_summary)
+
+    def test_no_fights_or_events(self):
+        empty = ParsedReplayData(match_id=1, replay_path="/tmp/1.dem")
+        response = CombatService(aggregation_backend="numpy").get_hero_combat_analysis(empty, 1, "lina", [])
+
+        assert response.total_fights == 0
+        assert response.ability_summary == []
+
+    def test_unknown_backend_is_rejected(self):
+        with pytest.raises(ValueError, match="Unknown aggregation backend"):
+            CombatService(aggregation_backend="gpu")
+
+    def test_backend_from_environment(self, monkeypatch):
+        monkeypatch.setenv("DOTA_COMBAT_BACKEND", "python")
+        assert CombatService()._aggregation_backend == "python"
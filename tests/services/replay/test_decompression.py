@@ -0,0 +1,199 @@
+"""
+Tests for streaming and block-parallel bz2 decompression of replays.
+
+Uses synthetic compressed data and a local HTTP server so no network or
+replay file is required.
+"""
+
+import bz2
+import io
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.services.cache.replay_cache import ReplayCache
+from src.services.replay import replay_service as replay_service_module
+from src.services.replay.decompression import (
+    StreamingBz2Writer,
+    decompress_bz2_parallel,
+    find_bz2_blocks,
+    scan_bz2_blocks,
+)
+from src.services.replay.replay_service import ReplayService
+
+PAYLOAD = bytes(range(256)) * 4096  # 1 MB
+# Incompressible enough that level 1 (100k blocks) yields several blocks
+MULTI_BLOCK_PAYLOAD = random.Random(0).randbytes(250_000) + b"abc" * 100_000
+
+
+def _feed_in_chunks(writer: StreamingBz2Writer, data: bytes, chunk_size: int = 4096) -> None:
+    for i in range(0, len(data), chunk_size):
+        writer.feed(data[i: i + chunk_size])
+
+
+class TestStreamingBz2Writer:
+    """Tests for incremental decompression into the output file."""
+
+    def test_chunked_stream_round_trips(self, tmp_path):
+        writer = StreamingBz2Writer(tmp_path / "1.dem", min_size=0)
+        _feed_in_chunks(writer, bz2.compress(PAYLOAD))
+
+        result = writer.finish()
+        assert result == tmp_path / "1.dem"
+        assert result.read_bytes() == PAYLOAD
+        assert not (tmp_path / "1.dem.part").exists()
+
+    def test_multi_stream_file(self, tmp_path):
+        writer = StreamingBz2Writer(tmp_path / "1.dem", min_size=0)
+        _feed_in_chunks(writer, bz2.compress(PAYLOAD[:1000]) + bz2.compress(PAYLOAD[1000:]))
+
+        assert writer.finish().read_bytes() == PAYLOAD
+
+    def test_truncated_stream_is_rejected(self, tmp_path):
+        writer = StreamingBz2Writer(tmp_path / "1.dem", min_size=0)
+        compressed = bz2.compress(PAYLOAD)
+        writer.feed(compressed[: len(compressed) // 2])
+
+        assert writer.finish() is None
+        assert not (tmp_path / "1.dem").exists()
+        assert not (tmp_path / "1.dem.part").exists()
+
+    def test_output_below_minimum_size_is_rejected(self, tmp_path):
+        writer = StreamingBz2Writer(tmp_path / "1.dem", min_size=len(PAYLOAD) + 1)
+        writer.feed(bz2.compress(PAYLOAD))
+
+        assert writer.finish() is None
+        assert not (tmp_path / "1.dem").exists()
+
+    def test_invalid_data_raises(self, tmp_path):
+        writer = StreamingBz2Writer(tmp_path / "1.dem", min_size=0)
+        with pytest.raises(OSError):
+            writer.feed(b"not bz2 data at all")
+        writer.abort()
+        assert not (tmp_path / "1.dem.part").exists()
+
+
+class TestStreamingDownload:
+    """Tests for ReplayService downloading straight into the decompressor."""
+
+    @pytest.fixture
+    async def server(self):
+        compressed = bz2.compress(PAYLOAD)
+
+        async def replay(request):
+            return web.Response(body=compressed)
+
+        async def expired(request):
+            return web.Response(status=404)
+
+        app = web.Application()
+        app.router.add_get("/1.dem.bz2", replay)
+        app.router.add_get("/2.dem.bz2", expired)
+        async with TestServer(app) as server:
+            yield server
+
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.services.replay.decompression.MIN_REPLAY_SIZE", 0)
+        service = ReplayService(cache=ReplayCache(cache_dir=tmp_path / "cache"), replay_dir=tmp_path / "replays")
+        yield service
+        service.close()
+
+    async def test_download_writes_dem_without_bz2_file(self, server, service):
+        dem_file = service._replay_dir / "1.dem"
+        messages = []
+
+        async def progress(current, total, message):
+            messages.append(message)
+
+        result = await service._download_streaming(1, str(server.make_url("/1.dem.bz2")), dem_file, progress)
+
+        assert result == dem_file
+        assert dem_file.read_bytes() == PAYLOAD
+        assert list(service._replay_dir.glob("*.bz2")) == []
+        assert messages[-1].startswith("Downloading and extracting...")
+
+    async def test_expired_replay_leaves_nothing_behind(self, server, service):
+        dem_file = service._replay_dir / "2.dem"
+
+        result = await service._download_streaming(2, str(server.make_url("/2.dem.bz2")), dem_file)
+
+        assert result is None
+        assert list(service._replay_dir.iterdir()) == []
+
+
+class TestParallelBz2:
+    """Tests for block-parallel bz2 decompression."""
+
+    def test_finds_every_block(self):
+        compressed = bz2.compress(MULTI_BLOCK_PAYLOAD, 1)
+        blocks = find_bz2_blocks(compressed)
+        assert len(blocks) > 1
+        assert blocks[0][0] == 32  # Straight after the "BZh1" header
+        assert all(end <= next_start for (_, end), (next_start, _) in zip(blocks, blocks[1:]))
+
+    @pytest.mark.parametrize("chunk_size", [7, 1000, 1 << 20])
+    def test_chunked_scan_matches_whole_file(self, chunk_size):
+        compressed = bz2.compress(MULTI_BLOCK_PAYLOAD, 1) + bz2.compress(PAYLOAD, 1)
+
+        blocks = scan_bz2_blocks(io.BytesIO(compressed), chunk_size=chunk_size)
+
+        assert blocks == find_bz2_blocks(compressed)
+
+    @pytest.mark.parametrize("level", [1, 9])
+    def test_round_trip_including_multi_stream(self, tmp_path, level):
+        source = tmp_path / "1.dem.bz2"
+        source.write_bytes(bz2.compress(MULTI_BLOCK_PAYLOAD, level) + bz2.compress(PAYLOAD, level))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            written = decompress_bz2_parallel(source, tmp_path / "1.dem", pool, workers=2)
+
+        assert (tmp_path / "1.dem").read_bytes() == MULTI_BLOCK_PAYLOAD + PAYLOAD
+        assert written == len(MULTI_BLOCK_PAYLOAD) + len(PAYLOAD)
+
+    def test_corrupt_block_raises(self, tmp_path):
+        compressed = bytearray(bz2.compress(MULTI_BLOCK_PAYLOAD, 1))
+        compressed[len(compressed) // 2] ^= 0xFF
+        source = tmp_path / "1.dem.bz2"
+        source.write_bytes(bytes(compressed))
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            with pytest.raises(OSError):
+                decompress_bz2_parallel(source, tmp_path / "1.dem", pool, workers=2)
+
+
+class TestExtractBz2Parallel:
+    """Tests for ReplayService choosing parallel extraction and falling back."""
+
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(replay_service_module, "MIN_REPLAY_SIZE", 0)
+        monkeypatch.setattr(replay_service_module, "PARALLEL_EXTRACT_MIN_SIZE", 0)
+        service = ReplayService(cache=ReplayCache(cache_dir=tmp_path / "cache"), replay_dir=tmp_path / "replays")
+        service._decompress_workers = 2
+        service._decompress_pool = ThreadPoolExecutor(max_workers=2)
+        yield service
+        service.close()
+
+    async def test_parallel_extraction(self, tmp_path, service):
+        source = tmp_path / "1.dem.bz2"
+        source.write_bytes(bz2.compress(MULTI_BLOCK_PAYLOAD, 1))
+
+        extracted = await service._extract_bz2(source, tmp_path / "1.dem")
+
+        assert extracted.read_bytes() == MULTI_BLOCK_PAYLOAD
+
+    async def test_falls_back_to_sequential_on_failure(self, tmp_path, service, monkeypatch):
+        def broken(*args):
+            raise OSError("Invalid data stream")
+
+        monkeypatch.setattr(replay_service_module, "decompress_bz2_parallel", broken)
+        source = tmp_path / "1.dem.bz2"
+        source.write_bytes(bz2.compress(MULTI_BLOCK_PAYLOAD, 1))
+
+        extracted = await service._extract_bz2(source, tmp_path / "1.dem")
+
+        assert extracted.read_bytes() == MULTI_BLOCK_PAYLOAD
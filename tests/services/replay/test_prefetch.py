@@ -0,0 +1,136 @@
+"""
+Tests for batch prefetch and the resumable prefetch manifest.
+
+Download and parse steps are replaced with fakes so no network or replay
+file is required.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services.cache.replay_cache import ReplayCache
+from src.services.models.replay_data import ALL_COLLECTORS, ParsedReplayData
+from src.services.replay.prefetch import STATUS_DONE, STATUS_FAILED, PrefetchManifest
+from src.services.replay.replay_service import ReplayService
+
+
+@pytest.fixture
+def replay_service(tmp_path):
+    service = ReplayService(cache=ReplayCache(cache_dir=tmp_path / "cache"), replay_dir=tmp_path / "replays")
+    state = {"downloads": [], "parses": [], "active_downloads": 0, "max_downloads": 0, "fail": {}}
+
+    async def fake_download(match_id, progress=None, wait_timeout=3600.0):
+        path = service._replay_dir / f"{match_id}.dem"
+        if path.exists():
+            return path
+        state["downloads"].append(match_id)
+        state["active_downloads"] += 1
+        state["max_downloads"] = max(state["max_downloads"], state["active_downloads"])
+        await asyncio.sleep(0.01)
+        state["active_downloads"] -= 1
+        if state["fail"].get(match_id, 0) > 0:
+            state["fail"][match_id] -= 1
+            return None
+        path.write_bytes(b"dem")
+        return path
+
+    async def fake_parse(match_id, replay_path, progress=None, collectors=ALL_COLLECTORS):
+        state["parses"].append(match_id)
+        return ParsedReplayData(match_id=match_id, replay_path=str(replay_path), collectors=collectors)
+
+    service._download_replay = fake_download
+    service._parse_replay = fake_parse
+    service.state = state
+    yield service
+    service.close()
+
+
+class TestPrefetch:
+    """Tests for ReplayService.prefetch."""
+
+    async def test_prefetches_and_caches_all_matches(self, replay_service):
+        summary = await replay_service.prefetch([1, 2, 3, 2])
+
+        assert sorted(summary.completed) == [1, 2, 3]
+        assert summary.failed == {}
+        assert all(replay_service.is_cached(match_id) for match_id in (1, 2, 3))
+        assert sorted(replay_service.state["parses"]) == [1, 2, 3]
+
+    async def test_download_concurrency_is_bounded(self, replay_service):
+        await replay_service.prefetch(range(10), download_concurrency=2)
+        assert replay_service.state["max_downloads"] == 2
+
+    async def test_retries_with_backoff_then_succeeds(self, replay_service):
+        replay_service.state["fail"][7] = 2
+
+        summary = await replay_service.prefetch([7], max_attempts=3, retry_delay=0.001)
+
+        assert summary.completed == [7]
+        assert replay_service.state["downloads"] == [7, 7, 7]
+
+    async def test_gives_up_after_max_attempts(self, replay_service, tmp_path):
+        replay_service.state["fail"][7] = 5
+        manifest = PrefetchManifest(tmp_path / "manifest.json")
+
+        summary = await replay_service.prefetch([7], max_attempts=2, retry_delay=0.001, manifest=manifest)
+
+        assert "Could not download" in summary.failed[7]
+        assert manifest.attempts(7) == 2
+        assert manifest.get_stats() == {STATUS_FAILED: 1}
+
+    async def test_resumes_from_manifest(self, replay_service, tmp_path):
+        path = tmp_path / "manifest.json"
+        await replay_service.prefetch([1, 2], manifest=PrefetchManifest(path))
+
+        summary = await replay_service.prefetch([1, 2, 3], manifest=PrefetchManifest(path))
+
+        assert sorted(summary.skipped) == [1, 2]
+        assert summary.completed == [3]
+        assert replay_service.state["parses"].count(1) == 1
+
+    async def test_evicted_matches_are_fetched_again(self, replay_service, tmp_path):
+        manifest = PrefetchManifest(tmp_path / "manifest.json")
+        await replay_service.prefetch([1, 2], manifest=manifest)
+        replay_service._cache.clear_all()
+
+        summary = await replay_service.prefetch([1, 2], manifest=manifest)
+
+        assert sorted(summary.completed) == [1, 2]
+        assert replay_service.is_cached(1, "full")
+        assert replay_service.state["parses"].count(1) == 2
+
+    async def test_already_cached_matches_are_skipped(self, replay_service):
+        await replay_service.get_parsed_data(5)
+
+        summary = await replay_service.prefetch([5])
+
+        assert summary.skipped == [5]
+        assert replay_service.state["downloads"] == [5]
+
+    async def test_draft_prefetch_does_not_count_as_full(self, replay_service, tmp_path):
+        manifest = PrefetchManifest(tmp_path / "manifest.json")
+        await replay_service.prefetch([1], manifest=manifest, profile="draft")
+
+        summary = await replay_service.prefetch([1], manifest=manifest, profile="full")
+
+        assert summary.completed == [1]
+        assert manifest.is_done(1, "full")
+
+
+class TestPrefetchManifest:
+    """Tests for the on-disk manifest."""
+
+    def test_round_trips_through_disk(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        PrefetchManifest(path).record(1, STATUS_DONE, attempts=1)
+
+        manifest = PrefetchManifest(path)
+        assert manifest.is_done(1)
+        assert not manifest.is_done(2)
+        assert manifest.attempts(1) == 1
+
+    def test_corrupt_manifest_starts_empty(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text("{not json")
+        assert PrefetchManifest(path).get_stats() == {}
@@ -0,0 +1,242 @@
+"""
+Tests for ReplayService load orchestration.
+
+Download and parse steps are replaced with fakes so no network or replay
+file is required.
+"""
+
+import asyncio
+import bz2
+import threading
+
+import pytest
+
+from src.services.cache.replay_cache import ReplayCache
+from src.services.models.replay_data import ALL_COLLECTORS, PARSE_PROFILES, ParsedReplayData
+from src.services.replay import replay_service as replay_service_module
+from src.services.replay.replay_service import ReplayService
+
+
+@pytest.fixture
+def replay_service(tmp_path):
+    service = ReplayService(cache=ReplayCache(cache_dir=tmp_path / "cache"), replay_dir=tmp_path / "replays")
+    calls = {"download": 0, "parse": 0}
+
+    async def fake_download(match_id, progress=None):
+        path = service._replay_dir / f"{match_id}.dem"
+        if path.exists():
+            return path
+        calls["download"] += 1
+        await asyncio.sleep(0.05)
+        if progress:
+            await progress(30, 100, "Downloading...")
+        path.write_bytes(b"dem")
+        return path
+
+    async def fake_parse(match_id, replay_path, progress=None, collectors=ALL_COLLECTORS):
+        calls["parse"] += 1
+        parsed.append(collectors)
+        return ParsedReplayData(match_id=match_id, replay_path=str(replay_path), collectors=collectors)
+
+    parsed = []
+    service._download_replay = fake_download
+    service._parse_replay = fake_parse
+    service.calls = calls
+    service.parsed_collectors = parsed
+    return service
+
+
+class TestSingleFlight:
+    """Concurrent get_parsed_data calls for one match share a single load."""
+
+    async def test_concurrent_calls_download_and_parse_once(self, replay_service):
+        results = await asyncio.gather(*[replay_service.get_parsed_data(123) for _ in range(3)])
+
+        assert replay_service.calls == {"download": 1, "parse": 1}
+        assert all(r is results[0] for r in results)
+
+    async def test_different_matches_load_independently(self, replay_service):
+        first, second = await asyncio.gather(
+            replay_service.get_parsed_data(1), replay_service.get_parsed_data(2)
+        )
+
+        assert replay_service.calls == {"download": 2, "parse": 2}
+        assert (first.match_id, second.match_id) == (1, 2)
+
+    async def test_waiters_share_progress_stream(self, replay_service):
+        seen = {"a": [], "b": []}
+
+        def recorder(name):
+            async def progress(current, total, message):
+                seen[name].append(message)
+            return progress
+
+        await asyncio.gather(
+            replay_service.get_parsed_data(123, progress=recorder("a")),
+            replay_service.get_parsed_data(123, progress=recorder("b")),
+        )
+
+        assert "Downloading..." in seen["a"]
+        assert "Downloading..." in seen["b"]
+        assert seen["b"][-1] == "Complete"
+
+    async def test_registry_cleared_after_completion(self, replay_service):
+        await replay_service.get_parsed_data(123)
+        assert replay_service._in_flight == {}
+
+        # Second call is served from cache without another load
+        await replay_service.get_parsed_data(123)
+        assert replay_service.calls == {"download": 1, "parse": 1}
+
+    async def test_failure_propagates_to_all_waiters(self, replay_service):
+        async def failing_download(match_id, progress=None):
+            await asyncio.sleep(0.01)
+            return None
+
+        replay_service._download_replay = failing_download
+
+        results = await asyncio.gather(
+            replay_service.get_parsed_data(123),
+            replay_service.get_parsed_data(123),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert replay_service._in_flight == {}
+
+    async def test_cancelled_waiter_does_not_cancel_shared_load(self, replay_service):
+        first = asyncio.create_task(replay_service.get_parsed_data(123))
+        second = asyncio.create_task(replay_service.get_parsed_data(123))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        data = await second
+        assert data.match_id == 123
+        assert replay_service.calls["parse"] == 1
+
+
+class TestParseProfiles:
+    """Cheap profiles parse only their collectors; the rest is filled in on demand."""
+
+    async def test_draft_profile_parses_only_draft_collectors(self, replay_service):
+        data = await replay_service.get_parsed_data(123, profile="draft")
+
+        assert replay_service.parsed_collectors == [PARSE_PROFILES["draft"]]
+        assert data.collectors == PARSE_PROFILES["draft"]
+
+    async def test_cached_profile_is_reused_for_narrower_request(self, replay_service):
+        await replay_service.get_parsed_data(123, profile="combat")
+        await replay_service.get_parsed_data(123, profile="draft")
+
+        assert replay_service.calls["parse"] == 1
+
+    async def test_missing_collectors_are_parsed_and_merged(self, replay_service):
+        await replay_service.get_parsed_data(123, profile="draft")
+        data = await replay_service.get_parsed_data(123, profile="full")
+
+        assert replay_service.parsed_collectors[1] == ALL_COLLECTORS - PARSE_PROFILES["draft"]
+        assert data.collectors == ALL_COLLECTORS
+        assert replay_service.calls["download"] == 1
+        assert replay_service.is_cached(123, profile="full")
+
+    async def test_waiter_needing_more_collectors_loads_the_rest(self, replay_service):
+        draft, full = await asyncio.gather(
+            replay_service.get_parsed_data(123, profile="draft"),
+            replay_service.get_parsed_data(123, profile="full"),
+        )
+
+        assert draft.has_collectors(PARSE_PROFILES["draft"])
+        assert full.collectors == ALL_COLLECTORS
+
+    async def test_dense_profile_adds_only_trajectories(self, replay_service):
+        await replay_service.get_parsed_data(123, profile="full")
+        data = await replay_service.get_parsed_data(123, profile="dense")
+
+        assert replay_service.parsed_collectors[1] == frozenset({"trajectories"})
+        assert data.collectors == PARSE_PROFILES["dense"]
+        await replay_service.get_parsed_data(123, profile="full")
+        assert replay_service.calls["parse"] == 2
+
+    async def test_unknown_profile_is_rejected(self, replay_service):
+        with pytest.raises(ValueError, match="Unknown parse profile"):
+            await replay_service.get_parsed_data(123, profile="everything")
+
+
+class TestWorkerPool:
+    """Blocking parse and extraction steps run off the event loop."""
+
+    async def test_event_loop_stays_responsive_during_blocking_job(self, tmp_path):
+        service = ReplayService(cache=ReplayCache(cache_dir=tmp_path / "cache"), replay_dir=tmp_path / "replays")
+        release = threading.Event()
+        ticks = []
+
+        async def ticker():
+            while not release.is_set():
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        job = asyncio.create_task(service._run_blocking(release.wait, 5))
+        tick_task = asyncio.create_task(ticker())
+        await asyncio.sleep(0.1)
+        release.set()
+
+        assert await job is True
+        await tick_task
+        assert len(ticks) > 1
+        service.close()
+
+    async def test_cache_reads_and_writes_run_off_the_event_loop(self, replay_service):
+        cache = replay_service._cache
+        threads = []
+
+        def recording(method):
+            def call(*args):
+                threads.append(threading.current_thread())
+                return method(*args)
+            return call
+
+        cache.get = recording(cache.get)
+        cache.set = recording(cache.set)
+        await replay_service.get_parsed_data(123)
+
+        assert len(threads) == 3  # Cache miss, merge check, store
+        assert threading.current_thread() not in threads
+
+    async def test_heartbeat_progress_while_job_runs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(replay_service_module, "PROGRESS_HEARTBEAT_SECONDS", 0.02)
+        service = ReplayService(cache=ReplayCache(cache_dir=tmp_path / "cache"), replay_dir=tmp_path / "replays")
+        messages = []
+
+        async def progress(current, total, message):
+            messages.append((current, message))
+
+        release = threading.Event()
+        job = asyncio.create_task(
+            service._run_blocking(release.wait, 5, progress=progress, percent=50, message="Parsing replay...")
+        )
+        await asyncio.sleep(0.1)
+        release.set()
+        await job
+
+        assert messages
+        assert all(current == 50 and message.startswith("Parsing replay...") for current, message in messages)
+        service.close()
+
+    async def test_job_exception_propagates(self, tmp_path):
+        service = ReplayService(cache=ReplayCache(cache_dir=tmp_path / "cache"), replay_dir=tmp_path / "replays")
+
+        def boom():
+            raise ValueError("bad replay")
+
+        with pytest.raises(ValueError, match="bad replay"):
+            await service._run_blocking(boom)
+        service.close()
+
+    async def test_extract_bz2_rejects_truncated_replay(self, tmp_path):
+        service = ReplayService(cache=ReplayCache(cache_dir=tmp_path / "cache"), replay_dir=tmp_path / "replays")
+        source = tmp_path / "1.dem.bz2"
+        source.write_bytes(bz2.compress(b"PBDEMS2" * 1000))
+
+        assert await service._extract_bz2(source, tmp_path / "1.dem") is None
+        assert not (tmp_path / "1.dem").exists()
+        service.close()
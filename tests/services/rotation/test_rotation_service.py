@@ -1,11 +1,17 @@
 """
 Tests for RotationService using real match data.
 
-All tests verify actual rotation detection results from test matches.
+All tests verify actual rotation detection results from test matches,
+except the window lookups, which are checked on synthetic events.
 """
 
+import random
+
 import pytest
 
+from src.models.combat_log import HeroDeath
+from src.services.analyzers.interval_index import IntervalIndex, TimeIndex
+from src.services.models.combat_data import Fight, RunePickup
 from src.services.rotation.rotation_service import (
     DEFAULT_LANE_BOUNDARIES,
     MIN_ROTATION_DURATION,
@@ -13,8 +19,10 @@ from src.services.rotation.rotation_service import (
     POWER_RUNE_INTERVAL,
     ROTATION_CORRELATION_WINDOW,
     WISDOM_FIGHT_RADIUS,
+    WISDOM_RUNE_DIRE,
     WISDOM_RUNE_FIRST_SPAWN,
     WISDOM_RUNE_INTERVAL,
+    WISDOM_RUNE_RADIANT,
     RotationService,
 )
 
@@ -242,3 +250,72 @@ class TestUtilityFunctions:
     def test_classify_lane_bot(self, rotation_service):
         """Bottom-right area classifies as bot lane."""
         assert rotation_service._classify_lane(4000, -5000) == "bot"
+
+
+class TestWindowLookups:
+    """Tests for the time-indexed rotation lookups, against linear scans over synthetic events."""
+
+    @staticmethod
+    def _events(seed=12):
+        rng = random.Random(seed)
+        heroes = ["axe", "lina", "pudge", "mirana"]
+        deaths = [
+            HeroDeath(
+                game_time=t, game_time_str="", killer=rng.choice(heroes), victim=rng.choice(heroes),
+                killer_is_hero=True, position_x=rng.uniform(-7000, 7000), position_y=rng.uniform(-2000, 2000),
+            )
+            for t in sorted(rng.uniform(0, 1800) for _ in range(150))
+        ]
+        fights = [
+            Fight(
+                fight_id=f"fight_{i + 1}", start_time=d.game_time - 5, start_time_str="",
+                end_time=d.game_time + 5, end_time_str="", duration=10.0,
+                deaths=[d], participants=sorted({d.killer, d.victim}),
+            )
+            for i, d in enumerate(deaths[::3])
+        ]
+        pickups = [
+            RunePickup(game_time=t, game_time_str="", tick=0, hero=rng.choice(heroes), rune_type="haste")
+            for t in sorted(rng.uniform(300, 1800) for _ in range(40))
+        ]
+        return deaths, fights, pickups
+
+    def test_fight_outcome_matches_linear_scan(self, rotation_service):
+        deaths, fights, _ = self._events()
+        fight_windows = IntervalIndex(fights, lambda f: f.start_time, lambda f: f.end_time)
+        death_times = TimeIndex(deaths, lambda d: d.game_time)
+
+        for rotation_time in range(0, 1800, 45):
+            for hero in ("axe", "mirana"):
+                outcome = rotation_service._find_fight_outcome(
+                    fight_windows, death_times, hero, rotation_time, "mid"
+                )
+                window_end = rotation_time + ROTATION_CORRELATION_WINDOW
+                in_window = [d for d in deaths if rotation_time <= d.game_time <= window_end]
+                fight_ids = [
+                    f.fight_id for f in fights
+                    if f.start_time <= window_end and f.end_time >= rotation_time and hero in f.participants
+                ]
+                assert outcome.deaths_in_window == len(in_window)
+                assert outcome.kills_by_rotation_hero == [d.victim for d in in_window if hero in d.killer]
+                if in_window:
+                    assert outcome.fight_id == (fight_ids[0] if fight_ids else None)
+
+    def test_rune_events_match_linear_scan(self, rotation_service):
+        deaths, fights, pickups = self._events()
+
+        power = rotation_service._build_power_rune_events(TimeIndex(pickups, lambda p: p.game_time), [], 0, 30)
+        for event in power:
+            near = [p for p in pickups if abs(p.game_time - event.spawn_time) <= 30]
+            assert event.pickup_time == (near[0].game_time if near else None)
+
+        wisdom = rotation_service._build_wisdom_rune_events(
+            TimeIndex(deaths, lambda d: d.game_time), TimeIndex(fights, lambda f: f.start_time), 0, 30
+        )
+        for event in wisdom:
+            near = [d for d in deaths if abs(d.game_time - event.spawn_time) <= 60]
+            rune = WISDOM_RUNE_RADIANT if event.location == "radiant_jungle" else WISDOM_RUNE_DIRE
+            nearby = [
+                d for d in near if rotation_service._distance((d.position_x, d.position_y), rune) <= WISDOM_FIGHT_RADIUS
+            ]
+            assert event.deaths_nearby == len(nearby)
@@ -0,0 +1,84 @@
+"""
+Tests for the entity checkpoint index.
+
+Uses synthetic entity snapshots, so no replay file is required.
+"""
+
+from python_manta import EntityParseResult, EntitySnapshot, Team
+from python_manta.manta_python import EntityStateSnapshot, HeroSnapshot
+
+from src.services.models.replay_data import ParsedReplayData
+from src.services.seek.checkpoint_index import CHECKPOINT_INTERVAL_TICKS, CheckpointIndex
+from src.services.seek.parser_pool import ParserPool
+from src.services.seek.seek_service import SeekService
+
+
+def _make_data(count: int = 10) -> ParsedReplayData:
+    snapshots = [
+        EntitySnapshot(
+            tick=i * CHECKPOINT_INTERVAL_TICKS,
+            game_time=i * 30.0,
+            heroes=[HeroSnapshot(hero_name="npc_dota_hero_axe", team=Team.RADIANT.value, x=float(i), y=0.0)],
+        )
+        for i in range(count)
+    ]
+    return ParsedReplayData(match_id=1, replay_path="/tmp/1.dem", entities=EntityParseResult(snapshots=snapshots))
+
+
+class _SeekCountingParser:
+    """Counts seeks; every seek returns an empty state at the tick."""
+
+    seeks = 0
+
+    def __init__(self, replay_path):
+        pass
+
+    def snapshot(self, tick, include_illusions=False):
+        _SeekCountingParser.seeks += 1
+        return EntityStateSnapshot(tick=tick, game_time=tick / 30)
+
+
+class TestCheckpointIndex:
+    """Tests for CheckpointIndex lookups."""
+
+    def test_nearest_checkpoint_within_tolerance(self):
+        index = _make_data().checkpoint_index
+
+        assert index.checkpoint_at(1800).tick == 1800
+        assert index.checkpoint_at(1801) is None
+        assert index.checkpoint_at(1801, tolerance_ticks=1).tick == 1800
+        assert index.checkpoint_at(2690, tolerance_ticks=450).tick == 2700
+        assert index.checkpoint_at(2250, tolerance_ticks=450).tick == 1800
+        assert index.checkpoint_at(-5, tolerance_ticks=4) is None
+        assert index.checkpoint_at(-5, tolerance_ticks=5).tick == 0
+
+    def test_built_once_per_data(self):
+        data = _make_data()
+        index = data.checkpoint_index
+
+        assert data.checkpoint_index is index
+        data.entities = EntityParseResult(snapshots=[])
+        assert data.checkpoint_index is not index
+
+    def test_without_checkpoints(self):
+        assert CheckpointIndex([]).checkpoint_at(100, tolerance_ticks=10**9) is None
+
+
+class TestSeekFromCheckpoints:
+    """Tests for SeekService seeks served from checkpoints."""
+
+    def test_checkpoint_served_without_decoding(self):
+        _SeekCountingParser.seeks = 0
+        service = SeekService(parser_pool=ParserPool(parser_factory=_SeekCountingParser))
+        data = _make_data()
+
+        late = service.get_snapshot_at_time(data.replay_path, 270.0, checkpoints=data.checkpoint_index)
+        assert (late.tick, late.heroes[0].x, _SeekCountingParser.seeks) == (8100, 9.0, 0)
+
+        near = service.get_snapshot_at_time(
+            data.replay_path, 275.0, checkpoints=data.checkpoint_index, tolerance_seconds=5
+        )
+        assert (near.tick, _SeekCountingParser.seeks) == (8100, 0)
+
+        exact = service.get_snapshot_at_time(data.replay_path, 275.0, checkpoints=data.checkpoint_index)
+        assert (exact.tick, _SeekCountingParser.seeks) == (8250, 1)
@@ -0,0 +1,135 @@
+"""
+Tests for pooled parser sessions and multi-tick snapshots.
+
+Uses an in-memory parser that serves synthetic hero states and counts how
+often it is opened and asked to decode, so no replay file is required.
+"""
+
+import pytest
+from python_manta import Team
+from python_manta.manta_python import EntityParseResult, EntitySnapshot, EntityStateSnapshot, HeroSnapshot
+
+from src.services.seek.parser_pool import ParserPool
+from src.services.seek.seek_service import TICKS_PER_SECOND, SeekService
+
+HEROES = [("npc_dota_hero_axe", Team.RADIANT.value), ("npc_dota_hero_lina", Team.DIRE.value)]
+
+
+def _heroes(tick: int):
+    heroes = [
+        HeroSnapshot(hero_name=name, team=team, player_id=i, x=float(tick + i), y=float(-tick), health=100)
+        for i, (name, team) in enumerate(HEROES)
+    ]
+    heroes.append(HeroSnapshot(hero_name="npc_dota_hero_axe", team=Team.RADIANT.value, is_illusion=True))
+    return heroes
+
+
+class _ParseResult:
+    def __init__(self, entities):
+        self.entities = entities
+
+
+class _FakeParser:
+    """Serves hero states at any tick; counts opens, seeks and forward decodes."""
+
+    opened = 0
+
+    def __init__(self, replay_path):
+        _FakeParser.opened += 1
+        self.replay_path = replay_path
+        self.seeks = 0
+        self.decodes = []
+
+    def snapshot(self, tick, include_illusions=False):
+        self.seeks += 1
+        return EntityStateSnapshot(tick=tick, game_time=tick / TICKS_PER_SECOND, heroes=_heroes(tick))
+
+    def parse(self, entities=None):
+        self.decodes.append(list(entities["target_ticks"]))
+        snapshots = [
+            EntitySnapshot(tick=t, game_time=t / TICKS_PER_SECOND, heroes=_heroes(t))
+            for t in reversed(entities["target_ticks"])
+        ]
+        return _ParseResult(EntityParseResult(snapshots=snapshots, snapshot_count=len(snapshots)))
+
+
+@pytest.fixture
+def pool():
+    _FakeParser.opened = 0
+    return ParserPool(max_sessions=2, parser_factory=_FakeParser)
+
+
+class TestParserPool:
+    """Tests for ParserPool and ReplaySession."""
+
+    def test_sessions_reused_per_replay(self, pool):
+        first = pool.session("/tmp/a.dem")
+
+        assert pool.session("/tmp/a.dem") is first
+        assert pool.session("/tmp/b.dem") is not first
+        assert _FakeParser.opened == 2
+
+    def test_least_recently_used_session_evicted(self, pool):
+        a = pool.session("/tmp/a.dem")
+        pool.session("/tmp/b.dem")
+        pool.session("/tmp/a.dem")
+        pool.session("/tmp/c.dem")
+
+        assert len(pool) == 2
+        assert pool.session("/tmp/a.dem") is a
+        pool.session("/tmp/b.dem")
+        assert _FakeParser.opened == 4  # b was reopened
+
+    def test_snapshots_are_forward_only(self, pool):
+        session = pool.session("/tmp/a.dem")
+
+        assert [s.tick for s in session.snapshots([30, 45, 60])] == [30, 45, 60]
+        assert session.snapshots([]) == []
+        with pytest.raises(ValueError):
+            session.snapshots([60, 30])
+        with pytest.raises(ValueError):
+            session.snapshots([30, 30])
+
+
+class TestSeekServiceSessions:
+    """Tests for SeekService sampling through one session."""
+
+    def test_fight_replay_decodes_once(self, pool):
+        service = SeekService(parser_pool=pool)
+
+        replay = service.get_fight_replay("/tmp/a.dem", 600.0, 630.0, interval_seconds=0.2)
+        parser = pool.session("/tmp/a.dem")._parser
+
+        assert len(replay.snapshots) == 151
+        assert parser.decodes == [list(range(18000, 18901, 6))]
+        assert parser.seeks == 0
+        assert _FakeParser.opened == 1
+        assert replay.snapshots[0].game_time == 600.0
+        assert [h.hero for h in replay.snapshots[0].heroes] == ["axe", "lina"]  # Illusions dropped
+
+    def test_snapshots_match_single_seeks(self, pool):
+        service = SeekService(parser_pool=pool)
+
+        batch = service.get_snapshots_at_ticks("/tmp/a.dem", [90, 30, 60, 30])
+        single = [service.get_snapshot_at_tick("/tmp/a.dem", t) for t in (30, 60, 90)]
+
+        assert batch == single
+        assert _FakeParser.opened == 1
+
+    def test_position_timeline_teams_from_samples(self, pool):
+        service = SeekService(parser_pool=pool)
+
+        timelines = service.get_position_timeline("/tmp/a.dem", 10.0, 12.0)
+        parser = pool.session("/tmp/a.dem")._parser
+
+        assert [(t.hero, t.team, len(t.positions)) for t in timelines] == [("axe", "radiant", 3), ("lina", "dire", 3)]
+        assert timelines[0].positions[0] == (300, 10.0, 300.0, -300.0)
+        assert len(parser.decodes) == 1
+        assert parser.seeks == 0
+
+    def test_sub_tick_interval_samples_every_tick(self, pool):
+        service = SeekService(parser_pool=pool)
+
+        timeline = service.get_hero_movement_during_fight("/tmp/a.dem", 1.0, 1.1, "lina", interval_seconds=0.001)
+
+        assert [p[0] for p in timeline.positions] == [30, 31, 32, 33]
@@ -0,0 +1,89 @@
+"""
+Tests for batched snapshot decoding.
+
+Uses an in-memory parser that serves synthetic hero states and records each
+forward decode, so no replay file is required.
+"""
+
+import pytest
+from python_manta import EntitySnapshot, Team
+from python_manta.manta_python import EntityParseResult, HeroSnapshot
+
+from src.services.seek.checkpoint_index import CheckpointIndex
+from src.services.seek.parser_pool import ParserPool
+from src.services.seek.seek_service import TICKS_PER_SECOND, SeekService
+
+LAST_TICK = 60000
+
+
+def _snapshot(tick: int) -> EntitySnapshot:
+    heroes = [HeroSnapshot(hero_name="npc_dota_hero_axe", team=Team.RADIANT.value, x=float(tick), y=0.0)]
+    return EntitySnapshot(tick=tick, game_time=tick / TICKS_PER_SECOND, heroes=heroes)
+
+
+class _ParseResult:
+    def __init__(self, entities):
+        self.entities = entities
+
+
+class _RecordingParser:
+    """Captures snapshots on even ticks up to LAST_TICK; records every forward decode."""
+
+    decodes = []
+
+    def __init__(self, replay_path):
+        pass
+
+    def parse(self, entities=None):
+        ticks = list(entities["target_ticks"])
+        _RecordingParser.decodes.append(ticks)
+        captured = sorted({t + t % 2 for t in ticks if t + t % 2 <= LAST_TICK})
+        snapshots = [_snapshot(t) for t in captured]
+        return _ParseResult(EntityParseResult(snapshots=snapshots, snapshot_count=len(snapshots)))
+
+
+@pytest.fixture
+def service():
+    _RecordingParser.decodes = []
+    return SeekService(parser_pool=ParserPool(parser_factory=_RecordingParser))
+
+
+class TestSnapshotBatch:
+    """Tests for SeekService.get_snapshots_batch."""
+
+    def test_results_in_request_order_with_duplicates(self, service):
+        snapshots = service.get_snapshots_batch("/tmp/1.dem", [40000, 2000, 9000, 2000, 30000, 100])
+
+        assert [s.tick for s in snapshots] == [40000, 2000, 9000, 2000, 30000, 100]
+        assert snapshots[1] is snapshots[3]
+        assert snapshots[0].heroes[0].hero == "axe"
+
+    def test_uncached_ticks_decoded_in_one_sorted_pass(self, service):
+        service.get_snapshots_batch("/tmp/1.dem", [9000, 3000])
+        _RecordingParser.decodes = []
+
+        service.get_snapshots_batch("/tmp/1.dem", [12000, 3000, 6000, 9000, 6000])
+
+        assert _RecordingParser.decodes == [[6000, 12000]]
+
+    def test_ticks_quantised_like_point_queries(self, service):
+        snapshots = service.get_snapshots_batch("/tmp/1.dem", [40002, 30001])
+
+        assert [s.tick for s in snapshots] == [40000, 30000]
+
+    def test_checkpoints_and_replay_end(self, service):
+        checkpoints = CheckpointIndex([_snapshot(3600)])
+
+        snapshots = service.get_snapshots_batch(
+            "/tmp/1.dem", [3610, LAST_TICK + 10, 5000], checkpoints=checkpoints, tolerance_ticks=15
+        )
+
+        assert snapshots[0].tick == 3600
+        assert snapshots[1] is None
+        assert _RecordingParser.decodes == [[5000, LAST_TICK + 10]]
+
+    def test_snapshots_at_times(self, service):
+        snapshots = service.get_snapshots_at_times("/tmp/1.dem", [600.0, 100.0, 600.0])
+
+        assert [s.game_time for s in snapshots] == [600.0, 100.0, 600.0]
+        assert len(_RecordingParser.decodes) == 1
@@ -0,0 +1,128 @@
+"""
+Tests for the decoded snapshot cache and its use by SeekService.
+
+Uses an in-memory parser that counts seeks and forward decodes, so no replay
+file is required.
+"""
+
+import pytest
+from python_manta import Team
+from python_manta.manta_python import EntityParseResult, EntitySnapshot, EntityStateSnapshot, HeroSnapshot
+
+from src.services.models.seek_data import GameSnapshot
+from src.services.seek.checkpoint_index import CheckpointIndex
+from src.services.seek.parser_pool import ParserPool
+from src.services.seek.seek_service import TICKS_PER_SECOND, SeekService
+from src.services.seek.snapshot_cache import SnapshotCache
+
+
+def _heroes(tick: int):
+    return [HeroSnapshot(hero_name="npc_dota_hero_axe", team=Team.RADIANT.value, x=float(tick), y=0.0)]
+
+
+class _ParseResult:
+    def __init__(self, entities):
+        self.entities = entities
+
+
+class _CountingParser:
+    """Serves hero states at any tick; counts seeks and decoded ticks across instances."""
+
+    seeks = 0
+    decoded = []
+
+    def __init__(self, replay_path):
+        pass
+
+    def snapshot(self, tick, include_illusions=False):
+        _CountingParser.seeks += 1
+        return EntityStateSnapshot(tick=tick, game_time=tick / TICKS_PER_SECOND, heroes=_heroes(tick))
+
+    def parse(self, entities=None):
+        ticks = list(entities["target_ticks"])
+        _CountingParser.decoded.extend(ticks)
+        snapshots = [EntitySnapshot(tick=t, game_time=t / TICKS_PER_SECOND, heroes=_heroes(t)) for t in ticks]
+        return _ParseResult(EntityParseResult(snapshots=snapshots, snapshot_count=len(snapshots)))
+
+
+def _game_snapshot(tick: int) -> GameSnapshot:
+    return GameSnapshot(tick=tick, game_time=tick / TICKS_PER_SECOND, game_time_str="", heroes=[])
+
+
+@pytest.fixture
+def service():
+    _CountingParser.seeks = 0
+    _CountingParser.decoded = []
+    return SeekService(parser_pool=ParserPool(parser_factory=_CountingParser))
+
+
+class TestSnapshotCache:
+    """Tests for SnapshotCache."""
+
+    def test_quantise_to_nearest(self):
+        cache = SnapshotCache(tick_quantum=5)
+
+        assert [cache.quantise(t) for t in (0, 2, 3, 7, 8, 18004)] == [0, 0, 5, 5, 10, 18005]
+        assert SnapshotCache(tick_quantum=1).quantise(18004) == 18004
+
+    def test_evicts_least_recently_used(self):
+        cache = SnapshotCache(max_entries=2)
+        for tick in (10, 20):
+            cache.set("/tmp/1.dem", tick, _game_snapshot(tick))
+
+        cache.get("/tmp/1.dem", 10)
+        cache.set("/tmp/1.dem", 30, _game_snapshot(30))
+
+        assert cache.get("/tmp/1.dem", 20) is None
+        assert cache.get("/tmp/1.dem", 10).tick == 10
+        assert cache.get("/tmp/2.dem", 10) is None
+        stats = cache.get_stats()
+        assert (stats["count"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 2, 2, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_disabled(self):
+        cache = SnapshotCache(max_entries=0)
+        cache.set("/tmp/1.dem", 10, _game_snapshot(10))
+
+        assert len(cache) == 0
+
+
+class TestSeekServiceSnapshotCache:
+    """Tests for snapshots shared between SeekService queries."""
+
+    def test_repeated_instant_decoded_once(self, service):
+        first = service.get_snapshot_at_time("/tmp/1.dem", 600.0)
+        again = service.get_snapshot_at_time("/tmp/1.dem", 600.05)
+
+        assert again is first
+        assert (first.tick, _CountingParser.seeks) == (18000, 1)
+        assert service.get_cache_stats()["hit_rate"] == 0.5
+
+    def test_fight_replay_feeds_point_queries_and_timelines(self, service):
+        service.get_fight_replay("/tmp/1.dem", 600.0, 610.0)
+        decoded = len(_CountingParser.decoded)
+
+        snapshot = service.get_snapshot_at_time("/tmp/1.dem", 605.0)
+        timelines = service.get_position_timeline("/tmp/1.dem", 600.0, 610.0)
+
+        assert (snapshot.tick, _CountingParser.seeks) == (18150, 0)
+        assert len(timelines[0].positions) == 11
+        assert len(_CountingParser.decoded) == decoded
+
+    def test_partial_range_decodes_only_missing_ticks(self, service):
+        service.get_position_timeline("/tmp/1.dem", 600.0, 605.0)
+        _CountingParser.decoded = []
+
+        replay = service.get_fight_replay("/tmp/1.dem", 600.0, 610.0, interval_seconds=1.0)
+
+        assert len(replay.snapshots) == 11
+        assert _CountingParser.decoded == list(range(18180, 18301, 30))
+
+    def test_inexact_checkpoint_not_cached(self, service):
+        checkpoint = EntitySnapshot(tick=18000, game_time=600.0, heroes=_heroes(18000))
+        checkpoints = CheckpointIndex([checkpoint])
+
+        nearby = service.get_snapshot_at_time("/tmp/1.dem", 601.0, checkpoints=checkpoints, tolerance_seconds=5)
+        exact = service.get_snapshot_at_time("/tmp/1.dem", 601.0, checkpoints=checkpoints)
+
+        assert (nearby.tick, exact.tick, _CountingParser.seeks) == (18000, 18030, 1)
@@ -0,0 +1,131 @@
+"""
+Tests for dense hero trajectories and SeekService answers from memory.
+
+Uses synthetic dense entity snapshots, so no replay file is required.
+"""
+
+import pickle
+
+import pytest
+from python_manta import EntitySnapshot, Team
+from python_manta.manta_python import HeroSnapshot
+
+from src.services.cache.memory_cache import estimate_replay_size
+from src.services.models.replay_data import ParsedReplayData
+from src.services.seek.parser_pool import ParserPool
+from src.services.seek.seek_service import SeekService
+from src.services.seek.trajectories import TRAJECTORY_INTERVAL_TICKS, HeroTrajectories, thin_snapshots
+
+START_TICK = 18000  # 10:00
+
+
+def _hero(name, team, i, tick, **kwargs):
+    return HeroSnapshot(
+        hero_name=f"npc_dota_hero_{name}",
+        team=team,
+        player_id=i,
+        x=float(tick - START_TICK),
+        y=float(i * 100),
+        health=500 + i,
+        max_health=1000,
+        mana=200.5,
+        max_mana=300.0,
+        level=10,
+        **kwargs,
+    )
+
+
+def _make_snapshots(count: int = 121):
+    snapshots = []
+    for n in range(count):
+        tick = START_TICK + n * TRAJECTORY_INTERVAL_TICKS
+        heroes = [_hero("axe", Team.RADIANT.value, 0, tick), _hero("lina", Team.DIRE.value, 1, tick, is_alive=n < 60)]
+        heroes.append(_hero("axe", Team.RADIANT.value, 0, tick, is_illusion=True))
+        snapshots.append(EntitySnapshot(tick=tick, game_time=tick / 30, heroes=heroes))
+    return snapshots
+
+
+class _NoDecodeParser:
+    """Fails the test if SeekService touches the replay."""
+
+    def __init__(self, replay_path):
+        pass
+
+    def parse(self, **kwargs):
+        raise AssertionError("replay was decoded")
+
+
+class TestHeroTrajectories:
+    """Tests for HeroTrajectories."""
+
+    def test_samples_skip_illusions(self):
+        trajectories = HeroTrajectories.from_snapshots(_make_snapshots())
+
+        assert len(trajectories) == 121
+        assert sorted(trajectories.tracks) == ["axe", "lina"]
+        assert len(trajectories.tracks["axe"]) == 121
+        assert trajectories.tracks["lina"].team == "dire"
+
+    def test_frame_interpolates_positions(self):
+        trajectories = HeroTrajectories.from_snapshots(_make_snapshots())
+
+        frame = trajectories.frame(START_TICK + 45)
+        axe = frame.heroes[0]
+        assert (frame.tick, frame.game_time) == (START_TICK + 45, 601.5)
+        assert (axe.hero, axe.x, axe.y, axe.health, axe.mana) == ("axe", 45.0, 0.0, 500, 200.5)
+        assert [p.hero for p in trajectories.frame(START_TICK, "LIN").heroes] == ["lina"]
+        assert trajectories.frame(START_TICK - 1) is None
+        assert trajectories.frame(START_TICK + 120 * TRAJECTORY_INTERVAL_TICKS + 1) is None
+
+    def test_cached_with_replay_data(self):
+        data = ParsedReplayData(
+            match_id=1, replay_path="/tmp/1.dem", trajectories=HeroTrajectories.from_snapshots(_make_snapshots())
+        )
+
+        restored = ParsedReplayData.from_cache_dict(pickle.loads(pickle.dumps(data.to_cache_dict())))
+
+        assert restored.trajectories.frame(START_TICK + 45) == data.trajectories.frame(START_TICK + 45)
+        # 26 bytes per hero sample plus tick and game time per sample
+        assert data.trajectories.nbytes == 121 * (2 * 26 + 4 + 8)
+        assert estimate_replay_size(data) == estimate_replay_size(ParsedReplayData(1, "/tmp/1.dem")) + 121 * 64
+
+    def test_thin_snapshots(self):
+        snapshots = _make_snapshots()
+
+        thinned = thin_snapshots(snapshots, 900, 200)
+        assert [s.tick for s in thinned] == list(range(START_TICK, START_TICK + 3601, 900))
+        assert len(thin_snapshots(snapshots, 900, 2)) == 2
+
+
+class TestSeekFromTrajectories:
+    """Tests for SeekService answers from trajectories."""
+
+    @pytest.fixture
+    def service(self):
+        return SeekService(parser_pool=ParserPool(parser_factory=_NoDecodeParser))
+
+    def test_movement_from_memory(self, service):
+        trajectories = HeroTrajectories.from_snapshots(_make_snapshots())
+
+        timeline = service.get_hero_movement_during_fight(
+            "/tmp/1.dem", 600.0, 601.0, "axe", trajectories=trajectories
+        )
+
+        assert timeline.team == "radiant"
+        assert [p[0] for p in timeline.positions] == list(range(START_TICK, START_TICK + 31, 6))
+        assert timeline.positions[1] == (START_TICK + 6, 600.2, 6.0, 0.0)
+
+    def test_fight_replay_from_memory(self, service):
+        trajectories = HeroTrajectories.from_snapshots(_make_snapshots())
+
+        replay = service.get_fight_replay("/tmp/1.dem", 600.0, 630.0, trajectories=trajectories)
+
+        assert len(replay.snapshots) == 61
+        lina = replay.snapshots[-1].heroes[1]
+        assert (lina.hero, lina.team, lina.alive, lina.mana, lina.health) == ("lina", "dire", True, 200, 501)
+
+    def test_uncovered_range_is_decoded(self, service):
+        trajectories = HeroTrajectories.from_snapshots(_make_snapshots())
+
+        with pytest.raises(AssertionError, match="decoded"):
+            service.get_position_timeline("/tmp/1.dem", 590.0, 610.0, trajectories=trajectories)